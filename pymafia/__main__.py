@@ -1,9 +1,31 @@
 """
 Module principal du package pymafia.
 C'est ici le point d'entrée du programme.
-Ce module définit 3 fonctions ainsi que les commandes principales qui lancent le jeu.
+Ce module définit les fonctions ainsi que les commandes principales qui lancent le jeu.
+
+Sans commande, le programme joue une partie à la console. Les options --players et --humans évitent de demander le
+nombre de joueurs, --rounds, --seed et --lang règlent la partie, et --verbosity choisit ce qui est affiché: rien
+(silent), le résumé de la partie (summary), les rondes (round) ou chaque tour (turn). Par exemple,
+    python -m pymafia --players 8 --humans 0 --rounds 100 --verbosity round > partie.txt
+joue une longue partie entre ordinateurs et l'écrit dans un fichier, une ronde à la fois. La commande
+    python -m pymafia simulate --games N --players P --jobs K
+simule plutôt un tournoi de N parties entre P joueurs ordinateurs, réparties entre K processus. Avec l'option
+--fast-forward, les rondes sont jouées en un seul tirage plutôt que tour par tour. La commande
+    python -m pymafia serve --port PORT
+démarre un serveur qui héberge des tables de jeu pour des clients TCP (voir ServeurPymafia). Avec l'option
+--store, les tables inactives sont suspendues dans une base SQLite au-delà de --hot-tables tables en mémoire.
 """
-from pymafia.partie import Partie
+import argparse
+import asyncio
+import os
+
+from pymafia.partie import Partie, RONDEMAX
+from pymafia.generateur_des import GenerateurDés
+from pymafia.messages import MESSAGES, LANGUE
+from pymafia.rendu_console import RenduConsole, VERBOSITES, SILENCE
+from pymafia.tournoi import Tournoi
+from pymafia.serveur import servir, HOTE, PORT
+from pymafia.magasin_sessions import MagasinSessions, CAPACITE
 
 
 def demander_nombre_joueurs():
@@ -52,19 +74,139 @@ def afficher_instructions():
     print("Instruction du jeu pyMafia.\n")
 
 
+def analyser_arguments():
+    """
+    Fonction qui analyse les arguments de la ligne de commande.
+
+    Returns:
+        argparse.Namespace: les arguments analysés (commande vaut None si aucune commande n'est donnée)
+    """
+    analyseur = argparse.ArgumentParser(prog='python -m pymafia', description="Jeu de dés pymafia.")
+    analyseur.add_argument('--players', type=int, default=None,
+                           help="nombre de joueurs de la partie, entre 2 et 8 (défaut: demandé à la console)")
+    analyseur.add_argument('--humans', type=int, default=None,
+                           help="nombre de joueurs humains, avec --players (défaut: demandé à la console)")
+    analyseur.add_argument('--rounds', type=int, default=RONDEMAX,
+                           help="nombre maximal de rondes de la partie (défaut: {})".format(RONDEMAX))
+    analyseur.add_argument('--seed', type=int, default=None,
+                           help="graine de la partie, pour une partie reproductible (défaut: au hasard)")
+    analyseur.add_argument('--lang', choices=sorted(MESSAGES), default=LANGUE,
+                           help="langue des messages de la partie (défaut: {})".format(LANGUE))
+    analyseur.add_argument('--verbosity', choices=list(VERBOSITES), default='turn',
+                           help="messages affichés: aucun, le résumé de la partie, les rondes ou chaque tour "
+                                "(défaut: turn)")
+    commandes = analyseur.add_subparsers(dest='commande')
+    simulation = commandes.add_parser('simulate', help="simuler un tournoi entre joueurs ordinateurs")
+    simulation.add_argument('--games', type=int, default=1000, help="nombre de parties (défaut: 1000)")
+    simulation.add_argument('--players', type=int, default=4,
+                            help="nombre de joueurs par partie, jusqu'à des milliers (défaut: 4)")
+    simulation.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                            help="nombre de processus (défaut: nombre de coeurs)")
+    simulation.add_argument('--rounds', type=int, default=RONDEMAX,
+                            help="nombre maximal de rondes par partie (défaut: {})".format(RONDEMAX))
+    simulation.add_argument('--seed', type=int, default=None,
+                            help="graine du tournoi, pour des résultats reproductibles (défaut: au hasard)")
+    simulation.add_argument('--fast-forward', action='store_true',
+                            help="jouer chaque ronde d'au plus 4 joueurs en un seul tirage (les tours ne sont pas "
+                                 "comptés)")
+    serveur = commandes.add_parser('serve', help="héberger des tables de jeu pour des clients TCP")
+    serveur.add_argument('--host', default=HOTE, help="adresse d'écoute (défaut: {})".format(HOTE))
+    serveur.add_argument('--port', type=int, default=PORT, help="port d'écoute (défaut: {})".format(PORT))
+    serveur.add_argument('--store', default=None,
+                         help="base SQLite où suspendre les tables inactives (défaut: toutes les tables en mémoire)")
+    serveur.add_argument('--hot-tables', type=int, default=CAPACITE,
+                         help="nombre de tables gardées en mémoire avec --store (défaut: {})".format(CAPACITE))
+    arguments = analyseur.parse_args()
+
+    if arguments.commande == 'simulate':
+        if arguments.games < 1:
+            analyseur.error("--games doit être au moins 1")
+        if arguments.players < 2:
+            analyseur.error("--players doit être au moins 2")
+        if arguments.jobs < 1:
+            analyseur.error("--jobs doit être au moins 1")
+        if arguments.rounds < 1:
+            analyseur.error("--rounds doit être au moins 1")
+    if arguments.commande == 'serve' and arguments.hot_tables < 1:
+        analyseur.error("--hot-tables doit être au moins 1")
+    if arguments.commande is None:
+        if arguments.humans is not None and arguments.players is None:
+            analyseur.error("--humans demande aussi --players")
+        if arguments.players is not None and not 2 <= arguments.players <= 8:
+            analyseur.error("--players doit être entre 2 et 8")
+        if arguments.humans is not None and not 0 <= arguments.humans <= arguments.players:
+            analyseur.error("--humans doit être entre 0 et --players")
+        if arguments.rounds < 1:
+            analyseur.error("--rounds doit être au moins 1")
+    return arguments
+
+
+def jouer_partie(arguments, nombre_joueurs, nombre_joueurs_humains):
+    """
+    Fonction qui joue une partie à la console selon les arguments de la ligne de commande. Les messages passent par
+    un RenduConsole, qui les filtre selon la verbosité et les écrit une ronde à la fois. En silence, la partie n'a
+    aucune sortie: elle ne crée aucun message.
+    Args:
+        arguments (argparse.Namespace): les arguments de la ligne de commande
+        nombre_joueurs (int): nombre de joueurs de la partie
+        nombre_joueurs_humains (int): nombre de joueurs humains de la partie
+
+    Returns:
+        ResultatPartie: le résultat de la partie
+    """
+    niveau = VERBOSITES[arguments.verbosity]
+    rendu = None if niveau == SILENCE else RenduConsole(niveau)
+    generateur = None if arguments.seed is None else GenerateurDés(arguments.seed)
+    partie = Partie(nombre_joueurs, nombre_joueurs_humains, affichage=False, generateur=generateur,
+                    langue=arguments.lang, sortie=rendu)
+    partie.ronde_max = arguments.rounds
+    resultat = partie.executer(partie.etapes())
+    partie.terminer_une_partie()
+    return resultat
+
+
+def simuler_tournoi(arguments):
+    """
+    Fonction qui simule un tournoi selon les arguments de la ligne de commande et affiche ses statistiques.
+    Args:
+        arguments (argparse.Namespace): les arguments de la commande simulate
+    """
+    tournoi = Tournoi(arguments.games, arguments.players, arguments.rounds, arguments.seed, arguments.fast_forward)
+    tournoi.simuler(arguments.jobs)
+    print(tournoi)
+
+
 if __name__ == '__main__':
 
+    arguments = analyser_arguments()
+    if arguments.commande == 'simulate':
+        simuler_tournoi(arguments)
+        raise SystemExit
+    if arguments.commande == 'serve':
+        sessions = None if arguments.store is None else MagasinSessions(arguments.store, arguments.hot_tables)
+        try:
+            asyncio.run(servir(arguments.host, arguments.port, sessions))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if sessions is not None:
+                sessions.fermer()
+        raise SystemExit
+
+    if arguments.players is not None:
+        # Partie entièrement décrite par la ligne de commande: rien n'est demandé, sauf aux joueurs humains
+        nombre_joueurs_humains = 1 if arguments.humans is None else arguments.humans
+        jouer_partie(arguments, arguments.players, min(nombre_joueurs_humains, arguments.players))
+        raise SystemExit
+
     print("Jouons une partie de pyMafia!\n")
     afficher_instructions()
     nombre_joueurs = demander_nombre_joueurs()
     nombre_joueurs_humains = demander_nombre_joueurs_humains(nombre_joueurs)
     print("\n")
 
-    # Création de l'objet partie
-    partie = Partie(nombre_joueurs, nombre_joueurs_humains)
-
-    # Démarrage de cette partie.
-    partie.jouer()
+    # Création et démarrage de la partie
+    jouer_partie(arguments, nombre_joueurs, nombre_joueurs_humains)
 
     input('Appuyer sur ENTER pour quitter.')
 
@@ -0,0 +1,144 @@
+"""
+Module de la classe AnneauJoueurs
+"""
+
+
+class AnneauJoueurs:
+    """
+    Classe pour l'anneau des joueurs actifs d'une partie, dans l'ordre où ils sont assis autour de la table. Chaque
+    joueur connaît son voisin dans chaque sens, de sorte que trouver le joueur suivant (dans un sens comme dans
+    l'autre), vérifier qu'un joueur est actif et retirer un joueur se font en temps constant. Les joueurs sont
+    retrouvés selon leur identité (is), jamais en comparant leurs attributs.
+
+    Un AnneauJoueurs se parcourt, se compare et s'indexe comme la liste des joueurs actifs, dans l'ordre initial.
+
+    Attributes:
+        suivants (dict): Voisin de chaque joueur dans le sens croissant
+        precedents (dict): Voisin de chaque joueur dans le sens décroissant
+        premier (Joueur): Premier joueur actif dans l'ordre initial (None si l'anneau est vide)
+    """
+
+    def __init__(self, joueurs=()):
+        """
+        Constructeur de la classe AnneauJoueurs
+        Args:
+            joueurs (iterable, optional): Joueurs de l'anneau, dans l'ordre où ils sont assis
+        """
+        joueurs = list(joueurs)
+        self.suivants = {}
+        self.precedents = {}
+        self.premier = joueurs[0] if joueurs else None
+        for i, joueur in enumerate(joueurs):
+            self.suivants[joueur] = joueurs[(i + 1) % len(joueurs)]
+            self.precedents[joueur] = joueurs[i - 1]
+
+    def voisin(self, joueur, sens=1):
+        """
+        Méthode qui retourne le voisin actif d'un joueur dans un sens donné.
+        Args:
+            joueur (Joueur): Joueur actif
+            sens (int, optional): 1 pour le sens croissant, -1 pour le sens décroissant
+
+        Returns:
+            Joueur: Le voisin du joueur dans ce sens (le joueur lui-même s'il est seul)
+        """
+        try:
+            if sens == 1:
+                return self.suivants[joueur]
+            return self.precedents[joueur]
+        except KeyError:
+            raise ValueError("Le joueur {} n'est pas actif.".format(joueur.identifiant)) from None
+
+    def retirer(self, joueur):
+        """
+        Méthode qui retire un joueur de l'anneau. Ses deux voisins deviennent voisins l'un de l'autre.
+        Args:
+            joueur (Joueur): Joueur à retirer
+        """
+        suivant = self.suivants.pop(joueur)
+        precedent = self.precedents.pop(joueur)
+        if suivant is joueur:
+            self.premier = None
+            return
+        self.suivants[precedent] = suivant
+        self.precedents[suivant] = precedent
+        if self.premier is joueur:
+            self.premier = suivant
+
+    def copier(self, correspondance):
+        """
+        Méthode qui crée un anneau de même forme, dont chaque joueur est remplacé par son correspondant.
+        Args:
+            correspondance (dict): Joueur qui remplace chaque joueur de l'anneau
+
+        Returns:
+            AnneauJoueurs: La copie
+        """
+        copie = AnneauJoueurs()
+        copie.suivants = {correspondance[joueur]: correspondance[suivant] for joueur, suivant in self.suivants.items()}
+        copie.precedents = {correspondance[joueur]: correspondance[precedent]
+                            for joueur, precedent in self.precedents.items()}
+        copie.premier = None if self.premier is None else correspondance[self.premier]
+        return copie
+
+    def __contains__(self, joueur):
+        """
+        Méthode qui vérifie si un joueur est dans l'anneau.
+        Args:
+            joueur (Joueur): Joueur à chercher
+        Returns:
+            bool: True si le joueur est actif, False autrement
+        """
+        return joueur in self.suivants
+
+    def __len__(self):
+        """
+        Méthode qui retourne le nombre de joueurs actifs.
+        Returns:
+            int: Nombre de joueurs
+        """
+        return len(self.suivants)
+
+    def __iter__(self):
+        """
+        Méthode qui permet de parcourir les joueurs actifs dans l'ordre initial, à partir du premier.
+        Returns:
+            iterator: Itérateur sur les joueurs
+        """
+        joueur = self.premier
+        for i in range(len(self.suivants)):
+            yield joueur
+            joueur = self.suivants[joueur]
+
+    def __getitem__(self, index):
+        """
+        Méthode qui retourne un joueur selon sa position dans l'ordre initial, comme pour une liste. Sauf pour le
+        premier joueur, cette opération parcourt l'anneau.
+        Args:
+            index (int ou slice): Position du joueur
+        Returns:
+            Joueur: Le joueur à cette position
+        """
+        if index == 0 and self.premier is not None:
+            return self.premier
+        return list(self)[index]
+
+    def __eq__(self, other):
+        """
+        Méthode qui définit l'opérateur == pour la classe AnneauJoueurs. Un anneau est égal à un autre anneau ou à une
+        liste qui contient les mêmes joueurs dans le même ordre.
+        Args:
+            other (AnneauJoueurs ou list): autre séquence de joueurs pour la comparaison
+        Returns:
+            bool: True si les deux séquences ont les mêmes joueurs dans le même ordre, False autrement
+        """
+        if isinstance(other, (AnneauJoueurs, list)):
+            return len(self) == len(other) and all(a is b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __ne__(self, other):
+        resultat = self.__eq__(other)
+        return resultat if resultat is NotImplemented else not resultat
+
+    def __repr__(self):
+        return "AnneauJoueurs({})".format([joueur.identifiant for joueur in self])
@@ -0,0 +1,208 @@
+"""
+Module de la classe ArchiveParties
+"""
+
+import lzma
+import mmap
+import struct
+import zlib
+
+from pymafia.enregistrement_partie import EnregistrementPartie
+
+# En-tête du fichier: signature, version du format et mode de compression
+ENTETE_FICHIER = struct.Struct('<4sBB2x')
+SIGNATURE = b'PYMA'
+VERSION = 2
+
+# En-tête d'un bloc: taille du bloc dans le fichier et taille une fois décompressé
+ENTETE_BLOC = struct.Struct('<II')
+
+# Modes de compression des blocs, selon leur nom
+COMPRESSIONS = {None: 0, 'zlib': 1, 'lzma': 2}
+
+# Taille (non compressée) à partir de laquelle un bloc d'enregistrements est écrit dans le fichier
+TAILLE_BLOC = 1 << 20
+
+
+class ArchiveParties:
+    """
+    Classe pour un fichier d'enregistrements binaires de parties (voir EnregistrementPartie). Le fichier débute par un
+    en-tête, suivi de blocs d'enregistrements. Chaque bloc est précédé de sa taille dans le fichier et de sa taille
+    décompressée; il est compressé en entier avec zlib ou lzma, ou conservé tel quel.
+
+    En lecture, le fichier est projeté en mémoire (mmap). Sans compression, les enregistrements parcourus sont des
+    vues sur cette projection et aucune donnée n'est copiée; avec compression, chaque bloc est décompressé une seule
+    fois, au moment où on le parcourt. On peut ainsi parcourir une archive beaucoup plus grande que la mémoire.
+
+    Une archive s'utilise comme un fichier, idéalement avec l'énoncé with:
+
+        with ArchiveParties('parties.pyma', 'w', compression='zlib') as archive:
+            archive.ajouter(partie)
+        with ArchiveParties('parties.pyma') as archive:
+            for enregistrement in archive:
+                ...
+
+    Attributes:
+        chemin (str): Chemin du fichier
+        mode (str): 'r' pour la lecture, 'w' pour l'écriture, 'a' pour l'ajout à la fin d'une archive existante
+        compression (str): None, 'zlib' ou 'lzma'
+        fichier (file): Fichier ouvert
+        bloc (bytearray): Enregistrements pas encore écrits dans le fichier (en écriture)
+        projection (mmap.mmap): Projection du fichier en mémoire (en lecture)
+    """
+
+    def __init__(self, chemin, mode='r', compression=None):
+        """
+        Constructeur de la classe ArchiveParties
+        Args:
+            chemin (str): Chemin du fichier
+            mode (str, optional): 'r' pour la lecture, 'w' pour l'écriture, 'a' pour l'ajout
+            compression (str, optional): None, 'zlib' ou 'lzma' (en écriture seulement; en lecture et en ajout, la
+                compression est celle de l'en-tête du fichier)
+        """
+        if mode not in ('r', 'w', 'a'):
+            raise ValueError("Le mode d'une archive doit être 'r', 'w' ou 'a'.")
+        if compression not in COMPRESSIONS:
+            raise ValueError("La compression doit être None, 'zlib' ou 'lzma'.")
+
+        self.chemin = chemin
+        self.mode = mode
+        self.compression = compression
+        self.bloc = bytearray()
+        self.projection = None
+
+        if mode == 'w':
+            self.fichier = open(chemin, 'wb')
+            self.fichier.write(ENTETE_FICHIER.pack(SIGNATURE, VERSION, COMPRESSIONS[compression]))
+        else:
+            self.fichier = open(chemin, 'rb' if mode == 'r' else 'r+b')
+            try:
+                self.compression = self.lire_entete(self.fichier.read(ENTETE_FICHIER.size))
+            except ValueError:
+                self.fichier.close()
+                raise
+            if mode == 'a':
+                self.fichier.seek(0, 2)
+            else:
+                self.projection = mmap.mmap(self.fichier.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def lire_entete(entete):
+        """
+        Méthode statique qui valide l'en-tête d'un fichier d'archive.
+        Args:
+            entete (bytes): Les premiers octets du fichier
+
+        Returns:
+            str: Le mode de compression du fichier
+        """
+        if len(entete) < ENTETE_FICHIER.size:
+            raise ValueError("Ce fichier n'est pas une archive de parties.")
+        signature, version, code_compression = ENTETE_FICHIER.unpack_from(entete)
+        if signature != SIGNATURE:
+            raise ValueError("Ce fichier n'est pas une archive de parties.")
+        if version != VERSION:
+            raise ValueError("Version d'archive non supportée: {}.".format(version))
+        for compression, code in COMPRESSIONS.items():
+            if code == code_compression:
+                return compression
+        raise ValueError("Compression d'archive inconnue: {}.".format(code_compression))
+
+    def ajouter(self, partie):
+        """
+        Méthode qui ajoute une partie à l'archive. La partie doit avoir été jouée avec la journalisation activée.
+        Args:
+            partie (Partie): La partie à ajouter
+        """
+        if partie.journal is None:
+            raise ValueError("Seule une partie dont la journalisation est activée peut être archivée.")
+        self.ajouter_enregistrement(EnregistrementPartie.encoder(partie.journal))
+
+    def ajouter_enregistrement(self, enregistrement):
+        """
+        Méthode qui ajoute un enregistrement déjà encodé à l'archive.
+        Args:
+            enregistrement (bytes): Enregistrement retourné par EnregistrementPartie.encoder
+        """
+        if self.mode == 'r':
+            raise ValueError("Une archive ouverte en lecture ne peut pas être modifiée.")
+        self.bloc += enregistrement
+        if len(self.bloc) >= TAILLE_BLOC:
+            self.ecrire_bloc()
+
+    def ecrire_bloc(self):
+        """
+        Méthode qui compresse et écrit dans le fichier les enregistrements en attente.
+        """
+        if not self.bloc:
+            return
+        if self.compression == 'zlib':
+            donnees = zlib.compress(self.bloc)
+        elif self.compression == 'lzma':
+            donnees = lzma.compress(self.bloc)
+        else:
+            donnees = self.bloc
+        self.fichier.write(ENTETE_BLOC.pack(len(donnees), len(self.bloc)))
+        self.fichier.write(donnees)
+        self.bloc = bytearray()
+
+    def blocs(self):
+        """
+        Méthode qui parcourt les blocs de l'archive, décompressés au besoin.
+        Returns:
+            iterator: Itérateur sur le contenu (memoryview ou bytes) de chaque bloc
+        """
+        if self.projection is None:
+            raise ValueError("L'archive doit être ouverte en lecture pour être parcourue.")
+        vue = memoryview(self.projection)
+        position = ENTETE_FICHIER.size
+        while position < len(vue):
+            taille, taille_décompressée = ENTETE_BLOC.unpack_from(vue, position)
+            position += ENTETE_BLOC.size
+            donnees = vue[position:position + taille]
+            if self.compression == 'zlib':
+                donnees = zlib.decompress(donnees)
+            elif self.compression == 'lzma':
+                donnees = lzma.decompress(donnees)
+            if len(donnees) != taille_décompressée:
+                raise ValueError("Bloc d'archive corrompu à la position {}.".format(position))
+            yield donnees
+            position += taille
+
+    def __iter__(self):
+        """
+        Méthode qui parcourt les enregistrements de l'archive, dans l'ordre où ils ont été ajoutés. Les
+        enregistrements sont des vues sur le fichier: pour conserver des données après la fermeture de l'archive, on
+        en copie les valeurs (par exemple, list(enregistrement.scores)).
+        Returns:
+            iterator: Itérateur sur les EnregistrementPartie
+        """
+        for bloc in self.blocs():
+            bloc = memoryview(bloc)
+            position = 0
+            while position < len(bloc):
+                taille = EnregistrementPartie.taille(bloc[position:])
+                yield EnregistrementPartie(bloc[position:position + taille])
+                position += taille
+
+    def fermer(self):
+        """
+        Méthode qui ferme l'archive, après avoir écrit les enregistrements en attente.
+        """
+        if self.mode != 'r':
+            self.ecrire_bloc()
+        if self.projection is not None:
+            try:
+                self.projection.close()
+            except BufferError:
+                # Des enregistrements encore utilisés sont des vues sur la projection: elle sera fermée lorsqu'ils
+                # seront détruits.
+                pass
+            self.projection = None
+        self.fichier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type_exception, exception, trace):
+        self.fermer()
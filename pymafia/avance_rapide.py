@@ -0,0 +1,198 @@
+"""
+Module de la classe AvanceRapide
+"""
+
+import random
+from bisect import bisect_right
+
+from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.oracle_victoire import OracleVictoire
+
+# Probabilité totale en deçà de laquelle la masse qui circule encore dans un niveau est négligée
+TOLERANCE = 1e-15
+
+# Plus grand nombre de joueurs actifs pour lequel une ronde est avancée rapidement, par défaut. Le nombre d'états
+# d'une ronde croît très vite avec le nombre de joueurs.
+NOMBRE_JOUEURS_MAX = 4
+
+# Distributions des issues de ronde déjà calculées, selon l'état de départ. Elles ne dépendent pas de la source des
+# valeurs aléatoires et sont partagées par toutes les avances rapides.
+DISTRIBUTIONS = {}
+
+
+class AvanceRapide:
+    """
+    Classe qui joue une ronde entière entre joueurs ordinateurs en un seul tirage. Entre ordinateurs, aucune décision
+    n'est prise pendant une ronde: son issue, c'est-à-dire le gagnant et le nombre de dés qui restent à chacun des
+    perdants, ne dépend que du hasard. Sa distribution exacte est calculée une fois pour chaque état de départ (le
+    nombre de dés de chaque joueur, dans l'ordre où ils jouent), puis une issue est tirée selon cette distribution.
+    La valeur des dés qui restent aux perdants n'a pas d'importance, puisqu'ils les relancent en fin de ronde.
+
+    La distribution est obtenue en propageant la probabilité d'être dans chaque état de la ronde à partir de l'état
+    de départ, par niveau (nombre total de dés) décroissant, avec les mêmes issues de lancer que OracleVictoire. À
+    l'intérieur d'un niveau, un lancer sans dé de valeur 1 ne fait que déplacer des dés: la probabilité y circule
+    jusqu'à ce qu'il en reste moins que TOLERANCE.
+
+    Les tours d'une ronde avancée rapidement ne sont pas joués: ils ne sont pas comptés dans le nombre de tours de la
+    partie.
+
+    Attributes:
+        generateur (GenerateurDés): source des valeurs aléatoires (None pour utiliser le module random)
+        nombre_joueurs_max (int): Plus grand nombre de joueurs actifs pour lequel une ronde est avancée rapidement
+    """
+
+    def __init__(self, generateur=None, nombre_joueurs_max=NOMBRE_JOUEURS_MAX):
+        """
+        Constructeur de la classe AvanceRapide
+        Args:
+            generateur (GenerateurDés, optional): source des valeurs aléatoires
+            nombre_joueurs_max (int, optional): Plus grand nombre de joueurs actifs pour lequel une ronde est avancée
+                rapidement
+        """
+        self.generateur = generateur
+        self.nombre_joueurs_max = nombre_joueurs_max
+
+    @staticmethod
+    def calculer_distribution(etat):
+        """
+        Méthode statique qui calcule la distribution exacte des issues d'une ronde.
+        Args:
+            etat (tuple): Nombre de dés de chaque joueur au début de la ronde, dans l'ordre où ils joueront à partir du
+                premier joueur de la ronde
+
+        Returns:
+            dict: Probabilité de chaque issue, soit (position du gagnant, nombre de dés de chaque joueur à la fin de la
+                ronde)
+        """
+        nombre_joueurs = len(etat)
+        # Probabilité d'arriver dans chaque état (nombre de dés de chaque joueur, position du joueur courant) de
+        # chaque niveau
+        niveaux = {sum(etat): {(etat, 0): 1.0}}
+        issues = {}
+        while niveaux:
+            niveau = max(niveaux)
+            arrivees = niveaux.pop(niveau)
+            # Probabilité totale de passer par chaque état du niveau, en comptant les retours à un même état
+            visites = {}
+            # États du même niveau qui suivent chaque état, avec leur probabilité (sans dé de valeur 1 ni fin de ronde)
+            transitions = {}
+            while sum(arrivees.values()) > TOLERANCE:
+                suivantes = {}
+                for cle, masse in arrivees.items():
+                    visites[cle] = visites.get(cle, 0.0) + masse
+                    if cle not in transitions:
+                        comptes, courant = cle
+                        suivant = (courant + 1) % nombre_joueurs
+                        transitions[cle] = [
+                            ((AvanceRapide.deplacer(comptes, courant, suivant, 0, nombre_6), suivant), probabilite)
+                            for nombre_1, nombre_6, probabilite in OracleVictoire.issues_lancer(comptes[courant])
+                            if nombre_1 == 0 and nombre_6 < comptes[courant]]
+                    for cle_suivante, probabilite in transitions[cle]:
+                        if cle_suivante in suivantes:
+                            suivantes[cle_suivante] += masse * probabilite
+                        else:
+                            suivantes[cle_suivante] = masse * probabilite
+                arrivees = suivantes
+
+            # Les lancers qui retirent au moins un dé, ou qui terminent la ronde, quittent le niveau
+            for (comptes, courant), masse in visites.items():
+                suivant = (courant + 1) % nombre_joueurs
+                for nombre_1, nombre_6, probabilite in OracleVictoire.issues_lancer(comptes[courant]):
+                    restants = comptes[courant] - nombre_1 - nombre_6
+                    if restants == 0:
+                        cle = (courant, AvanceRapide.deplacer(comptes, courant, suivant, nombre_1, nombre_6))
+                        issues[cle] = issues.get(cle, 0.0) + masse * probabilite
+                    elif nombre_1:
+                        inferieur = niveaux.setdefault(niveau - nombre_1, {})
+                        cle = (AvanceRapide.deplacer(comptes, courant, suivant, nombre_1, nombre_6), suivant)
+                        inferieur[cle] = inferieur.get(cle, 0.0) + masse * probabilite
+        return issues
+
+    @staticmethod
+    def deplacer(comptes, courant, suivant, nombre_1, nombre_6):
+        """
+        Méthode statique qui applique un lancer au nombre de dés de chaque joueur: le joueur courant retire ses 1 et
+        passe ses 6 au joueur suivant.
+        Args:
+            comptes (tuple): Nombre de dés de chaque joueur
+            courant (int): Position du joueur courant
+            suivant (int): Position du joueur suivant
+            nombre_1 (int): Nombre de dés de valeur 1 obtenus
+            nombre_6 (int): Nombre de dés de valeur 6 obtenus
+
+        Returns:
+            tuple: Nombre de dés de chaque joueur après le lancer
+        """
+        comptes = list(comptes)
+        comptes[courant] -= nombre_1 + nombre_6
+        comptes[suivant] += nombre_6
+        return tuple(comptes)
+
+    @staticmethod
+    def distribution(etat):
+        """
+        Méthode statique qui retourne les issues d'une ronde et leurs probabilités cumulées, en calculant la
+        distribution au besoin.
+        Args:
+            etat (tuple): Nombre de dés de chaque joueur au début de la ronde, dans l'ordre du jeu
+
+        Returns:
+            list, list: Issues de la ronde et probabilité cumulée jusqu'à chacune
+        """
+        if etat not in DISTRIBUTIONS:
+            probabilites = AvanceRapide.calculer_distribution(etat)
+            issues = sorted(probabilites, key=probabilites.get, reverse=True)
+            cumulees = []
+            total = 0.0
+            for issue in issues:
+                total += probabilites[issue]
+                cumulees.append(total)
+            # La masse négligée est répartie sur toutes les issues
+            DISTRIBUTIONS[etat] = issues, [cumulee / total for cumulee in cumulees]
+        return DISTRIBUTIONS[etat]
+
+    def tirer(self, etat):
+        """
+        Méthode qui tire l'issue d'une ronde.
+        Args:
+            etat (tuple): Nombre de dés de chaque joueur au début de la ronde, dans l'ordre du jeu
+
+        Returns:
+            int, tuple: Position du gagnant et nombre de dés de chaque joueur à la fin de la ronde
+        """
+        issues, cumulees = self.distribution(etat)
+        aleatoire = random if self.generateur is None else self.generateur
+        return issues[min(bisect_right(cumulees, aleatoire.random()), len(issues) - 1)]
+
+    def peut_avancer(self, partie):
+        """
+        Méthode qui vérifie si la ronde d'une partie peut être avancée rapidement: tous les joueurs actifs sont des
+        ordinateurs, ils ne sont pas trop nombreux, et la partie n'est ni affichée ni journalisée.
+        Args:
+            partie (Partie): La partie
+
+        Returns:
+            bool: True si la ronde peut être avancée rapidement, False autrement
+        """
+        if partie.affichage or partie.journal is not None:
+            return False
+        if len(partie.joueurs_actifs) > self.nombre_joueurs_max:
+            return False
+        return all(isinstance(joueur, JoueurOrdinateur) for joueur in partie.joueurs_actifs)
+
+    def avancer(self, partie):
+        """
+        Méthode qui joue la ronde d'une partie en un seul tirage. Les joueurs se retrouvent avec le nombre de dés tiré
+        et le gagnant devient le joueur courant, comme à la fin de Partie.jouer_une_ronde; la fin de ronde est
+        ensuite réglée normalement par Partie.terminer_ronde.
+        Args:
+            partie (Partie): La partie, au début d'une ronde
+        """
+        joueurs = [partie.joueur_courant]
+        for i in range(len(partie.joueurs_actifs) - 1):
+            joueurs.append(partie.anneau_joueurs.voisin(joueurs[-1], partie.sens))
+        gagnant, comptes = self.tirer(tuple(len(joueur.dés) for joueur in joueurs))
+        for joueur, nombre_dés in zip(joueurs, comptes):
+            joueur.reinitialiser_dés(nombre_dés)
+        partie.joueur_courant = joueurs[gagnant]
+        partie.determiner_joueur_suivant()
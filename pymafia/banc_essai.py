@@ -0,0 +1,779 @@
+"""
+Module des bancs d'essai du package pymafia.
+
+La commande
+    python -m pymafia.banc_essai
+mesure le coût d'une bifurcation de partie (voir Partie.bifurquer), avec une copie du générateur ou avec un générateur
+fourni, à côté de celui d'un copy.deepcopy de la partie et de celui d'un tour de jeu, pour quelques nombres de joueurs.
+Elle mesure aussi la mémoire occupée par une partie en cours, selon qu'elle est conservée comme une Partie ou comme un
+EtatPartie, la taille et la durée d'un aller-retour de Partie.en_octets et depuis_octets à côté de celles de pickle,
+le coût de suspendre une table sur disque et de la reprendre (voir MagasinSessions), le temps de
+réponse d'un ServeurPymafia qui héberge des milliers de tables à la fois, le déroulement de parties jouées en même
+temps dans plusieurs fils d'exécution, le coût des messages d'une partie selon qu'elle a une sortie ou non,
+celui d'écrire une longue partie dans un fichier avec un print par message ou avec un RenduConsole, la qualité du
+choix du sens d'un JoueurMonteCarlo selon son budget et le coût de calculer les distributions de la somme des dés
+(voir DistributionsDés) à côté de celui de les lire d'une table, et le nombre de parties par seconde d'un Tournoi
+selon son nombre de processus. Lorsque NumPy est installé, elle compare enfin le
+nombre de parties simulées par seconde par un SimulateurVectorise et par Partie.simuler, de 2 à 8 joueurs.
+"""
+import asyncio
+import copy
+import os
+import pickle
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from pymafia.generateur_des import GenerateurDés
+from pymafia.partie import Partie
+from pymafia.etat_partie import EtatPartie
+from pymafia.serveur import ServeurPymafia
+from pymafia.magasin_sessions import MagasinSessions
+from pymafia.table_jeu import TableJeu
+from pymafia.rendu_console import RenduConsole, RONDE, TOUR
+from pymafia.joueur_monte_carlo import JoueurMonteCarlo
+from pymafia.solveur_sens import SolveurSens
+from pymafia.table_sens import TableSens
+from pymafia.distributions_des import DistributionsDés, NOMBRE_DÉS_TABLE
+from pymafia.tournoi import Tournoi
+
+# Nombres de joueurs des parties mesurées, par défaut
+NOMBRES_JOUEURS = (4, 8, 64)
+
+# Nombre d'appels de chaque mesure, par défaut
+REPETITIONS = 2000
+
+# Nombre de parties conservées pour mesurer la mémoire, par défaut
+NOMBRE_PARTIES = 2000
+
+# Nombre de tables ouvertes en même temps sur le serveur et nombres de clients qui les jouent, par défaut
+NOMBRE_TABLES = 10000
+NOMBRES_CLIENTS = (1, 100)
+
+# Nombres de fils d'exécution qui jouent les parties en même temps, par défaut
+NOMBRES_FILS = (1, 4, 16)
+
+# Budgets du choix du sens d'un JoueurMonteCarlo, en secondes, par défaut
+BUDGETS_MONTE_CARLO = (0.002, 0.008, 0.032, 0.128, 0.512)
+
+# Nombre de parties du tournoi mesuré selon le nombre de processus, par défaut
+NOMBRE_PARTIES_TOURNOI = 20000
+
+# Nombres de parties simulées d'un coup par un SimulateurVectorise, par défaut
+NOMBRES_PARTIES_VECTORISEES = (100, 1000, 10000, 100000, 1000000)
+
+# Nombres de joueurs des parties simulées par un SimulateurVectorise, par défaut
+NOMBRES_JOUEURS_VECTORISES = (2, 3, 8)
+
+
+def mesurer(fonction, repetitions=REPETITIONS):
+    """
+    Fonction qui mesure la durée d'un appel à une fonction. La meilleure de trois séries d'appels est retenue, pour
+    écarter les interruptions du système.
+    Args:
+        fonction (callable): Fonction sans argument à mesurer
+        repetitions (int, optional): Nombre d'appels de chaque série
+
+    Returns:
+        float: Durée d'un appel, en secondes
+    """
+    return min(timeit.repeat(fonction, number=repetitions, repeat=3)) / repetitions
+
+
+def preparer_partie(nombre_joueurs, graine=0):
+    """
+    Fonction qui crée une partie entre joueurs ordinateurs, prête à jouer son premier tour.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs
+        graine (int, optional): Graine du générateur de la partie
+
+    Returns:
+        Partie: La partie
+    """
+    partie = Partie(nombre_joueurs, 0, affichage=False, generateur=GenerateurDés(graine))
+    partie.preparer_une_partie()
+    partie.determiner_sens()
+    partie.determiner_joueur_suivant()
+    return partie
+
+
+def banc_bifurcation(nombre_joueurs, repetitions=REPETITIONS):
+    """
+    Fonction qui mesure le coût d'une bifurcation, d'un copy.deepcopy et d'un tour de jeu d'une partie.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs de la partie
+        repetitions (int, optional): Nombre d'appels de chaque mesure
+
+    Returns:
+        dict: Durée d'un appel, en secondes, selon l'opération ('bifurquer', 'bifurquer_generateur' pour une
+            bifurcation avec un générateur fourni, 'deepcopy' ou 'tour')
+    """
+    partie = preparer_partie(nombre_joueurs)
+    # Les tours sont joués sur une bifurcation, qui recommence une ronde dès qu'un joueur n'a plus de dé
+    partie_jouee = partie.bifurquer()
+
+    def jouer_un_tour():
+        if partie_jouee.jouer_un_tour() is not None:
+            partie_jouee.reinitialiser_dés_joueurs()
+
+    generateur = GenerateurDés(1)
+    return {'bifurquer': mesurer(partie.bifurquer, repetitions),
+            'bifurquer_generateur': mesurer(lambda: partie.bifurquer(generateur), repetitions),
+            'deepcopy': mesurer(lambda: copy.deepcopy(partie), max(1, repetitions // 10)),
+            'tour': mesurer(jouer_un_tour, repetitions)}
+
+
+def afficher_banc_bifurcation(nombres_joueurs=NOMBRES_JOUEURS, repetitions=REPETITIONS):
+    """
+    Fonction qui affiche le coût d'une bifurcation à côté de celui d'un copy.deepcopy et d'un tour de jeu.
+    Args:
+        nombres_joueurs (tuple, optional): Nombres de joueurs des parties mesurées
+        repetitions (int, optional): Nombre d'appels de chaque mesure
+    """
+    print("{:>8} {:>16} {:>16} {:>16} {:>16}".format("joueurs", "bifurquer (µs)", "avec générateur", "deepcopy (µs)",
+                                                     "tour (µs)"))
+    for nombre_joueurs in nombres_joueurs:
+        durees = banc_bifurcation(nombre_joueurs, repetitions)
+        print("{:>8} {:>16.1f} {:>16.1f} {:>16.1f} {:>16.1f}".format(
+            nombre_joueurs, durees['bifurquer'] * 1e6, durees['bifurquer_generateur'] * 1e6,
+            durees['deepcopy'] * 1e6, durees['tour'] * 1e6))
+
+
+def mesurer_memoire(creer, nombre):
+    """
+    Fonction qui mesure la mémoire occupée par un objet, en moyenne sur plusieurs objets conservés ensemble.
+    Args:
+        creer (callable): Fonction sans argument qui crée un objet
+        nombre (int): Nombre d'objets créés
+
+    Returns:
+        float: Mémoire occupée par un objet, en octets
+    """
+    tracemalloc.start()
+    try:
+        avant = tracemalloc.get_traced_memory()[0]
+        objets = [creer() for i in range(nombre)]
+        return (tracemalloc.get_traced_memory()[0] - avant) / len(objets)
+    finally:
+        tracemalloc.stop()
+
+
+def banc_memoire(nombre_joueurs, nombre_parties=NOMBRE_PARTIES):
+    """
+    Fonction qui mesure la mémoire occupée par une partie en cours, comme Partie et comme EtatPartie.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs de la partie
+        nombre_parties (int, optional): Nombre de parties conservées pour la mesure
+
+    Returns:
+        dict: Mémoire occupée par une partie, en octets, selon sa forme ('partie' ou 'etat')
+    """
+    def creer_partie():
+        partie = preparer_partie(nombre_joueurs)
+        partie.jouer_un_tour()
+        return partie
+
+    partie = creer_partie()
+    return {'partie': mesurer_memoire(creer_partie, nombre_parties),
+            'etat': mesurer_memoire(lambda: EtatPartie.depuis_partie(partie), nombre_parties)}
+
+
+def afficher_banc_memoire(nombres_joueurs=NOMBRES_JOUEURS[:2], nombre_parties=NOMBRE_PARTIES):
+    """
+    Fonction qui affiche la mémoire occupée par une partie en cours, comme Partie et comme EtatPartie.
+    Args:
+        nombres_joueurs (tuple, optional): Nombres de joueurs des parties mesurées
+        nombre_parties (int, optional): Nombre de parties conservées pour chaque mesure
+    """
+    print("{:>8} {:>16} {:>16}".format("joueurs", "Partie (octets)", "EtatPartie"))
+    for nombre_joueurs in nombres_joueurs:
+        memoire = banc_memoire(nombre_joueurs, nombre_parties)
+        print("{:>8} {:>16.0f} {:>16.0f}".format(nombre_joueurs, memoire['partie'], memoire['etat']))
+
+
+def banc_serialisation(nombre_joueurs, repetitions=REPETITIONS):
+    """
+    Fonction qui compare la forme binaire d'une partie en cours (voir Partie.en_octets) à pickle: taille et durée
+    d'un aller-retour (sérialiser, puis recréer la partie).
+    Args:
+        nombre_joueurs (int): Nombre de joueurs de la partie
+        repetitions (int, optional): Nombre d'appels de chaque mesure
+
+    Returns:
+        dict: Taille en octets ('octets', 'pickle_octets') et durée d'un aller-retour en secondes ('aller_retour',
+            'pickle_aller_retour')
+    """
+    partie = preparer_partie(nombre_joueurs)
+    for i in range(nombre_joueurs):
+        partie.jouer_un_tour()
+    return {'octets': len(partie.en_octets()),
+            'pickle_octets': len(pickle.dumps(partie, pickle.HIGHEST_PROTOCOL)),
+            'aller_retour': mesurer(lambda: Partie.depuis_octets(partie.en_octets()), repetitions),
+            'pickle_aller_retour': mesurer(lambda: pickle.loads(pickle.dumps(partie, pickle.HIGHEST_PROTOCOL)),
+                                           repetitions)}
+
+
+def afficher_banc_serialisation(nombres_joueurs=(2, 4, 8), repetitions=REPETITIONS):
+    """
+    Fonction qui affiche la taille et la durée d'un aller-retour de la forme binaire d'une partie, à côté de pickle.
+    Args:
+        nombres_joueurs (tuple, optional): Nombres de joueurs des parties mesurées
+        repetitions (int, optional): Nombre d'appels de chaque mesure
+    """
+    print("{:>8} {:>16} {:>16} {:>16} {:>16}".format("joueurs", "octets", "pickle (octets)", "aller-retour (µs)",
+                                                     "pickle (µs)"))
+    for nombre_joueurs in nombres_joueurs:
+        mesures = banc_serialisation(nombre_joueurs, repetitions)
+        print("{:>8} {:>16} {:>16} {:>16.1f} {:>16.1f}".format(
+            nombre_joueurs, mesures['octets'], mesures['pickle_octets'], mesures['aller_retour'] * 1e6,
+            mesures['pickle_aller_retour'] * 1e6))
+
+
+def banc_sessions(nombre_tables=NOMBRE_PARTIES):
+    """
+    Fonction qui mesure le coût de suspendre une table sur disque et de la reprendre, avec un MagasinSessions sur un
+    fichier SQLite temporaire qui ne garde qu'une table en mémoire.
+    Args:
+        nombre_tables (int, optional): Nombre de tables suspendues puis reprises
+
+    Returns:
+        dict: Durée d'une opération, en secondes ('suspendre' ou 'reprendre'), et taille d'une table suspendue, en
+            octets ('octets')
+    """
+    with tempfile.TemporaryDirectory() as dossier:
+        magasin = MagasinSessions(os.path.join(dossier, 'sessions.sqlite'), capacite=1)
+        for identifiant in range(1, nombre_tables + 1):
+            magasin.tables[identifiant] = TableJeu(identifiant, 4, 1, 5, identifiant)
+        debut = time.perf_counter()
+        for identifiant in range(1, nombre_tables + 1):
+            magasin.suspendre(identifiant)
+        suspendre = (time.perf_counter() - debut) / nombre_tables
+        octets = magasin.connexion.execute("SELECT AVG(LENGTH(donnees)) FROM tables").fetchone()[0]
+        debut = time.perf_counter()
+        for identifiant in range(1, nombre_tables + 1):
+            magasin.reprendre(identifiant)
+        reprendre = (time.perf_counter() - debut) / nombre_tables
+        magasin.fermer()
+    return {'suspendre': suspendre, 'reprendre': reprendre, 'octets': octets}
+
+
+def afficher_banc_sessions(nombre_tables=NOMBRE_PARTIES):
+    """
+    Fonction qui affiche le coût de suspendre une table sur disque et de la reprendre.
+    Args:
+        nombre_tables (int, optional): Nombre de tables suspendues puis reprises
+    """
+    mesures = banc_sessions(nombre_tables)
+    print("{:>16} {:>16} {:>16}".format("suspendre (µs)", "reprendre (µs)", "octets/table"))
+    print("{:>16.1f} {:>16.1f} {:>16.0f}".format(mesures['suspendre'] * 1e6, mesures['reprendre'] * 1e6,
+                                                 mesures['octets']))
+
+
+def banc_serveur(nombre_tables=NOMBRE_TABLES, nombre_clients=NOMBRES_CLIENTS[0]):
+    """
+    Fonction qui mesure le temps de réponse d'un ServeurPymafia sur localhost. Les clients ouvrent chacun leur part
+    des tables (4 joueurs dont 1 humain, 5 rondes), puis les jouent jusqu'à la fin en parallèle: chaque client répond
+    à tour de rôle à la demande de chacune de ses tables. Client et serveur partagent le même processus et le même
+    coeur, ce qui compte aussi le travail des clients dans le temps de réponse.
+    Args:
+        nombre_tables (int, optional): Nombre de tables ouvertes en même temps
+        nombre_clients (int, optional): Nombre de connexions
+
+    Returns:
+        dict: 'tables' (nombre de tables ouvertes au plus fort), 'mémoire' (octets par table ouverte), 'actions'
+            (nombre de commandes), 'débit' (commandes par seconde), 'médiane' et 'p99' (temps de réponse d'une
+            commande, en secondes, vu par le client) et 'traitement' (temps moyen de ServeurPymafia.interpreter par
+            commande, en secondes)
+    """
+    durees = []
+    mesures = {}
+
+    async def client(port, nombre, pret):
+        lecteur, ecrivain = await asyncio.open_connection('127.0.0.1', port)
+
+        async def envoyer(commande):
+            debut = time.perf_counter()
+            ecrivain.write((commande + '\n').encode('utf-8'))
+            await ecrivain.drain()
+            reponse = (await lecteur.readline()).decode('utf-8').split()
+            durees.append(time.perf_counter() - debut)
+            return reponse
+
+        demandes = [await envoyer("NOUVELLE 4 1 5") for i in range(nombre)]
+        await pret.wait()
+        while demandes:
+            reponses = []
+            for demande in demandes:
+                if demande[0] == 'DEMANDE':
+                    commande = {'SENS': "SENS {} O", 'LANCER': "LANCER {}", 'CONTINUER': "CONTINUER {}"}[demande[2]]
+                    reponses.append(await envoyer(commande.format(demande[1])))
+            demandes = reponses
+        ecrivain.close()
+
+    async def principal():
+        serveur = ServeurPymafia(port=0)
+        interpreter = serveur.interpreter
+
+        def interpreter_mesure(commande):
+            debut = time.perf_counter()
+            reponse = interpreter(commande)
+            mesures['traitement'] = mesures.get('traitement', 0) + time.perf_counter() - debut
+            return reponse
+
+        serveur.interpreter = interpreter_mesure
+        await serveur.demarrer()
+        tracemalloc.start()
+        avant = tracemalloc.get_traced_memory()[0]
+        pret = asyncio.Event()
+        taches = [asyncio.ensure_future(client(serveur.port, nombre_tables // nombre_clients, pret))
+                  for i in range(nombre_clients)]
+        while len(durees) < nombre_clients * (nombre_tables // nombre_clients):
+            await asyncio.sleep(0.01)
+        mesures['tables'] = len(serveur.tables)
+        mesures['mémoire'] = (tracemalloc.get_traced_memory()[0] - avant) / max(1, len(serveur.tables))
+        tracemalloc.stop()
+        durees.clear()
+        mesures['traitement'] = 0
+        debut = time.perf_counter()
+        pret.set()
+        await asyncio.gather(*taches)
+        mesures['durée'] = time.perf_counter() - debut
+        await serveur.fermer()
+
+    asyncio.run(principal())
+    durees.sort()
+    return {'tables': mesures['tables'], 'mémoire': mesures['mémoire'], 'actions': len(durees),
+            'débit': len(durees) / mesures['durée'], 'médiane': durees[len(durees) // 2],
+            'p99': durees[int(len(durees) * 0.99)], 'traitement': mesures['traitement'] / len(durees)}
+
+
+def afficher_banc_serveur(nombre_tables=NOMBRE_TABLES, nombres_clients=NOMBRES_CLIENTS):
+    """
+    Fonction qui affiche le temps de réponse d'un ServeurPymafia qui héberge des milliers de tables à la fois. Avec un
+    seul client, c'est le temps d'un aller-retour; avec plusieurs, les commandes attendent aussi leur tour.
+    Args:
+        nombre_tables (int, optional): Nombre de tables ouvertes en même temps
+        nombres_clients (tuple, optional): Nombres de connexions des mesures
+    """
+    print("{:>8} {:>8} {:>16} {:>16} {:>16} {:>16} {:>16}".format(
+        "tables", "clients", "octets/table", "commandes/s", "médiane (µs)", "99e cent. (µs)", "traitement (µs)"))
+    for nombre_clients in nombres_clients:
+        mesures = banc_serveur(nombre_tables, nombre_clients)
+        print("{:>8} {:>8} {:>16.0f} {:>16.0f} {:>16.0f} {:>16.0f} {:>16.0f}".format(
+            mesures['tables'], nombre_clients, mesures['mémoire'], mesures['débit'], mesures['médiane'] * 1e6,
+            mesures['p99'] * 1e6, mesures['traitement'] * 1e6))
+
+
+def jouer_partie_graine(graine):
+    """
+    Fonction qui joue une partie complète entre 4 joueurs ordinateurs, en 5 rondes au plus.
+    Args:
+        graine (int): Graine du générateur de la partie
+
+    Returns:
+        tuple: Scores des joueurs et nombre de tours de la partie
+    """
+    partie = Partie(4, 0, affichage=False, generateur=GenerateurDés(graine))
+    partie.ronde_max = 5
+    resultat = partie.simuler()
+    return resultat.scores, resultat.nombre_tours
+
+
+def banc_fils(nombre_parties=NOMBRE_PARTIES, nombres_fils=NOMBRES_FILS):
+    """
+    Fonction qui joue les mêmes parties (une graine chacune) une à une, puis dans un ThreadPoolExecutor pour chaque
+    nombre de fils, et vérifie que chaque partie s'est déroulée de la même façon. L'interpréteur change de fil toutes
+    les microsecondes pendant la mesure, pour que les parties s'entrelacent le plus possible.
+    Args:
+        nombre_parties (int, optional): Nombre de parties jouées à chaque mesure
+        nombres_fils (tuple, optional): Nombres de fils d'exécution des mesures
+
+    Returns:
+        dict: Selon le nombre de fils, la durée d'une partie en secondes ('durée') et le nombre de parties dont le
+            résultat diffère de celui de la partie jouée seule ('différences')
+    """
+    graines = list(range(nombre_parties))
+    attendus = [jouer_partie_graine(graine) for graine in graines]
+    mesures = {}
+    intervalle = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for nombre_fils in nombres_fils:
+            debut = time.perf_counter()
+            with ThreadPoolExecutor(nombre_fils) as executeur:
+                resultats = list(executeur.map(jouer_partie_graine, graines))
+            duree = (time.perf_counter() - debut) / nombre_parties
+            mesures[nombre_fils] = {'durée': duree,
+                                    'différences': sum(1 for attendu, resultat in zip(attendus, resultats)
+                                                       if attendu != resultat)}
+    finally:
+        sys.setswitchinterval(intervalle)
+    return mesures
+
+
+def afficher_banc_fils(nombre_parties=NOMBRE_PARTIES, nombres_fils=NOMBRES_FILS):
+    """
+    Fonction qui affiche la durée des parties jouées dans plusieurs fils d'exécution, et le nombre de parties dont
+    le déroulement a changé (toujours 0, puisque chaque partie a son propre générateur).
+    Args:
+        nombre_parties (int, optional): Nombre de parties jouées à chaque mesure
+        nombres_fils (tuple, optional): Nombres de fils d'exécution des mesures
+    """
+    print("{:>8} {:>16} {:>16}".format("fils", "partie (µs)", "différences"))
+    for nombre_fils, mesures in banc_fils(nombre_parties, nombres_fils).items():
+        print("{:>8} {:>16.1f} {:>16}".format(nombre_fils, mesures['durée'] * 1e6, mesures['différences']))
+
+
+def banc_narration(repetitions=REPETITIONS // 10):
+    """
+    Fonction qui mesure la durée d'une partie complète entre 4 joueurs ordinateurs (5 rondes au plus) sans sortie,
+    avec une sortie qui ignore ses messages et avec une sortie qui rend chaque message en texte.
+    Args:
+        repetitions (int, optional): Nombre de parties de chaque mesure
+
+    Returns:
+        dict: Durée d'une partie en secondes, selon la sortie ('aucune', 'ignorés' ou 'rendus')
+    """
+    def jouer(sortie):
+        partie = Partie(4, 0, affichage=False, generateur=GenerateurDés(0), sortie=sortie)
+        partie.ronde_max = 5
+        # La partie est menée sans executer, qui attendrait une touche à la fin de chaque ronde
+        etapes = partie.etapes()
+        try:
+            while True:
+                etapes.send(None)
+        except StopIteration:
+            pass
+
+    return {'aucune': mesurer(lambda: jouer(None), repetitions),
+            'ignorés': mesurer(lambda: jouer(lambda message: None), repetitions),
+            'rendus': mesurer(lambda: jouer(str), repetitions)}
+
+
+def afficher_banc_narration(repetitions=REPETITIONS // 10):
+    """
+    Fonction qui affiche la durée d'une partie selon que ses messages sont absents, ignorés ou rendus en texte.
+    Args:
+        repetitions (int, optional): Nombre de parties de chaque mesure
+    """
+    mesures = banc_narration(repetitions)
+    print("{:>16} {:>16} {:>16}".format("sans sortie (µs)", "ignorés (µs)", "rendus (µs)"))
+    print("{:>16.1f} {:>16.1f} {:>16.1f}".format(mesures['aucune'] * 1e6, mesures['ignorés'] * 1e6,
+                                                 mesures['rendus'] * 1e6))
+
+
+def banc_rendu(nombre_rondes=100):
+    """
+    Fonction qui mesure la durée d'une longue partie entre 8 joueurs ordinateurs écrite dans un fichier temporaire:
+    sans sortie, avec un print par message dans un fichier à tampon de ligne (comme un terminal), et avec un
+    RenduConsole qui écrit chaque ronde d'un coup, à la verbosité des tours puis des rondes.
+    Args:
+        nombre_rondes (int, optional): Nombre maximal de rondes de la partie
+
+    Returns:
+        dict: Durée de la partie en secondes, selon la sortie ('aucune', 'print', 'tours' ou 'rondes')
+    """
+    def jouer(creer_sortie):
+        with tempfile.TemporaryFile('w+', buffering=1, encoding='utf-8') as fichier:
+            partie = Partie(8, 0, affichage=False, generateur=GenerateurDés(0), sortie=creer_sortie(fichier))
+            partie.ronde_max = nombre_rondes
+            debut = time.perf_counter()
+            # La partie est menée sans executer, qui attendrait une touche à la fin de chaque ronde
+            etapes = partie.etapes()
+            try:
+                while True:
+                    etapes.send(None)
+            except StopIteration:
+                pass
+            partie.terminer_une_partie()
+            return time.perf_counter() - debut
+
+    def mesurer_partie(creer_sortie):
+        return min(jouer(creer_sortie) for i in range(3))
+
+    return {'aucune': mesurer_partie(lambda fichier: None),
+            'print': mesurer_partie(lambda fichier: lambda message: print(message, file=fichier)),
+            'tours': mesurer_partie(lambda fichier: RenduConsole(TOUR, fichier)),
+            'rondes': mesurer_partie(lambda fichier: RenduConsole(RONDE, fichier))}
+
+
+def afficher_banc_rendu(nombre_rondes=100):
+    """
+    Fonction qui affiche la durée d'une longue partie écrite dans un fichier, selon sa sortie.
+    Args:
+        nombre_rondes (int, optional): Nombre maximal de rondes de la partie
+    """
+    mesures = banc_rendu(nombre_rondes)
+    print("{:>16} {:>16} {:>16} {:>16}".format("sans sortie (ms)", "print (ms)", "rendu tours (ms)",
+                                               "rendu rondes (ms)"))
+    print("{:>16.1f} {:>16.1f} {:>16.1f} {:>16.1f}".format(mesures['aucune'] * 1e3, mesures['print'] * 1e3,
+                                                           mesures['tours'] * 1e3, mesures['rondes'] * 1e3))
+
+
+def etats_deuxieme_ronde(nombre_etats):
+    """
+    Fonction qui joue la première ronde de parties entre 3 joueurs ordinateurs (une graine chacune) et retourne les
+    scores que trouve le gagnant au début de la deuxième ronde, lorsqu'il choisit le sens (voir TableSens.etat_partie).
+    Les parties dont un joueur a été éliminé sont écartées.
+    Args:
+        nombre_etats (int): Nombre d'états à retourner
+
+    Returns:
+        list: Scores des joueurs à partir du gagnant de la première ronde, pour chaque partie
+    """
+    etats = []
+    graine = 0
+    while len(etats) < nombre_etats:
+        partie = Partie(3, 0, affichage=False, generateur=GenerateurDés(graine))
+        partie.ronde_max = 2
+        next(partie.etapes())
+        partie.premier_joueur = partie.joueur_courant
+        scores, rondes = TableSens.etat_partie(partie)
+        if len(scores) == 3:
+            etats.append(scores)
+        graine += 1
+    return etats
+
+
+def banc_monte_carlo(nombre_etats=10, repetitions=6, budgets=BUDGETS_MONTE_CARLO):
+    """
+    Fonction qui mesure la qualité du choix du sens d'un JoueurMonteCarlo selon son budget, dans les états de la
+    deuxième ronde de parties réelles (voir etats_deuxieme_ronde), lorsqu'il reste une seule ronde à jouer. La
+    probabilité de victoire de chaque sens est calculée exactement par SolveurSens: la probabilité de victoire d'un
+    choix est celle du sens choisi, ou la moyenne des deux sens lorsque le joueur choisit au hasard.
+    Args:
+        nombre_etats (int, optional): Nombre d'états
+        repetitions (int, optional): Nombre de choix dans chaque état, pour chaque budget
+        budgets (tuple, optional): Budgets mesurés, en secondes
+
+    Returns:
+        dict: Selon le budget, le nombre moyen de simulations d'un choix ('simulations'), la proportion des choix du
+            meilleur sens ('meilleur') et la probabilité de victoire moyenne des choix ('victoire'). Les clés
+            'hasard' et 'optimum' donnent la probabilité de victoire moyenne d'un choix au hasard et du meilleur sens.
+    """
+    solveur = SolveurSens()
+    etats = etats_deuxieme_ronde(nombre_etats)
+    valeurs = [solveur.valeurs_sens(scores, 1) for scores in etats]
+    mesures = {'hasard': sum(croissant + decroissant for croissant, decroissant in valeurs) / (2 * len(valeurs)),
+               'optimum': sum(max(croissant, decroissant) for croissant, decroissant in valeurs) / len(valeurs)}
+    for budget in budgets:
+        joueur = JoueurMonteCarlo(1, budget, graine=0)
+        simulations = meilleurs = 0
+        victoire = 0.0
+        for scores, (croissant, decroissant) in zip(etats, valeurs):
+            valeur = {1: croissant, -1: decroissant}
+            for i in range(repetitions):
+                victoires, visites = joueur.rechercher(scores, 1, time.perf_counter() + budget)
+                simulations += joueur.nombre_simulations
+                if visites[1] and visites[-1] and victoires[1] / visites[1] != victoires[-1] / visites[-1]:
+                    sens = max((1, -1), key=lambda s: victoires[s] / visites[s])
+                    victoire += valeur[sens]
+                    meilleurs += valeur[sens] == max(croissant, decroissant)
+                else:
+                    victoire += (croissant + decroissant) / 2
+                    meilleurs += 0.5
+        nombre_choix = len(etats) * repetitions
+        mesures[budget] = {'simulations': simulations / nombre_choix, 'meilleur': meilleurs / nombre_choix,
+                           'victoire': victoire / nombre_choix}
+    return mesures
+
+
+def afficher_banc_monte_carlo(nombre_etats=10, repetitions=6, budgets=BUDGETS_MONTE_CARLO):
+    """
+    Fonction qui affiche, pour chaque budget d'un JoueurMonteCarlo, le nombre de simulations d'un choix du sens, la
+    proportion des choix du meilleur sens et la probabilité de victoire moyenne des choix, à côté de celles d'un choix
+    au hasard et du meilleur sens.
+    Args:
+        nombre_etats (int, optional): Nombre d'états
+        repetitions (int, optional): Nombre de choix dans chaque état, pour chaque budget
+        budgets (tuple, optional): Budgets mesurés, en secondes
+    """
+    mesures = banc_monte_carlo(nombre_etats, repetitions, budgets)
+    print("{:>12} {:>16} {:>16} {:>16}".format("budget (ms)", "simulations", "meilleur sens", "victoire"))
+    print("{:>12} {:>16} {:>16.3f} {:>16.4f}".format("hasard", 0, 0.5, mesures['hasard']))
+    for budget in budgets:
+        print("{:>12.1f} {:>16.0f} {:>16.3f} {:>16.4f}".format(budget * 1e3, mesures[budget]['simulations'],
+                                                               mesures[budget]['meilleur'],
+                                                               mesures[budget]['victoire']))
+    print("{:>12} {:>16} {:>16.3f} {:>16.4f}".format("optimum", "", 1.0, mesures['optimum']))
+
+
+def banc_distributions(nombre_dés_max=NOMBRE_DÉS_TABLE, repetitions=REPETITIONS // 20):
+    """
+    Fonction qui mesure la durée du calcul des comptes de la somme de 0 à nombre_dés_max dés par un nouveau
+    DistributionsDés, à côté de celle de la lecture de la même table dans un fichier (voir DistributionsDés.charger).
+    Args:
+        nombre_dés_max (int, optional): Plus grand nombre de dés
+        repetitions (int, optional): Nombre d'appels de chaque mesure
+
+    Returns:
+        dict: Durée du calcul ('calcul') et de la lecture ('lecture'), en secondes, et taille du fichier ('octets')
+    """
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, 'distributions.bin')
+        DistributionsDés().sauvegarder(chemin, nombre_dés_max)
+        return {'calcul': mesurer(lambda: DistributionsDés().comptes_somme(nombre_dés_max), repetitions),
+                'lecture': mesurer(lambda: DistributionsDés(chemin), repetitions),
+                'octets': os.path.getsize(chemin)}
+
+
+def afficher_banc_distributions(nombre_dés_max=NOMBRE_DÉS_TABLE, repetitions=REPETITIONS // 20):
+    """
+    Fonction qui affiche la durée du calcul et de la lecture des distributions de la somme des dés.
+    Args:
+        nombre_dés_max (int, optional): Plus grand nombre de dés
+        repetitions (int, optional): Nombre d'appels de chaque mesure
+    """
+    mesures = banc_distributions(nombre_dés_max, repetitions)
+    print("{:>10} {:>16} {:>16} {:>16}".format("dés", "calcul (ms)", "lecture (ms)", "table (octets)"))
+    print("{:>10} {:>16.3f} {:>16.3f} {:>16}".format(nombre_dés_max, mesures['calcul'] * 1e3,
+                                                     mesures['lecture'] * 1e3, mesures['octets']))
+
+
+def nombres_processus_tournoi():
+    """
+    Fonction qui retourne les nombres de processus mesurés par défaut pour un tournoi: les puissances de 2 jusqu'au
+    nombre de coeurs de la machine, et ce nombre lui-même.
+    Returns:
+        tuple: Nombres de processus, en ordre croissant
+    """
+    nombre_coeurs = os.cpu_count() or 1
+    nombres = [1]
+    while nombres[-1] * 2 <= nombre_coeurs:
+        nombres.append(nombres[-1] * 2)
+    if nombres[-1] != nombre_coeurs:
+        nombres.append(nombre_coeurs)
+    return tuple(nombres)
+
+
+def banc_tournoi(nombre_parties=NOMBRE_PARTIES_TOURNOI, nombres_processus=None, nombre_joueurs=4, ronde_max=5):
+    """
+    Fonction qui mesure le nombre de parties par seconde d'un Tournoi selon son nombre de processus (l'option --jobs
+    de python -m pymafia simulate), création et arrêt des processus compris. Le tournoi a une graine: ses totaux
+    doivent être les mêmes quel que soit le nombre de processus, ce qui est vérifié au passage.
+    Args:
+        nombre_parties (int, optional): Nombre de parties du tournoi
+        nombres_processus (tuple, optional): Nombres de processus mesurés (par défaut, voir nombres_processus_tournoi)
+        nombre_joueurs (int, optional): Nombre de joueurs de chaque partie
+        ronde_max (int, optional): Nombre maximal de rondes de chaque partie
+
+    Returns:
+        dict: Nombre de parties par seconde selon le nombre de processus
+    """
+    if nombres_processus is None:
+        nombres_processus = nombres_processus_tournoi()
+    mesures = {}
+    totaux = set()
+    for nombre_processus in nombres_processus:
+        tournoi = Tournoi(nombre_parties, nombre_joueurs, ronde_max, graine=0)
+        debut = time.perf_counter()
+        tournoi.simuler(nombre_processus)
+        mesures[nombre_processus] = nombre_parties / (time.perf_counter() - debut)
+        totaux.add((tuple(sorted(tournoi.victoires.items())), tournoi.total_rondes, tournoi.total_tours,
+                    tournoi.total_points_transférés))
+    if len(totaux) > 1:
+        raise RuntimeError("Les totaux du tournoi dépendent du nombre de processus.")
+    return mesures
+
+
+def afficher_banc_tournoi(nombre_parties=NOMBRE_PARTIES_TOURNOI, nombres_processus=None):
+    """
+    Fonction qui affiche le nombre de parties par seconde d'un Tournoi selon son nombre de processus, avec
+    l'accélération par rapport à un seul processus et l'efficacité (accélération divisée par le nombre de processus).
+    Args:
+        nombre_parties (int, optional): Nombre de parties du tournoi
+        nombres_processus (tuple, optional): Nombres de processus mesurés (par défaut, voir nombres_processus_tournoi)
+    """
+    mesures = banc_tournoi(nombre_parties, nombres_processus)
+    reference = mesures[min(mesures)] * min(mesures)
+    print("{} coeur(s) disponible(s)".format(os.cpu_count()))
+    print("{:>12} {:>16} {:>14} {:>12}".format("processus", "parties/s", "accélération", "efficacité"))
+    for nombre_processus, debit in mesures.items():
+        print("{:>12} {:>16.0f} {:>14.2f} {:>12.2f}".format(nombre_processus, debit, debit / reference,
+                                                            debit / reference / nombre_processus))
+
+
+def banc_simulateur_vectorise(nombre_joueurs=3, ronde_max=2, nombres_parties=NOMBRES_PARTIES_VECTORISEES,
+                              nombre_parties_partie=NOMBRE_PARTIES):
+    """
+    Fonction qui mesure le nombre de parties simulées par seconde par un SimulateurVectorise, selon le nombre de
+    parties simulées d'un coup, et par Partie.simuler, une partie à la fois.
+    Args:
+        nombre_joueurs (int, optional): Nombre de joueurs de chaque partie
+        ronde_max (int, optional): Nombre maximal de rondes de chaque partie
+        nombres_parties (tuple, optional): Nombres de parties simulées d'un coup par le simulateur vectorisé
+        nombre_parties_partie (int, optional): Nombre de parties simulées avec Partie.simuler
+
+    Returns:
+        dict: Nombre de parties par seconde selon le nombre de parties du simulateur vectorisé, et pour
+            Partie.simuler sous la clé 'partie'. None si NumPy n'est pas installé.
+    """
+    try:
+        from pymafia.simulateur_vectorise import SimulateurVectorise
+    except ImportError:
+        return None
+
+    debut = time.perf_counter()
+    for graine in range(nombre_parties_partie):
+        partie = Partie(nombre_joueurs, 0, affichage=False, generateur=GenerateurDés(graine))
+        partie.ronde_max = ronde_max
+        partie.simuler()
+    mesures = {'partie': nombre_parties_partie / (time.perf_counter() - debut)}
+
+    for nombre_parties in nombres_parties:
+        debut = time.perf_counter()
+        SimulateurVectorise(nombre_parties, nombre_joueurs, ronde_max=ronde_max, graine=0).simuler()
+        mesures[nombre_parties] = nombre_parties / (time.perf_counter() - debut)
+    return mesures
+
+
+def afficher_banc_simulateur_vectorise(nombres_joueurs=NOMBRES_JOUEURS_VECTORISES, ronde_max=2,
+                                       nombres_parties=NOMBRES_PARTIES_VECTORISEES):
+    """
+    Fonction qui affiche, pour chaque nombre de joueurs, le nombre de parties simulées par seconde par Partie.simuler
+    et par un SimulateurVectorise, avec le gain du simulateur vectorisé, ou un avis si NumPy n'est pas installé.
+    Args:
+        nombres_joueurs (tuple, optional): Nombres de joueurs des parties
+        ronde_max (int, optional): Nombre maximal de rondes de chaque partie
+        nombres_parties (tuple, optional): Nombres de parties simulées d'un coup par le simulateur vectorisé
+    """
+    print("{:>8} {:>20} {:>16} {:>10}".format("joueurs", "simulateur", "parties/s", "gain"))
+    for nombre_joueurs in nombres_joueurs:
+        mesures = banc_simulateur_vectorise(nombre_joueurs, ronde_max, nombres_parties)
+        if mesures is None:
+            print("NumPy n'est pas installé: le simulateur vectorisé n'est pas mesuré.")
+            return
+        print("{:>8} {:>20} {:>16.0f} {:>10.1f}".format(nombre_joueurs, "Partie.simuler", mesures['partie'], 1.0))
+        for nombre_parties in nombres_parties:
+            print("{:>8} {:>20} {:>16.0f} {:>10.1f}".format(nombre_joueurs, "vectorisé ({})".format(nombre_parties),
+                                                            mesures[nombre_parties],
+                                                            mesures[nombre_parties] / mesures['partie']))
+
+
+if __name__ == '__main__':
+    afficher_banc_bifurcation()
+    print()
+    afficher_banc_memoire()
+    print()
+    afficher_banc_serialisation()
+    print()
+    afficher_banc_sessions()
+    print()
+    afficher_banc_serveur()
+    print()
+    afficher_banc_fils()
+    print()
+    afficher_banc_narration()
+    print()
+    afficher_banc_rendu()
+    print()
+    afficher_banc_monte_carlo()
+    print()
+    afficher_banc_distributions()
+    print()
+    afficher_banc_tournoi()
+    print()
+    afficher_banc_simulateur_vectorise()
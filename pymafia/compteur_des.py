@@ -0,0 +1,201 @@
+"""
+Module de la classe CompteurDés
+"""
+
+import random
+
+from pymafia.de import Dé
+
+
+class CompteurDés:
+    """
+    Classe pour une main de dés compacte. Au lieu de conserver un objet Dé par dé, on conserve le nombre de dés
+    ayant chacune des 6 valeurs. Compter, retirer ou ajouter des dés d'une valeur se fait alors en temps constant.
+
+    Un CompteurDés se comporte comme la liste de dés d'un joueur pour len, str, l'itération et l'indexation. Les dés
+    sont alors présentés en ordre croissant de valeur.
+
+    Attributes:
+        comptes (list): Nombre de dés de chaque valeur (l'index 0 n'est pas utilisé, l'index 6 donne le nombre de 6)
+        nombre (int): Nombre total de dés
+        generateur (GenerateurDés): source des valeurs aléatoires des dés (None pour utiliser le module random)
+        echantillonneur (EchantillonneurDés): tire le résultat d'un lancer de tous les dés en une seule opération
+            (None pour lancer les dés un à un)
+    """
+
+    def __init__(self, nombre_dés=0, valeur=1, generateur=None, echantillonneur=None):
+        """
+        Constructeur de la classe CompteurDés
+        Args:
+            nombre_dés (int, optional): Nombre de dés initial
+            valeur (int, optional): Valeur initiale de ces dés
+            generateur (GenerateurDés, optional): source des valeurs aléatoires des dés
+            echantillonneur (EchantillonneurDés, optional): tire le résultat d'un lancer de tous les dés en une seule
+                opération. Le nombre de 1, le nombre de 6 et la somme des dés suivent alors exactement la même
+                distribution, mais les valeurs 2 à 5 ne sont pas tirées individuellement.
+        """
+        self.comptes = [0] * 7
+        self.comptes[valeur] = nombre_dés
+        self.nombre = nombre_dés
+        self.generateur = generateur
+        self.echantillonneur = echantillonneur
+
+    def rouler(self):
+        """
+        Méthode qui modifie aléatoirement la valeur de tous les dés, en choisissant pour chacun une valeur entre 1 et 6.
+        """
+        if self.echantillonneur is not None:
+            self.comptes = self.echantillonneur.tirer_comptes(self.nombre)
+            return
+        comptes = [0] * 7
+        if self.generateur is None:
+            for i in range(self.nombre):
+                comptes[random.randint(1, 6)] += 1
+        else:
+            for valeur in self.generateur.lancer_plusieurs(self.nombre):
+                comptes[valeur] += 1
+        self.comptes = comptes
+
+    def compter(self, valeur):
+        """
+        Méthode qui retourne le nombre de dés ayant une certaine valeur.
+        Args:
+            valeur (int): Nombre entre 1 et 6
+
+        Returns:
+            int: Nombre de dés ayant cette valeur
+        """
+        return self.comptes[valeur]
+
+    def retirer(self, valeur):
+        """
+        Méthode qui retire tous les dés ayant une certaine valeur.
+        Args:
+            valeur (int): Nombre entre 1 et 6 du ou des dés à retirer
+        """
+        self.nombre -= self.comptes[valeur]
+        self.comptes[valeur] = 0
+
+    def ajouter(self, valeur, nombre_dés=1):
+        """
+        Méthode qui ajoute des dés d'une certaine valeur.
+        Args:
+            valeur (int): Valeur des dés à ajouter
+            nombre_dés (int, optional): Nombre de dés à ajouter
+        """
+        self.comptes[valeur] += nombre_dés
+        self.nombre += nombre_dés
+
+    def vider(self):
+        """
+        Méthode qui retire tous les dés.
+        """
+        self.comptes = [0] * 7
+        self.nombre = 0
+
+    def reinitialiser(self, nombre_dés):
+        """
+        Méthode qui remplace les dés par un certain nombre de dés de valeur 1, comme le fait le constructeur.
+        Args:
+            nombre_dés (int): Nombre de dés
+        """
+        self.comptes = [0, nombre_dés, 0, 0, 0, 0, 0]
+        self.nombre = nombre_dés
+
+    def copier(self, generateur=None, echantillonneur=None):
+        """
+        Méthode qui crée une copie indépendante des dés.
+        Args:
+            generateur (GenerateurDés, optional): source des valeurs aléatoires de la copie
+            echantillonneur (EchantillonneurDés, optional): tire le résultat des lancers de la copie
+
+        Returns:
+            CompteurDés: La copie
+        """
+        copie = CompteurDés(generateur=generateur, echantillonneur=echantillonneur)
+        copie.comptes = list(self.comptes)
+        copie.nombre = self.nombre
+        return copie
+
+    def total(self):
+        """
+        Méthode qui calcule la somme de la valeur des dés.
+        Returns:
+            int: Somme de la valeur des dés
+        """
+        comptes = self.comptes
+        return comptes[1] + 2 * comptes[2] + 3 * comptes[3] + 4 * comptes[4] + 5 * comptes[5] + 6 * comptes[6]
+
+    def valeurs(self):
+        """
+        Méthode qui retourne la valeur de chacun des dés, en ordre croissant.
+        Returns:
+            list: Valeur de chaque dé
+        """
+        valeurs = []
+        for valeur in range(1, 7):
+            valeurs += [valeur] * self.comptes[valeur]
+        return valeurs
+
+    def __len__(self):
+        """
+        Méthode qui retourne le nombre de dés.
+        Returns:
+            int: Nombre de dés
+        """
+        return self.nombre
+
+    def __iter__(self):
+        """
+        Méthode qui permet de parcourir les dés comme des objets Dé, en ordre croissant de valeur.
+        Returns:
+            iterator: Itérateur sur les dés
+        """
+        return (Dé(valeur) for valeur in self.valeurs())
+
+    def __getitem__(self, index):
+        """
+        Méthode qui retourne un dé selon sa position, en ordre croissant de valeur.
+        Args:
+            index (int): Position du dé
+        Returns:
+            Dé: Le dé à cette position
+        """
+        return Dé(self.valeurs()[index])
+
+    def __eq__(self, other):
+        """
+        Méthode qui définit l'opérateur == pour la classe CompteurDés. Un CompteurDés est égal à un autre CompteurDés
+        ou à une liste de dés qui contient le même nombre de dés de chaque valeur.
+        Args:
+            other (CompteurDés ou list): autre main de dés pour la comparaison
+        Returns:
+            bool: True si les deux mains ont les mêmes dés, False autrement
+        """
+        if isinstance(other, CompteurDés):
+            return self.comptes == other.comptes
+        if isinstance(other, list):
+            return self.valeurs() == sorted(dé.valeur for dé in other)
+        return False
+
+    def __ne__(self, other):
+        """
+        Méthode qui définit l'opérateur != pour la classe CompteurDés
+        Args:
+            other (CompteurDés ou list): autre main de dés pour la comparaison
+        Returns:
+            bool: True si les deux mains n'ont pas les mêmes dés, False autrement
+        """
+        return not self == other
+
+    def __str__(self):
+        """
+        Méthode qui retourne une représentation des dés en chaîne de caractères, comme celle d'une liste de dés.
+        Par exemple, '[⚀, ⚃, ⚃]'.
+        Returns:
+            str: Représentation des dés
+        """
+        return str(list(self))
+
+    def __repr__(self):
+        return str(self)
@@ -3,6 +3,12 @@ Module de la classe Dé
 """
 
 import random
+import struct
+
+# Format binaire d'un dé: signature, version et valeur
+ENTETE = struct.Struct('<4sBB')
+SIGNATURE = b'PYDE'
+VERSION = 1
 
 
 class Dé:
@@ -11,21 +17,74 @@ class Dé:
 
     Attributes:
         valeur (int): valeur actuelle du dé
+        generateur (GenerateurDés): source des valeurs aléatoires du dé (None pour utiliser le module random)
     """
 
-    def __init__(self, valeur=1):
+    def __init__(self, valeur=1, generateur=None):
         """
         Constructeur de la classe Dé
         Args:
             valeur (int, optional): valeur initiale du dé
+            generateur (GenerateurDés, optional): source des valeurs aléatoires du dé
         """
         self.valeur = valeur
+        self.generateur = generateur
 
     def rouler(self):
         """
         Méthode qui modifie la valeur actuelle du dé en choisissant aléatoirement une valeur entre 1 et 6.
         """
-        self.valeur = random.randint(1, 6)
+        if self.generateur is None:
+            self.valeur = random.randint(1, 6)
+        else:
+            self.valeur = self.generateur.lancer()
+
+    def en_octets(self):
+        """
+        Méthode qui retourne le dé sous une forme binaire compacte et versionnée.
+        Returns:
+            bytes: Le dé
+        """
+        return ENTETE.pack(SIGNATURE, VERSION, self.valeur)
+
+    @staticmethod
+    def depuis_octets(donnees, generateur=None):
+        """
+        Méthode statique qui recrée un dé à partir de la forme binaire retournée par en_octets.
+        Args:
+            donnees (bytes): Le dé
+            generateur (GenerateurDés, optional): source des valeurs aléatoires du dé
+
+        Returns:
+            Dé: Le dé
+        """
+        signature, version, valeur = ENTETE.unpack_from(donnees)
+        if signature != SIGNATURE or version != VERSION:
+            raise ValueError("Ces données ne sont pas un dé dans un format connu.")
+        return Dé(valeur, generateur)
+
+    def en_dict(self):
+        """
+        Méthode qui retourne le dé sous la forme d'un dictionnaire, par exemple pour l'écrire en JSON.
+        Returns:
+            dict: La version du format et la valeur du dé
+        """
+        return {'version': VERSION, 'valeur': self.valeur}
+
+    @staticmethod
+    def depuis_dict(dictionnaire, generateur=None):
+        """
+        Méthode statique qui recrée un dé à partir du dictionnaire retourné par en_dict.
+        Args:
+            dictionnaire (dict): Le dé
+            generateur (GenerateurDés, optional): source des valeurs aléatoires du dé
+
+        Returns:
+            Dé: Le dé
+        """
+        if dictionnaire.get('version') != VERSION:
+            raise ValueError("Ce dictionnaire n'est pas un dé dans un format connu.")
+        return Dé(dictionnaire['valeur'], generateur)
 
     def __str__(self):
         """
@@ -0,0 +1,61 @@
+"""
+Module des classes de demandes d'une partie de pymafia.
+
+Les étapes d'une partie (voir Partie.etapes) sont un générateur qui joue la partie jusqu'à ce qu'elle ait besoin d'une
+décision de l'extérieur: il cède alors une demande, et la partie reprend lorsque la réponse lui est envoyée avec
+send. La console (voir Partie.executer) et l'interface graphique répondent aux mêmes demandes, chacune à sa façon.
+"""
+
+
+class Demande:
+    """
+    Classe de base des demandes d'une partie.
+
+    Attributes:
+        joueur (Joueur): Joueur à qui la décision revient (None si elle ne revient à aucun joueur en particulier)
+    """
+
+    def __init__(self, joueur=None):
+        """
+        Constructeur de la classe Demande
+        Args:
+            joueur (Joueur, optional): Joueur à qui la décision revient
+        """
+        self.joueur = joueur
+
+    def __repr__(self):
+        return "{}(joueur={})".format(type(self).__name__, None if self.joueur is None else self.joueur.identifiant)
+
+
+class DemandeSens(Demande):
+    """
+    Demande du sens du jeu à un joueur humain qui commence la partie. La réponse est le sens: 1 pour la gauche
+    (croissant) ou -1 pour la droite (décroissant).
+    """
+
+
+class DemandeLancer(Demande):
+    """
+    Demande à un joueur humain de lancer ses dés: c'est son tour. Le tour est joué dès la réponse, qui est ignorée.
+    """
+
+
+class DemandeContinuer(Demande):
+    """
+    Demande de continuer la partie à la fin d'une ronde, une fois les points réglés. La réponse est ignorée.
+
+    Attributes:
+        ronde (int): Numéro de la ronde terminée
+    """
+
+    def __init__(self, ronde):
+        """
+        Constructeur de la classe DemandeContinuer
+        Args:
+            ronde (int): Numéro de la ronde terminée
+        """
+        super().__init__()
+        self.ronde = ronde
+
+    def __repr__(self):
+        return "DemandeContinuer(ronde={})".format(self.ronde)
@@ -0,0 +1,168 @@
+"""
+Module de la classe DistributionsDés
+"""
+
+import struct
+from fractions import Fraction
+
+# En-tête de la table: signature, version et plus grand nombre de dés
+ENTETE_TABLE = struct.Struct('<4sBH')
+SIGNATURE = b'PYMD'
+VERSION = 1
+
+# Nombre d'octets de chaque compte de la table: 6 ** 49 < 2 ** 128, ce qui permet d'aller jusqu'à 49 dés
+OCTETS_COMPTE = 16
+
+# Plus grand nombre de dés d'une table, par défaut. Un joueur n'a en pratique jamais autant de dés.
+NOMBRE_DÉS_TABLE = 40
+
+
+class DistributionsDés:
+    """
+    Classe qui calcule les distributions de probabilités exactes de la somme de k dés, et du nombre de points donnés
+    au gagnant par un perdant qui lance k dés en fin de ronde (la somme des dés, plafonnée à son score, comme dans
+    Joueur.ajuster_score_en_fin_de_tour).
+
+    Pour chaque k, on conserve le nombre de façons d'obtenir chaque somme parmi les 6 ** k résultats possibles. Ces
+    comptes sont des entiers exacts, obtenus par convolution de ceux de k - 1 dés avec ceux d'un dé, et gardés en
+    cache. Les probabilités retournées sont des Fraction exactes.
+
+    La table des comptes peut être écrite dans un fichier binaire (des entiers de 128 bits en petit-boutiste, ligne
+    par ligne), par exemple pour d'autres outils d'analyse, et relue. Aucune table n'est toutefois livrée avec le
+    package: calculer les comptes jusqu'à 40 dés prend environ 0,7 ms, alors que lire la table correspondante (79 ko)
+    en prend environ 2 (voir banc_essai.banc_distributions). Le cache de l'instance suffit.
+
+    Attributes:
+        comptes (list): Comptes de chaque nombre de dés calculé jusqu'ici. comptes[k][s] est le nombre de résultats de
+            k dés dont la somme vaut s.
+    """
+
+    def __init__(self, chemin=None):
+        """
+        Constructeur de la classe DistributionsDés
+        Args:
+            chemin (str, optional): Table à charger (voir sauvegarder). Sans table, les comptes sont calculés au besoin.
+        """
+        self.comptes = [[1]]
+        if chemin is not None:
+            self.charger(chemin)
+
+    def comptes_somme(self, nombre_dés):
+        """
+        Méthode qui retourne le nombre de façons d'obtenir chaque somme avec un certain nombre de dés.
+        Args:
+            nombre_dés (int): Nombre de dés
+
+        Returns:
+            list: Nombre de résultats dont la somme vaut s, pour s de 0 à 6 x nombre_dés
+        """
+        while len(self.comptes) <= nombre_dés:
+            precedents = self.comptes[-1]
+            # Convolution avec un dé: chaque somme s est atteinte à partir des sommes s - 6 à s - 1
+            comptes = [0] * (len(precedents) + 6)
+            fenetre = 0
+            for somme in range(len(comptes)):
+                if 1 <= somme <= len(precedents):
+                    fenetre += precedents[somme - 1]
+                if somme - 7 >= 0 and somme - 7 < len(precedents):
+                    fenetre -= precedents[somme - 7]
+                comptes[somme] = fenetre
+            self.comptes.append(comptes)
+        return self.comptes[nombre_dés]
+
+    def distribution_somme(self, nombre_dés):
+        """
+        Méthode qui calcule la distribution de la somme d'un certain nombre de dés.
+        Args:
+            nombre_dés (int): Nombre de dés
+
+        Returns:
+            dict: Probabilité (Fraction) de chaque somme possible
+        """
+        comptes = self.comptes_somme(nombre_dés)
+        total = 6 ** nombre_dés
+        return {somme: Fraction(compte, total) for somme, compte in enumerate(comptes) if compte}
+
+    def distribution_paiement(self, nombre_dés, score):
+        """
+        Méthode qui calcule la distribution du nombre de points donnés au gagnant par un perdant qui lance un certain
+        nombre de dés en fin de ronde: la somme des dés, ou son score si la somme l'atteint ou le dépasse.
+        Args:
+            nombre_dés (int): Nombre de dés du perdant
+            score (int): Score du perdant
+
+        Returns:
+            dict: Probabilité (Fraction) de chaque nombre de points possible
+        """
+        comptes = self.comptes_somme(nombre_dés)
+        total = 6 ** nombre_dés
+        distribution = {somme: Fraction(compte, total) for somme, compte in enumerate(comptes[:score]) if compte}
+        compte_plafond = sum(comptes[score:])
+        if compte_plafond:
+            distribution[score] = Fraction(compte_plafond, total)
+        return distribution
+
+    def esperance_paiement(self, nombre_dés, score):
+        """
+        Méthode qui calcule l'espérance du nombre de points donnés au gagnant par un perdant en fin de ronde.
+        Args:
+            nombre_dés (int): Nombre de dés du perdant
+            score (int): Score du perdant
+
+        Returns:
+            Fraction: Nombre de points espéré
+        """
+        comptes = self.comptes_somme(nombre_dés)
+        total_points = sum(somme * compte for somme, compte in enumerate(comptes[:score]))
+        total_points += score * sum(comptes[score:])
+        return Fraction(total_points, 6 ** nombre_dés)
+
+    def probabilite_elimination(self, nombre_dés, score):
+        """
+        Méthode qui calcule la probabilité qu'un perdant soit éliminé en fin de ronde, c'est-à-dire que la somme de
+        ses dés atteigne ou dépasse son score.
+        Args:
+            nombre_dés (int): Nombre de dés du perdant
+            score (int): Score du perdant
+
+        Returns:
+            Fraction: Probabilité d'élimination
+        """
+        return Fraction(sum(self.comptes_somme(nombre_dés)[score:]), 6 ** nombre_dés)
+
+    def sauvegarder(self, chemin, nombre_dés_max=NOMBRE_DÉS_TABLE):
+        """
+        Méthode qui écrit la table des comptes de 0 à nombre_dés_max dés dans un fichier binaire.
+        Args:
+            chemin (str): Chemin du fichier
+            nombre_dés_max (int, optional): Plus grand nombre de dés de la table (au plus 49)
+        """
+        if 6 ** nombre_dés_max >= 1 << (8 * OCTETS_COMPTE):
+            raise ValueError("La table ne peut pas dépasser 49 dés.")
+        self.comptes_somme(nombre_dés_max)
+        with open(chemin, 'wb') as fichier:
+            fichier.write(ENTETE_TABLE.pack(SIGNATURE, VERSION, nombre_dés_max))
+            for comptes in self.comptes[:nombre_dés_max + 1]:
+                fichier.write(b''.join(compte.to_bytes(OCTETS_COMPTE, 'little') for compte in comptes))
+
+    def charger(self, chemin):
+        """
+        Méthode qui lit une table écrite par sauvegarder. Les comptes de la table remplacent ceux déjà calculés.
+        Args:
+            chemin (str): Chemin du fichier
+        """
+        with open(chemin, 'rb') as fichier:
+            donnees = fichier.read()
+        signature, version, nombre_dés_max = ENTETE_TABLE.unpack_from(donnees)
+        if signature != SIGNATURE or version != VERSION:
+            raise ValueError("Ce fichier n'est pas une table de distributions de dés.")
+
+        vue = memoryview(donnees)
+        position = ENTETE_TABLE.size
+        self.comptes = []
+        for nombre_dés in range(nombre_dés_max + 1):
+            comptes = []
+            for somme in range(6 * nombre_dés + 1):
+                comptes.append(int.from_bytes(vue[position:position + OCTETS_COMPTE], 'little'))
+                position += OCTETS_COMPTE
+            self.comptes.append(comptes)
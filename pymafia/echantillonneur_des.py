@@ -0,0 +1,188 @@
+"""
+Module de la classe EchantillonneurDés
+"""
+
+import random
+from math import factorial
+
+# Plus grand nombre de dés dont le lancer est tiré d'une table, par défaut
+NOMBRE_DÉS_MAX = 25
+
+# Tables d'alias déjà construites, selon le nombre de dés. Elles ne dépendent pas de la source des valeurs
+# aléatoires et sont partagées par tous les échantillonneurs.
+TABLES = {}
+
+
+class EchantillonneurDés:
+    """
+    Classe qui tire le résultat du lancer d'une main entière de dés en une seule opération. Pour le jeu, un lancer ne
+    compte que par trois nombres: le nombre de dés de valeur 1, le nombre de dés de valeur 6 et la somme des autres
+    dés. Pour chaque nombre de dés k jusqu'à un maximum, toutes les issues possibles de ces trois nombres sont
+    énumérées avec leur nombre exact de façons de se produire parmi les 6 ** k lancers, puis placées dans une table
+    d'alias (méthode de Walker et Vose) à seuils entiers: un seul entier aléatoire choisit une issue, avec exactement la
+    même probabilité que si les k dés étaient lancés un à un.
+
+    Les valeurs des dés autres que 1 et 6 ne sont pas tirées individuellement: chaque issue est conservée sous la
+    forme des comptes d'une main représentative (voir repartir), qui a le même nombre de 1, de 6 et de dés, et la même
+    somme. Au-delà du maximum, les dés sont lancés un à un.
+
+    La table d'un nombre de dés est construite à sa première utilisation, puis conservée dans TABLES.
+
+    Attributes:
+        nombre_dés_max (int): Plus grand nombre de dés dont le lancer est tiré d'une table
+        generateur (GenerateurDés): source des valeurs aléatoires (None pour utiliser le module random)
+    """
+
+    def __init__(self, nombre_dés_max=NOMBRE_DÉS_MAX, generateur=None):
+        """
+        Constructeur de la classe EchantillonneurDés
+        Args:
+            nombre_dés_max (int, optional): Plus grand nombre de dés dont le lancer est tiré d'une table
+            generateur (GenerateurDés, optional): source des valeurs aléatoires
+        """
+        self.nombre_dés_max = nombre_dés_max
+        self.generateur = generateur
+
+    @staticmethod
+    def table(nombre_dés):
+        """
+        Méthode statique qui retourne la table d'alias du lancer d'un certain nombre de dés, en la construisant au
+        besoin.
+        Args:
+            nombre_dés (int): Nombre de dés lancés
+
+        Returns:
+            list, list, list: Comptes de chaque issue (tuple de 7 nombres, comme CompteurDés.comptes), seuil et alias
+                de chaque colonne
+        """
+        if nombre_dés not in TABLES:
+            issues, poids = EchantillonneurDés.enumerer_issues(nombre_dés)
+            seuils, alias = EchantillonneurDés.construire_alias(poids)
+            TABLES[nombre_dés] = issues, seuils, alias
+        return TABLES[nombre_dés]
+
+    @staticmethod
+    def enumerer_issues(nombre_dés):
+        """
+        Méthode statique qui énumère les issues du lancer d'un certain nombre de dés, selon le nombre de 1, le nombre
+        de 6 et la somme des autres dés.
+        Args:
+            nombre_dés (int): Nombre de dés lancés
+
+        Returns:
+            list, list: Comptes de la main représentative de chaque issue, et nombre de lancers qui donnent chaque
+                issue (la somme de ces nombres est 6 ** nombre_dés)
+        """
+        # sommes[m][s] est le nombre de façons d'obtenir la somme 2 * m + s avec m dés de valeur 2 à 5
+        sommes = [[1]]
+        for m in range(nombre_dés):
+            precedentes = sommes[-1]
+            suivantes = [0] * (len(precedentes) + 3)
+            for s, compte in enumerate(precedentes):
+                for face in range(4):
+                    suivantes[s + face] += compte
+            sommes.append(suivantes)
+
+        issues = []
+        poids = []
+        for nombre_1 in range(nombre_dés + 1):
+            for nombre_6 in range(nombre_dés - nombre_1 + 1):
+                autres = nombre_dés - nombre_1 - nombre_6
+                façons = factorial(nombre_dés) // (factorial(nombre_1) * factorial(nombre_6) * factorial(autres))
+                for s, compte in enumerate(sommes[autres]):
+                    issues.append(EchantillonneurDés.repartir(nombre_1, nombre_6, autres, 2 * autres + s))
+                    poids.append(façons * compte)
+        return issues, poids
+
+    @staticmethod
+    def repartir(nombre_1, nombre_6, autres, somme_autres):
+        """
+        Méthode statique qui construit les comptes d'une main représentative d'une issue: des dés de valeur 5, au plus
+        un dé de valeur 3 ou 4, puis des dés de valeur 2, de façon à obtenir la somme des autres dés.
+        Args:
+            nombre_1 (int): Nombre de dés de valeur 1
+            nombre_6 (int): Nombre de dés de valeur 6
+            autres (int): Nombre de dés de valeur 2 à 5
+            somme_autres (int): Somme des dés de valeur 2 à 5
+
+        Returns:
+            tuple: Nombre de dés de chaque valeur (l'index 0 n'est pas utilisé)
+        """
+        comptes = [0, nombre_1, 0, 0, 0, 0, nombre_6]
+        nombre_5, reste = divmod(somme_autres - 2 * autres, 3)
+        comptes[5] = nombre_5
+        if reste:
+            comptes[2 + reste] += 1
+        comptes[2] += autres - nombre_5 - (1 if reste else 0)
+        return tuple(comptes)
+
+    @staticmethod
+    def construire_alias(poids):
+        """
+        Méthode statique qui construit une table d'alias à partir de poids entiers. Chaque colonne a une capacité
+        égale à la somme des poids; une colonne contient son issue jusqu'à son seuil, et son alias au-delà. Les
+        calculs sont faits en entiers, sans arrondi.
+        Args:
+            poids (list): Poids entier de chaque issue
+
+        Returns:
+            list, list: Seuil et alias de chaque colonne
+        """
+        capacite = sum(poids)
+        restants = [p * len(poids) for p in poids]
+        seuils = [capacite] * len(poids)
+        alias = list(range(len(poids)))
+        petits = [i for i, p in enumerate(restants) if p < capacite]
+        grands = [i for i, p in enumerate(restants) if p >= capacite]
+        while petits and grands:
+            petit = petits.pop()
+            grand = grands.pop()
+            seuils[petit] = restants[petit]
+            alias[petit] = grand
+            restants[grand] -= capacite - restants[petit]
+            if restants[grand] < capacite:
+                petits.append(grand)
+            else:
+                grands.append(grand)
+        return seuils, alias
+
+    def tirer_comptes(self, nombre_dés):
+        """
+        Méthode qui tire le résultat du lancer d'un certain nombre de dés.
+        Args:
+            nombre_dés (int): Nombre de dés lancés
+
+        Returns:
+            list: Nombre de dés de chaque valeur d'une main qui a le même nombre de 1, le même nombre de 6 et la même
+                somme que le lancer (l'index 0 n'est pas utilisé)
+        """
+        if nombre_dés > self.nombre_dés_max:
+            comptes = [0] * 7
+            if self.generateur is None:
+                for i in range(nombre_dés):
+                    comptes[random.randint(1, 6)] += 1
+            else:
+                for valeur in self.generateur.lancer_plusieurs(nombre_dés):
+                    comptes[valeur] += 1
+            return comptes
+
+        issues, seuils, alias = self.table(nombre_dés)
+        capacite = 6 ** nombre_dés
+        aleatoire = random if self.generateur is None else self.generateur
+        colonne, position = divmod(aleatoire.randrange(len(seuils) * capacite), capacite)
+        if position >= seuils[colonne]:
+            colonne = alias[colonne]
+        return list(issues[colonne])
+
+    def tirer(self, nombre_dés):
+        """
+        Méthode qui tire le résultat du lancer d'un certain nombre de dés, sous la forme des trois nombres qui
+        comptent pour le jeu.
+        Args:
+            nombre_dés (int): Nombre de dés lancés
+
+        Returns:
+            int, int, int: Nombre de dés de valeur 1, nombre de dés de valeur 6 et somme des autres dés
+        """
+        comptes = self.tirer_comptes(nombre_dés)
+        return comptes[1], comptes[6], 2 * comptes[2] + 3 * comptes[3] + 4 * comptes[4] + 5 * comptes[5]
@@ -0,0 +1,206 @@
+"""
+Module de la classe EnregistrementPartie
+"""
+
+import struct
+
+from pymafia.evenements import PartieCommencée, Lancer, PremierJoueurTrouvé, SensChoisi, RondeGagnée, PointsRéglés, \
+    RondeTerminée
+
+# En-tête d'un enregistrement: nombre de joueurs, premier joueur, sens, ronde maximale, nombre de rondes et de tours
+ENTETE = struct.Struct('<BBbxIII')
+
+# Nombre maximal de joueurs, pour que le nombre de dés d'une même valeur tienne toujours dans un octet (5 x 51 = 255)
+NOMBRE_JOUEURS_MAX = 51
+
+# Largeur d'un tour: identifiant du joueur, puis nombre de dés obtenus de chaque valeur de 1 à 6
+LARGEUR_TOUR = 7
+
+
+class EnregistrementPartie:
+    """
+    Classe pour l'enregistrement binaire d'une partie de pymafia. Chaque champ a une largeur fixe, mais la taille
+    d'un enregistrement dépend du nombre de joueurs, de rondes et de tours de la partie: elle se calcule à partir de
+    l'en-tête seul (voir taille), ce qui permet de passer d'un enregistrement au suivant sans lire les données. Les
+    données sont rangées par colonnes, à la suite de l'en-tête, et tous les entiers sont en petit-boutiste
+    (little-endian):
+
+        en-tête               ENTETE (16 octets)
+        rondes                nombre_rondes x 2 x uint32: gagnant et nombre de tours de chaque ronde
+        scores                nombre_joueurs x uint16: score final de chaque joueur
+        points                nombre_rondes x nombre_joueurs x uint16: points donnés par chaque joueur à chaque ronde
+        humains               nombre_joueurs x uint8: 1 si le joueur est humain, 0 autrement
+        tours                 nombre_tours x 7 x uint8: joueur, puis nombre de 1, 2, ..., 6 obtenus à chaque tour
+        dés_fin_de_ronde      nombre_rondes x nombre_joueurs x 6 x uint8: nombre de dés de chaque valeur lancés par
+                              chaque perdant en fin de ronde
+        bourrage              0 à 3 octets, pour que la taille soit un multiple de 4
+
+    Un EnregistrementPartie lu d'un tampon n'en copie pas les données: ses attributs sont des memoryview sur ce
+    tampon (par exemple, sur le mmap d'une archive). Les colonnes uint16 et uint32 sont présentées selon l'ordre des
+    octets de la machine, qui est petit-boutiste sur les processeurs x86 et ARM usuels. On lit une valeur d'un
+    tableau avec un tuple d'index (par exemple, points[ronde, joueur]), ou tout le tableau avec tolist();
+    numpy.frombuffer accepte aussi ces vues, toujours sans copie.
+
+    Attributes:
+        nombre_joueurs (int): Nombre de joueurs de la partie
+        premier_joueur (int): Identifiant du premier joueur
+        sens (int): Sens de la partie (1, croissant; -1, décroissant)
+        ronde_max (int): Nombre maximal de rondes de la partie
+        nombre_rondes (int): Nombre de rondes jouées
+        nombre_tours (int): Nombre de tours joués
+        scores (memoryview): Score final de chaque joueur (l'index 0 est le joueur 1)
+        rondes (memoryview): Tableau nombre_rondes x 2 du gagnant et du nombre de tours de chaque ronde
+        points (memoryview): Tableau nombre_rondes x nombre_joueurs des points donnés au gagnant de chaque ronde
+        humains (memoryview): 1 pour chaque joueur humain, 0 pour chaque joueur ordinateur
+        tours (memoryview): Tableau nombre_tours x 7 du joueur et des dés de chaque tour
+        dés_fin_de_ronde (memoryview): Tableau nombre_rondes x nombre_joueurs x 6 des dés lancés en fin de ronde
+    """
+
+    def __init__(self, tampon):
+        """
+        Constructeur de la classe EnregistrementPartie, qui lit un enregistrement sans copier ses données.
+        Args:
+            tampon (bytes, memoryview ou mmap): Tampon qui commence par l'enregistrement
+        """
+        tampon = memoryview(tampon)
+        (self.nombre_joueurs, self.premier_joueur, self.sens, self.ronde_max, self.nombre_rondes,
+         self.nombre_tours) = ENTETE.unpack_from(tampon)
+        n = self.nombre_joueurs
+        position = ENTETE.size
+
+        self.rondes, position = self.colonne(tampon, position, 'I', [self.nombre_rondes, 2])
+        self.scores, position = self.colonne(tampon, position, 'H', [n])
+        self.points, position = self.colonne(tampon, position, 'H', [self.nombre_rondes, n])
+        self.humains, position = self.colonne(tampon, position, 'B', [n])
+        self.tours, position = self.colonne(tampon, position, 'B', [self.nombre_tours, LARGEUR_TOUR])
+        self.dés_fin_de_ronde, position = self.colonne(tampon, position, 'B', [self.nombre_rondes, n, 6])
+
+    @staticmethod
+    def colonne(tampon, position, format_valeur, forme):
+        """
+        Méthode statique qui présente une colonne de l'enregistrement comme un memoryview, sans copier les données.
+        Args:
+            tampon (memoryview): Tampon de l'enregistrement
+            position (int): Position du début de la colonne dans le tampon
+            format_valeur (str): 'B' pour des uint8, 'H' pour des uint16, 'I' pour des uint32
+            forme (list): Dimensions de la colonne
+
+        Returns:
+            memoryview, int: La colonne et la position de la fin de la colonne
+        """
+        nombre_valeurs = 1
+        for dimension in forme:
+            nombre_valeurs *= dimension
+        fin = position + nombre_valeurs * struct.calcsize(format_valeur)
+        if nombre_valeurs == 0:
+            # memoryview.cast n'accepte pas de dimension nulle
+            return tampon[position:fin].cast(format_valeur), fin
+        return tampon[position:fin].cast(format_valeur, forme), fin
+
+    @staticmethod
+    def taille(tampon):
+        """
+        Méthode statique qui calcule la taille en octets de l'enregistrement qui débute un tampon, bourrage compris.
+        Args:
+            tampon (bytes, memoryview ou mmap): Tampon qui commence par l'enregistrement
+
+        Returns:
+            int: Taille de l'enregistrement
+        """
+        n, premier, sens, ronde_max, nombre_rondes, nombre_tours = ENTETE.unpack_from(tampon)
+        taille = ENTETE.size + 8 * nombre_rondes + 2 * (n + nombre_rondes * n) + n + LARGEUR_TOUR * nombre_tours + \
+            6 * nombre_rondes * n
+        return taille + (-taille) % 4
+
+    @staticmethod
+    def encoder(journal):
+        """
+        Méthode statique qui encode une partie à partir de son journal d'événements.
+        Args:
+            journal (list): Les événements de la partie (voir Partie.journal)
+
+        Returns:
+            bytes: L'enregistrement de la partie
+        """
+        if not journal or not isinstance(journal[0], PartieCommencée):
+            raise ValueError("Le journal doit commencer par l'événement PartieCommencée.")
+        n = len(journal[0].joueurs)
+        if n > NOMBRE_JOUEURS_MAX:
+            raise ValueError("Un enregistrement accepte au plus {} joueurs.".format(NOMBRE_JOUEURS_MAX))
+
+        humains = bytes(1 if nature == PartieCommencée.HUMAIN else 0 for nature in journal[0].joueurs)
+        scores = [50] * n
+        premier_joueur = 0
+        sens = 1
+        sens_choisi = False
+        rondes = []
+        points = []
+        tours = bytearray()
+        dés_fin_de_ronde = bytearray()
+        gagnant = 0
+        tours_ronde = 0
+        points_ronde = [0] * n
+        dés_ronde = bytearray(6 * n)
+
+        for evenement in journal:
+            if isinstance(evenement, Lancer):
+                comptes = [0] * 6
+                for valeur in evenement.valeurs:
+                    comptes[valeur - 1] += 1
+                if evenement.motif == Lancer.TOUR:
+                    tours.append(evenement.identifiant)
+                    tours += bytes(comptes)
+                    tours_ronde += 1
+                elif evenement.motif == Lancer.FIN_DE_RONDE:
+                    position = 6 * (evenement.identifiant - 1)
+                    dés_ronde[position:position + 6] = bytes(comptes)
+            elif isinstance(evenement, PointsRéglés):
+                points_ronde[evenement.identifiant - 1] = evenement.points
+                scores[evenement.identifiant - 1] -= evenement.points
+                scores[evenement.gagnant - 1] += evenement.points
+            elif isinstance(evenement, RondeGagnée):
+                gagnant = evenement.identifiant
+            elif isinstance(evenement, RondeTerminée):
+                rondes += [gagnant, tours_ronde]
+                points += points_ronde
+                dés_fin_de_ronde += dés_ronde
+                tours_ronde = 0
+                points_ronde = [0] * n
+                dés_ronde = bytearray(6 * n)
+            elif isinstance(evenement, PremierJoueurTrouvé):
+                premier_joueur = evenement.identifiant
+            elif isinstance(evenement, SensChoisi):
+                if sens_choisi:
+                    raise ValueError("Un enregistrement ne conserve qu'un sens: le sens doit être choisi une seule "
+                                     "fois.")
+                sens = evenement.sens
+                sens_choisi = True
+
+        nombre_rondes = len(rondes) // 2
+        enregistrement = ENTETE.pack(n, premier_joueur, sens, journal[0].ronde_max, nombre_rondes, len(tours) //
+                                     LARGEUR_TOUR)
+        enregistrement += struct.pack('<{}I'.format(len(rondes)), *rondes)
+        enregistrement += struct.pack('<{}H'.format(n + len(points)), *scores, *points)
+        enregistrement += humains + tours + dés_fin_de_ronde
+        return enregistrement + bytes(-len(enregistrement) % 4)
+
+    def gagnants(self):
+        """
+        Méthode qui retourne l'identifiant du ou des joueurs ayant le plus haut score en fin de partie.
+        Returns:
+            list: Identifiants des gagnants
+        """
+        score_max = max(self.scores)
+        return [i + 1 for i, score in enumerate(self.scores) if score == score_max]
+
+    def __str__(self):
+        """
+        Méthode qui retourne un résumé de l'enregistrement en chaîne de caractères.
+        Returns:
+            str: Résumé de la partie
+        """
+        return "Partie à {} joueurs, {} ronde(s), {} tours, scores: {}".format(
+            self.nombre_joueurs, self.nombre_rondes, self.nombre_tours, list(self.scores))
+
+    def __repr__(self):
+        return str(self)
@@ -0,0 +1,211 @@
+"""
+Module de la classe EtatPartie
+"""
+
+import struct
+
+from pymafia.compteur_des import CompteurDés
+from pymafia.de import Dé
+from pymafia.joueur_humain import JoueurHumain
+from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.partie import Partie, GRANDE_TABLE, ECHANTILLONNAGE, AVANCE_RAPIDE, SENS_CHAQUE_RONDE
+
+# En-tête de l'état: nombre de joueurs, index du premier joueur, du joueur courant et du joueur suivant, sens, options
+# (GRANDE_TABLE, ECHANTILLONNAGE, AVANCE_RAPIDE et SENS_CHAQUE_RONDE de Partie), ronde, ronde maximale, nombre de tours,
+# points transférés, plus grand nombre de dés de l'échantillonneur, plus grand nombre de joueurs de l'avance rapide et
+# code de la langue des messages (deux lettres ASCII)
+ENTETE = struct.Struct('<BBBBbBHHIIHH2s')
+
+# Nombre maximal de joueurs, pour que le nombre de dés d'une même valeur tienne toujours dans un octet (5 x 51 = 255)
+NOMBRE_JOUEURS_MAX = 51
+
+# Nombre maximal de rondes, pour que la ronde tienne dans l'en-tête (uint16) même une fois la ronde maximale dépassée
+RONDE_MAX = 65534
+
+# Drapeaux de chaque joueur
+ACTIF = 1
+HUMAIN = 2
+
+
+class EtatPartie:
+    """
+    Classe pour l'état compact d'une partie en cours, par exemple pour garder un très grand nombre de parties en
+    mémoire. Tout l'état est conservé dans un seul objet bytes, et les entiers sont en petit-boutiste:
+
+        en-tête               ENTETE (24 octets)
+        scores                nombre_joueurs x uint16: score de chaque joueur
+        dés                   nombre_joueurs x 6 x uint8: nombre de dés de chaque valeur de 1 à 6 de chaque joueur
+        drapeaux              nombre_joueurs x uint8: ACTIF si le joueur est actif, HUMAIN si c'est un humain
+
+    Une partie de 4 joueurs tient ainsi en 60 octets (environ 135 octets en mémoire avec l'objet lui-même), contre
+    plusieurs kilo-octets pour une Partie et ses objets (voir banc_essai).
+
+    La conversion depuis une Partie et vers une Partie conserve tout ce qui détermine la suite du jeu: les scores, les
+    dés, les joueurs actifs, le premier joueur, le joueur courant, le joueur suivant, le sens, la ronde, les
+    compteurs de la partie, ses options de jeu (grande table, échantillonnage, avance rapide, sens choisi à chaque
+    ronde) et la langue de ses messages. L'ordre des dés d'une liste n'a pas d'importance pour le jeu: une liste de
+    dés est recréée en ordre croissant de valeur. Le journal, les décisions, le générateur et le type précis des
+    joueurs ordinateurs ne font pas partie de l'état: ils sont redonnés, ou recréés par défaut, lors de la conversion
+    vers une Partie.
+
+    Attributes:
+        donnees (bytes): L'état de la partie
+    """
+    __slots__ = ('donnees',)
+
+    def __init__(self, donnees):
+        """
+        Constructeur de la classe EtatPartie
+        Args:
+            donnees (bytes): L'état de la partie, tel que produit par depuis_partie
+        """
+        self.donnees = bytes(donnees)
+
+    @staticmethod
+    def depuis_partie(partie):
+        """
+        Méthode statique qui crée l'état compact d'une partie.
+        Args:
+            partie (Partie): La partie
+
+        Returns:
+            EtatPartie: L'état de la partie
+        """
+        nombre_joueurs = len(partie.joueurs)
+        if nombre_joueurs > NOMBRE_JOUEURS_MAX:
+            raise ValueError("Un état compact ne peut pas avoir plus de {} joueurs.".format(NOMBRE_JOUEURS_MAX))
+        if not 0 <= partie.ronde_max <= RONDE_MAX or not 0 <= partie.ronde <= RONDE_MAX + 1:
+            raise ValueError("Un état compact ne peut pas avoir plus de {} rondes.".format(RONDE_MAX))
+        index = {joueur: i for i, joueur in enumerate(partie.joueurs)}
+        dés = []
+        drapeaux = []
+        for joueur in partie.joueurs:
+            if isinstance(joueur.dés, CompteurDés):
+                dés += joueur.dés.comptes[1:]
+            else:
+                comptes = [0] * 7
+                for dé in joueur.dés:
+                    comptes[dé.valeur] += 1
+                dés += comptes[1:]
+            drapeaux.append((ACTIF if joueur in partie.anneau_joueurs else 0)
+                            | (HUMAIN if isinstance(joueur, JoueurHumain) else 0))
+        options = ((GRANDE_TABLE if partie.grande_table else 0)
+                   | (ECHANTILLONNAGE if partie.echantillonneur is not None else 0)
+                   | (AVANCE_RAPIDE if partie.avance_rapide is not None else 0)
+                   | (SENS_CHAQUE_RONDE if partie.sens_chaque_ronde else 0))
+        entete = ENTETE.pack(nombre_joueurs, index[partie.premier_joueur], index[partie.joueur_courant],
+                             index[partie.joueur_suivant], partie.sens, options, partie.ronde, partie.ronde_max,
+                             partie.nombre_tours, partie.points_transférés,
+                             0 if partie.echantillonneur is None else partie.echantillonneur.nombre_dés_max,
+                             0 if partie.avance_rapide is None else partie.avance_rapide.nombre_joueurs_max,
+                             partie.catalogue.langue.encode('ascii'))
+        scores = struct.pack('<{}H'.format(nombre_joueurs), *[joueur.score for joueur in partie.joueurs])
+        return EtatPartie(entete + scores + bytes(dés) + bytes(drapeaux))
+
+    def en_partie(self, affichage=False, dés_compacts=False, generateur=None):
+        """
+        Méthode qui recrée une partie dans cet état, avec ses options de jeu et sa langue.
+        Args:
+            affichage (bool, optional): True pour afficher les messages de la partie à la console
+            dés_compacts (bool, optional): True pour que les dés des joueurs soient conservés dans des CompteurDés (ils
+                le sont toujours sur une grande table ou avec l'échantillonnage)
+            generateur (GenerateurDés, optional): source des valeurs aléatoires de la partie (par défaut, un nouveau
+                générateur, propre à la partie)
+
+        Returns:
+            Partie: La partie
+        """
+        (nombre_joueurs, premier, courant, suivant, sens, options, ronde, ronde_max, nombre_tours, points_transférés,
+         nombre_dés_max, nombre_joueurs_max, langue) = ENTETE.unpack_from(self.donnees)
+        scores = self.scores()
+        # La partie est créée sans joueurs: ses joueurs ne doivent pas consommer de valeurs du générateur
+        partie = Partie.creer(options, nombre_dés_max, nombre_joueurs_max, generateur, langue.decode('ascii'))
+        partie.affichage = affichage
+        partie.journal = None
+        partie.décisions = []
+        partie.décisions_à_rejouer = []
+        generateur = partie.generateur
+        dés_compacts = dés_compacts or bool(options & (GRANDE_TABLE | ECHANTILLONNAGE))
+        joueurs = []
+        for i, drapeaux in enumerate(self.drapeaux()):
+            classe = JoueurHumain if drapeaux & HUMAIN else JoueurOrdinateur
+            joueur = classe(i + 1, dés_compacts, generateur, partie.echantillonneur)
+            comptes = [0] + list(self.comptes_dés(i))
+            if dés_compacts:
+                joueur.dés.comptes = comptes
+                joueur.dés.nombre = sum(comptes)
+            else:
+                joueur.dés = [Dé(valeur, generateur) for valeur in range(1, 7) for j in range(comptes[valeur])]
+            joueur.score = scores[i]
+            joueurs.append(joueur)
+        partie.joueurs = joueurs
+        partie.joueurs_actifs = [joueur for joueur, drapeaux in zip(joueurs, self.drapeaux()) if drapeaux & ACTIF]
+        partie.premier_joueur = joueurs[premier]
+        partie.joueur_courant = joueurs[courant]
+        partie.joueur_suivant = joueurs[suivant]
+        partie.sens = sens
+        partie.ronde = ronde
+        partie.ronde_max = ronde_max
+        partie.nombre_tours = nombre_tours
+        partie.points_transférés = points_transférés
+        return partie
+
+    @property
+    def nombre_joueurs(self):
+        """
+        Propriété qui donne le nombre de joueurs de la partie.
+        Returns:
+            int: Nombre de joueurs
+        """
+        return self.donnees[0]
+
+    def scores(self):
+        """
+        Méthode qui retourne le score de chaque joueur.
+        Returns:
+            tuple: Score de chaque joueur, dans l'ordre des joueurs
+        """
+        return struct.unpack_from('<{}H'.format(self.nombre_joueurs), self.donnees, ENTETE.size)
+
+    def comptes_dés(self, index):
+        """
+        Méthode qui retourne le nombre de dés de chaque valeur d'un joueur.
+        Args:
+            index (int): Position du joueur dans la liste des joueurs
+
+        Returns:
+            bytes: Nombre de dés de valeur 1 à 6
+        """
+        debut = ENTETE.size + 2 * self.nombre_joueurs + 6 * index
+        return self.donnees[debut:debut + 6]
+
+    def drapeaux(self):
+        """
+        Méthode qui retourne les drapeaux de chaque joueur (ACTIF, HUMAIN).
+        Returns:
+            bytes: Drapeaux de chaque joueur, dans l'ordre des joueurs
+        """
+        return self.donnees[ENTETE.size + 8 * self.nombre_joueurs:]
+
+    def __eq__(self, other):
+        """
+        Méthode qui définit l'opérateur == pour la classe EtatPartie
+        Args:
+            other (EtatPartie): autre état pour la comparaison
+
+        Returns:
+            bool: True si les deux états sont identiques, False autrement
+        """
+        if not isinstance(other, EtatPartie):
+            return NotImplemented
+        return self.donnees == other.donnees
+
+    def __ne__(self, other):
+        resultat = self.__eq__(other)
+        return resultat if resultat is NotImplemented else not resultat
+
+    def __hash__(self):
+        return hash(self.donnees)
+
+    def __repr__(self):
+        return "EtatPartie(joueurs={}, scores={})".format(self.nombre_joueurs, list(self.scores()))
@@ -0,0 +1,341 @@
+"""
+Module des classes d'événements d'une partie de pymafia.
+
+Une Partie dont la journalisation est activée consigne chaque action du jeu sous la forme d'un événement typé, dans
+l'ordre où elle survient. Chaque événement sait s'appliquer à une Partie; appliquer tous les événements d'un journal à
+une partie neuve (voir la classe Rejoueur) reconstruit l'état complet de la partie sans lancer un seul dé.
+"""
+
+from pymafia.de import Dé
+from pymafia.joueur_humain import JoueurHumain
+from pymafia.joueur_ordinateur import JoueurOrdinateur
+
+
+class Evenement:
+    """
+    Classe de base des événements d'une partie. Chaque sous-classe définit son TYPE (nom de l'événement dans un
+    dictionnaire) et ses CHAMPS (noms des attributs, dans l'ordre des arguments du constructeur).
+    """
+    TYPE = None
+    CHAMPS = ()
+
+    def appliquer(self, partie):
+        """
+        Méthode qui modifie l'état d'une partie selon l'événement.
+        Args:
+            partie (Partie): La partie à modifier
+        """
+        raise NotImplementedError
+
+    def en_dict(self):
+        """
+        Méthode qui retourne l'événement sous la forme d'un dictionnaire, par exemple pour l'analyse des parties.
+        Returns:
+            dict: Le type de l'événement (clé 'type') et la valeur de chacun de ses champs
+        """
+        dictionnaire = {'type': self.TYPE}
+        for champ in self.CHAMPS:
+            dictionnaire[champ] = getattr(self, champ)
+        return dictionnaire
+
+    @staticmethod
+    def depuis_dict(dictionnaire):
+        """
+        Méthode statique qui recrée un événement à partir du dictionnaire retourné par en_dict.
+        Args:
+            dictionnaire (dict): Le dictionnaire de l'événement
+
+        Returns:
+            Evenement: L'événement
+        """
+        classe = TYPES_EVENEMENTS[dictionnaire['type']]
+        return classe(*[dictionnaire[champ] for champ in classe.CHAMPS])
+
+    @staticmethod
+    def joueur(partie, identifiant):
+        """
+        Méthode statique qui retourne le joueur d'une partie selon son identifiant.
+        Args:
+            partie (Partie): La partie
+            identifiant (int): Identifiant du joueur
+
+        Returns:
+            Joueur: Le joueur
+        """
+        return partie.joueurs[identifiant - 1]
+
+    def verifier(self, condition, message):
+        """
+        Méthode qui lève une exception si l'événement ne concorde pas avec l'état de la partie, ce qui signifie que le
+        journal est incohérent.
+        Args:
+            condition (bool): True si l'événement concorde avec la partie
+            message (str): Description de l'incohérence
+        """
+        if not condition:
+            raise ValueError("Journal incohérent ({}): {}".format(self, message))
+
+    def __eq__(self, other):
+        """
+        Méthode qui définit l'opérateur == pour les événements
+        Args:
+            other (Evenement): autre événement pour la comparaison
+        Returns:
+            bool: True si les deux événements sont du même type et ont les mêmes champs, False autrement
+        """
+        return type(self) is type(other) and self.en_dict() == other.en_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, ", ".join(
+            "{}={!r}".format(champ, getattr(self, champ)) for champ in self.CHAMPS))
+
+
+class PartieCommencée(Evenement):
+    """
+    Événement du début d'une partie: il donne la nature de chacun des joueurs et le nombre maximal de rondes.
+
+    Attributes:
+        joueurs (list): 'humain' ou 'ordinateur' pour chaque joueur, dans l'ordre des identifiants
+        ronde_max (int): Nombre maximal de rondes de la partie
+    """
+    TYPE = 'partie_commencée'
+    CHAMPS = ('joueurs', 'ronde_max')
+    HUMAIN = 'humain'
+    ORDINATEUR = 'ordinateur'
+
+    def __init__(self, joueurs, ronde_max):
+        self.joueurs = joueurs
+        self.ronde_max = ronde_max
+
+    def appliquer(self, partie):
+        partie.joueurs = []
+        for i, nature in enumerate(self.joueurs):
+            classe = JoueurHumain if nature == PartieCommencée.HUMAIN else JoueurOrdinateur
+            partie.joueurs.append(classe(i + 1))
+        partie.joueurs_actifs = list(partie.joueurs)
+        partie.premier_joueur = partie.joueurs[0]
+        partie.joueur_courant = partie.joueurs[0]
+        partie.joueur_suivant = partie.joueurs[1]
+        partie.ronde = 1
+        partie.sens = 1
+        partie.ronde_max = self.ronde_max
+        partie.nombre_tours = 0
+        partie.points_transférés = 0
+
+
+class Lancer(Evenement):
+    """
+    Événement d'un joueur qui lance ses dés, pour trouver le premier joueur, pour jouer son tour ou pour calculer
+    les points qu'il donne en fin de ronde.
+
+    Attributes:
+        identifiant (int): Identifiant du joueur
+        valeurs (list): Valeur de chacun des dés obtenus
+        motif (str): Lancer.PREMIER_JOUEUR, Lancer.TOUR ou Lancer.FIN_DE_RONDE
+    """
+    TYPE = 'lancer'
+    CHAMPS = ('identifiant', 'valeurs', 'motif')
+    PREMIER_JOUEUR = 'premier_joueur'
+    TOUR = 'tour'
+    FIN_DE_RONDE = 'fin_de_ronde'
+
+    def __init__(self, identifiant, valeurs, motif):
+        self.identifiant = identifiant
+        self.valeurs = valeurs
+        self.motif = motif
+
+    def appliquer(self, partie):
+        if self.motif == Lancer.TOUR:
+            # Un tour qui n'a pas terminé la ronde a fait passer la main au joueur suivant
+            if partie.joueur_courant.identifiant != self.identifiant:
+                partie.passer_au_prochain_joueur()
+            self.verifier(partie.joueur_courant.identifiant == self.identifiant, "ce n'est pas le tour de ce joueur")
+            partie.nombre_tours += 1
+        joueur = self.joueur(partie, self.identifiant)
+        self.verifier(len(joueur.dés) == len(self.valeurs), "le joueur n'a pas ce nombre de dés")
+        joueur.dés = [Dé(valeur) for valeur in self.valeurs]
+
+
+class PremierJoueurTrouvé(Evenement):
+    """
+    Événement qui désigne le joueur qui débute la partie.
+
+    Attributes:
+        identifiant (int): Identifiant du premier joueur
+    """
+    TYPE = 'premier_joueur_trouvé'
+    CHAMPS = ('identifiant',)
+
+    def __init__(self, identifiant):
+        self.identifiant = identifiant
+
+    def appliquer(self, partie):
+        partie.premier_joueur = self.joueur(partie, self.identifiant)
+        partie.joueur_courant = partie.premier_joueur
+        partie.determiner_joueur_suivant()
+        partie.reinitialiser_dés_joueurs()
+
+
+class SensChoisi(Evenement):
+    """
+    Événement du choix du sens de la partie par le premier joueur. Lorsque le sens est choisi à chaque ronde, le
+    joueur qui choisit devient le premier joueur de la ronde.
+
+    Attributes:
+        identifiant (int): Identifiant du joueur qui choisit
+        sens (int): 1 pour l'ordre croissant, -1 pour l'ordre décroissant
+    """
+    TYPE = 'sens_choisi'
+    CHAMPS = ('identifiant', 'sens')
+
+    def __init__(self, identifiant, sens):
+        self.identifiant = identifiant
+        self.sens = sens
+
+    def appliquer(self, partie):
+        partie.premier_joueur = self.joueur(partie, self.identifiant)
+        partie.sens = self.sens
+        partie.determiner_joueur_suivant()
+
+
+class DésRetirés(Evenement):
+    """
+    Événement d'un joueur qui retire du jeu ses dés de valeur 1.
+
+    Attributes:
+        identifiant (int): Identifiant du joueur
+        nombre (int): Nombre de dés retirés
+    """
+    TYPE = 'dés_retirés'
+    CHAMPS = ('identifiant', 'nombre')
+
+    def __init__(self, identifiant, nombre):
+        self.identifiant = identifiant
+        self.nombre = nombre
+
+    def appliquer(self, partie):
+        joueur = self.joueur(partie, self.identifiant)
+        self.verifier(joueur.compter_1_et_6()[0] == self.nombre, "le joueur n'a pas ce nombre de 1")
+        joueur.retirer_dé(1)
+
+
+class DésPassés(Evenement):
+    """
+    Événement d'un joueur qui passe ses dés de valeur 6 au joueur suivant.
+
+    Attributes:
+        identifiant (int): Identifiant du joueur qui passe les dés
+        destinataire (int): Identifiant du joueur qui les reçoit
+        nombre (int): Nombre de dés passés
+    """
+    TYPE = 'dés_passés'
+    CHAMPS = ('identifiant', 'destinataire', 'nombre')
+
+    def __init__(self, identifiant, destinataire, nombre):
+        self.identifiant = identifiant
+        self.destinataire = destinataire
+        self.nombre = nombre
+
+    def appliquer(self, partie):
+        joueur = self.joueur(partie, self.identifiant)
+        self.verifier(joueur.compter_1_et_6()[1] == self.nombre, "le joueur n'a pas ce nombre de 6")
+        self.verifier(partie.joueur_suivant.identifiant == self.destinataire, "le destinataire n'est pas le suivant")
+        joueur.retirer_dé(6)
+        for i in range(self.nombre):
+            partie.joueur_suivant.ajouter_un_dé()
+
+
+class RondeGagnée(Evenement):
+    """
+    Événement d'un joueur qui gagne la ronde parce qu'il n'a plus de dé.
+
+    Attributes:
+        ronde (int): Numéro de la ronde
+        identifiant (int): Identifiant du gagnant
+    """
+    TYPE = 'ronde_gagnée'
+    CHAMPS = ('ronde', 'identifiant')
+
+    def __init__(self, ronde, identifiant):
+        self.ronde = ronde
+        self.identifiant = identifiant
+
+    def appliquer(self, partie):
+        self.verifier(partie.ronde == self.ronde, "ce n'est pas la ronde en cours")
+        self.verifier(partie.joueur_courant.identifiant == self.identifiant, "ce n'est pas le joueur courant")
+        self.verifier(partie.verifier_si_fin_de_ronde(), "le joueur a encore des dés")
+
+
+class PointsRéglés(Evenement):
+    """
+    Événement d'un perdant de la ronde qui donne des points au gagnant.
+
+    Attributes:
+        identifiant (int): Identifiant du perdant
+        gagnant (int): Identifiant du gagnant
+        points (int): Nombre de points donnés
+    """
+    TYPE = 'points_réglés'
+    CHAMPS = ('identifiant', 'gagnant', 'points')
+
+    def __init__(self, identifiant, gagnant, points):
+        self.identifiant = identifiant
+        self.gagnant = gagnant
+        self.points = points
+
+    def appliquer(self, partie):
+        perdant = self.joueur(partie, self.identifiant)
+        self.verifier(self.points == min(perdant.calculer_points(), perdant.score),
+                      "les points ne correspondent pas aux dés du perdant")
+        perdant.score -= self.points
+        self.joueur(partie, self.gagnant).score += self.points
+        partie.points_transférés += self.points
+
+
+class JoueurÉliminé(Evenement):
+    """
+    Événement d'un joueur retiré de la partie parce qu'il n'a plus de points.
+
+    Attributes:
+        identifiant (int): Identifiant du joueur
+    """
+    TYPE = 'joueur_éliminé'
+    CHAMPS = ('identifiant',)
+
+    def __init__(self, identifiant):
+        self.identifiant = identifiant
+
+    def appliquer(self, partie):
+        joueur = self.joueur(partie, self.identifiant)
+        self.verifier(joueur.score == 0, "le joueur a encore des points")
+        partie.joueurs_actifs.retirer(joueur)
+        if partie.joueur_suivant is joueur:
+            partie.determiner_joueur_suivant()
+
+
+class RondeTerminée(Evenement):
+    """
+    Événement de la fin d'une ronde, après le règlement des points: les joueurs actifs reprennent 5 dés.
+
+    Attributes:
+        ronde (int): Numéro de la ronde terminée
+    """
+    TYPE = 'ronde_terminée'
+    CHAMPS = ('ronde',)
+
+    def __init__(self, ronde):
+        self.ronde = ronde
+
+    def appliquer(self, partie):
+        self.verifier(partie.ronde == self.ronde, "ce n'est pas la ronde en cours")
+        partie.reinitialiser_dés_joueurs()
+        partie.passer_a_la_ronde_suivante()
+
+
+# Classe de chaque type d'événement, selon son nom
+TYPES_EVENEMENTS = {classe.TYPE: classe for classe in (PartieCommencée, Lancer, PremierJoueurTrouvé, SensChoisi,
+                                                       DésRetirés, DésPassés, RondeGagnée, PointsRéglés,
+                                                       JoueurÉliminé, RondeTerminée)}
@@ -0,0 +1,166 @@
+"""
+Module de la classe GenerateurDés
+"""
+
+import random
+import struct
+
+# Début de l'état d'un générateur en octets: taille du tampon, nombre de valeurs dans le tampon et longueur de la graine
+ENTETE_ETAT = struct.Struct('<HHB')
+
+# État du générateur sous-jacent: ses 625 mots de 32 bits (le dernier est la position dans les autres), puis la valeur
+# de random.gauss en attente, s'il y en a une
+ETAT_ALEATOIRE = struct.Struct('<625I?d')
+
+# Version de l'état du générateur sous-jacent (voir random.Random.getstate)
+VERSION_ALEATOIRE = 3
+
+
+class GenerateurDés:
+    """
+    Classe pour une source de nombres aléatoires dédiée aux lancers de dés. Au lieu d'appeler random.randint pour chaque
+    dé, les valeurs sont tirées en bloc dans un tampon, puis distribuées une à une.
+
+    Un GenerateurDés créé avec une graine donne toujours la même suite de valeurs. Lorsqu'il est partagé par une Partie,
+    ses joueurs et leurs dés, une partie créée avec la même graine se déroule donc exactement de la même façon.
+
+    Attributes:
+        graine (int): Graine du générateur, conservée pour pouvoir le recréer (voir RejeuPartie)
+        aleatoire (random.Random): Générateur de nombres aléatoires sous-jacent
+        taille_tampon (int): Nombre d'octets aléatoires tirés à chaque remplissage du tampon
+        tampon (list): Valeurs entre 1 et 6 qui n'ont pas encore été distribuées
+    """
+
+    def __init__(self, graine=None, taille_tampon=256):
+        """
+        Constructeur de la classe GenerateurDés
+        Args:
+            graine (int, optional): Graine du générateur. Sans graine, une graine de 64 bits est tirée au hasard.
+            taille_tampon (int, optional): Nombre d'octets aléatoires tirés à chaque remplissage du tampon
+        """
+        self.graine = random.getrandbits(64) if graine is None else graine
+        self.aleatoire = random.Random(self.graine)
+        self.taille_tampon = taille_tampon
+        self.tampon = []
+
+    def remplir(self):
+        """
+        Méthode qui ajoute des valeurs au tampon. Chaque octet aléatoire inférieur à 252 donne une valeur entre 1 et 6
+        (252 est le plus grand multiple de 6 qui ne dépasse pas 256); les autres octets sont rejetés pour que les 6
+        valeurs soient exactement équiprobables.
+        """
+        self.tampon += [octet % 6 + 1 for octet in self.aleatoire.randbytes(self.taille_tampon) if octet < 252]
+
+    def lancer(self):
+        """
+        Méthode qui retourne la valeur d'un dé lancé.
+        Returns:
+            int: Valeur entre 1 et 6
+        """
+        try:
+            return self.tampon.pop()
+        except IndexError:
+            self.remplir()
+            return self.tampon.pop()
+
+    def lancer_plusieurs(self, nombre_dés):
+        """
+        Méthode qui retourne la valeur de plusieurs dés lancés. Les valeurs sont celles qu'auraient données autant
+        d'appels à lancer (dans un autre ordre), de sorte qu'une partie se déroule de la même façon que les dés soient
+        lancés un à un ou ensemble.
+        Args:
+            nombre_dés (int): Nombre de dés à lancer
+
+        Returns:
+            list: Valeur entre 1 et 6 de chaque dé
+        """
+        valeurs = []
+        while len(self.tampon) < nombre_dés:
+            # Le tampon est épuisé avant d'être rempli à nouveau, comme avec lancer
+            valeurs += self.tampon
+            nombre_dés -= len(self.tampon)
+            self.tampon = []
+            self.remplir()
+        if nombre_dés:
+            valeurs += self.tampon[-nombre_dés:]
+            del self.tampon[-nombre_dés:]
+        return valeurs
+
+    def randrange(self, fin):
+        """
+        Méthode qui choisit un entier au hasard entre 0 et fin - 1, comme random.randrange.
+        Args:
+            fin (int): Borne supérieure (exclue)
+
+        Returns:
+            int: Entier choisi
+        """
+        return self.aleatoire.randrange(fin)
+
+    def random(self):
+        """
+        Méthode qui choisit un nombre réel au hasard entre 0 (inclus) et 1 (exclu), comme random.random.
+        Returns:
+            float: Nombre choisi
+        """
+        return self.aleatoire.random()
+
+    def copier(self):
+        """
+        Méthode qui crée un générateur indépendant, dans le même état: il donnera la même suite de valeurs que
+        celui-ci, sans que l'un influence l'autre.
+        Returns:
+            GenerateurDés: La copie
+        """
+        copie = GenerateurDés.__new__(GenerateurDés)
+        copie.graine = self.graine
+        # L'état est remplacé aussitôt: inutile d'initialiser le générateur sous-jacent
+        copie.aleatoire = random.Random.__new__(random.Random)
+        copie.aleatoire.setstate(self.aleatoire.getstate())
+        copie.taille_tampon = self.taille_tampon
+        copie.tampon = list(self.tampon)
+        return copie
+
+    def en_octets(self):
+        """
+        Méthode qui retourne l'état complet du générateur sous une forme compacte (environ 2,5 ko), par exemple pour
+        suspendre une partie sur disque.
+        Returns:
+            bytes: L'état du générateur
+        """
+        version, mots, gauss = self.aleatoire.getstate()
+        graine = self.graine.to_bytes((self.graine.bit_length() + 8) // 8, 'little', signed=True)
+        return (ENTETE_ETAT.pack(self.taille_tampon, len(self.tampon), len(graine)) + graine
+                + ETAT_ALEATOIRE.pack(*mots, gauss is not None, gauss or 0.0) + bytes(self.tampon))
+
+    @staticmethod
+    def depuis_octets(donnees):
+        """
+        Méthode statique qui recrée un générateur à partir de l'état retourné par en_octets. Il donnera la même suite
+        de valeurs que le générateur d'origine.
+        Args:
+            donnees (bytes): L'état du générateur
+
+        Returns:
+            GenerateurDés: Le générateur
+        """
+        taille_tampon, nombre_valeurs, longueur_graine = ENTETE_ETAT.unpack_from(donnees)
+        position = ENTETE_ETAT.size + longueur_graine
+        *mots, attente, gauss = ETAT_ALEATOIRE.unpack_from(donnees, position)
+        position += ETAT_ALEATOIRE.size
+        generateur = GenerateurDés.__new__(GenerateurDés)
+        generateur.graine = int.from_bytes(donnees[ENTETE_ETAT.size:ENTETE_ETAT.size + longueur_graine], 'little',
+                                           signed=True)
+        generateur.aleatoire = random.Random.__new__(random.Random)
+        generateur.aleatoire.setstate((VERSION_ALEATOIRE, tuple(mots), gauss if attente else None))
+        generateur.taille_tampon = taille_tampon
+        generateur.tampon = list(donnees[position:position + nombre_valeurs])
+        return generateur
+
+    def shuffle(self, liste):
+        """
+        Méthode qui mélange une liste sur place, comme random.shuffle.
+        Args:
+            liste (list): Liste à mélanger
+        """
+        self.aleatoire.shuffle(liste)
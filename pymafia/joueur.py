@@ -2,34 +2,70 @@
 Module de la classe Joueur
 """
 
+import struct
+
 from pymafia.de import Dé
+from pymafia.compteur_des import CompteurDés
+
+# Format binaire d'un joueur: signature, version, type de joueur (voir TYPE_JOUEUR), identifiant, score, dés compacts
+# (1) ou non (0) et nombre de dés. Suivent la valeur de chaque dé (un octet chacune), dans l'ordre des dés.
+ENTETE = struct.Struct('<4sBBIIBI')
+SIGNATURE = b'PYMJ'
+VERSION = 1
 
 
 class Joueur:
     """
-    Classe pour un joueur du jeu pymafia
+    Classe pour un joueur du jeu pymafia. Deux joueurs ne sont égaux que s'ils sont le même objet: un joueur peut
+    donc servir de clé de dictionnaire ou d'élément d'ensemble, même si ses dés et son score changent.
 
     Attributes:
         identifiant (int): Numéro d'identification du joueur
-        dés (liste): liste contenant les dés du joueur
+        dés (liste ou CompteurDés): liste contenant les dés du joueur, ou main compacte qui ne conserve que le nombre
+            de dés de chaque valeur
         score (int): nombre de points du joueur
+        generateur (GenerateurDés): source des valeurs aléatoires des dés du joueur (None pour utiliser le module
+            random)
+        echantillonneur (EchantillonneurDés): tire le résultat des lancers du joueur (None pour lancer ses dés un à
+            un)
+        dés_partagés (bool): True si les dés du joueur sont partagés avec une copie du joueur (voir copier): ils sont
+            alors copiés avant d'être modifiés
     """
+    # Code du type de joueur dans les formes binaire et dictionnaire (voir en_octets). Une sous-classe qui ne le
+    # redéfinit pas a un état qui ne peut pas être sérialisé.
+    TYPE_JOUEUR = 0
 
-    def __init__(self, identifiant):
+    def __init__(self, identifiant, dés_compacts=False, generateur=None, echantillonneur=None):
         """
         Constructeur de la classe Joueur.
         Note: Lorsqu'un joueur est créé en début de partie, on lui donne deux dés.
         Args:
             identifiant (int): Identifiant du joueur à être instancié
+            dés_compacts (bool, optional): True pour conserver les dés du joueur dans un CompteurDés
+            generateur (GenerateurDés, optional): source des valeurs aléatoires des dés du joueur
+            echantillonneur (EchantillonneurDés, optional): tire le résultat d'un lancer de tous les dés du joueur
+                en une seule opération, au lieu de lancer ses dés un à un (les dés du joueur sont alors conservés dans
+                un CompteurDés)
         """
         self.identifiant = identifiant
-        self.dés = [Dé(), Dé()]
+        self.generateur = generateur
+        self.echantillonneur = echantillonneur
+        self.dés_partagés = False
+        if dés_compacts or echantillonneur is not None:
+            self.dés = CompteurDés(2, generateur=generateur, echantillonneur=echantillonneur)
+        else:
+            self.dés = [Dé(generateur=generateur), Dé(generateur=generateur)]
         self.score = 50
 
     def rouler_dés(self):
         """
         Méthode qui modifie aléatoirement la valeur de tous les dés du joueur.
         """
+        if self.dés_partagés:
+            self.detacher_dés()
+        if isinstance(self.dés, CompteurDés):
+            self.dés.rouler()
+            return
         for dé in self.dés:
             dé.rouler()
 
@@ -40,6 +76,8 @@ class Joueur:
             nombre_1 (int): Nombre de dés du joueur ayant la valeur 1
             nombre_6 (int): Nombre de dés du joueur ayant la valeur 6
         """
+        if isinstance(self.dés, CompteurDés):
+            return self.dés.compter(1), self.dés.compter(6)
         nombre_1 = 0
         nombre_6 = 0
         for dé in self.dés:
@@ -55,25 +93,211 @@ class Joueur:
         Args:
             valeur (int): Nombre entre 1 et 6 du ou des dés à retirer
         """
-        self.dés = [dé for dé in self.dés if dé.valeur != valeur]
+        if self.dés_partagés:
+            self.detacher_dés()
+        if isinstance(self.dés, CompteurDés):
+            self.dés.retirer(valeur)
+        else:
+            self.dés = [dé for dé in self.dés if dé.valeur != valeur]
 
     def retirer_dés(self):
         """
         Méthode qui retire tous les dés du joueurs
         """
-        self.dés = []
+        if self.dés_partagés:
+            self.detacher_dés()
+        if isinstance(self.dés, CompteurDés):
+            self.dés.vider()
+        else:
+            self.dés = []
 
     def ajouter_un_dé(self):
         """
         Méthode qui ajoute un dé de valeur 6 aux dés du joueur
         """
-        self.dés.append(Dé(6))
+        if self.dés_partagés:
+            self.detacher_dés()
+        if isinstance(self.dés, CompteurDés):
+            self.dés.ajouter(6)
+        else:
+            self.dés.append(Dé(6, self.generateur))
 
-    def reinitialiser_dés(self):
+    def reinitialiser_dés(self, nombre_dés=5):
         """
         Méthode qui réinitialise les dés du joueur en lui remettant 5 dés en main.
+        Args:
+            nombre_dés (int, optional): Nombre de dés à remettre en main
+        """
+        if self.dés_partagés:
+            self.detacher_dés()
+        if isinstance(self.dés, CompteurDés):
+            self.dés.reinitialiser(nombre_dés)
+        else:
+            self.dés = [Dé(generateur=self.generateur) for i in range(nombre_dés)]
+
+    def copier(self, generateur=None, echantillonneur=None):
+        """
+        Méthode qui crée une copie indépendante du joueur, de la même classe, avec le même score et les mêmes dés. Les
+        dés ne sont pas copiés tout de suite: ils sont partagés par les deux joueurs jusqu'à ce que l'un d'eux les
+        modifie, et ce dernier les copie alors pour lui seul (voir detacher_dés). Les autres attributs sont partagés.
+        Args:
+            generateur (GenerateurDés, optional): source des valeurs aléatoires de la copie et de ses dés
+            echantillonneur (EchantillonneurDés, optional): tire le résultat des lancers de la copie, si ses dés sont
+                compacts
+
+        Returns:
+            Joueur: La copie
         """
-        self.dés = [Dé(), Dé(), Dé(), Dé(), Dé()]
+        # Copie superficielle, sans passer par le constructeur (et sans créer de dés inutilement)
+        copie = object.__new__(type(self))
+        copie.__dict__.update(self.__dict__)
+        copie.generateur = generateur
+        copie.echantillonneur = echantillonneur
+        copie.dés_partagés = True
+        self.dés_partagés = True
+        return copie
+
+    def detacher_dés(self):
+        """
+        Méthode qui remplace les dés du joueur, partagés avec une copie, par une copie qui n'appartient qu'à lui.
+        """
+        if isinstance(self.dés, CompteurDés):
+            self.dés = self.dés.copier(self.generateur, self.echantillonneur)
+        else:
+            self.dés = [Dé(dé.valeur, self.generateur) for dé in self.dés]
+        self.dés_partagés = False
+
+    def en_octets(self):
+        """
+        Méthode qui retourne le joueur sous une forme binaire compacte et versionnée: son type, son identifiant, son
+        score et ses dés. Le générateur et l'échantillonneur, partagés avec la partie, n'en font pas partie.
+        Returns:
+            bytes: Le joueur
+        """
+        valeurs = self.valeurs_dés()
+        return ENTETE.pack(SIGNATURE, VERSION, self.type_joueur(), self.identifiant, self.score,
+                           isinstance(self.dés, CompteurDés), len(valeurs)) + bytes(valeurs)
+
+    @staticmethod
+    def depuis_octets(donnees, generateur=None, echantillonneur=None):
+        """
+        Méthode statique qui recrée un joueur, de la même classe, à partir de la forme binaire retournée par
+        en_octets.
+        Args:
+            donnees (bytes): Le joueur
+            generateur (GenerateurDés, optional): source des valeurs aléatoires du joueur et de ses dés
+            echantillonneur (EchantillonneurDés, optional): tire le résultat des lancers du joueur, si ses dés sont
+                compacts
+
+        Returns:
+            Joueur: Le joueur
+        """
+        signature, version, type_joueur, identifiant, score, compacts, nombre_dés = ENTETE.unpack_from(donnees)
+        if signature != SIGNATURE or version != VERSION:
+            raise ValueError("Ces données ne sont pas un joueur dans un format connu.")
+        valeurs = donnees[ENTETE.size:ENTETE.size + nombre_dés]
+        return Joueur.creer(Joueur.classe_joueur(type_joueur), identifiant, score, compacts, valeurs, generateur,
+                            echantillonneur)
+
+    def en_dict(self):
+        """
+        Méthode qui retourne le joueur sous la forme d'un dictionnaire, par exemple pour l'écrire en JSON.
+        Returns:
+            dict: La version du format, le type du joueur (nom de sa classe), son identifiant, son score et ses dés
+        """
+        self.type_joueur()
+        return {'version': VERSION, 'type': type(self).__name__, 'identifiant': self.identifiant,
+                'score': self.score, 'dés_compacts': isinstance(self.dés, CompteurDés), 'dés': self.valeurs_dés()}
+
+    @staticmethod
+    def depuis_dict(dictionnaire, generateur=None, echantillonneur=None):
+        """
+        Méthode statique qui recrée un joueur, de la même classe, à partir du dictionnaire retourné par en_dict.
+        Args:
+            dictionnaire (dict): Le joueur
+            generateur (GenerateurDés, optional): source des valeurs aléatoires du joueur et de ses dés
+            echantillonneur (EchantillonneurDés, optional): tire le résultat des lancers du joueur, si ses dés sont
+                compacts
+
+        Returns:
+            Joueur: Le joueur
+        """
+        if dictionnaire.get('version') != VERSION:
+            raise ValueError("Ce dictionnaire n'est pas un joueur dans un format connu.")
+        return Joueur.creer(Joueur.classe_joueur(dictionnaire['type']), dictionnaire['identifiant'],
+                            dictionnaire['score'], dictionnaire['dés_compacts'], dictionnaire['dés'], generateur,
+                            echantillonneur)
+
+    def type_joueur(self):
+        """
+        Méthode qui retourne le code du type du joueur, pour la sérialisation.
+        Returns:
+            int: Le code du type du joueur (TYPE_JOUEUR)
+        """
+        if 'TYPE_JOUEUR' not in type(self).__dict__:
+            raise ValueError("Un joueur de la classe {} ne peut pas être sérialisé.".format(type(self).__name__))
+        return self.TYPE_JOUEUR
+
+    @staticmethod
+    def classe_joueur(type_joueur):
+        """
+        Méthode statique qui retrouve la classe de joueur d'un code de type (TYPE_JOUEUR) ou d'un nom de classe,
+        parmi Joueur et ses sous-classes (celles dont le module a été importé).
+        Args:
+            type_joueur (int ou str): Le code du type ou le nom de la classe
+
+        Returns:
+            type: La classe de joueur
+        """
+        classes = [Joueur]
+        for classe in classes:
+            classes += classe.__subclasses__()
+            if 'TYPE_JOUEUR' in classe.__dict__ and type_joueur in (classe.TYPE_JOUEUR, classe.__name__):
+                return classe
+        raise ValueError("Type de joueur inconnu: {}".format(type_joueur))
+
+    @staticmethod
+    def creer(classe, identifiant, score, dés_compacts, valeurs, generateur=None, echantillonneur=None):
+        """
+        Méthode statique qui crée un joueur dans un état donné, sans passer par le constructeur (et sans créer de dés
+        inutilement).
+        Args:
+            classe (type): Classe du joueur
+            identifiant (int): Identifiant du joueur
+            score (int): Score du joueur
+            dés_compacts (bool): True pour conserver les dés du joueur dans un CompteurDés
+            valeurs (iterable): Valeur de chaque dé du joueur
+            generateur (GenerateurDés, optional): source des valeurs aléatoires du joueur et de ses dés
+            echantillonneur (EchantillonneurDés, optional): tire le résultat des lancers du joueur, si ses dés sont
+                compacts
+
+        Returns:
+            Joueur: Le joueur
+        """
+        joueur = object.__new__(classe)
+        joueur.identifiant = identifiant
+        joueur.generateur = generateur
+        joueur.echantillonneur = echantillonneur
+        joueur.dés_partagés = False
+        if dés_compacts:
+            joueur.dés = CompteurDés(generateur=generateur, echantillonneur=echantillonneur)
+            for valeur in valeurs:
+                joueur.dés.comptes[valeur] += 1
+            joueur.dés.nombre = len(valeurs)
+        else:
+            joueur.dés = [Dé(valeur, generateur) for valeur in valeurs]
+        joueur.score = score
+        return joueur
+
+    def valeurs_dés(self):
+        """
+        Méthode qui retourne la valeur de chacun des dés du joueur.
+        Returns:
+            list: Valeur de chaque dé
+        """
+        if isinstance(self.dés, CompteurDés):
+            return self.dés.valeurs()
+        return [dé.valeur for dé in self.dés]
 
     def calculer_points(self):
         """
@@ -81,6 +305,8 @@ class Joueur:
         Returns:
             int: Total de la valeur des dés
         """
+        if isinstance(self.dés, CompteurDés):
+            return self.dés.total()
         points = 0
         for dé in self.dés:
             points += dé.valeur
@@ -104,28 +330,6 @@ class Joueur:
             self.score = 0
             return points_restants
 
-    def __eq__(self, other):
-        """
-        Méthode qui définit l'opérateur == pour la classe joueur
-        Args:
-            other (Joueur): autre objet joueur pour la comparaison
-        Returns:
-            bool: True si c'est le même joueur, False autrement
-        """
-        if not isinstance(other, type(self)):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        """
-        Méthode qui définit l'opérateur != pour la classe joueur
-        Args:
-            other (Joueur): autre objet joueur pour la comparaison
-        Returns:
-            bool: True si ce n'est pas le même joueur, False autrement
-        """
-        return not self == other
-
     def __len__(self):
         """
         Méthode qui retourne le nombre de dés du joueur.
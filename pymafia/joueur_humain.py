@@ -13,12 +13,18 @@ class JoueurHumain(Joueur):
     joueurs ordinateurs.
     """
 
-    def __init__(self, identifiant):
+    TYPE_JOUEUR = 1
+
+    def __init__(self, identifiant, dés_compacts=False, generateur=None, echantillonneur=None):
         """
         Constructeur de la classe JoueurHumain
         Args:
             identifiant (int): Numéro d'identification du joueur
+            dés_compacts (bool, optional): True pour conserver les dés du joueur dans un CompteurDés
+            generateur (GenerateurDés, optional): source des valeurs aléatoires du joueur
+            echantillonneur (EchantillonneurDés, optional): tire le résultat d'un lancer de tous les dés du joueur
+                en une seule opération (ses dés sont alors compacts)
         """
 
-        super().__init__(identifiant)
+        super().__init__(identifiant, dés_compacts, generateur, echantillonneur)
 
@@ -0,0 +1,173 @@
+"""
+Module de la classe JoueurMonteCarlo
+"""
+
+from math import log, sqrt
+from time import perf_counter
+
+from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.echantillonneur_des import EchantillonneurDés
+from pymafia.generateur_des import GenerateurDés
+from pymafia.table_sens import TableSens
+
+# Temps alloué à chaque choix du sens, en secondes, par défaut
+BUDGET = 0.005
+
+# Constante d'exploration de UCB1
+EXPLORATION = sqrt(2)
+
+# Nombre de dés de chaque joueur au début d'une ronde
+DÉS_DÉBUT_RONDE = 5
+
+
+class JoueurMonteCarlo(JoueurOrdinateur):
+    """
+    Classe pour un joueur ordinateur qui choisit le sens du jeu par recherche Monte-Carlo, dans un temps limité. Il
+    simule la suite de la partie dans chacun des deux sens, entre joueurs qui jouent au hasard, autant de fois que son
+    budget le permet, et choisit le sens où il termine le plus souvent parmi les gagnants. Le choix du sens étant la
+    seule décision du jeu, l'arbre de recherche n'a qu'un noeud: chaque simulation est attribuée à l'un des deux sens
+    selon UCB1, qui favorise le meilleur sens tout en continuant d'explorer l'autre.
+
+    Une simulation ne copie que les scores des joueurs actifs, dans l'ordre croissant des identifiants à partir du
+    joueur qui choisit: les dés ne sont que des nombres de dés, et chaque main est lancée en un seul tirage par un
+    EchantillonneurDés. Plus le budget est grand, plus les simulations sont nombreuses et meilleur est le choix. Dans
+    les états de la deuxième ronde de parties réelles à 3 joueurs (voir banc_monte_carlo dans banc_essai), le joueur
+    choisit le meilleur sens environ 6 fois sur 10 avec 2 ms, 7 fois sur 10 avec 128 ms et 3 fois sur 4 avec 0,5 s.
+    L'enjeu reste petit: à 50 points de départ, les deux sens y diffèrent d'au plus 2 ou 3 points de pourcentage de
+    probabilité de victoire.
+
+    Au début d'une partie, tous les scores sont égaux et les deux sens se valent: le choix ne compte que dans une
+    partie où le sens est choisi à chaque ronde (voir Partie, sens_chaque_ronde).
+
+    Le budget est strict: une simulation qui n'est pas terminée à l'échéance est abandonnée. Si aucun des deux sens
+    n'a pu être simulé, ou s'ils ont obtenu le même résultat, le joueur choisit au hasard comme JoueurOrdinateur. Les
+    simulations ont leur propre source de valeurs aléatoires, pour ne pas modifier la suite des dés de la partie.
+
+    Attributes:
+        budget (float): Temps alloué à chaque choix du sens, en secondes
+        echantillonneur_simulations (EchantillonneurDés): tire le résultat des lancers des simulations
+        nombre_simulations (int): Nombre de simulations terminées lors du dernier choix du sens
+        simulations_max (int): Nombre maximal de simulations de chaque choix du sens, même si le budget n'est pas
+            épuisé (None pour ne s'arrêter qu'à la fin du budget)
+    """
+    def __init__(self, identifiant, budget=BUDGET, dés_compacts=False, generateur=None, echantillonneur=None,
+                 graine=None, simulations_max=None):
+        """
+        Constructeur de la classe JoueurMonteCarlo
+        Args:
+            identifiant (int): Numéro d'identification du joueur
+            budget (float, optional): Temps alloué à chaque choix du sens, en secondes
+            dés_compacts (bool, optional): True pour conserver les dés du joueur dans un CompteurDés
+            generateur (GenerateurDés, optional): source des valeurs aléatoires du joueur
+            echantillonneur (EchantillonneurDés, optional): tire le résultat d'un lancer de tous les dés du joueur
+                en une seule opération (ses dés sont alors compacts)
+            graine (int, optional): Graine des simulations (au hasard par défaut)
+            simulations_max (int, optional): Nombre maximal de simulations de chaque choix du sens. Avec un budget
+                infini et une graine, le choix ne dépend plus de la vitesse de la machine.
+        """
+        super().__init__(identifiant, dés_compacts, generateur, echantillonneur)
+        self.budget = budget
+        self.echantillonneur_simulations = EchantillonneurDés(generateur=GenerateurDés(graine))
+        self.nombre_simulations = 0
+        self.simulations_max = simulations_max
+
+    def demander_sens(self, partie=None):
+        """
+        Méthode qui choisit le sens du jeu par recherche Monte-Carlo, ou au hasard si elle ne départage pas les deux
+        sens.
+        Args:
+            partie (Partie, optional): La partie dont le joueur choisit le sens, au début d'une ronde qu'il commence
+
+        Returns:
+            tuple: Le sens (1 pour la gauche (croissant) ou -1 pour la droite (décroissant)) et le message qui
+            indique le choix du joueur
+        """
+        if partie is not None:
+            scores, rondes = TableSens.etat_partie(partie)
+            victoires, visites = self.rechercher(scores, rondes, perf_counter() + self.budget, self.simulations_max)
+            if visites[1] and visites[-1] and victoires[1] / visites[1] != victoires[-1] / visites[-1]:
+                return self.reponse_sens(max((1, -1), key=lambda sens: victoires[sens] / visites[sens]), partie)
+        return super().demander_sens(partie)
+
+    def rechercher(self, scores, rondes, echeance, simulations_max=None):
+        """
+        Méthode qui simule la suite de la partie dans l'un ou l'autre sens jusqu'à l'échéance, ou jusqu'au nombre
+        maximal de simulations.
+        Args:
+            scores (tuple): Scores des joueurs actifs dans l'ordre croissant des identifiants, à partir du joueur qui
+                choisit le sens et commence la ronde
+            rondes (int): Nombre de rondes qui restent à jouer, en comptant celle-ci
+            echeance (float): Moment (selon time.perf_counter) où la recherche doit être terminée
+            simulations_max (int, optional): Nombre maximal de simulations (sans limite par défaut)
+
+        Returns:
+            dict, dict: Nombre de simulations gagnées et nombre de simulations terminées dans chaque sens
+        """
+        victoires = {1: 0, -1: 0}
+        visites = {1: 0, -1: 0}
+        self.nombre_simulations = 0
+        while simulations_max is None or self.nombre_simulations < simulations_max:
+            if not visites[1]:
+                sens = 1
+            elif not visites[-1]:
+                sens = -1
+            else:
+                total = log(self.nombre_simulations)
+                sens = max((1, -1), key=lambda s: victoires[s] / visites[s] + EXPLORATION * sqrt(total / visites[s]))
+            resultat = self.simuler(scores, rondes, sens, echeance)
+            if resultat is None:
+                return victoires, visites
+            victoires[sens] += resultat
+            visites[sens] += 1
+            self.nombre_simulations += 1
+        return victoires, visites
+
+    def simuler(self, scores, rondes, sens, echeance):
+        """
+        Méthode qui simule la suite d'une partie selon ses règles, entre joueurs qui jouent au hasard: à chaque tour,
+        le joueur courant retire ses 1 et passe ses 6 au joueur suivant; le premier joueur sans dé gagne la ronde, les
+        perdants lancent leurs dés et lui donnent leurs points, et les joueurs sans points sont retirés.
+        Args:
+            scores (tuple): Scores des joueurs actifs dans l'ordre croissant des identifiants, à partir du joueur qui
+                choisit le sens et commence la ronde
+            rondes (int): Nombre de rondes qui restent à jouer, en comptant celle-ci
+            sens (int): Sens du jeu (1 ou -1)
+            echeance (float): Moment (selon time.perf_counter) où la simulation est abandonnée
+
+        Returns:
+            int: 1 si le joueur qui choisit termine parmi les gagnants, 0 autrement, ou None si l'échéance est passée
+        """
+        tirer = self.echantillonneur_simulations.tirer
+        scores = list(scores)
+        premier = 0
+        while True:
+            nombre_joueurs = len(scores)
+            dés = [DÉS_DÉBUT_RONDE] * nombre_joueurs
+            courant = premier
+            while True:
+                if perf_counter() > echeance:
+                    return None
+                nombre_1, nombre_6, somme = tirer(dés[courant])
+                suivant = (courant + sens) % nombre_joueurs
+                dés[courant] -= nombre_1 + nombre_6
+                dés[suivant] += nombre_6
+                if dés[courant] == 0:
+                    break
+                courant = suivant
+
+            points_au_gagnant = 0
+            for position in range(nombre_joueurs):
+                if position != courant:
+                    nombre_1, nombre_6, somme = tirer(dés[position])
+                    points = min(nombre_1 + 6 * nombre_6 + somme, scores[position])
+                    scores[position] -= points
+                    points_au_gagnant += points
+            scores[courant] += points_au_gagnant
+
+            if scores[0] == 0:
+                return 0
+            premier = courant - sum(1 for score in scores[:courant] if score == 0)
+            scores = [score for score in scores if score > 0]
+            rondes -= 1
+            if rondes == 0 or len(scores) == 1:
+                return 1 if scores[0] == max(scores) else 0
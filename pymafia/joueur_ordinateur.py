@@ -3,6 +3,7 @@ Module de la classe JoueurOrdinateur
 """
 
 from pymafia.joueur import Joueur
+from pymafia.messages import CatalogueMessages, Message
 from random import randrange
 
 
@@ -10,28 +11,50 @@ class JoueurOrdinateur(Joueur):
     """
     Classe pour un joueur ordinateur au jeu pymafia. Cette classe hérite de la classe Joueur.
     """
-    def __init__(self, identifiant):
+    TYPE_JOUEUR = 2
+
+    def __init__(self, identifiant, dés_compacts=False, generateur=None, echantillonneur=None):
         """
         Constructeur de la classe JoueurOrdinateur
         Args:
             identifiant (int): Numéro d'identification du joueur
+            dés_compacts (bool, optional): True pour conserver les dés du joueur dans un CompteurDés
+            generateur (GenerateurDés, optional): source des valeurs aléatoires du joueur
+            echantillonneur (EchantillonneurDés, optional): tire le résultat d'un lancer de tous les dés du joueur
+                en une seule opération (ses dés sont alors compacts)
         """
-        super().__init__(identifiant)
+        super().__init__(identifiant, dés_compacts, generateur, echantillonneur)
 
-    def demander_sens(self):
+    def demander_sens(self, partie=None):
         """
         Méthode qui fait un choix aléatoire pour le sens du jeu (ordre croissant ou décroissant).
+        Args:
+            partie (Partie, optional): La partie dont le joueur choisit le sens (non utilisée pour un choix aléatoire)
+
         Returns:
             tuple: contenant un entier (1 pour la gauche (croissant) ou -1 pour la droite (décroissant))
-            et un string (message qui indique le choix du joueur ordinateur,
+            et un Message (message qui indique le choix du joueur ordinateur,
             par exemple: Le joueur X choisit de jouer vers la gauche (en ordre croissant)).
         """
-        choix = randrange(2)
+        if self.generateur is None:
+            choix = randrange(2)
+        else:
+            choix = self.generateur.randrange(2)
 
         if choix == 0:
-            message = "Le joueur {} choisit de jouer vers la gauche (en ordre croissant).\n".format(self.identifiant)
-            return 1, message
+            return self.reponse_sens(1, partie)
         else:
-            message = "Le joueur {} choisit de jouer vers la droite (en ordre décroissant).\n".format(self.identifiant)
-            return -1, message
+            return self.reponse_sens(-1, partie)
 
+    def reponse_sens(self, sens, partie=None):
+        """
+        Méthode qui construit la réponse du joueur pour un sens choisi.
+        Args:
+            sens (int): Sens choisi (1, croissant; -1, décroissant)
+            partie (Partie, optional): La partie, dans la langue de laquelle le message est rendu
+
+        Returns:
+            tuple: Le sens et le message qui indique le choix du joueur (rendu seulement au besoin, avec str)
+        """
+        catalogue = CatalogueMessages.obtenir() if partie is None else partie.catalogue
+        return sens, Message(catalogue, 'sens_croissant' if sens == 1 else 'sens_décroissant', (self.identifiant,))
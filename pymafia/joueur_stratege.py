@@ -0,0 +1,52 @@
+"""
+Module de la classe JoueurStratège
+"""
+
+from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.table_sens import TableSens, ÉGALITÉ
+
+
+class JoueurStratège(JoueurOrdinateur):
+    """
+    Classe pour un joueur ordinateur qui choisit le sens du jeu à l'aide d'une TableSens précalculée: il choisit le
+    sens qui lui donne la meilleure probabilité de terminer la partie parmi les gagnants. Lorsque l'état de la partie
+    n'est pas dans la table, ou que les deux sens se valent, il choisit au hasard comme JoueurOrdinateur. Cette classe
+    hérite de la classe JoueurOrdinateur.
+
+    Au début d'une partie, tous les scores sont égaux et les deux sens se valent toujours: la table ne change une
+    décision que dans une partie où le sens est choisi à chaque ronde (voir Partie, sens_chaque_ronde). La valeur
+    d'un sens suppose que le jeu se poursuit dans ce sens jusqu'à la fin de la partie: elle est exacte à la dernière
+    ronde, et approchée avant.
+
+    Attributes:
+        table_sens (TableSens): Meilleur sens dans chaque état de la table
+    """
+    def __init__(self, identifiant, table_sens, dés_compacts=False, generateur=None, echantillonneur=None):
+        """
+        Constructeur de la classe JoueurStratège
+        Args:
+            identifiant (int): Numéro d'identification du joueur
+            table_sens (TableSens): Meilleur sens dans chaque état de la table, partagée par les joueurs
+            dés_compacts (bool, optional): True pour conserver les dés du joueur dans un CompteurDés
+            generateur (GenerateurDés, optional): source des valeurs aléatoires du joueur
+            echantillonneur (EchantillonneurDés, optional): tire le résultat d'un lancer de tous les dés du joueur
+                en une seule opération (ses dés sont alors compacts)
+        """
+        super().__init__(identifiant, dés_compacts, generateur, echantillonneur)
+        self.table_sens = table_sens
+
+    def demander_sens(self, partie=None):
+        """
+        Méthode qui choisit le sens du jeu selon la table, ou au hasard si elle ne départage pas les deux sens.
+        Args:
+            partie (Partie, optional): La partie dont le joueur choisit le sens, au début d'une ronde qu'il commence
+
+        Returns:
+            tuple: Le sens (1 pour la gauche (croissant) ou -1 pour la droite (décroissant)) et le message qui
+            indique le choix du joueur
+        """
+        if partie is not None:
+            sens = self.table_sens.choisir(*TableSens.etat_partie(partie))
+            if sens is not None and sens != ÉGALITÉ:
+                return self.reponse_sens(sens, partie)
+        return super().demander_sens(partie)
@@ -0,0 +1,192 @@
+"""
+Module de la classe MagasinSessions
+"""
+
+import sqlite3
+import struct
+from collections import OrderedDict
+
+from pymafia.table_jeu import TableJeu
+
+# Nombre de tables gardées en mémoire, par défaut
+CAPACITE = 1000
+
+
+class MagasinSessions:
+    """
+    Classe pour les tables d'un serveur (voir ServeurPymafia): seules les tables utilisées le plus récemment sont
+    gardées en mémoire, jusqu'à la capacité du magasin. Lorsqu'elle est dépassée, la table inactive depuis le plus
+    longtemps est suspendue (voir TableJeu.en_octets) dans une base SQLite locale. Elle est reprise dès qu'on la
+    redemande, et retirée de la base: une table n'est jamais à la fois en mémoire et sur disque.
+
+    Le magasin s'utilise comme un dictionnaire de tables selon leur numéro (get, pop, in, len, iter, [] et del),
+    sans se soucier de l'endroit où elles se trouvent.
+
+    La base sert à libérer la mémoire, pas à conserver les tables en cas de panne: elle est écrite sans attendre que
+    le système confirme chaque écriture sur le disque (PRAGMA synchronous = OFF), ce qui permet de suspendre ou de
+    reprendre une table en quelques dizaines de microsecondes.
+
+    Attributes:
+        capacite (int): Nombre maximal de tables gardées en mémoire
+        tables (OrderedDict): Tables en mémoire selon leur numéro, de la moins récemment utilisée à la plus récente
+        connexion (sqlite3.Connection): Base des tables suspendues
+        nombre_suspensions (int): Nombre de tables suspendues sur disque depuis la création du magasin
+        nombre_reprises (int): Nombre de tables reprises du disque depuis la création du magasin
+    """
+
+    def __init__(self, chemin=':memory:', capacite=CAPACITE):
+        """
+        Constructeur de la classe MagasinSessions
+        Args:
+            chemin (str, optional): Fichier de la base des tables suspendues (par défaut, une base temporaire en
+                mémoire, par exemple pour les essais). Les tables d'une base existante sont reprises.
+            capacite (int, optional): Nombre maximal de tables gardées en mémoire
+        """
+        if capacite < 1:
+            raise ValueError("Le magasin doit pouvoir garder au moins une table en mémoire.")
+        self.capacite = capacite
+        self.tables = OrderedDict()
+        self.connexion = sqlite3.connect(chemin, isolation_level=None)
+        self.connexion.execute("PRAGMA journal_mode = WAL")
+        self.connexion.execute("PRAGMA synchronous = OFF")
+        self.connexion.execute("CREATE TABLE IF NOT EXISTS tables (identifiant INTEGER PRIMARY KEY, donnees BLOB)")
+        self.nombre_suspensions = 0
+        self.nombre_reprises = 0
+
+    def get(self, identifiant, defaut=None):
+        """
+        Méthode qui retourne une table, en la reprenant du disque au besoin. Elle devient la table la plus récemment
+        utilisée.
+        Args:
+            identifiant (int): Numéro de la table
+            defaut (optional): Valeur retournée si la table n'existe pas
+
+        Returns:
+            TableJeu: La table, ou la valeur par défaut
+        """
+        table = self.tables.get(identifiant)
+        if table is not None:
+            self.tables.move_to_end(identifiant)
+            return table
+        table = self.reprendre(identifiant)
+        if table is None:
+            return defaut
+        self[identifiant] = table
+        return table
+
+    def __getitem__(self, identifiant):
+        table = self.get(identifiant)
+        if table is None:
+            raise KeyError(identifiant)
+        return table
+
+    def __setitem__(self, identifiant, table):
+        """
+        Méthode qui ajoute une table en mémoire, comme la plus récemment utilisée. Si la capacité du magasin est
+        dépassée, les tables les moins récemment utilisées sont suspendues sur disque. Une table qui ne peut pas être
+        suspendue (voir TableJeu.en_octets) reste en mémoire, quitte à dépasser la capacité: elle n'est jamais perdue.
+        Args:
+            identifiant (int): Numéro de la table
+            table (TableJeu): La table
+        """
+        self.tables[identifiant] = table
+        self.tables.move_to_end(identifiant)
+        candidats = list(self.tables)[:-1]
+        while len(self.tables) > self.capacite and candidats:
+            try:
+                self.suspendre(candidats.pop(0))
+            except (ValueError, struct.error):
+                pass
+
+    def pop(self, identifiant, *defaut):
+        """
+        Méthode qui retire une table du magasin, qu'elle soit en mémoire ou sur disque.
+        Args:
+            identifiant (int): Numéro de la table
+            defaut (optional): Valeur retournée si la table n'existe pas (KeyError autrement)
+
+        Returns:
+            TableJeu: La table retirée
+        """
+        table = self.tables.pop(identifiant, None)
+        if table is None:
+            table = self.reprendre(identifiant)
+        if table is None:
+            if defaut:
+                return defaut[0]
+            raise KeyError(identifiant)
+        return table
+
+    def __delitem__(self, identifiant):
+        self.pop(identifiant)
+
+    def __contains__(self, identifiant):
+        return identifiant in self.tables or self.connexion.execute(
+            "SELECT 1 FROM tables WHERE identifiant = ?", (identifiant,)).fetchone() is not None
+
+    def __iter__(self):
+        identifiants = list(self.tables)
+        identifiants += [ligne[0] for ligne in self.connexion.execute("SELECT identifiant FROM tables")]
+        return iter(identifiants)
+
+    def __len__(self):
+        return len(self.tables) + self.nombre_sur_disque()
+
+    def nombre_sur_disque(self):
+        """
+        Méthode qui compte les tables suspendues sur disque.
+        Returns:
+            int: Nombre de tables sur disque
+        """
+        return self.connexion.execute("SELECT COUNT(*) FROM tables").fetchone()[0]
+
+    def suspendre(self, identifiant):
+        """
+        Méthode qui suspend une table en mémoire sur disque, pour libérer sa mémoire. La table n'est retirée de la
+        mémoire qu'une fois écrite dans la base: si elle ne peut pas être suspendue, elle reste en mémoire.
+        Args:
+            identifiant (int): Numéro de la table
+        """
+        donnees = self.tables[identifiant].en_octets()
+        self.connexion.execute("INSERT OR REPLACE INTO tables (identifiant, donnees) VALUES (?, ?)",
+                               (identifiant, donnees))
+        del self.tables[identifiant]
+        self.nombre_suspensions += 1
+
+    def reprendre(self, identifiant):
+        """
+        Méthode qui reprend une table suspendue sur disque et la retire de la base. La table n'est retirée de la base
+        qu'une fois décodée: si elle ne peut pas l'être, elle reste sur disque. La table n'est pas ajoutée aux tables
+        en mémoire.
+        Args:
+            identifiant (int): Numéro de la table
+
+        Returns:
+            TableJeu: La table, ou None si elle n'est pas sur disque
+        """
+        ligne = self.connexion.execute("SELECT donnees FROM tables WHERE identifiant = ?", (identifiant,)).fetchone()
+        if ligne is None:
+            return None
+        table = TableJeu.depuis_octets(identifiant, ligne[0])
+        self.connexion.execute("DELETE FROM tables WHERE identifiant = ?", (identifiant,))
+        self.nombre_reprises += 1
+        return table
+
+    def fermer(self):
+        """
+        Méthode qui suspend toutes les tables en mémoire sur disque, puis ferme la base. Un magasin créé plus tard sur
+        le même fichier les reprendra. Une table qui ne peut pas être suspendue n'empêche pas de suspendre les
+        suivantes: elle reste dans les tables en mémoire. La base est fermée dans tous les cas.
+        Returns:
+            list: Numéros des tables qui n'ont pas pu être suspendues
+        """
+        non_suspendues = []
+        try:
+            for identifiant in list(self.tables):
+                try:
+                    self.suspendre(identifiant)
+                except (ValueError, struct.error):
+                    non_suspendues.append(identifiant)
+        finally:
+            self.connexion.close()
+        return non_suspendues
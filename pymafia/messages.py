@@ -0,0 +1,238 @@
+"""
+Module des classes de messages d'une partie de pymafia.
+
+Le texte que raconte une partie n'est pas assemblé au fil du jeu: la partie crée un Message, qui ne retient qu'une clé
+du catalogue et ses arguments, et seulement si une sortie reçoit ses messages (voir Partie.sortie). Le texte n'est
+rendu, dans la langue du catalogue, que lorsque la sortie le demande avec str. Une partie sans sortie, comme une
+simulation ou une table d'un serveur, n'assemble ainsi aucun texte.
+"""
+
+# Langue des parties, par défaut
+LANGUE = 'fr'
+
+# Modèles des messages, selon la langue et la clé. Un modèle qui dépend d'un nombre est une paire (singulier, pluriel):
+# le nombre est alors le premier argument du message. Une liste en argument est énumérée ("1, 2 et 3"), et la clé 'et'
+# donne le mot qui précède son dernier élément.
+MESSAGES = {
+    'fr': {
+        'et': " et ",
+        'oui': "O",
+        'non': "N",
+        'vide': "",
+        'saut_ligne': "\n",
+        'tous_ordinateurs': "Tous les joueurs sont des ordinateurs!\n",
+        'un_humain': "Le joueur {} est le joueur humain.",
+        'tous_humains': "Tous les joueurs sont des joueurs humains!",
+        'humains': "Les joueurs {} sont des joueurs humains.",
+        'autre_ordinateur': "L'autre joueur est un ordinateur.\n",
+        'autres_ordinateurs': "Les autres joueurs sont des ordinateurs.\n",
+        'lancer_premier_joueur': "Le joueur {} joue les dés {}. Son score est {}.",
+        'premier_joueur': "\nLe joueur {} a le plus haut score et débutera la partie.\n",
+        'égalité_premier_joueur': "\nIl y a égalité entre les joueurs {}. Ces joueurs doivent relancer les dés.",
+        'sens_croissant': "Le joueur {} choisit de jouer vers la gauche (en ordre croissant).\n",
+        'sens_décroissant': "Le joueur {} choisit de jouer vers la droite (en ordre décroissant).\n",
+        'question_sens': "Joueur {}, voulez-vous jouer en ordre croissant (O) ou décroissant (N)? ",
+        'choix_sens_invalide': "Choix invalide. Veuillez choisir entre 'O' et 'N'.\n",
+        'question_continuer': "Appuyer sur une touche pour continuer.\n",
+        'début_ronde': "Début de la ronde {} par le joueur {}.\n",
+        'lancer': "Le joueur {} joue les dés suivants: {} \n",
+        'dés_retirés': ("Le joueur {1} a roulé {0} dé de valeur 1 et le retire du jeu.",
+                        "Le joueur {1} a roulé {0} dés de valeur 1 et les retire du jeu."),
+        'dés_passés': ("Le joueur {1} a roulé {0} dé de valeur 6 et le passe au joueur suivant.",
+                       "Le joueur {1} a roulé {0} dés de valeur 6 et les passe au joueur suivant."),
+        'gagnant_ronde': "Le joueur {} n'a plus de dé. Il gagne la ronde.",
+        'fin_de_ronde': "Les autres joueurs jouent leurs dés pour calculer les points qu'ils donnent au gagnant du "
+                        "tour.",
+        'points_donnés': ("Le joueur {1} joue les dés suivants: {2}. Il donne {0} point au gagnant de la ronde.\n\n",
+                          "Le joueur {1} joue les dés suivants: {2}. Il donne {0} points au gagnant de la ronde.\n\n"),
+        'points_donnés_retrait': (
+            "Le joueur {1} joue les dés suivants: {2}.\nLa somme des dés est égale ou supérieure à son nombre de "
+            "points. Il donne {0} point au gagnant de la ronde et se retire de la partie.\n\n",
+            "Le joueur {1} joue les dés suivants: {2}.\nLa somme des dés est égale ou supérieure à son nombre de "
+            "points. Il donne {0} points au gagnant de la ronde et se retire de la partie.\n\n"),
+        'points_gagnant': ("Le joueur {1} obtient {0} point.\n", "Le joueur {1} obtient {0} points.\n"),
+        'points_fin_de_ronde': "À la fin de cette ronde, les joueurs ont les points suivants:\n{}",
+        'fin_rondes': "Le nombre maximal de rondes est atteint. La partie est terminée.",
+        'points_fin_de_partie': "À la fin de la partie, les joueurs ont les points suivants:\n{}",
+        'points_joueur': ("Le joueur {1} a {0} point.\n", "Le joueur {1} a {0} points.\n"),
+        'gagnant_partie': "Le joueur {} a gagné à la partie!\n",
+        'égalité_partie': "Il y a égalité entre les joueurs {}.\n",
+        'merci': "Merci d'avoir joué à pymafia!",
+    },
+    'en': {
+        'et': " and ",
+        'oui': "Y",
+        'non': "N",
+        'vide': "",
+        'saut_ligne': "\n",
+        'tous_ordinateurs': "All players are computers!\n",
+        'un_humain': "Player {} is the human player.",
+        'tous_humains': "All players are human players!",
+        'humains': "Players {} are human players.",
+        'autre_ordinateur': "The other player is a computer.\n",
+        'autres_ordinateurs': "The other players are computers.\n",
+        'lancer_premier_joueur': "Player {} rolls {}. Their score is {}.",
+        'premier_joueur': "\nPlayer {} has the highest score and will start the game.\n",
+        'égalité_premier_joueur': "\nPlayers {} are tied. These players must roll again.",
+        'sens_croissant': "Player {} chooses to play to the left (in increasing order).\n",
+        'sens_décroissant': "Player {} chooses to play to the right (in decreasing order).\n",
+        'question_sens': "Player {}, do you want to play in increasing (Y) or decreasing (N) order? ",
+        'choix_sens_invalide': "Invalid choice. Please choose between 'Y' and 'N'.\n",
+        'question_continuer': "Press a key to continue.\n",
+        'début_ronde': "Round {} starts with player {}.\n",
+        'lancer': "Player {} rolls the following dice: {} \n",
+        'dés_retirés': ("Player {1} rolled {0} die with value 1 and removes it from the game.",
+                        "Player {1} rolled {0} dice with value 1 and removes them from the game."),
+        'dés_passés': ("Player {1} rolled {0} die with value 6 and passes it to the next player.",
+                       "Player {1} rolled {0} dice with value 6 and passes them to the next player."),
+        'gagnant_ronde': "Player {} has no dice left. They win the round.",
+        'fin_de_ronde': "The other players roll their dice to count the points they give to the winner of the round.",
+        'points_donnés': ("Player {1} rolls the following dice: {2}. They give {0} point to the winner of the "
+                          "round.\n\n",
+                          "Player {1} rolls the following dice: {2}. They give {0} points to the winner of the "
+                          "round.\n\n"),
+        'points_donnés_retrait': (
+            "Player {1} rolls the following dice: {2}.\nThe sum of the dice is equal to or greater than their score. "
+            "They give {0} point to the winner of the round and leave the game.\n\n",
+            "Player {1} rolls the following dice: {2}.\nThe sum of the dice is equal to or greater than their score. "
+            "They give {0} points to the winner of the round and leave the game.\n\n"),
+        'points_gagnant': ("Player {1} gets {0} point.\n", "Player {1} gets {0} points.\n"),
+        'points_fin_de_ronde': "At the end of this round, the players have the following points:\n{}",
+        'fin_rondes': "The maximum number of rounds has been reached. The game is over.",
+        'points_fin_de_partie': "At the end of the game, the players have the following points:\n{}",
+        'points_joueur': ("Player {1} has {0} point.\n", "Player {1} has {0} points.\n"),
+        'gagnant_partie': "Player {} won the game!\n",
+        'égalité_partie': "Players {} are tied.\n",
+        'merci': "Thank you for playing pymafia!",
+    },
+}
+
+# Règle du pluriel de chaque langue: True si un nombre demande le pluriel
+PLURIELS = {
+    'fr': lambda nombre: nombre > 1,
+    'en': lambda nombre: nombre != 1,
+}
+
+
+class CatalogueMessages:
+    """
+    Classe pour les modèles des messages d'une langue. Les modèles sont précompilés une fois pour toutes: chacun est
+    gardé sous la forme de sa méthode format, prête à recevoir les arguments d'un message. Il n'y a qu'un catalogue
+    par langue (voir obtenir), partagé par toutes les parties.
+
+    Attributes:
+        langue (str): Code de la langue ('fr' ou 'en')
+        modeles (dict): Méthode format de chaque modèle (ou paire de méthodes, au singulier et au pluriel), selon sa
+            clé
+        pluriel (callable): Règle du pluriel de la langue
+        et (str): Mot qui précède le dernier élément d'une énumération
+    """
+    catalogues = {}
+
+    def __init__(self, langue=LANGUE):
+        """
+        Constructeur de la classe CatalogueMessages
+        Args:
+            langue (str, optional): Code de la langue ('fr' ou 'en')
+        """
+        if langue not in MESSAGES:
+            raise ValueError("Langue inconnue: {} (langues connues: {}).".format(langue, ', '.join(MESSAGES)))
+        self.langue = langue
+        self.modeles = {}
+        for cle, modele in MESSAGES[langue].items():
+            if isinstance(modele, tuple):
+                self.modeles[cle] = tuple(forme.format for forme in modele)
+            else:
+                self.modeles[cle] = modele.format
+        self.pluriel = PLURIELS[langue]
+        self.et = MESSAGES[langue]['et']
+
+    @staticmethod
+    def obtenir(langue=LANGUE):
+        """
+        Méthode statique qui retourne le catalogue d'une langue, créé à la première demande.
+        Args:
+            langue (str, optional): Code de la langue
+
+        Returns:
+            CatalogueMessages: Le catalogue de la langue
+        """
+        catalogue = CatalogueMessages.catalogues.get(langue)
+        if catalogue is None:
+            catalogue = CatalogueMessages.catalogues[langue] = CatalogueMessages(langue)
+        return catalogue
+
+    def rendre(self, cle, arguments=()):
+        """
+        Méthode qui rend le texte d'un message.
+        Args:
+            cle (str): Clé du modèle
+            arguments (tuple, optional): Arguments du message (le nombre d'abord, pour un modèle au pluriel)
+
+        Returns:
+            str: Le texte du message
+        """
+        modele = self.modeles[cle]
+        if type(modele) is tuple:
+            modele = modele[self.pluriel(arguments[0])]
+        return modele(*[self.enumerer(argument) if type(argument) is list else argument for argument in arguments])
+
+    def enumerer(self, elements):
+        """
+        Méthode qui énumère les éléments d'une liste. Par exemple, "1, 2 et 3".
+        Args:
+            elements (list): Les éléments
+
+        Returns:
+            str: L'énumération
+        """
+        elements = [str(element) for element in elements]
+        if len(elements) < 2:
+            return ''.join(elements)
+        return ', '.join(elements[:-1]) + self.et + elements[-1]
+
+    def __reduce__(self):
+        # Un catalogue copié ou recréé par pickle est celui de sa langue
+        return CatalogueMessages.obtenir, (self.langue,)
+
+
+class Message:
+    """
+    Classe pour un message d'une partie, qui n'est rendu en texte qu'au moment où on le demande (avec str). Les
+    arguments sont des valeurs figées au moment du message (nombres, listes d'identifiants, ValeursDés, autres
+    messages), de sorte que le texte ne dépend pas du moment où il est rendu.
+
+    Attributes:
+        catalogue (CatalogueMessages): Catalogue dans lequel le message est rendu
+        cle (str): Clé du modèle du message (None pour une suite de messages, rendus l'un après l'autre)
+        arguments (tuple): Arguments du message
+    """
+
+    def __init__(self, catalogue, cle, arguments=()):
+        """
+        Constructeur de la classe Message
+        Args:
+            catalogue (CatalogueMessages): Catalogue dans lequel le message est rendu
+            cle (str): Clé du modèle du message (None pour une suite de messages)
+            arguments (tuple, optional): Arguments du message (les messages de la suite, si cle est None)
+        """
+        self.catalogue = catalogue
+        self.cle = cle
+        self.arguments = arguments
+
+    def __str__(self):
+        if self.cle is None:
+            return ''.join(str(message) for message in self.arguments)
+        return self.catalogue.rendre(self.cle, self.arguments)
+
+    def __repr__(self):
+        return "Message({!r}, {!r})".format(self.cle, self.arguments)
+
+
+class ValeursDés(tuple):
+    """
+    Classe pour les valeurs de dés en argument d'un message, rendues avec les caractères ⚀ à ⚅. Par exemple, '⚀ ⚃ ⚃'.
+    """
+
+    def __str__(self):
+        return ' '.join(chr(9855 + valeur) for valeur in self)
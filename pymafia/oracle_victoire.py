@@ -0,0 +1,271 @@
+"""
+Module de la classe OracleVictoire
+"""
+
+import shelve
+from functools import lru_cache
+from math import factorial
+
+# Erreur maximale des probabilités d'un niveau, par rapport à la solution exacte du niveau, lorsque les itérations
+# s'arrêtent (voir OracleVictoire.calculer). Les probabilités sont au plus 1: cette erreur correspond à une
+# cinquantaine d'unités d'arrondi d'un float, ce que les itérations atteignent toujours.
+TOLERANCE = 1e-14
+
+# Version du calcul des probabilités, qui fait partie de la clé de chaque état dans le fichier (voir OracleVictoire.cle)
+VERSION = 2
+
+
+class OracleVictoire:
+    """
+    Classe qui calcule la probabilité que chaque joueur gagne la ronde en cours, c'est-à-dire qu'il soit le
+    premier à ne plus avoir de dé, selon le nombre de dés de chacun et l'ordre dans lequel ils jouent.
+
+    Le déroulement d'une ronde est une chaîne de Markov: à son tour, un joueur qui a n dés obtient a dés de valeur 1 et
+    b dés de valeur 6 avec une probabilité multinomiale; il retire les a dés, passe les b dés au joueur suivant et
+    gagne s'il ne lui reste aucun dé (voir Partie.deplacer_les_dés_1_et_6). Un état de la chaîne est décrit, sous sa
+    forme canonique, par le nombre de dés de chaque joueur dans l'ordre où ils joueront à partir du joueur courant: le
+    sens de la partie et la position du joueur courant à la table n'ont pas d'autre effet.
+
+    Le nombre total de dés ne fait que diminuer. Les états sont donc calculés par niveau (nombre total de dés), en
+    ordre croissant; à l'intérieur d'un niveau, un lancer sans dé de valeur 1 peut ramener à un état déjà visité, et
+    les probabilités du niveau sont obtenues par itérations successives (Gauss-Seidel) en float. Aucune partie n'est
+    simulée.
+
+    Les probabilités sont donc approchées. Un lancer de n dés reste dans le même niveau (aucun 1 et au moins un dé
+    qui n'est pas un 6) avec une probabilité q d'au plus (5/6)^n - (1/6)^n <= 2/3, de sorte que chaque itération
+    réduit l'erreur d'un facteur q au moins, et que l'erreur après une itération est au plus q / (1 - q) fois le plus
+    grand changement de cette itération. Les itérations s'arrêtent lorsque cette borne passe sous la tolérance.
+    L'erreur des niveaux inférieurs ne s'amplifie pas en remontant (leurs contributions ont un poids total d'au plus
+    1 - q): à un arrondi de float près, l'erreur d'une probabilité est au plus la tolérance multipliée par le nombre
+    total de dés de l'état, soit moins de 1e-12 avec la tolérance par défaut et 75 dés.
+
+    Les probabilités calculées sont gardées en mémoire, et aussi dans un fichier (shelve) si un chemin est donné, de
+    sorte qu'elles n'ont à être calculées qu'une fois. La clé de chaque état dans le fichier comprend la version du
+    calcul et la tolérance, pour qu'un fichier partagé ne rende jamais des probabilités calculées autrement. Une fois
+    un état connu, une requête ne prend que quelques microsecondes. Le nombre d'états atteignables croît toutefois
+    très vite avec le nombre de joueurs: l'oracle convient aux tables de quelques joueurs.
+
+    L'oracle s'utilise idéalement avec l'énoncé with lorsqu'il a un fichier:
+
+        with OracleVictoire('oracle.db') as oracle:
+            probabilites = oracle.probabilites_partie(partie)
+
+    Attributes:
+        probabilites (dict): Probabilités de victoire de chaque état canonique déjà calculé (tuple du nombre de dés
+            de chaque joueur, à partir du joueur courant), pour chaque joueur dans le même ordre
+        cache_disque (shelve.Shelf): Probabilités conservées dans un fichier (None sans fichier)
+        tolerance (float): Erreur maximale des probabilités de chaque niveau, par rapport à sa solution exacte
+    """
+
+    def __init__(self, chemin=None, tolerance=TOLERANCE):
+        """
+        Constructeur de la classe OracleVictoire
+        Args:
+            chemin (str, optional): Fichier où conserver les probabilités calculées (créé au besoin)
+            tolerance (float, optional): Erreur maximale des probabilités de chaque niveau
+        """
+        self.probabilites = {}
+        self.tolerance = tolerance
+        self.cache_disque = shelve.open(chemin) if chemin is not None else None
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def issues_lancer(nombre_dés):
+        """
+        Méthode statique qui retourne les issues possibles du lancer d'un certain nombre de dés, selon le nombre de dés
+        de valeur 1 et de valeur 6 obtenus. Les issues de chaque nombre de dés ne sont calculées qu'une fois.
+        Args:
+            nombre_dés (int): Nombre de dés lancés
+
+        Returns:
+            list: (nombre de 1, nombre de 6, probabilité) pour chaque issue
+        """
+        issues = []
+        for nombre_1 in range(nombre_dés + 1):
+            for nombre_6 in range(nombre_dés - nombre_1 + 1):
+                autres = nombre_dés - nombre_1 - nombre_6
+                façons = factorial(nombre_dés) // (factorial(nombre_1) * factorial(nombre_6) * factorial(autres))
+                issues.append((nombre_1, nombre_6, façons * 4 ** autres / 6 ** nombre_dés))
+        return issues
+
+    def cle(self, etat):
+        """
+        Méthode qui retourne la clé d'un état dans le fichier: la version du calcul, la tolérance et le nombre de dés
+        de chaque joueur. Par exemple, '2:1e-14:4,3,2'.
+        Args:
+            etat (tuple): État canonique
+
+        Returns:
+            str: Clé de l'état
+        """
+        return '{}:{!r}:{}'.format(VERSION, self.tolerance, ','.join(str(nombre_dés) for nombre_dés in etat))
+
+    def connu(self, etat):
+        """
+        Méthode qui vérifie si les probabilités d'un état sont déjà calculées, en mémoire ou dans le fichier. Celles
+        du fichier sont alors chargées en mémoire.
+        Args:
+            etat (tuple): État canonique
+
+        Returns:
+            bool: True si les probabilités de l'état sont connues, False autrement
+        """
+        if etat in self.probabilites:
+            return True
+        if self.cache_disque is not None:
+            probabilites = self.cache_disque.get(self.cle(etat))
+            if probabilites is not None:
+                self.probabilites[etat] = probabilites
+                return True
+        return False
+
+    def probabilites_etat(self, etat):
+        """
+        Méthode qui retourne la probabilité de victoire de chaque joueur dans un état donné.
+        Args:
+            etat (tuple): Nombre de dés de chaque joueur actif, dans l'ordre où ils joueront à partir du joueur courant
+
+        Returns:
+            tuple: Probabilité que chaque joueur gagne la ronde, dans le même ordre
+        """
+        probabilites = self.probabilites.get(etat)
+        if probabilites is not None:
+            return probabilites
+        if etat[0] == 0 or len(etat) == 1:
+            # Le joueur courant vient de gagner la ronde
+            return (1.0,) + (0.0,) * (len(etat) - 1)
+        if not self.connu(etat):
+            self.calculer(etat)
+        return self.probabilites[etat]
+
+    def probabilites_partie(self, partie):
+        """
+        Méthode qui retourne la probabilité que chaque joueur actif d'une partie gagne la ronde en cours, au moment
+        où le joueur courant s'apprête à lancer ses dés.
+        Args:
+            partie (Partie): La partie
+
+        Returns:
+            dict: Probabilité de victoire de chaque joueur actif
+        """
+        joueurs = [partie.joueur_courant]
+        for i in range(len(partie.joueurs_actifs) - 1):
+            joueurs.append(partie.anneau_joueurs.voisin(joueurs[-1], partie.sens))
+        probabilites = self.probabilites_etat(tuple(len(joueur.dés) for joueur in joueurs))
+        return dict(zip(joueurs, probabilites))
+
+    def calculer(self, etat):
+        """
+        Méthode qui calcule les probabilités d'un état et de tous les états inconnus atteignables à partir de lui.
+        Args:
+            etat (tuple): État canonique
+        """
+        # Recherche des états inconnus atteignables, regroupés par nombre total de dés
+        niveaux = {}
+        a_visiter = [etat]
+        vus = {etat}
+        while a_visiter:
+            courant = a_visiter.pop()
+            niveaux.setdefault(sum(courant), []).append(courant)
+            for nombre_1, nombre_6, probabilite in self.issues_lancer(courant[0]):
+                restants = courant[0] - nombre_1 - nombre_6
+                if restants:
+                    suivant = (courant[1] + nombre_6,) + courant[2:] + (restants,)
+                    if suivant not in vus and not self.connu(suivant):
+                        vus.add(suivant)
+                        a_visiter.append(suivant)
+
+        for niveau in sorted(niveaux):
+            etats = niveaux[niveau]
+            decompositions = {}
+            for courant in etats:
+                self.probabilites[courant] = [0.0] * len(etat)
+            for courant in etats:
+                decompositions[courant] = self.decomposer(courant)
+            # Facteur de réduction de l'erreur à chaque itération: la plus grande probabilité de rester dans le niveau
+            reduction = max(sum(probabilite for probabilite, suivant in decompositions[courant][1])
+                            for courant in etats)
+            borne = 1.0
+            while borne > self.tolerance:
+                ecart = 0.0
+                for courant in etats:
+                    nouvelles = self.iterer(*decompositions[courant])
+                    ecart = max(ecart, max(map(abs, map(float.__sub__, nouvelles, self.probabilites[courant]))))
+                    self.probabilites[courant] = nouvelles
+                borne = ecart * reduction / (1.0 - reduction)
+            for courant in etats:
+                self.probabilites[courant] = tuple(self.probabilites[courant])
+                if self.cache_disque is not None:
+                    self.cache_disque[self.cle(courant)] = self.probabilites[courant]
+
+    def decomposer(self, etat):
+        """
+        Méthode qui sépare les issues du lancer du joueur courant d'un état en deux: celles qui terminent la ronde ou
+        retirent au moins un dé mènent à un état d'un niveau inférieur, déjà calculé, et leur contribution aux
+        probabilités de l'état est constante; les autres mènent à un état du même niveau. Après le lancer, le joueur
+        suivant devient le premier de l'état et le joueur courant, le dernier.
+        Args:
+            etat (tuple): État canonique
+
+        Returns:
+            list, list: Contribution constante à la probabilité de victoire de chaque joueur, et (probabilité, état
+                suivant) pour chaque issue qui mène au même niveau
+        """
+        constantes = [0.0] * len(etat)
+        internes = []
+        for nombre_1, nombre_6, probabilite in self.issues_lancer(etat[0]):
+            restants = etat[0] - nombre_1 - nombre_6
+            if not restants:
+                constantes[0] += probabilite
+            elif nombre_1:
+                suivantes = self.probabilites[(etat[1] + nombre_6,) + etat[2:] + (restants,)]
+                constantes = self.accumuler(constantes, probabilite, suivantes)
+            else:
+                internes.append((probabilite, (etat[1] + nombre_6,) + etat[2:] + (restants,)))
+        return constantes, internes
+
+    @staticmethod
+    def accumuler(probabilites, probabilite, suivantes):
+        """
+        Méthode statique qui ajoute aux probabilités d'un état la contribution d'une issue du lancer, à partir des
+        probabilités de l'état qui la suit (dont le premier joueur est le deuxième de l'état).
+        Args:
+            probabilites (list): Probabilités de l'état
+            probabilite (float): Probabilité de l'issue
+            suivantes (list): Probabilités de l'état suivant
+
+        Returns:
+            list: Probabilités de l'état, avec la contribution de l'issue
+        """
+        return [actuelle + probabilite * suivante for actuelle, suivante in
+                zip(probabilites, suivantes[-1:] + suivantes[:-1])]
+
+    def iterer(self, constantes, internes):
+        """
+        Méthode qui recalcule les probabilités d'un état à partir de sa décomposition (voir decomposer) et des
+        probabilités actuelles des états du même niveau.
+        Args:
+            constantes (list): Contribution des issues qui quittent le niveau
+            internes (list): (probabilité, état suivant) des issues qui restent dans le niveau
+
+        Returns:
+            list: Nouvelles probabilités de victoire de chaque joueur
+        """
+        probabilites = constantes
+        for probabilite, suivant in internes:
+            probabilites = self.accumuler(probabilites, probabilite, self.probabilites[suivant])
+        return probabilites
+
+    def fermer(self):
+        """
+        Méthode qui ferme le fichier de l'oracle, s'il en a un.
+        """
+        if self.cache_disque is not None:
+            self.cache_disque.close()
+            self.cache_disque = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type_exception, exception, trace):
+        self.fermer()
@@ -4,11 +4,47 @@ Module de la classe Partie
 
 from pymafia.joueur_humain import JoueurHumain
 from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.joueur_stratege import JoueurStratège
+from pymafia.joueur_monte_carlo import JoueurMonteCarlo
+from pymafia.resultat_partie import ResultatPartie
+from pymafia.anneau_joueurs import AnneauJoueurs
+from pymafia.echantillonneur_des import EchantillonneurDés
+from pymafia.avance_rapide import AvanceRapide
+from pymafia.demandes import DemandeSens, DemandeLancer, DemandeContinuer
+from pymafia.evenements import Evenement, PartieCommencée, Lancer, PremierJoueurTrouvé, SensChoisi, DésRetirés, \
+    DésPassés, RondeGagnée, PointsRéglés, JoueurÉliminé, RondeTerminée
+from pymafia.joueur import Joueur
+from pymafia.generateur_des import GenerateurDés
+from pymafia.messages import CatalogueMessages, Message, ValeursDés, LANGUE
+from pymafia.rendu_console import RenduConsole
 from random import shuffle
+import json
+import struct
 
 # Variable globale spécifiant le nombre maximale de rondes d'une partie du jeu pymafia
 RONDEMAX = 1
 
+# Format binaire d'une partie: signature, version, nombre de joueurs, index du premier joueur, du joueur courant et du
+# joueur suivant, sens, ronde, ronde maximale, nombre de tours, points transférés, options (voir ci-dessous), plus
+# grand nombre de dés de l'échantillonneur, plus grand nombre de joueurs de l'avance rapide et code de la langue des
+# messages (deux lettres ASCII). Suivent les joueurs
+# actifs (un bit par joueur), les décisions et les décisions à rejouer (nombre, puis un octet signé chacune), chaque
+# joueur (longueur, puis Joueur.en_octets), l'état du générateur (longueur, puis GenerateurDés.en_octets) et le
+# journal (longueur, puis liste des événements en JSON).
+ENTETE = struct.Struct('<4sBIIIIbIIIQBHH2s')
+SIGNATURE = b'PYMP'
+VERSION = 2
+LONGUEUR = struct.Struct('<I')
+
+# Options d'une partie dans sa forme binaire
+AFFICHAGE = 1
+GRANDE_TABLE = 2
+ECHANTILLONNAGE = 4
+AVANCE_RAPIDE = 8
+JOURNALISATION = 16
+GENERATEUR = 32
+SENS_CHAQUE_RONDE = 64
+
 
 
 class Partie:
@@ -16,32 +52,141 @@ class Partie:
     Documentation de la classe Partie
     Attributes:
         joueurs (list): Liste des joueurs au départ de la partie
-        joueurs_actifs (list): Liste des joueurs qui ont encore des points (score supérieur à 0)
+        joueurs_actifs (AnneauJoueurs): Anneau des joueurs qui ont encore des points (score supérieur à 0), dans
+            l'ordre de la liste des joueurs. On peut aussi lui affecter une liste de joueurs.
         premier_joueur (Joueur): Premier joueur de la ronde
         joueur_courant (Joueur): Joueur dont c'est le tour
         joueur_suivant (Joueur): Joueur dont ce sera le tour lorsque le joueur_courant aura joué (prochain joueur actif)
         ronde (int): Nombre de la ronde actuelle
         sens (int): Nombre qui indique le sens du tour (1, croissant; -1, décroissant)
+        ronde_max (int): Nombre maximal de rondes de la partie
+        affichage (bool): True si la partie a une sortie pour ses messages, False autrement. On peut lui affecter True
+            pour afficher les messages à la console (si la partie n'a pas déjà une sortie), ou False pour les taire.
+        sortie (callable): Reçoit chaque message de la partie (voir le module messages), par exemple print (None si
+            la partie n'a pas de sortie: aucun message n'est alors créé)
+        catalogue (CatalogueMessages): Catalogue des messages de la partie, dans sa langue
+        nombre_tours (int): Nombre de tours joués depuis le début de la partie (les tours des rondes avancées
+            rapidement ne sont pas joués, et ne sont pas comptés)
+        points_transférés (int): Somme des points donnés aux gagnants des rondes depuis le début de la partie
+        generateur (GenerateurDés): Source des valeurs aléatoires de la partie, qui n'appartient qu'à elle
+        echantillonneur (EchantillonneurDés): Tire le résultat des lancers des joueurs (None si les dés sont lancés un
+            à un)
+        journal (list): Événements de la partie, dans l'ordre où ils sont survenus (None si la journalisation n'est
+            pas activée)
+        décisions (list): Sens choisi (1 ou -1) à chaque appel de determiner_sens, dans l'ordre. Avec la graine du
+            générateur, c'est tout ce qu'il faut pour recréer la partie (voir RejeuPartie).
+        décisions_à_rejouer (list): Sens à utiliser, dans l'ordre des décisions de la partie, lorsqu'un joueur humain
+            doit choisir le sens, au lieu de le lui demander à la console. La décision d'un joueur ordinateur est
+            sautée: il choisit à nouveau le sens.
+        grande_table (bool): True si la fin de ronde est réglée en une seule passe sur les joueurs (voir
+            regler_fin_de_ronde), pour les tables de milliers de joueurs
+        avance_rapide (AvanceRapide): Joue les rondes entre joueurs ordinateurs en un seul tirage (None pour toujours
+            jouer les rondes tour par tour)
+        sens_chaque_ronde (bool): True si le gagnant d'une ronde, qui commence la suivante, choisit à nouveau le sens
     """
 
-    def __init__(self, nombre_joueurs, nombre_joueurs_humains):
+    def __init__(self, nombre_joueurs, nombre_joueurs_humains, affichage=True, dés_compacts=False, generateur=None,
+                 journalisation=False, grande_table=False, echantillonnage=False, avance_rapide=False,
+                 table_sens=None, budget_monte_carlo=None, langue=LANGUE, sortie=None, sens_chaque_ronde=False):
         """
         Constructeur de la classe Partie
         Args:
             nombre_joueurs (int): Nombre de joueurs de la partie
             nombre_joueurs_humains (int): Nombre de joueurs humains de la partie
-        """
-        self.joueurs = self.creer_joueurs(nombre_joueurs, nombre_joueurs_humains)
+            affichage (bool, optional): False pour jouer la partie sans aucun affichage à la console
+            dés_compacts (bool, optional): True pour que les dés des joueurs soient conservés dans des CompteurDés
+            generateur (GenerateurDés, optional): source des valeurs aléatoires de la partie, partagée par les joueurs
+                et leurs dés. Une partie dont le générateur a une graine est reproductible. Par défaut, la partie crée
+                son propre générateur: aucune partie ne tire ses dés du module random, et des parties jouées en même
+                temps dans des fils d'exécution différents ne se dérangent pas.
+            journalisation (bool, optional): True pour consigner les événements de la partie dans son journal
+            grande_table (bool, optional): True pour une table de milliers de joueurs: les dés des joueurs sont
+                compacts et la fin de ronde est réglée en une seule passe. La partie se déroule exactement de la même
+                façon qu'avec une table ordinaire.
+            echantillonnage (bool, optional): True pour que chaque lancer d'une main de dés soit tiré en une seule
+                opération par un EchantillonneurDés partagé par les joueurs. Les dés sont alors compacts, et le nombre
+                de 1, le nombre de 6 et la somme des dés d'un lancer suivent exactement la même distribution.
+            avance_rapide (bool, optional): True pour que les rondes entre joueurs ordinateurs soient jouées en un seul
+                tirage (voir AvanceRapide), lorsque la partie n'est ni affichée ni journalisée
+            table_sens (TableSens, optional): Table des meilleurs sens (voir SolveurSens). Les joueurs ordinateurs
+                sont alors des JoueurStratège, qui choisissent le sens selon cette table.
+            budget_monte_carlo (float, optional): Temps alloué à chaque choix du sens, en secondes. Les joueurs
+                ordinateurs sont alors des JoueurMonteCarlo, qui choisissent le sens par recherche Monte-Carlo.
+            langue (str, optional): Langue des messages de la partie ('fr' ou 'en')
+            sortie (callable, optional): Reçoit chaque message de la partie, au lieu de la console
+            sens_chaque_ronde (bool, optional): True pour que le sens soit choisi au début de chaque ronde par le
+                joueur qui la commence, plutôt qu'une seule fois au début de la partie. Au début de la partie, tous
+                les scores sont égaux et les deux sens se valent; ce n'est qu'à partir de la deuxième ronde que le
+                choix d'un JoueurStratège ou d'un JoueurMonteCarlo peut faire une différence.
+        """
+        dés_compacts = dés_compacts or grande_table
+        self.grande_table = grande_table
+        if generateur is None:
+            generateur = GenerateurDés()
+        self.generateur = generateur
+        self.echantillonneur = EchantillonneurDés(generateur=generateur) if echantillonnage else None
+        self.joueurs = self.creer_joueurs(nombre_joueurs, nombre_joueurs_humains, dés_compacts, generateur,
+                                          self.echantillonneur, table_sens, budget_monte_carlo)
         self.joueurs_actifs = list(self.joueurs)
         self.premier_joueur = self.joueurs[0]
         self.joueur_courant = self.joueurs[0]
         self.joueur_suivant = self.joueurs[1]
         self.ronde = 1
         self.sens = 1
+        self.ronde_max = RONDEMAX
+        self.catalogue = CatalogueMessages.obtenir(langue)
+        self.sortie = sortie
+        self.affichage = affichage or sortie is not None
+        self.nombre_tours = 0
+        self.points_transférés = 0
+        self.journal = [] if journalisation else None
+        self.décisions = []
+        self.décisions_à_rejouer = []
+        self.avance_rapide = AvanceRapide(generateur) if avance_rapide else None
+        self.sens_chaque_ronde = sens_chaque_ronde
+
+    @property
+    def affichage(self):
+        """
+        Propriété qui indique si la partie a une sortie pour ses messages.
+        Returns:
+            bool: True si la partie a une sortie, False autrement
+        """
+        return self.sortie is not None
+
+    @affichage.setter
+    def affichage(self, affichage):
+        """
+        Propriété qui affiche les messages de la partie à la console, si elle n'a pas déjà une sortie, ou qui les tait.
+        Args:
+            affichage (bool): True pour afficher les messages, False pour les taire
+        """
+        if not affichage:
+            self.sortie = None
+        elif self.sortie is None:
+            self.sortie = print
 
+    @property
+    def joueurs_actifs(self):
+        """
+        Propriété qui donne l'anneau des joueurs actifs.
+        Returns:
+            AnneauJoueurs: Les joueurs actifs
+        """
+        return self.anneau_joueurs
+
+    @joueurs_actifs.setter
+    def joueurs_actifs(self, joueurs):
+        """
+        Propriété qui remplace les joueurs actifs.
+        Args:
+            joueurs (iterable): Les joueurs actifs, dans l'ordre où ils sont assis
+        """
+        self.anneau_joueurs = AnneauJoueurs(joueurs)
 
     @staticmethod
-    def creer_joueurs(nombre_joueurs, nombre_joueurs_humains):
+    def creer_joueurs(nombre_joueurs, nombre_joueurs_humains, dés_compacts=False, generateur=None,
+                      echantillonneur=None, table_sens=None, budget_monte_carlo=None):
         """
         Méthode statique qui crée la liste de joueurs de la partie.
         Dans le cas où des joueurs ordinateurs sont permis, les joueurs humains et ordinateurs sont
@@ -49,6 +194,13 @@ class Partie:
         Args:
             nombre_joueurs (int): Nombre de joueurs de la partie
             nombre_joueurs_humains (int): Nombre de joueurs humains de la partie
+            dés_compacts (bool, optional): True pour que les dés des joueurs soient conservés dans des CompteurDés
+            generateur (GenerateurDés, optional): source des valeurs aléatoires des joueurs et du mélange
+            echantillonneur (EchantillonneurDés, optional): tire le résultat des lancers des joueurs
+            table_sens (TableSens, optional): Table des meilleurs sens des joueurs ordinateurs, qui sont alors des
+                JoueurStratège
+            budget_monte_carlo (float, optional): Temps alloué à chaque choix du sens des joueurs ordinateurs, qui
+                sont alors des JoueurMonteCarlo (si aucune table des sens n'est donnée)
 
         Returns:
             list: Liste des joueurs
@@ -56,11 +208,19 @@ class Partie:
         joueurs = []
         # Ajout des joueurs humains et ordinateurs à la liste
         for i in range(nombre_joueurs_humains):
-            joueurs.append(JoueurHumain(0))
+            joueurs.append(JoueurHumain(0, dés_compacts, generateur, echantillonneur))
         for i in range(nombre_joueurs - nombre_joueurs_humains):
-            joueurs.append(JoueurOrdinateur(0))
+            if table_sens is not None:
+                joueurs.append(JoueurStratège(0, table_sens, dés_compacts, generateur, echantillonneur))
+            elif budget_monte_carlo is not None:
+                joueurs.append(JoueurMonteCarlo(0, budget_monte_carlo, dés_compacts, generateur, echantillonneur))
+            else:
+                joueurs.append(JoueurOrdinateur(0, dés_compacts, generateur, echantillonneur))
         # Mélange de la liste des joueurs
-        shuffle(joueurs)
+        if generateur is None:
+            shuffle(joueurs)
+        else:
+            generateur.shuffle(joueurs)
         # Modification de l'identifiant des joueurs selon la position dans la liste
         for i, joueur in enumerate(joueurs):
             joueur.identifiant = i + 1
@@ -76,6 +236,10 @@ class Partie:
         5. Déterminer qui est le joueur suivant.
         6. Réinitialiser les dés des joueurs pour que chaque joueur ait 5 dés.
         """
+        if self.journal is not None:
+            self.consigner(PartieCommencée([PartieCommencée.HUMAIN if isinstance(joueur, JoueurHumain)
+                                            else PartieCommencée.ORDINATEUR for joueur in self.joueurs],
+                                           self.ronde_max))
         self.afficher_joueurs()
         self.trouver_premier_joueur()
         #self.determiner_sens()
@@ -83,37 +247,82 @@ class Partie:
         self.determiner_joueur_suivant()
         self.reinitialiser_dés_joueurs()
 
+    def afficher(self, message=None):
+        """
+        Méthode qui envoie un message à la sortie de la partie, seulement si elle en a une.
+        Args:
+            message (Message, optional): Message à afficher (une ligne vide par défaut)
+        """
+        if self.sortie is not None:
+            self.sortie(self.message('vide') if message is None else message)
+
+    def message(self, cle, *arguments):
+        """
+        Méthode qui crée un message de la partie, rendu dans sa langue seulement lorsque la sortie le demande.
+        Args:
+            cle (str): Clé du modèle du message (voir le module messages)
+            arguments: Arguments du message, figés au moment du message
+
+        Returns:
+            Message: Le message
+        """
+        return Message(self.catalogue, cle, arguments)
+
+    def demander(self, cle, *arguments):
+        """
+        Méthode qui pose une question à la console et retourne la réponse. Une sortie RenduConsole est d'abord vidée,
+        pour que tout ce qui précède la question soit affiché.
+        Args:
+            cle (str): Clé du modèle de la question (voir le module messages)
+            arguments: Arguments de la question
+
+        Returns:
+            str: La réponse
+        """
+        if isinstance(self.sortie, RenduConsole):
+            self.sortie.vider()
+        return input(self.catalogue.rendre(cle, arguments))
+
+    def consigner(self, evenement):
+        """
+        Méthode qui ajoute un événement au journal de la partie, seulement si la journalisation est activée.
+        Args:
+            evenement (Evenement): Événement à consigner
+        """
+        if self.journal is not None:
+            self.journal.append(evenement)
+
     def afficher_joueurs(self):
         """
         Méthode qui affiche quels joueurs sont humains et quels joueurs sont l'ordinateur.
         La version simple de cette méthode peut se limiter à lister les joueurs.
         Par exemple, "Le joueur 6 est prêt à jouer!"
-        Dans la version complète, on suppose qu'il y a au moins un joueur humain.
+        Dans la version complète, on indique aussi le cas où tous les joueurs sont des ordinateurs.
         """
+        if self.sortie is None:
+            return
         # Lister l'identifiant des joueurs humains
         identifiants_joueurs_humains = []
         for joueur in self.joueurs:
             if isinstance(joueur, JoueurHumain):
-                identifiants_joueurs_humains.append(str(joueur.identifiant))
+                identifiants_joueurs_humains.append(joueur.identifiant)
 
-        # Afficher les identifiants des joueurs humains (la chaîne est différente selon le nombre)
-        if len(identifiants_joueurs_humains) == 1:
-            print("Le joueur {} est le joueur humain.".format(identifiants_joueurs_humains[0]))
+        # Afficher les identifiants des joueurs humains (le message est différent selon le nombre)
+        if len(identifiants_joueurs_humains) == 0:
+            self.afficher(self.message('tous_ordinateurs'))
+        elif len(identifiants_joueurs_humains) == 1:
+            self.afficher(self.message('un_humain', identifiants_joueurs_humains[0]))
         elif len(identifiants_joueurs_humains) == len(self.joueurs):
-            print('Tous les joueurs sont des joueurs humains!')
-        elif len(identifiants_joueurs_humains) == 2:
-            print("Les joueurs {} et {} sont des joueurs humains.".format(identifiants_joueurs_humains[0],
-                                                                          identifiants_joueurs_humains[1]))
+            self.afficher(self.message('tous_humains'))
         else:
-            liste_joueurs_humains = ", ".join(identifiants_joueurs_humains[:-1])
-            print("Les joueurs {} et {} sont des joueurs humains.".format(liste_joueurs_humains,
-                                                                          identifiants_joueurs_humains[-1]))
+            self.afficher(self.message('humains', identifiants_joueurs_humains))
         # Si nécessaire, indiquer que l'autre joueur ou les autres joueurs sont des ordinateurs.
         nombre_joueurs_ordinateur = len(self.joueurs) - len(identifiants_joueurs_humains)
-        if nombre_joueurs_ordinateur == 1:
-            print("L'autre joueur est un ordinateur.\n")
-        elif nombre_joueurs_ordinateur > 1:
-            print("Les autres joueurs sont des ordinateurs.\n")
+        if 0 < nombre_joueurs_ordinateur < len(self.joueurs):
+            if nombre_joueurs_ordinateur == 1:
+                self.afficher(self.message('autre_ordinateur'))
+            else:
+                self.afficher(self.message('autres_ordinateurs'))
 
     def trouver_premier_joueur(self):
         """
@@ -127,27 +336,26 @@ class Partie:
         while not premier_joueur_trouvé:
             for joueur in joueurs_en_liste:
                 joueur.rouler_dés()
-                print("Le joueur {} joue les dés {}. Son score est {}.".format(
-                    joueur.identifiant, joueur, joueur.calculer_points()))
+                if self.journal is not None:
+                    self.consigner(Lancer(joueur.identifiant, joueur.valeurs_dés(), Lancer.PREMIER_JOUEUR))
+                if self.sortie is not None:
+                    self.afficher(self.message('lancer_premier_joueur', joueur.identifiant,
+                                               ValeursDés(joueur.valeurs_dés()), joueur.calculer_points()))
 
             joueurs_au_plus_haut_score = self.trouver_joueurs_au_plus_haut_total(joueurs_en_liste)
 
             if len(joueurs_au_plus_haut_score) == 1:
                 self.premier_joueur = joueurs_au_plus_haut_score[0]
-                print("\nLe joueur {} a le plus haut score et débutera la partie.\n"
-                      .format(self.premier_joueur.identifiant))
+                if self.journal is not None:
+                    self.consigner(PremierJoueurTrouvé(self.premier_joueur.identifiant))
+                if self.sortie is not None:
+                    self.afficher(self.message('premier_joueur', self.premier_joueur.identifiant))
                 premier_joueur_trouvé = True
 
-            elif len(joueurs_au_plus_haut_score) == 2:
-                print("\nIl y a égalité entre les joueurs {} et {}. Ces joueurs doivent relancer les dés."
-                      .format(joueurs_au_plus_haut_score[0].identifiant,
-                              joueurs_au_plus_haut_score[1].identifiant))
-                joueurs_en_liste = joueurs_au_plus_haut_score
-
             else:
-                print("\nIl y a égalité entre les joueurs {} et {}. Ces joueurs doivent relancer les dés."
-                      .format(', '.join([str(joueur.identifiant) for joueur in joueurs_au_plus_haut_score[:-1]]),
-                              joueurs_au_plus_haut_score[-1].identifiant))
+                if self.sortie is not None:
+                    self.afficher(self.message('égalité_premier_joueur',
+                                               [joueur.identifiant for joueur in joueurs_au_plus_haut_score]))
                 joueurs_en_liste = joueurs_au_plus_haut_score
 
 
@@ -191,33 +399,53 @@ class Partie:
         Méthode qui demande au premier joueur le sens dans lequel il souhaite bouger. Cette méthode vérifie si le
         premier joueur est un humain ou l'ordinateur. Dans le cas de l'humain, une demande est faite à la console.
         L'attribut sens de la partie est modifié selon la réponse. Dans le cas de l'ordinateur, on affiche son choix.
+        Si des décisions sont à rejouer, le joueur humain n'est pas consulté: on utilise la prochaine de ces décisions.
+        Le sens choisi est ajouté aux décisions de la partie.
         """
-        if isinstance(self.premier_joueur, JoueurHumain):
-            continuer = True
-            while continuer:
-                reponse = input('Joueur {}, voulez-vous jouer en ordre croissant (O) ou décroissant (N)? '.format(
-                    self.premier_joueur.identifiant))
-                if reponse.upper() == 'O' or reponse.upper() == 'N':
-                    print('\n')
-                    if reponse.upper() == 'O':
-                        self.sens = 1
-                    else:
-                        self.sens = -1
-                    continuer = False
-                else:
-                    print("Choix invalide. Veuillez choisir entre 'O' et 'N'.\n")
+        self.executer(self.etapes_sens())
+
+    def etapes_sens(self):
+        """
+        Méthode génératrice qui fait choisir le sens au premier joueur (voir determiner_sens). Si le premier joueur est
+        un humain et qu'aucune décision n'est à rejouer, elle cède une DemandeSens, dont la réponse est le sens.
+        """
+        if isinstance(self.premier_joueur, JoueurHumain) and self.décisions_à_rejouer:
+            self.sens = self.décisions_à_rejouer.pop(0)
+        elif isinstance(self.premier_joueur, JoueurHumain):
+            sens = yield DemandeSens(self.premier_joueur)
+            if sens not in (1, -1):
+                raise ValueError("Le sens doit être 1 (croissant) ou -1 (décroissant).")
+            self.sens = sens
         else:
-            reponse = self.premier_joueur.demander_sens()
-            self.sens = reponse[0]
-            print(reponse[1])
+            if self.décisions_à_rejouer:
+                self.décisions_à_rejouer.pop(0)
+            self.sens = self.premier_joueur.demander_sens(self)[0]
+            if self.sortie is not None:
+                self.afficher(self.message('sens_croissant' if self.sens == 1 else 'sens_décroissant',
+                                           self.premier_joueur.identifiant))
+        self.décisions.append(self.sens)
+        if self.journal is not None:
+            self.consigner(SensChoisi(self.premier_joueur.identifiant, self.sens))
+
+    def demander_sens_console(self):
+        """
+        Méthode qui demande le sens au premier joueur, un humain, à la console, jusqu'à obtenir une réponse valide.
+        Returns:
+            int: Le sens (1 pour croissant, -1 pour décroissant)
+        """
+        oui, non = self.catalogue.rendre('oui'), self.catalogue.rendre('non')
+        while True:
+            reponse = self.demander('question_sens', self.premier_joueur.identifiant)
+            if reponse.upper() == oui or reponse.upper() == non:
+                self.afficher(self.message('saut_ligne'))
+                return 1 if reponse.upper() == oui else -1
+            self.afficher(self.message('choix_sens_invalide'))
 
     def determiner_joueur_suivant(self):
         """
         Méthode qui trouve qui est le joueur suivant et qui modifie l'attribut joueur_suivant de la partie.
         """
-        index_prochain_joueur_suivant = (self.joueurs_actifs.index(self.joueur_courant) + self.sens + len(
-            self.joueurs_actifs)) % len(self.joueurs_actifs)
-        self.joueur_suivant = self.joueurs_actifs[index_prochain_joueur_suivant]
+        self.joueur_suivant = self.anneau_joueurs.voisin(self.joueur_courant, self.sens)
 
     def reinitialiser_dés_joueurs(self):
         """
@@ -230,7 +458,7 @@ class Partie:
         """
         Méthode qui accomplit les actions pour jouer une partie de pymafia.
         Cette méthode contient une grande boucle qui vérifier que le numéro de la ronde actuelle est inférieure ou
-        égale au nombre maximal de ronde.
+        égale au nombre maximal de ronde et qu'il reste au moins deux joueurs actifs.
         Les étapes pour une ronde sont:
         1. Jouer une ronde.
         2. Terminer la ronde.
@@ -238,22 +466,63 @@ class Partie:
         4. Réinitialiser les dés des joueurs.
         5. Passer à la prochaine ronde.
         """
-        while self.ronde <= RONDEMAX:
-            self.jouer_une_ronde()
-            self.terminer_ronde()
-            print(self.message_points_en_fin_de_ronde())
-            input("Appuyer sur une touche pour continuer.\n")
-            self.reinitialiser_dés_joueurs()
+        self.executer(self.etapes_partie())
+
+    def etapes_partie(self, reprise=None):
+        """
+        Méthode génératrice qui joue les rondes de la partie (voir jouer_une_partie). Elle cède les demandes des rondes
+        (voir etapes_ronde), puis une DemandeContinuer à la fin de chaque ronde, une fois les points réglés. Si le sens
+        est choisi à chaque ronde, le joueur qui commence une ronde après la première choisit d'abord le sens (voir
+        etapes_sens).
+        Args:
+            reprise (Demande, optional): Demande à laquelle la partie a été arrêtée (voir etapes), pour la reprendre
+        """
+        while reprise is not None or self.ronde <= self.ronde_max and len(self.joueurs_actifs) > 1:
+            if reprise is None and self.sens_chaque_ronde and self.ronde > 1 or isinstance(reprise, DemandeSens):
+                self.premier_joueur = self.joueur_courant
+                yield from self.etapes_sens()
+                self.determiner_joueur_suivant()
+                reprise = None
+            if not isinstance(reprise, DemandeContinuer):
+                yield from self.etapes_ronde(reprise is not None)
+                self.terminer_ronde()
+                if self.sortie is not None:
+                    self.afficher(self.message_points_en_fin_de_ronde())
+            reprise = None
+            yield DemandeContinuer(self.ronde)
+            if self.journal is not None:
+                self.consigner(RondeTerminée(self.ronde))
+            if not self.grande_table:
+                # Sur une grande table, les dés sont déjà réinitialisés par regler_fin_de_ronde
+                self.reinitialiser_dés_joueurs()
             self.passer_a_la_ronde_suivante()
 
     def jouer_une_ronde(self):
         """
         Méthode qui permet de jouer une ronde. Un message de début de ronde est affiché. Ensuite faire une boucle pour
         jouer une succession de tour. On sort de la boucle lorsqu'un joueur gagne le tour.
+        Si la partie a une avance rapide et que tous les joueurs actifs sont des ordinateurs, la ronde est plutôt jouée
+        en un seul tirage.
+        """
+        self.executer(self.etapes_ronde())
+
+    def etapes_ronde(self, reprise=False):
         """
-        print("Début de la ronde {} par le joueur {}.\n".format(self.ronde, self.joueur_courant.identifiant))
+        Méthode génératrice qui joue une ronde (voir jouer_une_ronde). Elle cède une DemandeLancer avant le tour de
+        chaque joueur humain.
+        Args:
+            reprise (bool, optional): True pour reprendre la ronde au tour du joueur courant, là où elle a été arrêtée
+        """
+        if not reprise:
+            if self.avance_rapide is not None and self.avance_rapide.peut_avancer(self):
+                self.avance_rapide.avancer(self)
+                return
+            if self.sortie is not None:
+                self.afficher(self.message('début_ronde', self.ronde, self.joueur_courant.identifiant))
         gagnant_ronde = None
         while gagnant_ronde is None:
+            if isinstance(self.joueur_courant, JoueurHumain):
+                yield DemandeLancer(self.joueur_courant)
             gagnant_ronde = self.jouer_un_tour()
 
     def jouer_un_tour(self):
@@ -267,14 +536,22 @@ class Partie:
         Returns:
             Joueur: Le joueur gagnant, si le joueur courant gagne le tour, None autrement.
         """
+        self.nombre_tours += 1
         self.joueur_courant.rouler_dés()
-        print("Le joueur {} joue les dés suivants: {} \n".format(self.joueur_courant.identifiant, self.joueur_courant))
+        if self.journal is not None:
+            self.consigner(Lancer(self.joueur_courant.identifiant, self.joueur_courant.valeurs_dés(), Lancer.TOUR))
+        if self.sortie is not None:
+            self.afficher(self.message('lancer', self.joueur_courant.identifiant,
+                                       ValeursDés(self.joueur_courant.valeurs_dés())))
         self.gerer_dés_1_et_6()
 
         gagnant_ronde = None
         if self.verifier_si_fin_de_ronde():
             gagnant_ronde = self.joueur_courant
-            print("Le joueur {} n'a plus de dé. Il gagne la ronde.".format(gagnant_ronde.identifiant))
+            if self.journal is not None:
+                self.consigner(RondeGagnée(self.ronde, gagnant_ronde.identifiant))
+            if self.sortie is not None:
+                self.afficher(self.message('gagnant_ronde', gagnant_ronde.identifiant))
         else:
             self.passer_au_prochain_joueur()
         return gagnant_ronde
@@ -288,7 +565,8 @@ class Partie:
         3. Déplacer les dés 1 et 6.
         """
         nombre_1, nombre_6 = self.verifier_dés_joueur_courant_pour_1_et_6()
-        self.afficher_messages_dés_1_et_6(nombre_1, nombre_6)
+        if self.sortie is not None:
+            self.afficher_messages_dés_1_et_6(nombre_1, nombre_6)
         self.deplacer_les_dés_1_et_6(nombre_1, nombre_6)
 
     def verifier_dés_joueur_courant_pour_1_et_6(self):
@@ -309,11 +587,11 @@ class Partie:
             nombre_6 (int): Nombre de dé(s) de valeur 6
         """
         if nombre_1:
-            print(self.message_pour_dé_1(nombre_1))
+            self.afficher(self.message_pour_dé_1(nombre_1))
         if nombre_6:
-            print(self.message_pour_dé_6(nombre_6))
+            self.afficher(self.message_pour_dé_6(nombre_6))
         if nombre_1 or nombre_6:
-            print()
+            self.afficher()
 
     def message_pour_dé_1(self, nombre_1):
         """
@@ -322,10 +600,9 @@ class Partie:
         Args:
             nombre_1 (int): Nombre de dé(s) de valeur 1
         Returns:
-            str: Message contenant le nombre de dé(s) retiré
+            Message: Message contenant le nombre de dé(s) retiré
         """
-        return 'Le joueur {} a roulé {} dé{} de valeur 1 et le{} retire du jeu.'.format(
-                self.joueur_courant.identifiant, nombre_1, 's' if nombre_1 > 1 else '', 's' if nombre_1 > 1 else '')
+        return self.message('dés_retirés', nombre_1, self.joueur_courant.identifiant)
 
     def message_pour_dé_6(self, nombre_6):
         """
@@ -334,10 +611,9 @@ class Partie:
         Args:
             nombre_6 (int): Nombre de dé(s) de valeur 6
         Returns:
-            str: Message contenant le nombre de dé(s) passé au suivant
+            Message: Message contenant le nombre de dé(s) passé au suivant
         """
-        return 'Le joueur {} a roulé {} dé{} de valeur 6 et le{} passe au joueur suivant.'.format(
-                self.joueur_courant.identifiant, nombre_6, 's' if nombre_6 > 1 else '', 's' if nombre_6 > 1 else '')
+        return self.message('dés_passés', nombre_6, self.joueur_courant.identifiant)
 
     def deplacer_les_dés_1_et_6(self, nombre_1, nombre_6):
         """
@@ -350,9 +626,13 @@ class Partie:
         if nombre_1:
             # Si dé de valeur 1, les retirer.
             self.joueur_courant.retirer_dé(1)
+            if self.journal is not None:
+                self.consigner(DésRetirés(self.joueur_courant.identifiant, nombre_1))
         if nombre_6:
             # Si dé de valeur 6, les retirer.
             self.joueur_courant.retirer_dé(6)
+            if self.journal is not None:
+                self.consigner(DésPassés(self.joueur_courant.identifiant, self.joueur_suivant.identifiant, nombre_6))
             # Ajouter autant de dé de valeur 6 au joueur suivant
             for i in range(nombre_6):
                 self.joueur_suivant.ajouter_un_dé()
@@ -390,15 +670,63 @@ class Partie:
         4. Ajuster les points du gagnant avec les points des perdants.
         5. Afficher le message qui annonce le nouveau score du gagnant.
         6. Retirer les joueurs sans points.
-        """
-        print("Les autres joueurs jouent leurs dés pour calculer les points qu'ils donnent au gagnant du tour.")
+        Sur une grande table, les étapes 1, 3, 4 et 6 sont accomplies en une seule passe par regler_fin_de_ronde, et
+        seul le message du gagnant est affiché.
+        """
+        if self.sortie is not None:
+            self.afficher(self.message('fin_de_ronde'))
+        if self.grande_table:
+            points_au_gagnant = self.regler_fin_de_ronde()
+            if self.sortie is not None:
+                self.afficher(self.message_pour_points_du_gagnant(points_au_gagnant))
+            return
         self.jouer_dés_en_fin_de_ronde()
-        print(self.messages_pour_points_fin_de_ronde())
+        if self.sortie is not None:
+            self.afficher(self.messages_pour_points_fin_de_ronde())
         points_au_gagnant = self.ajuster_points_des_perdants_en_fin_de_ronde()
         self.ajuster_points_du_gagnant(points_au_gagnant)
-        print(self.message_pour_points_du_gagnant(points_au_gagnant))
+        if self.sortie is not None:
+            self.afficher(self.message_pour_points_du_gagnant(points_au_gagnant))
         self.retirer_joueurs_sans_points()
 
+    def regler_fin_de_ronde(self):
+        """
+        Méthode qui règle la fin de ronde d'une grande table en une seule passe sur les joueurs actifs, plutôt qu'en
+        trois (jouer_dés_en_fin_de_ronde, ajuster_points_des_perdants_en_fin_de_ronde et retirer_joueurs_sans_points).
+        Chaque perdant lance ses dés et donne ses points au gagnant; il est ensuite retiré s'il n'a plus de points, ou
+        reprend 5 dés pour la prochaine ronde. Les dés sont lancés dans le même ordre qu'avec les trois méthodes, de
+        sorte que la partie se déroule de la même façon.
+        Returns:
+            int: Somme des points donnés au gagnant
+        """
+        gagnant = self.joueur_courant
+        points_au_gagnant = 0
+        joueurs_à_retirer = []
+        for joueur in self.anneau_joueurs:
+            if joueur is gagnant:
+                continue
+            joueur.rouler_dés()
+            if self.journal is not None:
+                self.consigner(Lancer(joueur.identifiant, joueur.valeurs_dés(), Lancer.FIN_DE_RONDE))
+            points = joueur.ajuster_score_en_fin_de_tour()
+            if self.journal is not None:
+                self.consigner(PointsRéglés(joueur.identifiant, gagnant.identifiant, points))
+            points_au_gagnant += points
+            if joueur.score <= 0:
+                joueurs_à_retirer.append(joueur)
+                if self.journal is not None:
+                    self.consigner(JoueurÉliminé(joueur.identifiant))
+            else:
+                joueur.reinitialiser_dés()
+        gagnant.reinitialiser_dés()
+        self.ajuster_points_du_gagnant(points_au_gagnant)
+
+        for joueur in joueurs_à_retirer:
+            self.anneau_joueurs.retirer(joueur)
+        if self.joueur_suivant not in self.anneau_joueurs:
+            self.determiner_joueur_suivant()
+        return points_au_gagnant
+
     def jouer_dés_en_fin_de_ronde(self):
         """
         Méthode qui fait rouler les dés des joueurs qui sont encore actifs (sauf le gagnant)
@@ -406,6 +734,8 @@ class Partie:
         for joueur in self.joueurs_actifs:
             if joueur is not self.joueur_courant:
                 joueur.rouler_dés()
+                if self.journal is not None:
+                    self.consigner(Lancer(joueur.identifiant, joueur.valeurs_dés(), Lancer.FIN_DE_RONDE))
 
     def message_points_en_fin_de_ronde(self):
         """
@@ -413,11 +743,9 @@ class Partie:
         ronde, les joueurs ont les points suivants: Le joueur 1 a 45 points. ..." Et ainsi de suite pour tous les
         joueurs.
         Returns:
-            str: Le message qui donne les points actuels.
+            Message: Le message qui donne les points actuels.
         """
-        message = "À la fin de cette ronde, les joueurs ont les points suivants:\n"
-        message += self.message_points_des_joueurs()
-        return message
+        return self.message('points_fin_de_ronde', self.message_points_des_joueurs())
 
     def messages_pour_points_fin_de_ronde(self):
         """
@@ -429,23 +757,19 @@ class Partie:
         suivants: ⚅ ⚃ . La somme des dés est égale ou supérieure à son nombre de points. Il donne 7 points au gagnant
         de la ronde et se retire de la partie.
         Returns:
-            str: Le message qui indique le nombre de points par chaque joueur perdant de la ronde.
+            Message: Le message qui indique le nombre de points par chaque joueur perdant de la ronde.
         """
-        message = ""
+        messages = []
         for joueur in self.joueurs_actifs:
             if joueur is not self.joueur_courant:
                 points = joueur.calculer_points()
                 if points < joueur.score:
-                    phrase = \
-                        "Le joueur {} joue les dés suivants: {}. Il donne {} points au gagnant de la ronde.\n\n".format(
-                            joueur.identifiant, joueur, points)
-                    message = message + phrase
+                    messages.append(self.message('points_donnés', points, joueur.identifiant,
+                                                 ValeursDés(joueur.valeurs_dés())))
                 else:
-                    message += "Le joueur {} joue les dés suivants: {}.\n".format(joueur.identifiant, joueur)
-                    message += "La somme des dés est égale ou supérieure à son nombre de points. "
-                    message += "Il donne {} point(s) au gagnant de la ronde et se retire de la partie.\n\n".format(
-                        joueur.score)
-        return message
+                    messages.append(self.message('points_donnés_retrait', joueur.score, joueur.identifiant,
+                                                 ValeursDés(joueur.valeurs_dés())))
+        return Message(self.catalogue, None, messages)
 
     def ajuster_points_des_perdants_en_fin_de_ronde(self):
         """
@@ -457,7 +781,10 @@ class Partie:
         score_total = 0
         for joueur in self.joueurs_actifs:
             if joueur is not self.joueur_courant:
-                score_total += joueur.ajuster_score_en_fin_de_tour()
+                points = joueur.ajuster_score_en_fin_de_tour()
+                if self.journal is not None:
+                    self.consigner(PointsRéglés(joueur.identifiant, self.joueur_courant.identifiant, points))
+                score_total += points
         return score_total
 
     def ajuster_points_du_gagnant(self, score):
@@ -467,6 +794,7 @@ class Partie:
             score (int): Le nombre de points à ajouter au score du joueur courant.
         """
         self.joueur_courant.score += score
+        self.points_transférés += score
 
     def message_pour_points_du_gagnant(self, points_au_gagnant):
         """
@@ -475,9 +803,9 @@ class Partie:
         Args:
             points_au_gagnant (int): Nombre de points donnés au gagnant.
         Returns:
-            str: Chaîne de caractères contenant le message.
+            Message: Le message.
         """
-        return "Le joueur {} obtient {} points.\n".format(self.joueur_courant.identifiant, points_au_gagnant)
+        return self.message('points_gagnant', points_au_gagnant, self.joueur_courant.identifiant)
 
     def retirer_joueurs_sans_points(self):
         """
@@ -488,17 +816,17 @@ class Partie:
             list: La liste des joueurs à retirer. (Cette valeur de retour ne devrait pas être utilisée dans le TP3, mais
             sera utile pour le TP4.
         """
-        joueurs_à_conserver = []
         joueurs_à_retirer = []
         for joueur in self.joueurs_actifs:
-            if joueur.score > 0:
-                joueurs_à_conserver.append(joueur)
-            else:
+            if joueur.score <= 0:
                 joueurs_à_retirer.append(joueur)
+                if self.journal is not None:
+                    self.consigner(JoueurÉliminé(joueur.identifiant))
 
-        self.joueurs_actifs = joueurs_à_conserver
+        for joueur in joueurs_à_retirer:
+            self.anneau_joueurs.retirer(joueur)
 
-        if self.joueur_suivant not in self.joueurs_actifs:
+        if self.joueur_suivant not in self.anneau_joueurs:
             self.determiner_joueur_suivant()
 
         return joueurs_à_retirer
@@ -509,11 +837,13 @@ class Partie:
         atteint. Ensuite, ces affichages contiennent le bilan des points des joueurs et le message sur le ou les
         gagnants de la partie.
         """
-        print("Le nombre maximal de rondes est atteint. La partie est terminée.")
-        print(self.message_points_en_fin_de_partie())
+        if self.sortie is None:
+            return
+        self.afficher(self.message('fin_rondes'))
+        self.afficher(self.message_points_en_fin_de_partie())
 
-        print(self.message_gagnants(self.determiner_liste_gagnants()))
-        print("Merci d'avoir joué à pymafia!")
+        self.afficher(self.message_gagnants(self.determiner_liste_gagnants()))
+        self.afficher(self.message('merci'))
 
     def message_points_en_fin_de_partie(self):
         """
@@ -521,24 +851,19 @@ class Partie:
         ronde, les joueurs ont les points suivants: Le joueur 1 a 16 points. ..." Et ainsi de suite pour tous les
         joueurs.
         Returns:
-            str: Le message qui donne les points en fin de partie.
+            Message: Le message qui donne les points en fin de partie.
         """
-        message = "À la fin de la partie, les joueurs ont les points suivants:\n"
-        message += self.message_points_des_joueurs()
-        return message
+        return self.message('points_fin_de_partie', self.message_points_des_joueurs())
 
     def message_points_des_joueurs(self):
         """
         Méthode qui assemble un message indiquant les points de tous les joueurs. Par exemple, "Le joueur 1 a 16
         points. ..." Et ainsi de suite pour tous les joueurs.
         Returns:
-            str: Les message donnant les points des joueurs.
+            Message: Les messages donnant les points des joueurs.
         """
-        message = ""
-        for joueur in self.joueurs:
-            message += "Le joueur {} a {} point{}.\n".format(
-                joueur.identifiant, joueur.score, 's' if joueur.score > 0 else '')
-        return message
+        return Message(self.catalogue, None, [self.message('points_joueur', joueur.score, joueur.identifiant)
+                                              for joueur in self.joueurs])
 
     def determiner_liste_gagnants(self):
         """
@@ -560,45 +885,342 @@ class Partie:
         Args:
             liste_index_gagnants (list): Liste contenant l'index (qui est l'identifiant) du ou des joueurs gagnants
         Returns:
-            str: Message annonçant le gagnant.
+            Message: Message annonçant le gagnant.
         """
         if len(liste_index_gagnants) == 1:
-            message = "Le joueur {} a gagné à la partie!\n".format(self.joueurs[liste_index_gagnants[0]].identifiant)
-        else:
-            message = "Il y a égalité entre les joueurs {}.\n".format(" et ".join(
-                str(self.joueurs[gagnant].identifiant) for gagnant in liste_index_gagnants))
-        return message
+            return self.message('gagnant_partie', self.joueurs[liste_index_gagnants[0]].identifiant)
+        return self.message('égalité_partie', [self.joueurs[gagnant].identifiant for gagnant in liste_index_gagnants])
 
     def jouer(self):
         """
         Méthode principale de la classe qui spécifie le déroulement d'une partie. Les étapes sont: 1) préparer une
-        partie; 2) jouer une partie et 3) terminer une partie.
+        partie; 2) déterminer le sens; 3) jouer une partie et 4) terminer une partie. Les décisions sont demandées
+        à la console.
         """
-
-        self.preparer_une_partie()
-        self.jouer_une_partie()
+        self.executer(self.etapes())
         self.terminer_une_partie()
 
+    def etapes(self, reprise=None):
+        """
+        Méthode génératrice qui joue une partie complète, une étape à la fois: elle prépare la partie, fait choisir le
+        sens au premier joueur et joue les rondes, en cédant une Demande (voir le module demandes) chaque fois qu'une
+        décision doit venir de l'extérieur. La réponse à une demande lui est envoyée avec send.
 
+        Rien d'autre ne bloque la partie: un seul fil d'exécution peut ainsi mener un grand nombre de parties à la
+        fois, en répondant aux demandes de l'une pendant que les autres attendent. La console (voir executer) et
+        l'interface graphique mènent les parties avec ce même générateur.
 
+        Une partie arrêtée à une demande, puis recréée dans le même état (par exemple avec EtatPartie), reprend avec
+        les étapes de cette demande: elles cèdent d'abord à nouveau la même demande.
+        Args:
+            reprise (Demande, optional): Demande à laquelle la partie a été arrêtée (au début de la partie par défaut)
 
+        Returns:
+            ResultatPartie: Le résultat de la partie, comme valeur de l'exception StopIteration
+        """
+        if reprise is None:
+            self.preparer_une_partie()
+        if reprise is None or isinstance(reprise, DemandeSens) and self.ronde == 1:
+            yield from self.etapes_sens()
+            self.determiner_joueur_suivant()
+            reprise = None
+        yield from self.etapes_partie(reprise)
+        return self.resultat()
 
+    def executer(self, etapes):
+        """
+        Méthode qui mène des étapes de la partie jusqu'à la fin, en répondant à leurs demandes à la console (voir
+        repondre_console).
+        Args:
+            etapes (generator): Étapes à mener, par exemple celles de la méthode etapes
 
+        Returns:
+            La valeur retournée par les étapes
+        """
+        reponse = None
+        while True:
+            try:
+                demande = etapes.send(reponse)
+            except StopIteration as fin:
+                return fin.value
+            reponse = self.repondre_console(demande)
 
+    def repondre_console(self, demande):
+        """
+        Méthode qui répond à une demande de la partie à la console. Le sens est demandé au joueur humain, la fin d'une
+        ronde attend une touche si la partie est affichée (et si sa sortie RenduConsole fait une pause), et un joueur
+        humain lance ses dés sans attendre.
+        Args:
+            demande (Demande): La demande
 
+        Returns:
+            La réponse à la demande
+        """
+        if isinstance(demande, DemandeSens):
+            return self.demander_sens_console()
+        if isinstance(demande, DemandeContinuer) and self.sortie is not None:
+            if not isinstance(self.sortie, RenduConsole) or self.sortie.pause:
+                self.demander('question_continuer')
+        return None
 
+    def resultat(self):
+        """
+        Méthode qui retourne le résultat de la partie, une fois terminée.
+        Returns:
+            ResultatPartie: Le résultat de la partie (gagnants, scores, nombre de rondes et de tours, points transférés)
+        """
+        return ResultatPartie([self.joueurs[index].identifiant for index in self.determiner_liste_gagnants()],
+                              {joueur.identifiant: joueur.score for joueur in self.joueurs},
+                              self.ronde - 1, self.nombre_tours, self.points_transférés)
 
+    def bifurquer(self, generateur=None):
+        """
+        Méthode qui crée une partie indépendante dans le même état, par exemple pour explorer la suite de la partie
+        sans la modifier. Rien n'est copié en profondeur: les joueurs sont des copies superficielles qui partagent
+        leurs dés avec les originaux jusqu'à ce qu'ils soient modifiés (voir Joueur.copier), l'anneau des joueurs
+        actifs et les listes de la partie sont recréés, et les autres attributs, qui ne sont jamais modifiés sur
+        place, sont partagés.
 
+        Par défaut, le générateur de la partie est copié, ce qui coûte quelques dizaines de microsecondes. Une
+        recherche qui bifurque souvent gagne à fournir son propre générateur: une bifurcation ne coûte alors
+        que quelques microsecondes par joueur (voir banc_essai).
+        Args:
+            generateur (GenerateurDés, optional): source des valeurs aléatoires de la nouvelle partie. Par défaut,
+                une copie du générateur de la partie: les deux parties donneront alors les mêmes dés.
 
+        Returns:
+            Partie: La nouvelle partie
+        """
+        if generateur is None and self.generateur is not None:
+            generateur = self.generateur.copier()
+        # Copie superficielle, sans passer par le constructeur (et sans créer de joueurs inutilement)
+        copie = object.__new__(Partie)
+        copie.__dict__.update(self.__dict__)
+        if generateur is not self.generateur:
+            copie.generateur = generateur
+            if self.echantillonneur is not None:
+                copie.echantillonneur = EchantillonneurDés(self.echantillonneur.nombre_dés_max, generateur)
+            if self.avance_rapide is not None:
+                copie.avance_rapide = AvanceRapide(generateur, self.avance_rapide.nombre_joueurs_max)
+
+        correspondance = {joueur: joueur.copier(generateur, copie.echantillonneur) for joueur in self.joueurs}
+        copie.joueurs = [correspondance[joueur] for joueur in self.joueurs]
+        copie.anneau_joueurs = self.anneau_joueurs.copier(correspondance)
+        copie.premier_joueur = correspondance[self.premier_joueur]
+        copie.joueur_courant = correspondance[self.joueur_courant]
+        copie.joueur_suivant = correspondance[self.joueur_suivant]
+        if self.journal is not None:
+            copie.journal = list(self.journal)
+        copie.décisions = list(self.décisions)
+        copie.décisions_à_rejouer = list(self.décisions_à_rejouer)
+        return copie
+
+    def en_octets(self):
+        """
+        Méthode qui retourne la partie sous une forme binaire compacte et versionnée (voir ENTETE), par exemple pour
+        l'enregistrer. Tout l'état de la partie en fait partie, y compris l'état de son générateur et son journal: la
+        partie recréée par depuis_octets se poursuit exactement de la même façon. Seuls les joueurs Joueur,
+        JoueurHumain et JoueurOrdinateur peuvent être sérialisés.
+        Returns:
+            bytes: La partie
+        """
+        index = {joueur: i for i, joueur in enumerate(self.joueurs)}
+        options = ((AFFICHAGE if self.affichage else 0) | (GRANDE_TABLE if self.grande_table else 0)
+                   | (ECHANTILLONNAGE if self.echantillonneur is not None else 0)
+                   | (AVANCE_RAPIDE if self.avance_rapide is not None else 0)
+                   | (JOURNALISATION if self.journal is not None else 0)
+                   | (GENERATEUR if self.generateur is not None else 0)
+                   | (SENS_CHAQUE_RONDE if self.sens_chaque_ronde else 0))
+        morceaux = [ENTETE.pack(SIGNATURE, VERSION, len(self.joueurs), index[self.premier_joueur],
+                                index[self.joueur_courant], index[self.joueur_suivant], self.sens, self.ronde,
+                                self.ronde_max, self.nombre_tours, self.points_transférés, options,
+                                0 if self.echantillonneur is None else self.echantillonneur.nombre_dés_max,
+                                0 if self.avance_rapide is None else self.avance_rapide.nombre_joueurs_max,
+                                self.catalogue.langue.encode('ascii'))]
+        actifs = bytearray((len(self.joueurs) + 7) // 8)
+        for joueur in self.anneau_joueurs:
+            actifs[index[joueur] // 8] |= 1 << index[joueur] % 8
+        morceaux.append(bytes(actifs))
+        for décisions in (self.décisions, self.décisions_à_rejouer):
+            morceaux.append(LONGUEUR.pack(len(décisions)) + struct.pack('<{}b'.format(len(décisions)), *décisions))
+        for joueur in self.joueurs:
+            donnees = joueur.en_octets()
+            morceaux.append(LONGUEUR.pack(len(donnees)) + donnees)
+        if self.generateur is not None:
+            donnees = self.generateur.en_octets()
+            morceaux.append(LONGUEUR.pack(len(donnees)) + donnees)
+        if self.journal is not None:
+            donnees = json.dumps([evenement.en_dict() for evenement in self.journal]).encode('utf-8')
+            morceaux.append(LONGUEUR.pack(len(donnees)) + donnees)
+        return b''.join(morceaux)
 
+    @staticmethod
+    def depuis_octets(donnees):
+        """
+        Méthode statique qui recrée une partie à partir de la forme binaire retournée par en_octets.
+        Args:
+            donnees (bytes): La partie
 
+        Returns:
+            Partie: La partie
+        """
+        (signature, version, nombre_joueurs, premier, courant, suivant, sens, ronde, ronde_max, nombre_tours,
+         points_transférés, options, nombre_dés_max, nombre_joueurs_max, langue) = ENTETE.unpack_from(donnees)
+        if signature != SIGNATURE or version != VERSION:
+            raise ValueError("Ces données ne sont pas une partie dans un format connu.")
+        position = ENTETE.size
+        actifs = donnees[position:position + (nombre_joueurs + 7) // 8]
+        position += len(actifs)
+        listes_décisions = []
+        for i in range(2):
+            nombre, = LONGUEUR.unpack_from(donnees, position)
+            listes_décisions.append(list(struct.unpack_from('<{}b'.format(nombre), donnees, position + LONGUEUR.size)))
+            position += LONGUEUR.size + nombre
+        morceaux_joueurs = []
+        for i in range(nombre_joueurs):
+            longueur, = LONGUEUR.unpack_from(donnees, position)
+            position += LONGUEUR.size
+            morceaux_joueurs.append(donnees[position:position + longueur])
+            position += longueur
+        generateur = None
+        if options & GENERATEUR:
+            longueur, = LONGUEUR.unpack_from(donnees, position)
+            position += LONGUEUR.size
+            generateur = GenerateurDés.depuis_octets(donnees[position:position + longueur])
+            position += longueur
+        journal = None
+        if options & JOURNALISATION:
+            longueur, = LONGUEUR.unpack_from(donnees, position)
+            position += LONGUEUR.size
+            journal = [Evenement.depuis_dict(evenement)
+                       for evenement in json.loads(donnees[position:position + longueur].decode('utf-8'))]
+
+        partie = Partie.creer(options, nombre_dés_max, nombre_joueurs_max, generateur, langue.decode('ascii'))
+        partie.joueurs = [Joueur.depuis_octets(morceau, partie.generateur, partie.echantillonneur)
+                          for morceau in morceaux_joueurs]
+        partie.joueurs_actifs = [joueur for i, joueur in enumerate(partie.joueurs) if actifs[i // 8] >> i % 8 & 1]
+        partie.premier_joueur = partie.joueurs[premier]
+        partie.joueur_courant = partie.joueurs[courant]
+        partie.joueur_suivant = partie.joueurs[suivant]
+        partie.sens = sens
+        partie.ronde = ronde
+        partie.ronde_max = ronde_max
+        partie.nombre_tours = nombre_tours
+        partie.points_transférés = points_transférés
+        partie.journal = journal
+        partie.décisions, partie.décisions_à_rejouer = listes_décisions
+        return partie
+
+    def en_dict(self):
+        """
+        Méthode qui retourne la partie sous la forme d'un dictionnaire versionné, par exemple pour l'écrire en JSON.
+        Elle contient le même état que la forme binaire (voir en_octets); l'état du générateur y est en hexadécimal.
+        Returns:
+            dict: La partie
+        """
+        index = {joueur: i for i, joueur in enumerate(self.joueurs)}
+        return {'version': VERSION,
+                'joueurs': [joueur.en_dict() for joueur in self.joueurs],
+                'joueurs_actifs': [index[joueur] for joueur in self.anneau_joueurs],
+                'premier_joueur': index[self.premier_joueur],
+                'joueur_courant': index[self.joueur_courant],
+                'joueur_suivant': index[self.joueur_suivant],
+                'sens': self.sens,
+                'ronde': self.ronde,
+                'ronde_max': self.ronde_max,
+                'nombre_tours': self.nombre_tours,
+                'points_transférés': self.points_transférés,
+                'affichage': self.affichage,
+                'langue': self.catalogue.langue,
+                'grande_table': self.grande_table,
+                'echantillonnage': None if self.echantillonneur is None else self.echantillonneur.nombre_dés_max,
+                'avance_rapide': None if self.avance_rapide is None else self.avance_rapide.nombre_joueurs_max,
+                'sens_chaque_ronde': self.sens_chaque_ronde,
+                'generateur': None if self.generateur is None else self.generateur.en_octets().hex(),
+                'journal': None if self.journal is None else [evenement.en_dict() for evenement in self.journal],
+                'décisions': list(self.décisions),
+                'décisions_à_rejouer': list(self.décisions_à_rejouer)}
 
+    @staticmethod
+    def depuis_dict(dictionnaire):
+        """
+        Méthode statique qui recrée une partie à partir du dictionnaire retourné par en_dict.
+        Args:
+            dictionnaire (dict): La partie
 
+        Returns:
+            Partie: La partie
+        """
+        if dictionnaire.get('version') != VERSION:
+            raise ValueError("Ce dictionnaire n'est pas une partie dans un format connu.")
+        generateur = None
+        if dictionnaire['generateur'] is not None:
+            generateur = GenerateurDés.depuis_octets(bytes.fromhex(dictionnaire['generateur']))
+        options = ((AFFICHAGE if dictionnaire['affichage'] else 0)
+                   | (GRANDE_TABLE if dictionnaire['grande_table'] else 0)
+                   | (ECHANTILLONNAGE if dictionnaire['echantillonnage'] is not None else 0)
+                   | (AVANCE_RAPIDE if dictionnaire['avance_rapide'] is not None else 0)
+                   | (SENS_CHAQUE_RONDE if dictionnaire.get('sens_chaque_ronde') else 0))
+        partie = Partie.creer(options, dictionnaire['echantillonnage'], dictionnaire['avance_rapide'], generateur,
+                              dictionnaire.get('langue', LANGUE))
+        partie.joueurs = [Joueur.depuis_dict(joueur, partie.generateur, partie.echantillonneur)
+                          for joueur in dictionnaire['joueurs']]
+        partie.joueurs_actifs = [partie.joueurs[i] for i in dictionnaire['joueurs_actifs']]
+        partie.premier_joueur = partie.joueurs[dictionnaire['premier_joueur']]
+        partie.joueur_courant = partie.joueurs[dictionnaire['joueur_courant']]
+        partie.joueur_suivant = partie.joueurs[dictionnaire['joueur_suivant']]
+        for attribut in ('sens', 'ronde', 'ronde_max', 'nombre_tours', 'points_transférés'):
+            setattr(partie, attribut, dictionnaire[attribut])
+        partie.journal = None
+        if dictionnaire['journal'] is not None:
+            partie.journal = [Evenement.depuis_dict(evenement) for evenement in dictionnaire['journal']]
+        partie.décisions = list(dictionnaire['décisions'])
+        partie.décisions_à_rejouer = list(dictionnaire['décisions_à_rejouer'])
+        return partie
 
+    @staticmethod
+    def creer(options, nombre_dés_max, nombre_joueurs_max, generateur, langue=LANGUE):
+        """
+        Méthode statique qui crée une partie vide, sans passer par le constructeur (et sans créer de joueurs
+        inutilement), pour depuis_octets et depuis_dict. Il reste à lui donner ses joueurs et son état.
+        Args:
+            options (int): Options de la partie (AFFICHAGE, GRANDE_TABLE, ECHANTILLONNAGE, AVANCE_RAPIDE,
+                SENS_CHAQUE_RONDE)
+            nombre_dés_max (int): Plus grand nombre de dés de l'échantillonneur, avec ECHANTILLONNAGE
+            nombre_joueurs_max (int): Plus grand nombre de joueurs de l'avance rapide, avec AVANCE_RAPIDE
+            generateur (GenerateurDés): source des valeurs aléatoires de la partie (None pour un nouveau générateur)
+            langue (str, optional): Langue des messages de la partie
 
+        Returns:
+            Partie: La partie
+        """
+        partie = object.__new__(Partie)
+        partie.catalogue = CatalogueMessages.obtenir(langue)
+        partie.sortie = None
+        partie.affichage = bool(options & AFFICHAGE)
+        partie.grande_table = bool(options & GRANDE_TABLE)
+        if generateur is None:
+            generateur = GenerateurDés()
+        partie.generateur = generateur
+        partie.echantillonneur = None
+        if options & ECHANTILLONNAGE:
+            partie.echantillonneur = EchantillonneurDés(nombre_dés_max, generateur)
+        partie.avance_rapide = None
+        if options & AVANCE_RAPIDE:
+            partie.avance_rapide = AvanceRapide(generateur, nombre_joueurs_max)
+        partie.sens_chaque_ronde = bool(options & SENS_CHAQUE_RONDE)
+        return partie
+
+    def simuler(self):
+        """
+        Méthode qui joue une partie complète sans aucun affichage ni saisie à la console. Les étapes sont les mêmes
+        que pour la méthode jouer, sauf que le sens est choisi par le premier joueur (un ordinateur) sans affichage.
+        Cette méthode n'accepte que des parties dont tous les joueurs sont des ordinateurs.
+        Returns:
+            ResultatPartie: Le résultat de la partie (gagnants, scores, nombre de rondes et de tours, points transférés)
+        """
+        if any(isinstance(joueur, JoueurHumain) for joueur in self.joueurs):
+            raise ValueError("Une partie simulée ne peut contenir que des joueurs ordinateurs.")
 
-
-
-
-
-
+        self.affichage = False
+        return self.executer(self.etapes())
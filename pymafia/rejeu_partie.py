@@ -0,0 +1,188 @@
+"""
+Module de la classe RejeuPartie
+"""
+
+import struct
+import zlib
+
+from pymafia.generateur_des import GenerateurDés
+from pymafia.joueur_humain import JoueurHumain
+from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.partie import Partie, GRANDE_TABLE, ECHANTILLONNAGE, AVANCE_RAPIDE, SENS_CHAQUE_RONDE
+
+# Format binaire d'un rejeu: graine, nombre de joueurs, nombre de joueurs humains, ronde maximale, empreinte des
+# scores finaux, options de la partie et nombre de décisions. Les décisions suivent, à raison d'un bit par décision
+# (1 pour le sens croissant, 0 pour le sens décroissant).
+ENTETE_REJEU = struct.Struct('<QIIIIBB')
+
+
+class RejeuPartie:
+    """
+    Classe pour la description minimale d'une partie. Avec un GenerateurDés, les seules sources de variation d'une
+    partie sont la graine du générateur et le sens choisi par le premier joueur: ce sont les seules données
+    conservées, avec une empreinte des scores finaux pour la vérification. La partie complète est recréée au besoin
+    en la rejouant.
+
+    Seules les parties jouées avec les méthodes jouer ou simuler de Partie, à partir d'un GenerateurDés neuf, peuvent
+    être recréées ainsi. Les options qui changent le déroulement de la partie (grande table, échantillonnage, avance
+    rapide et choix du sens à chaque ronde) sont conservées et redonnées à la partie recréée.
+
+    Attributes:
+        graine (int): Graine du GenerateurDés de la partie
+        nombre_joueurs (int): Nombre de joueurs de la partie
+        nombre_joueurs_humains (int): Nombre de joueurs humains de la partie
+        ronde_max (int): Nombre maximal de rondes de la partie
+        décisions (list): Sens choisi (1 ou -1) à chaque fois que le premier joueur a dû choisir le sens
+        empreinte (int): Empreinte CRC-32 des scores finaux de la partie
+        options (int): Options de la partie (GRANDE_TABLE, ECHANTILLONNAGE, AVANCE_RAPIDE et SENS_CHAQUE_RONDE de
+            Partie)
+    """
+
+    def __init__(self, graine, nombre_joueurs, nombre_joueurs_humains, ronde_max, décisions, empreinte, options=0):
+        """
+        Constructeur de la classe RejeuPartie
+        Args:
+            graine (int): Graine du GenerateurDés de la partie
+            nombre_joueurs (int): Nombre de joueurs de la partie
+            nombre_joueurs_humains (int): Nombre de joueurs humains de la partie
+            ronde_max (int): Nombre maximal de rondes de la partie
+            décisions (list): Sens choisi à chaque fois que le premier joueur a dû choisir le sens
+            empreinte (int): Empreinte CRC-32 des scores finaux de la partie
+            options (int, optional): Options de la partie (GRANDE_TABLE, ECHANTILLONNAGE, AVANCE_RAPIDE et
+                SENS_CHAQUE_RONDE de Partie)
+        """
+        self.graine = graine
+        self.nombre_joueurs = nombre_joueurs
+        self.nombre_joueurs_humains = nombre_joueurs_humains
+        self.ronde_max = ronde_max
+        self.décisions = décisions
+        self.empreinte = empreinte
+        self.options = options
+
+    @staticmethod
+    def calculer_empreinte(scores):
+        """
+        Méthode statique qui calcule l'empreinte CRC-32 d'une liste de scores.
+        Args:
+            scores (list): Score de chaque joueur, dans l'ordre des identifiants
+
+        Returns:
+            int: Empreinte des scores
+        """
+        return zlib.crc32(struct.pack('<{}I'.format(len(scores)), *scores))
+
+    @staticmethod
+    def depuis_partie(partie):
+        """
+        Méthode statique qui crée le rejeu d'une partie terminée.
+        Args:
+            partie (Partie): Partie jouée avec un GenerateurDés
+
+        Returns:
+            RejeuPartie: Le rejeu de la partie
+        """
+        if any(type(joueur) not in (JoueurOrdinateur, JoueurHumain) for joueur in partie.joueurs):
+            raise ValueError("Seule une partie entre joueurs ordinateurs ordinaires et joueurs humains peut être "
+                             "rejouée.")
+        nombre_joueurs_humains = len([joueur for joueur in partie.joueurs if isinstance(joueur, JoueurHumain)])
+        options = ((GRANDE_TABLE if partie.grande_table else 0)
+                   | (ECHANTILLONNAGE if partie.echantillonneur is not None else 0)
+                   | (AVANCE_RAPIDE if partie.avance_rapide is not None else 0)
+                   | (SENS_CHAQUE_RONDE if partie.sens_chaque_ronde else 0))
+        return RejeuPartie(partie.generateur.graine, len(partie.joueurs), nombre_joueurs_humains, partie.ronde_max,
+                           list(partie.décisions),
+                           RejeuPartie.calculer_empreinte([joueur.score for joueur in partie.joueurs]), options)
+
+    def regenerer(self, dés_compacts=True, journalisation=False):
+        """
+        Méthode qui recrée la partie en la rejouant au complet, sans affichage. Le sens choisi par un joueur humain
+        est pris dans les décisions; celui d'un joueur ordinateur est recalculé à partir de la graine.
+        Args:
+            dés_compacts (bool, optional): True pour que les dés des joueurs soient conservés dans des CompteurDés (le
+                déroulement de la partie est le même dans les deux cas)
+            journalisation (bool, optional): True pour obtenir aussi le journal d'événements de la partie
+
+        Returns:
+            Partie: La partie recréée, terminée
+        """
+        partie = Partie(self.nombre_joueurs, self.nombre_joueurs_humains, affichage=False, dés_compacts=dés_compacts,
+                        generateur=GenerateurDés(self.graine), journalisation=journalisation,
+                        grande_table=bool(self.options & GRANDE_TABLE),
+                        echantillonnage=bool(self.options & ECHANTILLONNAGE),
+                        avance_rapide=bool(self.options & AVANCE_RAPIDE),
+                        sens_chaque_ronde=bool(self.options & SENS_CHAQUE_RONDE))
+        partie.ronde_max = self.ronde_max
+        partie.décisions_à_rejouer = list(self.décisions)
+        partie.executer(partie.etapes())
+        return partie
+
+    def verifier(self, scores=None):
+        """
+        Méthode qui rejoue la partie et vérifie que les scores finaux obtenus sont ceux attendus, et que les joueurs
+        ordinateurs ont pris les mêmes décisions.
+        Args:
+            scores (list, optional): Scores finaux attendus, dans l'ordre des identifiants. Sans scores, on compare
+                avec l'empreinte conservée.
+
+        Returns:
+            bool: True si la partie recréée concorde, False autrement
+        """
+        partie = self.regenerer()
+        scores_obtenus = [joueur.score for joueur in partie.joueurs]
+        if partie.décisions != self.décisions:
+            return False
+        if scores is not None:
+            return scores_obtenus == list(scores)
+        return self.calculer_empreinte(scores_obtenus) == self.empreinte
+
+    def en_bytes(self):
+        """
+        Méthode qui encode le rejeu dans sa forme binaire (26 octets, plus un octet par tranche de 8 décisions).
+        Returns:
+            bytes: Le rejeu encodé
+        """
+        if not isinstance(self.graine, int) or not 0 <= self.graine < 2 ** 64:
+            raise ValueError("Seule une graine entière de 64 bits peut être encodée.")
+        bits = 0
+        for i, sens in enumerate(self.décisions):
+            if sens == 1:
+                bits |= 1 << i
+        return ENTETE_REJEU.pack(self.graine, self.nombre_joueurs, self.nombre_joueurs_humains, self.ronde_max,
+                                 self.empreinte, self.options, len(self.décisions)) + \
+            bits.to_bytes((len(self.décisions) + 7) // 8, 'little')
+
+    @staticmethod
+    def depuis_bytes(donnees):
+        """
+        Méthode statique qui décode un rejeu encodé par en_bytes.
+        Args:
+            donnees (bytes): Le rejeu encodé
+
+        Returns:
+            RejeuPartie: Le rejeu
+        """
+        graine, nombre_joueurs, nombre_joueurs_humains, ronde_max, empreinte, options, nombre_décisions = \
+            ENTETE_REJEU.unpack_from(donnees)
+        bits = int.from_bytes(donnees[ENTETE_REJEU.size:ENTETE_REJEU.size + (nombre_décisions + 7) // 8], 'little')
+        décisions = [1 if bits >> i & 1 else -1 for i in range(nombre_décisions)]
+        return RejeuPartie(graine, nombre_joueurs, nombre_joueurs_humains, ronde_max, décisions, empreinte, options)
+
+    def __eq__(self, other):
+        """
+        Méthode qui définit l'opérateur == pour la classe RejeuPartie
+        Args:
+            other (RejeuPartie): autre rejeu pour la comparaison
+        Returns:
+            bool: True si les deux rejeux décrivent la même partie, False autrement
+        """
+        if not isinstance(other, RejeuPartie):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "RejeuPartie(graine={}, joueurs={}, humains={}, ronde_max={}, décisions={}, options={})".format(
+            self.graine, self.nombre_joueurs, self.nombre_joueurs_humains, self.ronde_max, self.décisions,
+            self.options)
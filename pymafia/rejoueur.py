@@ -0,0 +1,65 @@
+"""
+Module de la classe Rejoueur
+"""
+
+from pymafia.evenements import PartieCommencée
+from pymafia.partie import Partie
+
+
+class Rejoueur:
+    """
+    Classe qui reconstruit une partie à partir de son journal d'événements, sans lancer aucun dé: les valeurs des dés
+    sont celles consignées dans les événements Lancer. Chaque événement est vérifié contre l'état de la partie
+    reconstruite, de sorte qu'un journal incohérent (par exemple, des points réglés qui ne correspondent pas aux dés
+    du perdant) lève une ValueError.
+
+    Attributes:
+        evenements (list): Événements du journal à rejouer
+        position (int): Nombre d'événements déjà appliqués
+        partie (Partie): Partie reconstruite (None avant l'événement PartieCommencée)
+    """
+
+    def __init__(self, evenements):
+        """
+        Constructeur de la classe Rejoueur
+        Args:
+            evenements (list): Événements du journal, dans l'ordre où ils sont survenus
+        """
+        self.evenements = list(evenements)
+        self.position = 0
+        self.partie = None
+
+    def appliquer(self, evenement):
+        """
+        Méthode qui applique un événement à la partie reconstruite. L'événement PartieCommencée crée la partie.
+        Args:
+            evenement (Evenement): Événement à appliquer
+        """
+        if isinstance(evenement, PartieCommencée):
+            self.partie = Partie(len(evenement.joueurs), 0, affichage=False)
+        elif self.partie is None:
+            raise ValueError("Journal incohérent: le premier événement doit être PartieCommencée.")
+        evenement.appliquer(self.partie)
+
+    def avancer(self):
+        """
+        Méthode qui applique le prochain événement du journal.
+        Returns:
+            Evenement: L'événement appliqué, ou None s'il n'y a plus d'événement
+        """
+        if self.position == len(self.evenements):
+            return None
+        evenement = self.evenements[self.position]
+        self.appliquer(evenement)
+        self.position += 1
+        return evenement
+
+    def rejouer(self):
+        """
+        Méthode qui applique tous les événements restants du journal.
+        Returns:
+            Partie: La partie reconstruite
+        """
+        while self.avancer() is not None:
+            pass
+        return self.partie
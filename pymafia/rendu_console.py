@@ -0,0 +1,97 @@
+"""
+Module de la classe RenduConsole
+"""
+
+import sys
+
+# Niveaux de verbosité: rien, le résumé de la partie, les rondes, chaque tour
+SILENCE = 0
+RESUME = 1
+RONDE = 2
+TOUR = 3
+
+# Niveau de chaque verbosité, selon son nom à la ligne de commande
+VERBOSITES = {'silent': SILENCE, 'summary': RESUME, 'round': RONDE, 'turn': TOUR}
+
+# Niveau de verbosité à partir duquel chaque message est affiché, selon sa clé (TOUR pour une clé absente)
+NIVEAUX = {
+    'tous_ordinateurs': RESUME, 'un_humain': RESUME, 'tous_humains': RESUME, 'humains': RESUME,
+    'autre_ordinateur': RESUME, 'autres_ordinateurs': RESUME, 'saut_ligne': RESUME, 'choix_sens_invalide': RESUME,
+    'fin_rondes': RESUME, 'points_fin_de_partie': RESUME, 'gagnant_partie': RESUME, 'égalité_partie': RESUME,
+    'merci': RESUME,
+    'premier_joueur': RONDE, 'sens_croissant': RONDE, 'sens_décroissant': RONDE, 'début_ronde': RONDE,
+    'gagnant_ronde': RONDE, 'points_gagnant': RONDE, 'points_fin_de_ronde': RONDE,
+}
+
+# Clés des messages après lesquels le texte accumulé est écrit: la fin d'une ronde et la fin de la partie
+VIDAGES = {'points_fin_de_ronde', 'merci'}
+
+
+class RenduConsole:
+    """
+    Classe pour la sortie d'une partie à la console (voir Partie.sortie). Les messages sont filtrés selon un niveau
+    de verbosité, puis accumulés et écrits d'un seul coup à la fin de chaque ronde et de la partie, plutôt qu'avec un
+    print par message. Un message filtré n'est jamais rendu en texte.
+
+    La partie vide le rendu avant de poser une question à la console (voir Partie.demander), pour que le joueur voie
+    tout ce qui la précède.
+
+    Attributes:
+        niveau (int): Niveau de verbosité (SILENCE, RESUME, RONDE ou TOUR)
+        flux (io.TextIOBase): Flux où le texte est écrit
+        pause (bool): True pour attendre une touche à la fin de chaque ronde
+        tampon (list): Textes pas encore écrits
+    """
+
+    def __init__(self, niveau=TOUR, flux=None, pause=None):
+        """
+        Constructeur de la classe RenduConsole
+        Args:
+            niveau (int, optional): Niveau de verbosité
+            flux (io.TextIOBase, optional): Flux où le texte est écrit (la sortie standard par défaut)
+            pause (bool, optional): True pour attendre une touche à la fin de chaque ronde. Par défaut, seulement si
+                le flux est un terminal et que les rondes sont affichées.
+        """
+        self.niveau = niveau
+        self.flux = sys.stdout if flux is None else flux
+        if pause is None:
+            pause = niveau >= RONDE and self.flux.isatty()
+        self.pause = pause
+        self.tampon = []
+
+    def __call__(self, message):
+        """
+        Méthode qui reçoit un message de la partie. Il est rendu et ajouté au tampon si le niveau de verbosité le
+        demande; le tampon est écrit à la fin d'une ronde ou de la partie.
+        Args:
+            message (Message): Le message
+        """
+        cle = self.cle(message)
+        if NIVEAUX.get(cle, TOUR) <= self.niveau:
+            self.tampon.append(str(message))
+            self.tampon.append('\n')
+        if cle in VIDAGES:
+            self.vider()
+
+    @staticmethod
+    def cle(message):
+        """
+        Méthode statique qui retourne la clé d'un message. Une suite de messages prend la clé du premier.
+        Args:
+            message (Message): Le message
+
+        Returns:
+            str: La clé du message (None pour une suite vide)
+        """
+        while message.cle is None and message.arguments:
+            message = message.arguments[0]
+        return message.cle
+
+    def vider(self):
+        """
+        Méthode qui écrit tout le texte accumulé dans le flux, puis le vide.
+        """
+        if self.tampon:
+            self.flux.write(''.join(self.tampon))
+            self.tampon = []
+        self.flux.flush()
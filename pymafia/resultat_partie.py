@@ -0,0 +1,44 @@
+"""
+Module de la classe ResultatPartie
+"""
+
+
+class ResultatPartie:
+    """
+    Classe qui regroupe le résultat d'une partie de pymafia jouée sans affichage.
+
+    Attributes:
+        gagnants (list): Identifiants du ou des joueurs ayant le plus haut score en fin de partie
+        scores (dict): Score final de chaque joueur, selon son identifiant
+        nombre_rondes (int): Nombre de rondes jouées
+        nombre_tours (int): Nombre de tours joués, toutes rondes confondues
+        points_transférés (int): Somme des points donnés aux gagnants des rondes
+    """
+
+    def __init__(self, gagnants, scores, nombre_rondes, nombre_tours, points_transférés):
+        """
+        Constructeur de la classe ResultatPartie
+        Args:
+            gagnants (list): Identifiants du ou des joueurs gagnants
+            scores (dict): Score final de chaque joueur, selon son identifiant
+            nombre_rondes (int): Nombre de rondes jouées
+            nombre_tours (int): Nombre de tours joués
+            points_transférés (int): Somme des points donnés aux gagnants des rondes
+        """
+        self.gagnants = gagnants
+        self.scores = scores
+        self.nombre_rondes = nombre_rondes
+        self.nombre_tours = nombre_tours
+        self.points_transférés = points_transférés
+
+    def __str__(self):
+        """
+        Méthode qui retourne une représentation du résultat en chaîne de caractères.
+        Returns:
+            str: Résumé du résultat de la partie
+        """
+        return "Gagnant(s): {}, scores: {}, rondes: {}, tours: {}, points transférés: {}".format(
+            self.gagnants, self.scores, self.nombre_rondes, self.nombre_tours, self.points_transférés)
+
+    def __repr__(self):
+        return str(self)
@@ -0,0 +1,265 @@
+"""
+Module de la classe ServeurPymafia
+"""
+
+import asyncio
+
+from pymafia.demandes import DemandeSens, DemandeLancer, DemandeContinuer
+from pymafia.partie import RONDEMAX
+from pymafia.table_jeu import TableJeu
+
+# Adresse et port d'écoute du serveur, par défaut
+HOTE = '127.0.0.1'
+PORT = 8765
+
+# Nombre de joueurs d'une table
+NOMBRE_JOUEURS_MIN = 2
+NOMBRE_JOUEURS_MAX = 8
+
+# Nombre maximal de rondes d'une table
+RONDES_MAX = 1000
+
+# Nombre de rondes qu'une table sans joueur humain actif joue d'un coup, avant de laisser les autres tables jouer
+TRANCHE_RONDES = 1
+
+
+class ServeurPymafia:
+    """
+    Classe pour un serveur asyncio qui héberge un grand nombre de tables de jeu (voir TableJeu) dans un seul
+    processus. Un client envoie une commande par ligne, en UTF-8, et reçoit exactement une ligne en réponse:
+
+        NOUVELLE <joueurs> <humains> [<rondes> [<graine>]]    crée une table
+        SENS <table> O|N                                       choisit le sens croissant (O) ou décroissant (N)
+        LANCER <table>                                         lance les dés du joueur dont c'est le tour
+        CONTINUER <table>                                      continue la partie après la fin d'une ronde
+        ETAT <table>                                           donne l'état de la table
+        QUITTER <table>                                        abandonne la partie de la table
+
+    Après une création ou une réponse, le serveur indique ce que la table attend:
+
+        DEMANDE <table> SENS <joueur>                          le sens, de la part du joueur qui commence
+        DEMANDE <table> LANCER <joueur>                        le lancer du joueur dont c'est le tour
+        DEMANDE <table> CONTINUER <ronde>                      la suite de la partie, après la ronde terminée
+        FIN <table> <gagnants> <scores>                        rien: la partie est terminée et la table fermée
+
+    ETAT répond ETAT <table> <ronde> <scores> <nombres de dés>, QUITTER répond FERMEE <table>, et une commande
+    invalide répond ERREUR <message>. Les listes sont séparées par des virgules, dans l'ordre des joueurs.
+
+    Une table n'appartient à aucune connexion: n'importe quel client peut y répondre à l'aide de son numéro. Tout le
+    jeu est fait par les étapes des parties, qui ne bloquent jamais: la saisie à la console de Partie devient ici la
+    prochaine ligne du client, attendue sans bloquer les autres tables. Une table sans joueur humain actif se joue
+    d'elle-même jusqu'à la fin de sa partie, TRANCHE_RONDES rondes à la fois, en laissant les autres connexions être
+    servies entre deux tranches (voir traiter_sans_bloquer).
+
+    Par défaut, toutes les tables restent en mémoire. Avec un MagasinSessions, seules les tables les plus récemment
+    utilisées y restent; les autres attendent sur disque qu'un client leur réponde.
+
+    Attributes:
+        hote (str): Adresse d'écoute
+        port (int): Port d'écoute (celui choisi par le système une fois le serveur démarré, si 0 a été demandé)
+        tables (dict): Tables en cours, selon leur numéro (ou MagasinSessions)
+        prochain_identifiant (int): Numéro de la prochaine table créée
+        serveur (asyncio.Server): Le serveur, une fois démarré
+    """
+
+    def __init__(self, hote=HOTE, port=PORT, sessions=None):
+        """
+        Constructeur de la classe ServeurPymafia
+        Args:
+            hote (str, optional): Adresse d'écoute
+            port (int, optional): Port d'écoute (0 pour un port libre choisi par le système)
+            sessions (MagasinSessions, optional): Magasin des tables, qui garde en mémoire les plus récemment utilisées
+                et les autres sur disque. Ses tables existantes sont reprises.
+        """
+        self.hote = hote
+        self.port = port
+        self.tables = {} if sessions is None else sessions
+        self.prochain_identifiant = max(self.tables, default=0) + 1
+        self.serveur = None
+
+    async def demarrer(self):
+        """
+        Méthode qui démarre l'écoute des connexions.
+        """
+        self.serveur = await asyncio.start_server(self.servir_client, self.hote, self.port)
+        self.port = self.serveur.sockets[0].getsockname()[1]
+
+    async def fermer(self):
+        """
+        Méthode qui arrête l'écoute des connexions. Les tables restent dans le serveur.
+        """
+        self.serveur.close()
+        await self.serveur.wait_closed()
+
+    async def servir_client(self, lecteur, ecrivain):
+        """
+        Méthode qui répond aux commandes d'une connexion, une ligne à la fois, jusqu'à ce que le client la ferme.
+        Args:
+            lecteur (asyncio.StreamReader): Lignes reçues du client
+            ecrivain (asyncio.StreamWriter): Lignes envoyées au client
+        """
+        try:
+            while True:
+                ligne = await lecteur.readline()
+                if not ligne:
+                    break
+                try:
+                    reponse = await self.traiter_sans_bloquer(ligne.decode('utf-8', 'replace'))
+                except Exception as erreur:
+                    # Une table défaillante ne doit pas couper la connexion, ni les autres tables du client
+                    reponse = "ERREUR interne: {}".format(erreur)
+                ecrivain.write((reponse + '\n').encode('utf-8'))
+                await ecrivain.drain()
+        except ConnectionError:
+            pass
+        finally:
+            ecrivain.close()
+
+    async def traiter_sans_bloquer(self, commande):
+        """
+        Méthode qui exécute une commande et retourne la ligne de réponse. Une table sans joueur humain actif est jouée
+        jusqu'à ce qu'elle attende un joueur humain ou que sa partie soit terminée, TRANCHE_RONDES rondes à la fois:
+        la boucle sert les autres connexions entre deux tranches.
+        Args:
+            commande (str): La commande (voir la documentation de la classe)
+
+        Returns:
+            str: La réponse, sans fin de ligne
+        """
+        reponse = self.interpreter(commande)
+        if isinstance(reponse, str):
+            return reponse
+        table = reponse
+        while table.automatique:
+            await asyncio.sleep(0)
+            # Entre deux tranches, la table a pu être suspendue sur disque ou fermée par un autre client
+            table = self.tables.get(reponse.identifiant)
+            if table is None:
+                return "FERMEE {}".format(reponse.identifiant)
+            table.poursuivre(TRANCHE_RONDES)
+        return self.message_demande(table)
+
+    def interpreter(self, commande):
+        """
+        Méthode qui exécute une commande, en ne jouant qu'une première tranche de rondes d'une table sans joueur humain
+        actif.
+        Args:
+            commande (str): La commande (voir la documentation de la classe)
+
+        Returns:
+            str ou TableJeu: La réponse, ou la table qui a avancé, si la réponse dépend de ce qu'elle attend
+        """
+        mots = commande.split()
+        if not mots:
+            return "ERREUR commande vide"
+        nom, arguments = mots[0].upper(), mots[1:]
+        try:
+            if nom == 'NOUVELLE':
+                return self.creer_table(arguments)
+            if nom not in ('SENS', 'LANCER', 'CONTINUER', 'ETAT', 'QUITTER'):
+                return "ERREUR commande inconnue: {}".format(mots[0])
+            if not arguments:
+                return "ERREUR numéro de table manquant"
+            table = self.tables.get(int(arguments[0]))
+        except ValueError:
+            return "ERREUR nombre invalide"
+        if table is None:
+            return "ERREUR table inconnue: {}".format(arguments[0])
+
+        if nom == 'ETAT':
+            return self.message_etat(table)
+        if nom == 'QUITTER':
+            del self.tables[table.identifiant]
+            return "FERMEE {}".format(table.identifiant)
+        if nom == 'SENS' and isinstance(table.demande, DemandeSens):
+            if len(arguments) < 2 or arguments[1].upper() not in ('O', 'N'):
+                return "ERREUR le sens doit être O (croissant) ou N (décroissant)"
+            reponse = 1 if arguments[1].upper() == 'O' else -1
+        elif nom == 'LANCER' and isinstance(table.demande, DemandeLancer) or \
+                nom == 'CONTINUER' and isinstance(table.demande, DemandeContinuer):
+            reponse = None
+        else:
+            return "ERREUR la table {} n'attend pas {}: {}".format(table.identifiant, nom,
+                                                                  self.message_demande(table))
+        table.avancer(reponse, TRANCHE_RONDES)
+        return table
+
+    def creer_table(self, arguments):
+        """
+        Méthode qui crée une table selon les arguments de la commande NOUVELLE.
+        Args:
+            arguments (list): Nombre de joueurs, nombre de joueurs humains et, au choix, nombre maximal de rondes et
+                graine de la partie
+
+        Returns:
+            str ou TableJeu: Une erreur, ou la nouvelle table
+        """
+        if not 2 <= len(arguments) <= 4:
+            return "ERREUR usage: NOUVELLE <joueurs> <humains> [<rondes> [<graine>]]"
+        nombre_joueurs, nombre_joueurs_humains = int(arguments[0]), int(arguments[1])
+        ronde_max = int(arguments[2]) if len(arguments) > 2 else RONDEMAX
+        graine = int(arguments[3]) if len(arguments) > 3 else None
+        if not NOMBRE_JOUEURS_MIN <= nombre_joueurs <= NOMBRE_JOUEURS_MAX:
+            return "ERREUR le nombre de joueurs doit être entre {} et {}".format(NOMBRE_JOUEURS_MIN,
+                                                                                  NOMBRE_JOUEURS_MAX)
+        if not 0 <= nombre_joueurs_humains <= nombre_joueurs:
+            return "ERREUR le nombre de joueurs humains doit être entre 0 et {}".format(nombre_joueurs)
+        if not 1 <= ronde_max <= RONDES_MAX:
+            return "ERREUR le nombre de rondes doit être entre 1 et {}".format(RONDES_MAX)
+
+        table = TableJeu(self.prochain_identifiant, nombre_joueurs, nombre_joueurs_humains, ronde_max, graine,
+                         TRANCHE_RONDES)
+        self.prochain_identifiant += 1
+        self.tables[table.identifiant] = table
+        return table
+
+    def message_demande(self, table):
+        """
+        Méthode qui assemble la ligne qui indique ce qu'attend une table. Une table dont la partie est terminée est
+        fermée.
+        Args:
+            table (TableJeu): La table
+
+        Returns:
+            str: La ligne DEMANDE ou FIN de la table
+        """
+        demande = table.demande
+        if isinstance(demande, DemandeSens):
+            return "DEMANDE {} SENS {}".format(table.identifiant, demande.joueur.identifiant)
+        if isinstance(demande, DemandeLancer):
+            return "DEMANDE {} LANCER {}".format(table.identifiant, demande.joueur.identifiant)
+        if isinstance(demande, DemandeContinuer):
+            return "DEMANDE {} CONTINUER {}".format(table.identifiant, demande.ronde)
+        self.tables.pop(table.identifiant, None)
+        return "FIN {} {} {}".format(table.identifiant, ','.join(str(gagnant) for gagnant in table.resultat.gagnants),
+                                     ','.join(str(joueur.score) for joueur in table.partie.joueurs))
+
+    @staticmethod
+    def message_etat(table):
+        """
+        Méthode statique qui assemble la ligne qui donne l'état d'une table.
+        Args:
+            table (TableJeu): La table
+
+        Returns:
+            str: La ligne ETAT de la table
+        """
+        partie = table.partie
+        return "ETAT {} {} {} {}".format(table.identifiant, partie.ronde,
+                                         ','.join(str(joueur.score) for joueur in partie.joueurs),
+                                         ','.join(str(len(joueur.dés)) for joueur in partie.joueurs))
+
+
+async def servir(hote=HOTE, port=PORT, sessions=None):
+    """
+    Fonction qui démarre un serveur pymafia et le garde en marche jusqu'à son interruption.
+    Args:
+        hote (str, optional): Adresse d'écoute
+        port (int, optional): Port d'écoute
+        sessions (MagasinSessions, optional): Magasin des tables (toutes en mémoire par défaut)
+    """
+    serveur = ServeurPymafia(hote, port, sessions)
+    await serveur.demarrer()
+    print("Serveur pymafia à l'écoute sur {}:{}".format(serveur.hote, serveur.port))
+    async with serveur.serveur:
+        await serveur.serveur.serve_forever()
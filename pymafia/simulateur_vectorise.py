@@ -0,0 +1,315 @@
+"""
+Module de la classe SimulateurVectorise
+
+Ce module nécessite NumPy, contrairement au reste du package: NumPy n'est pas une dépendance de pymafia, et
+l'importation de ce module échoue avec un message explicite lorsqu'il n'est pas installé.
+
+Débit mesuré par banc_essai.banc_simulateur_vectorise (ronde_max de 2, un seul cœur, meilleure de plusieurs séries,
+à ±20 % près d'une série à l'autre), par rapport à Partie.simuler:
+    - 100 000 parties d'un coup: environ 108 fois plus de parties par seconde à 2 joueurs, 125 fois à 3 joueurs et
+      103 fois à 8 joueurs;
+    - 1 000 000 de parties d'un coup: de 76 à 90 fois seulement, les tableaux d'état ne tenant plus en cache.
+L'objectif de 100 fois n'est donc atteint qu'avec des lots d'environ 100 000 parties; les lots plus petits paient le
+coût fixe de chaque appel à NumPy et les lots plus grands celui des accès mémoire.
+"""
+
+try:
+    import numpy as np
+except ImportError as erreur:
+    raise ImportError("Le simulateur vectorisé nécessite NumPy, qui n'est pas installé "
+                      "(pip install numpy).") from erreur
+
+from pymafia.partie import RONDEMAX
+
+# Nombre maximal de dés lancés d'un seul tirage. Un tirage est un entier uniforme entre 0 et 6**DÉS_PAR_TIRAGE - 1
+# dont les chiffres en base 6 sont les faces des dés. Lancer m dés revient à n'utiliser que les m premiers chiffres:
+# les tables ci-dessous donnent directement le résultat d'un tirage de m dés à l'index m * TIRAGES + tirage.
+DÉS_PAR_TIRAGE = 6
+TIRAGES = 6 ** DÉS_PAR_TIRAGE
+
+
+def creer_tables_de_tirage():
+    """
+    Fonction qui crée les tables donnant le résultat de chaque tirage de m dés, pour m entre 0 et DÉS_PAR_TIRAGE. La
+    table des tours contient le nombre de dés retirés de la main du joueur (valeurs 1 et 6) dans l'octet de poids
+    faible et le nombre de dés de valeur 6 dans l'octet suivant, ce qui permet d'additionner les résultats de plusieurs
+    tirages tant qu'un joueur a moins de 256 dés. La table des sommes contient la somme des dés.
+    Returns:
+        ndarray, ndarray: Table des tours et table des sommes
+    """
+    tirages = np.arange(TIRAGES)
+    tours = np.zeros((DÉS_PAR_TIRAGE + 1, TIRAGES), dtype=np.uint16)
+    sommes = np.zeros((DÉS_PAR_TIRAGE + 1, TIRAGES), dtype=np.uint8)
+    for m in range(1, DÉS_PAR_TIRAGE + 1):
+        faces = tirages // 6 ** (m - 1) % 6 + 1
+        tours[m] = tours[m - 1] + (faces == 1) + 257 * (faces == 6)
+        sommes[m] = sommes[m - 1] + faces
+    return tours.ravel(), sommes.ravel()
+
+
+TABLE_TOURS, TABLE_SOMMES = creer_tables_de_tirage()
+
+
+class SimulateurVectorise:
+    """
+    Classe qui simule simultanément plusieurs parties indépendantes de pymafia entre joueurs ordinateurs. L'état des
+    parties en cours est conservé dans des tableaux NumPy et chaque appel à jouer_un_tour fait jouer un tour à toutes
+    les parties en cours, avec des tirages aléatoires groupés et des mises à jour masquées.
+
+    Les règles sont celles de Partie.jouer_un_tour, Partie.deplacer_les_dés_1_et_6 et
+    Joueur.ajuster_score_en_fin_de_tour. Le premier joueur est tiré uniformément parmi les joueurs, ce qui donne la même
+    distribution que Partie.trouver_premier_joueur (les égalités sont relancées entre joueurs symétriques), et le sens
+    est tiré uniformément comme le fait JoueurOrdinateur.demander_sens.
+
+    Les tableaux d'état ne contiennent que les parties en cours (une ligne par partie, une colonne par joueur) et sont
+    compactés lorsque le quart des parties qu'ils contiennent sont terminées. La position du joueur courant est un
+    index dans les tableaux d'état aplatis.
+
+    Attributes:
+        nombre_parties (int): Nombre de parties simulées
+        nombre_joueurs (int): Nombre de joueurs de chaque partie
+        ronde_max (int): Nombre maximal de rondes d'une partie
+        scores (ndarray): Score final de chaque joueur, de forme (nombre_parties, nombre_joueurs)
+        nombre_rondes (ndarray): Nombre de rondes jouées dans chaque partie
+        nombre_tours (ndarray): Nombre de tours joués dans chaque partie
+        points_transférés (ndarray): Somme des points donnés aux gagnants des rondes de chaque partie
+        parties (ndarray): Index de la partie de chaque ligne des tableaux d'état
+        en_cours (ndarray): True pour les lignes dont la partie n'est pas terminée
+        dés (ndarray): Nombre de dés de chaque joueur
+        scores_en_cours (ndarray): Score de chaque joueur
+        suivants (ndarray): Écart entre la position de chaque joueur et celle du joueur actif qui le suit, selon le sens
+            de la partie (cet écart ne change pas lorsque les tableaux sont compactés)
+        courant (ndarray): Position du joueur courant de chaque partie
+        sens (ndarray): Sens de chaque partie (1, croissant; -1, décroissant)
+        ronde (ndarray): Numéro de la ronde actuelle de chaque partie
+        étape (int): Nombre d'appels à jouer_un_tour, qui est aussi le nombre de tours joués dans chaque partie en cours
+        points (ndarray): Somme des points donnés aux gagnants des rondes de chaque partie
+    """
+
+    def __init__(self, nombre_parties, nombre_joueurs, ronde_max=RONDEMAX, graine=None):
+        """
+        Constructeur de la classe SimulateurVectorise
+        Args:
+            nombre_parties (int): Nombre de parties à simuler
+            nombre_joueurs (int): Nombre de joueurs de chaque partie (entre 2 et 51, pour qu'un joueur ait toujours
+                moins de 256 dés)
+            ronde_max (int, optional): Nombre maximal de rondes d'une partie
+            graine (int, optional): Graine du générateur aléatoire, pour des simulations reproductibles
+        """
+        if not 2 <= nombre_joueurs <= 51:
+            raise ValueError("Le simulateur vectorisé accepte entre 2 et 51 joueurs par partie.")
+
+        self.nombre_parties = nombre_parties
+        self.nombre_joueurs = nombre_joueurs
+        self.ronde_max = ronde_max
+        self.générateur = np.random.default_rng(graine)
+
+        self.scores = np.zeros((nombre_parties, nombre_joueurs), dtype=np.int32)
+        self.nombre_rondes = np.zeros(nombre_parties, dtype=np.int32)
+        self.nombre_tours = np.zeros(nombre_parties, dtype=np.int32)
+        self.points_transférés = np.zeros(nombre_parties, dtype=np.int32)
+
+        self.parties = np.arange(nombre_parties)
+        self.en_cours = np.ones(nombre_parties, dtype=bool)
+        self.dés = np.full(nombre_parties * nombre_joueurs, 5, dtype=np.int32)
+        self.scores_en_cours = np.full(nombre_parties * nombre_joueurs, 50, dtype=np.int32)
+        self.suivants = np.zeros(nombre_parties * nombre_joueurs, dtype=np.int8)
+        self.sens = np.where(self.générateur.integers(2, size=nombre_parties) == 0, 1, -1)
+        self.courant = (self.parties * nombre_joueurs
+                        + self.générateur.integers(nombre_joueurs, size=nombre_parties)).astype(np.intp)
+        self.ronde = np.ones(nombre_parties, dtype=np.int32)
+        self.étape = 0
+        self.points = np.zeros(nombre_parties, dtype=np.int32)
+
+        self.calculer_suivants(np.arange(nombre_parties))
+
+    def lancer(self, nombre_dés, table):
+        """
+        Méthode qui lance un nombre de dés différent pour chaque élément d'un tableau. Les dés sont lancés par tirages
+        d'au plus DÉS_PAR_TIRAGE dés et le résultat de chaque tirage est lu dans une table de tirage. Seuls les éléments
+        qui ont encore des dés à lancer font un tirage supplémentaire.
+        Args:
+            nombre_dés (ndarray): Nombre de dés à lancer pour chaque élément
+            table (ndarray): Table de tirage (TABLE_TOURS ou TABLE_SOMMES)
+
+        Returns:
+            ndarray: Somme des résultats des tirages de chaque élément
+        """
+        dés_du_tirage = np.minimum(nombre_dés, DÉS_PAR_TIRAGE)
+        index = dés_du_tirage * TIRAGES + self.générateur.integers(0, TIRAGES, size=len(nombre_dés), dtype=np.int32)
+        résultat = table.take(index).astype(np.int32)
+
+        if nombre_dés.max(initial=0) <= DÉS_PAR_TIRAGE:
+            return résultat
+
+        à_lancer = nombre_dés - dés_du_tirage
+        éléments = np.flatnonzero(à_lancer)
+        while len(éléments):
+            dés_du_tirage = np.minimum(à_lancer[éléments], DÉS_PAR_TIRAGE)
+            index = dés_du_tirage * TIRAGES + self.générateur.integers(0, TIRAGES, size=len(éléments), dtype=np.int32)
+            résultat[éléments] += table.take(index)
+            à_lancer[éléments] -= dés_du_tirage
+            éléments = éléments[à_lancer[éléments] > 0]
+        return résultat
+
+    def calculer_suivants(self, lignes):
+        """
+        Méthode qui calcule, pour chaque joueur des lignes données, l'écart jusqu'au prochain joueur actif dans le sens
+        de la partie. Ce calcul n'est refait qu'en fin de ronde, lorsque des joueurs peuvent être retirés.
+        Args:
+            lignes (ndarray): Lignes des parties à mettre à jour
+        """
+        nombre_joueurs = self.nombre_joueurs
+        positions = np.arange(nombre_joueurs)[np.newaxis, :]
+        actifs = self.scores_en_cours.reshape(-1, nombre_joueurs)[lignes] > 0
+        sens = self.sens[lignes][:, np.newaxis]
+        # Lorsque tous les joueurs d'une partie sont actifs, le joueur suivant est le voisin immédiat. Les autres
+        # parties cherchent le prochain joueur actif à un écart de plus en plus grand.
+        suivants = (positions + sens) % nombre_joueurs
+        incomplètes = np.flatnonzero(~actifs.all(axis=1))
+        if len(incomplètes):
+            actifs = actifs[incomplètes]
+            sens = sens[incomplètes]
+            incomplets = np.repeat(positions, len(incomplètes), axis=0)
+            trouvés = np.zeros(actifs.shape, dtype=bool)
+            rangées = np.arange(len(incomplètes))[:, np.newaxis]
+            for décalage in range(1, nombre_joueurs):
+                candidats = (positions + sens * décalage) % nombre_joueurs
+                nouveaux = actifs[rangées, candidats] & ~trouvés
+                incomplets[nouveaux] = candidats[nouveaux]
+                trouvés |= nouveaux
+            suivants[incomplètes] = incomplets
+
+        self.suivants.reshape(-1, nombre_joueurs)[lignes] = suivants - positions
+
+    def jouer_un_tour(self):
+        """
+        Méthode qui fait jouer un tour au joueur courant de chaque partie en cours:
+        1) Les dés de tous les joueurs courants sont lancés à la fois.
+        2) Les dés de valeur 1 sont retirés et les dés de valeur 6 sont passés au joueur suivant.
+        3) Les parties dont le joueur courant n'a plus de dé terminent leur ronde, les autres passent au joueur suivant.
+        Returns:
+            int: Nombre de parties qui étaient en cours avant ce tour
+        """
+        if len(self.parties) == 0:
+            return 0
+
+        courant = self.courant
+        suivant = courant + self.suivants.take(courant)
+        nombre_dés = self.dés.take(courant)
+        résultat = self.lancer(nombre_dés, TABLE_TOURS)
+        retirés = résultat & 255
+        nombre_6 = résultat >> 8
+
+        restants = nombre_dés - retirés
+        self.dés[courant] = restants
+        self.dés[suivant] += nombre_6
+        self.étape += 1
+
+        fin_de_ronde = restants == 0
+        if fin_de_ronde.any():
+            fin_de_ronde &= self.en_cours
+            self.courant = np.where(fin_de_ronde, courant, suivant)
+            self.terminer_rondes(np.flatnonzero(fin_de_ronde))
+        else:
+            self.courant = suivant
+
+        return len(self.parties)
+
+    def terminer_rondes(self, lignes):
+        """
+        Méthode qui termine la ronde des parties des lignes données, dont le joueur courant est le gagnant. Les perdants
+        jouent les dés qui leur restent et donnent au gagnant la somme de leurs dés (au plus leur score). Les joueurs
+        sans points sont retirés et les parties qui ont atteint le nombre maximal de rondes ou qui n'ont plus qu'un seul
+        joueur actif sont terminées. Les autres parties recommencent une ronde avec 5 dés par joueur actif.
+        Args:
+            lignes (ndarray): Lignes des parties dont la ronde est terminée
+        """
+        if len(lignes) == 0:
+            return
+
+        nombre_joueurs = self.nombre_joueurs
+        gagnants = self.courant[lignes] - lignes * nombre_joueurs
+        rangées = np.arange(len(lignes))
+        dés = self.dés.reshape(-1, nombre_joueurs)[lignes]
+        dés[rangées, gagnants] = 0
+        scores = self.scores_en_cours.reshape(-1, nombre_joueurs)[lignes]
+
+        sommes = self.lancer(dés.ravel(), TABLE_SOMMES)
+        points = np.minimum(sommes.reshape(dés.shape), scores)
+
+        scores -= points
+        total = points.sum(axis=1)
+        scores[rangées, gagnants] += total
+        self.scores_en_cours.reshape(-1, nombre_joueurs)[lignes] = scores
+        self.points[lignes] += total
+        self.ronde[lignes] += 1
+
+        actifs = scores > 0
+        terminées = (self.ronde[lignes] > self.ronde_max) | (actifs.sum(axis=1) < 2)
+        continuées = ~terminées
+        self.dés.reshape(-1, nombre_joueurs)[lignes[continuées]] = 5 * actifs[continuées]
+        # Les joueurs suivants ne changent que dans les parties où un joueur vient d'être retiré.
+        retraits = ((points > 0) & ~actifs).any(axis=1)
+        self.calculer_suivants(lignes[retraits & continuées])
+
+        if terminées.any():
+            self.terminer_parties(lignes[terminées])
+
+    def terminer_parties(self, lignes):
+        """
+        Méthode qui retire des parties en cours les parties terminées. Les lignes des parties terminées restent dans les
+        tableaux d'état jusqu'à ce qu'au moins le quart soient terminées, moment où leur résultat est enregistré et où
+        les tableaux sont compactés. D'ici là, le joueur courant de ces parties n'a aucun dé et son tour est ignoré.
+        Args:
+            lignes (ndarray): Lignes des parties terminées
+        """
+        self.nombre_tours[self.parties[lignes]] = self.étape
+        self.en_cours[lignes] = False
+        self.dés[self.courant[lignes]] = 0
+        self.suivants[self.courant[lignes]] = 0
+
+        if 4 * np.count_nonzero(~self.en_cours) >= len(self.en_cours):
+            self.compacter()
+
+    def compacter(self):
+        """
+        Méthode qui enregistre le résultat des parties terminées et qui retire leurs lignes des tableaux d'état.
+        """
+        nombre_joueurs = self.nombre_joueurs
+        terminées = np.flatnonzero(~self.en_cours)
+        parties = self.parties[terminées]
+        self.scores[parties] = self.scores_en_cours.reshape(-1, nombre_joueurs)[terminées]
+        self.nombre_rondes[parties] = self.ronde[terminées] - 1
+        self.points_transférés[parties] = self.points[terminées]
+
+        conservées = np.flatnonzero(self.en_cours)
+        décalages = (np.arange(len(conservées)) - conservées) * nombre_joueurs
+
+        self.dés = self.dés.reshape(-1, nombre_joueurs)[conservées].ravel()
+        self.scores_en_cours = self.scores_en_cours.reshape(-1, nombre_joueurs)[conservées].ravel()
+        self.suivants = self.suivants.reshape(-1, nombre_joueurs)[conservées].ravel()
+        self.courant = (self.courant[conservées] + décalages).astype(np.intp)
+        self.parties = self.parties[conservées]
+        self.en_cours = self.en_cours[conservées]
+        self.sens = self.sens[conservées]
+        self.ronde = self.ronde[conservées]
+        self.points = self.points[conservées]
+
+    def simuler(self):
+        """
+        Méthode qui fait jouer des tours jusqu'à ce que toutes les parties soient terminées.
+        Returns:
+            SimulateurVectorise: Le simulateur lui-même, pour consulter les résultats
+        """
+        while self.jouer_un_tour():
+            pass
+        return self
+
+    def gagnants(self):
+        """
+        Méthode qui détermine les joueurs ayant le plus haut score de chaque partie.
+        Returns:
+            ndarray: Tableau booléen de forme (nombre_parties, nombre_joueurs), True pour le ou les gagnants
+        """
+        return self.scores == self.scores.max(axis=1, keepdims=True)
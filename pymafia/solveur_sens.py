@@ -0,0 +1,218 @@
+"""
+Module de la classe SolveurSens
+"""
+
+from pymafia.avance_rapide import AvanceRapide
+from pymafia.distributions_des import DistributionsDés
+
+# Nombre de dés de chaque joueur au début d'une ronde
+DÉS_DÉBUT_RONDE = 5
+
+# Score de chaque joueur au début d'une partie, par défaut
+SCORE_DÉPART = 50
+
+
+class SolveurSens:
+    """
+    Classe qui calcule, pour le premier joueur d'une ronde, la valeur de chacun des deux sens du jeu: la probabilité
+    qu'il termine la partie parmi les gagnants (avec le plus haut score) si le jeu se déroule dans ce sens jusqu'à la
+    fin de la partie, entre joueurs qui jouent au hasard.
+
+    Un état est décrit par les scores des joueurs actifs, dans l'ordre croissant des identifiants à partir du joueur
+    qui choisit, et par le nombre de rondes qui restent à jouer; au début d'une ronde, tous les joueurs ont 5 dés. La
+    valeur d'un état est obtenue par récurrence sur le nombre de rondes restantes (une itération de valeur à horizon
+    fini), avec mémoïsation: pour chaque issue d'une ronde (voir AvanceRapide.distribution), les perdants lancent les
+    dés qui leur restent et donnent leurs points au gagnant (voir DistributionsDés.distribution_paiement), les joueurs
+    sans points sont retirés, et le gagnant commence la ronde suivante.
+
+    Le nombre d'états croît très vite avec le nombre de joueurs, de rondes et de points: le solveur convient aux
+    petites parties. Un état de 3 joueurs à 50 points prend environ une demi-seconde pour une seule ronde restante,
+    mais les milliers d'états d'une partie de 2 rondes prennent de longues minutes.
+
+    Au début d'une partie, tous les joueurs ont le même score: par symétrie, les deux sens ont alors exactement la
+    même valeur. Ils ne diffèrent que lorsque les scores des voisins du premier joueur diffèrent, soit au début d'une
+    ronde suivante, dans une partie où le sens est choisi à chaque ronde (voir Partie, sens_chaque_ronde).
+
+    Attributes:
+        valeurs (dict): Valeur de chaque état déjà calculé, selon (scores, position du premier joueur de la ronde,
+            sens, rondes restantes)
+        paiements (dict): Distribution (en float) des points donnés par un perdant, selon (nombre de dés, score)
+        distributions (DistributionsDés): Distributions exactes de la somme des dés
+    """
+
+    def __init__(self):
+        """
+        Constructeur de la classe SolveurSens
+        """
+        self.valeurs = {}
+        self.paiements = {}
+        self.distributions = DistributionsDés()
+
+    def valeurs_sens(self, scores, rondes):
+        """
+        Méthode qui calcule la valeur de chacun des deux sens pour le joueur qui choisit, au début d'une ronde.
+        Args:
+            scores (tuple): Scores des joueurs actifs dans l'ordre croissant des identifiants, à partir du joueur qui
+                choisit le sens et commence la ronde
+            rondes (int): Nombre de rondes qui restent à jouer, en comptant celle-ci
+
+        Returns:
+            float, float: Probabilité que le joueur qui choisit termine parmi les gagnants en jouant en ordre
+                croissant, puis en ordre décroissant
+        """
+        return self.valeur(tuple(scores), 0, 1, rondes), self.valeur(tuple(scores), 0, -1, rondes)
+
+    def valeur(self, scores, premier, sens, rondes):
+        """
+        Méthode qui calcule la probabilité que le joueur à la position 0 termine la partie parmi les gagnants.
+        Args:
+            scores (tuple): Scores des joueurs actifs dans l'ordre croissant des identifiants
+            premier (int): Position du premier joueur de la ronde
+            sens (int): Sens du jeu (1 ou -1)
+            rondes (int): Nombre de rondes qui restent à jouer
+
+        Returns:
+            float: Probabilité de victoire du joueur à la position 0
+        """
+        if rondes == 0 or len(scores) == 1:
+            return 1.0 if scores[0] == max(scores) else 0.0
+        cle = (scores, premier, sens, rondes)
+        if cle in self.valeurs:
+            return self.valeurs[cle]
+
+        valeur = 0.0
+        for probabilite, scores_fin, gagnant in self.fins_de_ronde(scores, premier, sens):
+            valeur += probabilite * self.valeur_ronde_suivante(scores_fin, gagnant, sens, rondes - 1)
+        self.valeurs[cle] = valeur
+        return valeur
+
+    def fins_de_ronde(self, scores, premier, sens):
+        """
+        Méthode qui énumère les fins possibles d'une ronde: le gagnant et les scores après que les perdants ont donné
+        leurs points.
+        Args:
+            scores (tuple): Scores des joueurs actifs au début de la ronde, dans l'ordre croissant des identifiants
+            premier (int): Position du premier joueur de la ronde
+            sens (int): Sens du jeu (1 ou -1)
+
+        Returns:
+            generator: (probabilité, scores en fin de ronde, position du gagnant) de chaque fin de ronde possible
+        """
+        nombre_joueurs = len(scores)
+        # Position à la table du joueur qui joue en position i de la ronde
+        positions = [(premier + sens * i) % nombre_joueurs for i in range(nombre_joueurs)]
+        issues, cumulees = AvanceRapide.distribution((DÉS_DÉBUT_RONDE,) * nombre_joueurs)
+        precedente = 0.0
+        for (gagnant, comptes), cumulee in zip(issues, cumulees):
+            probabilite_issue = cumulee - precedente
+            precedente = cumulee
+            gagnant = positions[gagnant]
+            for scores_fin, probabilite in self.scores_fin_de_ronde(scores, gagnant, positions, comptes).items():
+                yield probabilite_issue * probabilite, scores_fin, gagnant
+
+    def etats_accessibles(self, nombre_joueurs, rondes, score_depart=SCORE_DÉPART):
+        """
+        Méthode qui énumère les états dans lesquels le premier joueur d'une ronde peut se trouver, à partir du début
+        d'une partie, quel que soit le sens du jeu.
+        Args:
+            nombre_joueurs (int): Nombre de joueurs au début de la partie
+            rondes (int): Nombre de rondes de la partie
+            score_depart (int, optional): Score de chaque joueur au début de la partie
+
+        Returns:
+            list: (scores à partir du premier joueur de la ronde, rondes restantes) de chaque état, en commençant par
+                la première ronde
+        """
+        etats = []
+        niveau = {(score_depart,) * nombre_joueurs}
+        for rondes_restantes in range(rondes, 0, -1):
+            etats.extend((scores, rondes_restantes) for scores in sorted(niveau))
+            suivant = set()
+            if rondes_restantes > 1:
+                for scores in niveau:
+                    for sens in (1, -1):
+                        for probabilite, scores_fin, gagnant in self.fins_de_ronde(scores, 0, sens):
+                            scores_fin, gagnant = self.retirer_joueurs_sans_points(scores_fin, gagnant)
+                            if len(scores_fin) > 1:
+                                suivant.add(scores_fin[gagnant:] + scores_fin[:gagnant])
+            niveau = suivant
+        return etats
+
+    def scores_fin_de_ronde(self, scores, gagnant, positions, comptes):
+        """
+        Méthode qui calcule la distribution des scores en fin de ronde, lorsque les perdants lancent les dés qui leur
+        restent et donnent leurs points au gagnant.
+        Args:
+            scores (tuple): Scores des joueurs actifs au début de la ronde
+            gagnant (int): Position à la table du gagnant
+            positions (list): Position à la table du joueur de chaque position de la ronde
+            comptes (tuple): Nombre de dés de chaque joueur à la fin de la ronde, selon sa position dans la ronde
+
+        Returns:
+            dict: Probabilité de chaque tuple de scores en fin de ronde
+        """
+        distribution = {scores: 1.0}
+        for position, nombre_dés in zip(positions, comptes):
+            if position == gagnant:
+                continue
+            paiements = self.distribution_paiement(nombre_dés, scores[position])
+            suivante = {}
+            for scores_avant, probabilite in distribution.items():
+                for points, probabilite_points in paiements:
+                    scores_apres = list(scores_avant)
+                    scores_apres[position] -= points
+                    scores_apres[gagnant] += points
+                    scores_apres = tuple(scores_apres)
+                    suivante[scores_apres] = suivante.get(scores_apres, 0.0) + probabilite * probabilite_points
+            distribution = suivante
+        return distribution
+
+    def valeur_ronde_suivante(self, scores, gagnant, sens, rondes):
+        """
+        Méthode qui retire les joueurs sans points et calcule la valeur de l'état au début de la ronde suivante, que
+        le gagnant commence.
+        Args:
+            scores (tuple): Scores en fin de ronde
+            gagnant (int): Position à la table du gagnant
+            sens (int): Sens du jeu
+            rondes (int): Nombre de rondes qui restent à jouer après celle-ci
+
+        Returns:
+            float: Probabilité de victoire du joueur à la position 0
+        """
+        if scores[0] == 0:
+            return 0.0
+        scores, premier = self.retirer_joueurs_sans_points(scores, gagnant)
+        return self.valeur(scores, premier, sens, rondes)
+
+    @staticmethod
+    def retirer_joueurs_sans_points(scores, gagnant):
+        """
+        Méthode statique qui retire les joueurs sans points des scores en fin de ronde.
+        Args:
+            scores (tuple): Scores en fin de ronde
+            gagnant (int): Position à la table du gagnant
+
+        Returns:
+            tuple, int: Scores des joueurs qui ont encore des points et nouvelle position du gagnant
+        """
+        if 0 not in scores:
+            return scores, gagnant
+        return (tuple(score for score in scores if score > 0),
+                gagnant - sum(1 for score in scores[:gagnant] if score == 0))
+
+    def distribution_paiement(self, nombre_dés, score):
+        """
+        Méthode qui retourne la distribution des points donnés par un perdant, en float.
+        Args:
+            nombre_dés (int): Nombre de dés du perdant
+            score (int): Score du perdant
+
+        Returns:
+            list: (points, probabilité) de chaque nombre de points possible
+        """
+        cle = (nombre_dés, score)
+        if cle not in self.paiements:
+            self.paiements[cle] = [(points, float(probabilite)) for points, probabilite in
+                                   self.distributions.distribution_paiement(nombre_dés, score).items()]
+        return self.paiements[cle]
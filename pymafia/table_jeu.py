@@ -0,0 +1,175 @@
+"""
+Module de la classe TableJeu
+"""
+
+import struct
+
+from pymafia.demandes import DemandeSens, DemandeLancer, DemandeContinuer
+from pymafia.etat_partie import EtatPartie
+from pymafia.generateur_des import GenerateurDés
+from pymafia.joueur_humain import JoueurHumain
+from pymafia.partie import Partie, RONDEMAX
+
+# En-tête d'une table suspendue: version, demande en cours, longueur de l'état de la partie et nombre de décisions.
+# Suivent l'état de la partie (EtatPartie), les décisions (un octet signé chacune) et l'état du générateur.
+ENTETE = struct.Struct('<BBHH')
+VERSION = 1
+
+# Code de la demande en cours d'une table suspendue
+DEMANDES = (DemandeSens, DemandeLancer, DemandeContinuer)
+
+
+class TableJeu:
+    """
+    Classe pour une table de jeu hébergée par un serveur: une partie sans affichage, avec son propre générateur, et
+    les étapes de cette partie (voir Partie.etapes) arrêtées à la demande qui attend une réponse. Une table ne bloque
+    jamais: elle avance d'un coup jusqu'à la prochaine demande chaque fois qu'elle reçoit une réponse.
+
+    À la fin d'une ronde, une table qui n'a plus de joueur humain actif continue d'elle-même: personne n'a à le lui
+    demander. Une table sans joueur humain se joue ainsi au complet dès sa création, à moins de limiter le nombre de
+    rondes jouées d'un coup: la table reste alors automatique (voir automatique) et poursuit sa partie une tranche de
+    rondes à la fois (voir poursuivre), par exemple pour qu'un serveur ne bloque pas ses autres tables.
+
+    Une table qui attend une demande peut être suspendue en octets (voir en_octets), par exemple pour libérer la
+    mémoire d'une table inactive (voir MagasinSessions), puis reprise exactement là où elle était.
+
+    Attributes:
+        identifiant (int): Numéro d'identification de la table
+        partie (Partie): La partie jouée à la table
+        etapes (generator): Les étapes de la partie
+        demande (Demande): Demande qui attend une réponse (None lorsque la partie est terminée)
+        resultat (ResultatPartie): Le résultat de la partie, une fois terminée (None autrement)
+    """
+
+    def __init__(self, identifiant, nombre_joueurs, nombre_joueurs_humains, ronde_max=RONDEMAX, graine=None,
+                 rondes=None):
+        """
+        Constructeur de la classe TableJeu. La partie avance aussitôt jusqu'à sa première demande.
+        Args:
+            identifiant (int): Numéro d'identification de la table
+            nombre_joueurs (int): Nombre de joueurs de la partie
+            nombre_joueurs_humains (int): Nombre de joueurs humains de la partie
+            ronde_max (int, optional): Nombre maximal de rondes de la partie
+            graine (int, optional): Graine du générateur de la partie (au hasard par défaut)
+            rondes (int, optional): Nombre maximal de rondes que la table continue d'elle-même dès sa création (voir
+                avancer)
+        """
+        self.identifiant = identifiant
+        self.partie = Partie(nombre_joueurs, nombre_joueurs_humains, affichage=False,
+                             generateur=GenerateurDés(graine))
+        self.partie.ronde_max = ronde_max
+        self.etapes = self.partie.etapes()
+        self.demande = None
+        self.resultat = None
+        self.avancer(None, rondes)
+
+    @property
+    def terminee(self):
+        """
+        Propriété qui indique si la partie de la table est terminée.
+        Returns:
+            bool: True si la partie est terminée, False autrement
+        """
+        return self.resultat is not None
+
+    @property
+    def automatique(self):
+        """
+        Propriété qui indique si la table attend de continuer d'elle-même, sans joueur humain actif, parce que le
+        nombre de rondes jouées d'un coup était limité.
+        Returns:
+            bool: True si la table continue d'elle-même à la fin de la ronde, False autrement
+        """
+        return isinstance(self.demande, DemandeContinuer) and not self.humains_actifs()
+
+    def avancer(self, reponse, rondes=None):
+        """
+        Méthode qui envoie une réponse à la demande en cours et fait avancer la partie jusqu'à la prochaine demande, ou
+        jusqu'à la fin de la partie.
+        Args:
+            reponse: Réponse à la demande en cours (None pour la première)
+            rondes (int, optional): Nombre maximal de rondes que la table continue d'elle-même, faute de joueur
+                humain actif (sans limite par défaut). La table reste automatique si la limite est atteinte.
+
+        Returns:
+            Demande: La nouvelle demande, ou None si la partie est terminée
+        """
+        try:
+            demande = self.etapes.send(reponse)
+            while isinstance(demande, DemandeContinuer) and not self.humains_actifs() and rondes != 0:
+                demande = self.etapes.send(None)
+                if rondes is not None:
+                    rondes -= 1
+        except StopIteration as fin:
+            self.resultat = fin.value
+            demande = None
+        self.demande = demande
+        return demande
+
+    def poursuivre(self, rondes=1):
+        """
+        Méthode qui poursuit la partie d'une table automatique pendant quelques rondes au plus.
+        Args:
+            rondes (int, optional): Nombre maximal de rondes jouées
+
+        Returns:
+            Demande: La nouvelle demande, ou None si la partie est terminée
+        """
+        return self.avancer(None, rondes - 1)
+
+    def humains_actifs(self):
+        """
+        Méthode qui vérifie s'il reste un joueur humain parmi les joueurs actifs.
+        Returns:
+            bool: True s'il reste un joueur humain actif, False autrement
+        """
+        return any(isinstance(joueur, JoueurHumain) for joueur in self.partie.joueurs_actifs)
+
+    def en_octets(self):
+        """
+        Méthode qui suspend la table: elle retourne tout ce qu'il faut pour la reprendre à la demande en cours, soit
+        l'état de la partie, ses décisions et l'état de son générateur (environ 3 ko pour 4 joueurs).
+        Returns:
+            bytes: La table suspendue
+        """
+        if self.terminee:
+            raise ValueError("Une table dont la partie est terminée ne peut pas être suspendue.")
+        etat = EtatPartie.depuis_partie(self.partie).donnees
+        décisions = self.partie.décisions
+        return (ENTETE.pack(VERSION, DEMANDES.index(type(self.demande)), len(etat), len(décisions)) + etat
+                + struct.pack('<{}b'.format(len(décisions)), *décisions) + self.partie.generateur.en_octets())
+
+    @staticmethod
+    def depuis_octets(identifiant, donnees):
+        """
+        Méthode statique qui reprend une table suspendue par en_octets. La table attend la même demande qu'au moment
+        où elle a été suspendue, et sa partie se poursuivra exactement de la même façon.
+        Args:
+            identifiant (int): Numéro d'identification de la table
+            donnees (bytes): La table suspendue
+
+        Returns:
+            TableJeu: La table
+        """
+        version, code_demande, longueur_etat, nombre_décisions = ENTETE.unpack_from(donnees)
+        if version != VERSION:
+            raise ValueError("Cette table suspendue n'est pas dans un format connu.")
+        position = ENTETE.size + longueur_etat
+        generateur = GenerateurDés.depuis_octets(donnees[position + nombre_décisions:])
+        partie = EtatPartie(donnees[ENTETE.size:position]).en_partie(generateur=generateur)
+        partie.décisions = list(struct.unpack_from('<{}b'.format(nombre_décisions), donnees, position))
+
+        table = TableJeu.__new__(TableJeu)
+        table.identifiant = identifiant
+        table.partie = partie
+        demande = DEMANDES[code_demande]
+        if demande is DemandeSens:
+            reprise = DemandeSens(partie.premier_joueur)
+        elif demande is DemandeLancer:
+            reprise = DemandeLancer(partie.joueur_courant)
+        else:
+            reprise = DemandeContinuer(partie.ronde)
+        table.etapes = partie.etapes(reprise)
+        table.demande = next(table.etapes)
+        table.resultat = None
+        return table
@@ -0,0 +1,147 @@
+"""
+Module de la classe TableSens
+"""
+
+import struct
+
+from pymafia.solveur_sens import SolveurSens, SCORE_DÉPART
+
+# En-tête de la table: signature, version et nombre d'entrées
+ENTETE_TABLE = struct.Struct('<4sBI')
+SIGNATURE = b'PYMS'
+VERSION = 1
+
+# Début de chaque entrée: nombre de joueurs et rondes restantes. Suivent le score de chaque joueur (entier non signé
+# de 16 bits), puis le sens choisi (entier signé de 8 bits).
+ENTETE_ENTREE = struct.Struct('<BB')
+
+# Sens inscrit lorsque les deux sens ont la même valeur
+ÉGALITÉ = 0
+
+# Écart de valeur en deçà duquel les deux sens sont considérés comme égaux
+TOLERANCE = 1e-12
+
+
+class TableSens:
+    """
+    Classe qui conserve le meilleur sens du jeu pour le premier joueur d'une ronde, dans chaque état accessible d'une
+    petite partie, tel que calculé par SolveurSens. Une fois la table construite ou chargée, le choix d'un joueur ne
+    demande qu'une recherche dans un dictionnaire.
+
+    La table peut être écrite dans un fichier binaire compact (voir sauvegarder), puis relue sans refaire les calculs.
+
+    Attributes:
+        choix (dict): Sens à choisir (1, -1 ou ÉGALITÉ), selon (scores des joueurs actifs dans l'ordre croissant des
+            identifiants à partir du premier joueur de la ronde, rondes restantes)
+    """
+
+    def __init__(self, chemin=None):
+        """
+        Constructeur de la classe TableSens
+        Args:
+            chemin (str, optional): Table à charger (voir sauvegarder). Sans table, elle est vide.
+        """
+        self.choix = {}
+        if chemin is not None:
+            self.charger(chemin)
+
+    def remplir(self, nombre_joueurs, rondes, score_depart=SCORE_DÉPART, solveur=None):
+        """
+        Méthode qui calcule le meilleur sens dans chaque état accessible d'une partie et l'ajoute à la table.
+        Args:
+            nombre_joueurs (int): Nombre de joueurs au début de la partie
+            rondes (int): Nombre de rondes de la partie
+            score_depart (int, optional): Score de chaque joueur au début de la partie
+            solveur (SolveurSens, optional): Solveur à utiliser, par exemple pour partager ses valeurs déjà calculées
+        """
+        if solveur is None:
+            solveur = SolveurSens()
+        for scores, rondes_restantes in solveur.etats_accessibles(nombre_joueurs, rondes, score_depart):
+            self.calculer(scores, rondes_restantes, solveur)
+
+    def calculer(self, scores, rondes, solveur=None):
+        """
+        Méthode qui calcule le meilleur sens dans un seul état et l'ajoute à la table, par exemple pour un état d'une
+        partie réelle, trop grande pour être remplie au complet.
+        Args:
+            scores (tuple): Scores des joueurs actifs dans l'ordre croissant des identifiants, à partir du premier
+                joueur de la ronde
+            rondes (int): Nombre de rondes qui restent à jouer, en comptant celle-ci
+            solveur (SolveurSens, optional): Solveur à utiliser, par exemple pour partager ses valeurs déjà calculées
+
+        Returns:
+            int: 1, -1 ou ÉGALITÉ
+        """
+        if solveur is None:
+            solveur = SolveurSens()
+        croissant, decroissant = solveur.valeurs_sens(scores, rondes)
+        if abs(croissant - decroissant) <= TOLERANCE:
+            sens = ÉGALITÉ
+        else:
+            sens = 1 if croissant > decroissant else -1
+        self.choix[(tuple(scores), rondes)] = sens
+        return sens
+
+    def choisir(self, scores, rondes):
+        """
+        Méthode qui retourne le meilleur sens dans un état.
+        Args:
+            scores (tuple): Scores des joueurs actifs dans l'ordre croissant des identifiants, à partir du premier
+                joueur de la ronde
+            rondes (int): Nombre de rondes qui restent à jouer, en comptant celle-ci
+
+        Returns:
+            int: 1 ou -1, ÉGALITÉ si les deux sens se valent, ou None si l'état n'est pas dans la table
+        """
+        return self.choix.get((scores, rondes))
+
+    @staticmethod
+    def etat_partie(partie):
+        """
+        Méthode statique qui décrit l'état d'une partie au moment où son premier joueur choisit le sens.
+        Args:
+            partie (Partie): La partie
+
+        Returns:
+            tuple, int: Scores des joueurs actifs dans l'ordre croissant des identifiants à partir du premier joueur,
+                et nombre de rondes qui restent à jouer
+        """
+        joueur = partie.premier_joueur
+        scores = []
+        for i in range(len(partie.joueurs_actifs)):
+            scores.append(joueur.score)
+            joueur = partie.anneau_joueurs.voisin(joueur, 1)
+        return tuple(scores), partie.ronde_max - partie.ronde + 1
+
+    def sauvegarder(self, chemin):
+        """
+        Méthode qui écrit la table dans un fichier binaire.
+        Args:
+            chemin (str): Chemin du fichier
+        """
+        with open(chemin, 'wb') as fichier:
+            fichier.write(ENTETE_TABLE.pack(SIGNATURE, VERSION, len(self.choix)))
+            for (scores, rondes), sens in self.choix.items():
+                fichier.write(ENTETE_ENTREE.pack(len(scores), rondes))
+                fichier.write(struct.pack('<{}Hb'.format(len(scores)), *scores, sens))
+
+    def charger(self, chemin):
+        """
+        Méthode qui lit une table écrite par sauvegarder. Ses entrées s'ajoutent à celles de la table.
+        Args:
+            chemin (str): Chemin du fichier
+        """
+        with open(chemin, 'rb') as fichier:
+            donnees = fichier.read()
+        signature, version, nombre_entrees = ENTETE_TABLE.unpack_from(donnees)
+        if signature != SIGNATURE or version != VERSION:
+            raise ValueError("Ce fichier n'est pas une table de sens.")
+
+        position = ENTETE_TABLE.size
+        for i in range(nombre_entrees):
+            nombre_joueurs, rondes = ENTETE_ENTREE.unpack_from(donnees, position)
+            position += ENTETE_ENTREE.size
+            format_entree = '<{}Hb'.format(nombre_joueurs)
+            *scores, sens = struct.unpack_from(format_entree, donnees, position)
+            position += struct.calcsize(format_entree)
+            self.choix[(tuple(scores), rondes)] = sens
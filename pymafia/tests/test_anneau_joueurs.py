@@ -0,0 +1,49 @@
+from unittest import TestCase
+from pymafia.anneau_joueurs import AnneauJoueurs
+from pymafia.joueur import Joueur
+
+
+class TestAnneauJoueurs(TestCase):
+
+    def test_voisin(self):
+        joueurs = [Joueur(1), Joueur(2), Joueur(3), Joueur(4)]
+        anneau = AnneauJoueurs(joueurs)
+
+        self.assertIs(joueurs[1], anneau.voisin(joueurs[0]))
+        self.assertIs(joueurs[0], anneau.voisin(joueurs[3], 1))
+        self.assertIs(joueurs[3], anneau.voisin(joueurs[0], -1))
+        self.assertIs(joueurs[1], anneau.voisin(joueurs[2], -1))
+
+        # Un joueur qui n'est pas dans l'anneau n'a pas de voisin
+        self.assertRaises(ValueError, anneau.voisin, Joueur(5))
+
+    def test_retirer(self):
+        joueurs = [Joueur(1), Joueur(2), Joueur(3), Joueur(4)]
+        anneau = AnneauJoueurs(joueurs)
+
+        anneau.retirer(joueurs[0])
+        self.assertEqual([joueurs[1], joueurs[2], joueurs[3]], anneau)
+        self.assertIs(joueurs[1], anneau[0])
+        self.assertIs(joueurs[1], anneau.voisin(joueurs[3]))
+        self.assertIs(joueurs[3], anneau.voisin(joueurs[1], -1))
+
+        anneau.retirer(joueurs[2])
+        self.assertEqual(2, len(anneau))
+        self.assertNotIn(joueurs[2], anneau)
+        self.assertIn(joueurs[3], anneau)
+        self.assertIs(joueurs[3], anneau.voisin(joueurs[1]))
+        self.assertIs(joueurs[3], anneau[-1])
+
+        anneau.retirer(joueurs[1])
+        self.assertIs(joueurs[3], anneau.voisin(joueurs[3]))
+        anneau.retirer(joueurs[3])
+        self.assertEqual([], list(anneau))
+
+    def test_identite(self):
+        # Deux joueurs identiques sont tout de même deux joueurs distincts de l'anneau
+        joueurs = [Joueur(1), Joueur(1), Joueur(1)]
+        anneau = AnneauJoueurs(joueurs)
+        self.assertEqual(3, len(anneau))
+        self.assertIs(joueurs[2], anneau.voisin(joueurs[1]))
+        self.assertNotEqual(joueurs[0], joueurs[1])
+        self.assertEqual(3, len({joueur: joueur.score for joueur in joueurs}))
@@ -0,0 +1,59 @@
+import os
+import tempfile
+from unittest import TestCase
+from pymafia.partie import Partie
+from pymafia.generateur_des import GenerateurDés
+from pymafia.archive_parties import ArchiveParties
+
+
+class TestArchiveParties(TestCase):
+
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, 'parties.pyma')
+        self.parties = []
+        self.resultats = []
+        for graine in range(30):
+            partie = Partie(2 + graine % 5, 0, dés_compacts=True, generateur=GenerateurDés(graine),
+                            journalisation=True)
+            partie.ronde_max = 1 + graine % 4
+            self.resultats.append(partie.simuler())
+            self.parties.append(partie)
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_ecrire_et_lire(self):
+        for compression in (None, 'zlib', 'lzma'):
+            with ArchiveParties(self.chemin, 'w', compression) as archive:
+                for partie in self.parties:
+                    archive.ajouter(partie)
+
+            with ArchiveParties(self.chemin) as archive:
+                self.assertEqual(compression, archive.compression)
+                lus = [(enregistrement.scores.tolist(), enregistrement.nombre_tours) for enregistrement in archive]
+
+            self.assertEqual([([resultat.scores[i] for i in sorted(resultat.scores)], resultat.nombre_tours)
+                              for resultat in self.resultats], lus)
+
+    def test_ajout(self):
+        with ArchiveParties(self.chemin, 'w', 'zlib') as archive:
+            for partie in self.parties[:10]:
+                archive.ajouter(partie)
+        with ArchiveParties(self.chemin, 'a') as archive:
+            for partie in self.parties[10:]:
+                archive.ajouter(partie)
+
+        with ArchiveParties(self.chemin) as archive:
+            self.assertEqual([resultat.nombre_tours for resultat in self.resultats],
+                             [enregistrement.nombre_tours for enregistrement in archive])
+
+    def test_erreurs(self):
+        # Une partie sans journal ne peut pas être archivée
+        with ArchiveParties(self.chemin, 'w') as archive:
+            self.assertRaises(ValueError, archive.ajouter, Partie(3, 0))
+
+        # Un fichier qui n'est pas une archive est refusé
+        with open(self.chemin, 'wb') as fichier:
+            fichier.write(b'pas une archive')
+        self.assertRaises(ValueError, ArchiveParties, self.chemin)
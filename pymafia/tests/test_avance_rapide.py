@@ -0,0 +1,77 @@
+from unittest import TestCase
+from pymafia.avance_rapide import AvanceRapide
+from pymafia.oracle_victoire import OracleVictoire
+from pymafia.generateur_des import GenerateurDés
+from pymafia.partie import Partie
+
+# Valeur critique du khi carré à 2 degrés de liberté, au seuil de 0,1 %
+KHI_CARRE_2_DEGRES = 13.82
+
+
+class TestAvanceRapide(TestCase):
+
+    @staticmethod
+    def khi_carre(observes, probabilites):
+        total = sum(observes)
+        return sum((observe - total * p) ** 2 / (total * p) for observe, p in zip(observes, probabilites))
+
+    def test_calculer_distribution(self):
+        distribution = AvanceRapide.calculer_distribution((5, 5, 5))
+        self.assertAlmostEqual(1.0, sum(distribution.values()), places=12)
+        probabilites_gagnant = [0.0, 0.0, 0.0]
+        for (gagnant, comptes), probabilite in distribution.items():
+            self.assertEqual(0, comptes[gagnant])
+            self.assertLessEqual(sum(comptes), 15)
+            probabilites_gagnant[gagnant] += probabilite
+
+        # Deux calculs indépendants de la même chaîne de Markov
+        oracle = OracleVictoire()
+        for obtenue, attendue in zip(probabilites_gagnant, oracle.probabilites_etat((5, 5, 5))):
+            self.assertAlmostEqual(attendue, obtenue, places=12)
+
+    def test_memes_issues_que_tour_par_tour(self):
+        # Les rondes jouées tour par tour et celles avancées rapidement suivent la distribution calculée
+        distribution = AvanceRapide.calculer_distribution((5, 5, 5))
+        probabilites_gagnant = [sum(p for (gagnant, comptes), p in distribution.items() if gagnant == position)
+                                for position in range(3)]
+        moyenne_dés = sum(p * sum(comptes) for (gagnant, comptes), p in distribution.items())
+        variance_dés = sum(p * (sum(comptes) - moyenne_dés) ** 2 for (gagnant, comptes), p in distribution.items())
+
+        nombre_rondes = 3000
+        partie = Partie(3, 0, affichage=False, generateur=GenerateurDés(14))
+        avance_rapide = AvanceRapide(GenerateurDés(15))
+        victoires_tour_par_tour = [0, 0, 0]
+        victoires_avance_rapide = [0, 0, 0]
+        dés_tour_par_tour = 0
+        dés_avance_rapide = 0
+        for i in range(nombre_rondes):
+            partie.reinitialiser_dés_joueurs()
+            partie.joueur_courant = partie.joueurs[0]
+            partie.determiner_joueur_suivant()
+            partie.jouer_une_ronde()
+            victoires_tour_par_tour[partie.joueurs.index(partie.joueur_courant)] += 1
+            dés_tour_par_tour += sum(len(joueur.dés) for joueur in partie.joueurs)
+
+            gagnant, comptes = avance_rapide.tirer((5, 5, 5))
+            victoires_avance_rapide[gagnant] += 1
+            dés_avance_rapide += sum(comptes)
+
+        self.assertLess(self.khi_carre(victoires_tour_par_tour, probabilites_gagnant), KHI_CARRE_2_DEGRES)
+        self.assertLess(self.khi_carre(victoires_avance_rapide, probabilites_gagnant), KHI_CARRE_2_DEGRES)
+        # Moyennes du nombre de dés restants à moins de 4 écarts-types de la moyenne exacte
+        ecart_type = (variance_dés / nombre_rondes) ** 0.5
+        self.assertLess(abs(dés_tour_par_tour / nombre_rondes - moyenne_dés), 4 * ecart_type)
+        self.assertLess(abs(dés_avance_rapide / nombre_rondes - moyenne_dés), 4 * ecart_type)
+
+    def test_partie(self):
+        partie = Partie(3, 0, affichage=False, generateur=GenerateurDés(3), avance_rapide=True)
+        partie.ronde_max = 4
+        resultat = partie.simuler()
+        self.assertEqual(3 * 50, sum(resultat.scores.values()))
+        self.assertLessEqual(resultat.nombre_rondes, 4)
+        # Toutes les rondes ont été avancées rapidement
+        self.assertEqual(0, resultat.nombre_tours)
+
+        # Une partie journalisée est toujours jouée tour par tour
+        partie = Partie(3, 0, affichage=False, generateur=GenerateurDés(3), journalisation=True, avance_rapide=True)
+        self.assertGreater(partie.simuler().nombre_tours, 0)
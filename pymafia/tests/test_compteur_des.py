@@ -0,0 +1,58 @@
+from unittest import TestCase
+from pymafia.compteur_des import CompteurDés
+from pymafia.de import Dé
+
+
+class TestCompteurDés(TestCase):
+
+    def test_compteur_dés(self):
+        dés = CompteurDés(5)
+        self.assertEqual(len(dés), 5)
+        self.assertEqual(dés.compter(1), 5)
+        self.assertEqual(dés, [Dé(), Dé(), Dé(), Dé(), Dé()])
+
+    def test_rouler(self):
+        dés = CompteurDés(5)
+        frequence_lancer = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0}
+        nombre_lancers = 10000
+
+        for i in range(nombre_lancers):
+            dés.rouler()
+            self.assertEqual(len(dés), 5)
+            self.assertEqual(sum(dés.comptes), 5)
+            for valeur in range(1, 7):
+                frequence_lancer[valeur] += dés.compter(valeur)
+
+        for valeur in range(1, 7):
+            self.assertLess(abs(frequence_lancer[valeur] / (5 * nombre_lancers) - 1 / 6), 0.02)
+
+    def test_retirer_et_ajouter(self):
+        dés = CompteurDés()
+        dés.comptes = [0, 2, 0, 1, 0, 1, 3]
+        dés.nombre = 7
+
+        dés.retirer(6)
+        self.assertEqual(len(dés), 4)
+        self.assertEqual(dés.total(), 10)
+
+        dés.ajouter(6, 2)
+        self.assertEqual(len(dés), 6)
+        self.assertEqual(dés.total(), 22)
+
+        dés.retirer(1)
+        dés.retirer(1)
+        self.assertEqual(len(dés), 4)
+        self.assertEqual(str(dés), str([Dé(3), Dé(5), Dé(6), Dé(6)]))
+
+        dés.vider()
+        self.assertEqual(len(dés), 0)
+        self.assertEqual(dés, [])
+
+    def test_indexation(self):
+        dés = CompteurDés()
+        dés.ajouter(4)
+        dés.ajouter(2)
+        self.assertIsInstance(dés[0], Dé)
+        self.assertEqual(dés[0].valeur, 2)
+        self.assertEqual(dés[-1].valeur, 4)
+        self.assertEqual([dé.valeur for dé in dés], [2, 4])
@@ -1,5 +1,6 @@
 from unittest import TestCase
 from pymafia.de import Dé
+from pymafia.distributions_des import SIGNATURE as SIGNATURE_DISTRIBUTIONS
 
 
 class TestDé(TestCase):
@@ -24,3 +25,13 @@ class TestDé(TestCase):
         for valeur_test in range(1, 7):
             dé.valeur = valeur_test
             self.assertEqual(dé.__repr__(), chr(9855+dé.valeur))
+
+    def test_en_octets(self):
+        for valeur in range(1, 7):
+            dé = Dé(valeur)
+            self.assertEqual(valeur, Dé.depuis_octets(dé.en_octets()).valeur)
+            self.assertEqual(valeur, Dé.depuis_dict(dé.en_dict()).valeur)
+        self.assertRaises(ValueError, Dé.depuis_octets, b'XXXX\x01\x03')
+        # Un fichier de distributions n'est pas pris pour un dé
+        self.assertRaises(ValueError, Dé.depuis_octets, SIGNATURE_DISTRIBUTIONS + b'\x01\x03')
+        self.assertRaises(ValueError, Dé.depuis_dict, {'version': 99, 'valeur': 3})
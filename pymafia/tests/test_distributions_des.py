@@ -0,0 +1,46 @@
+import itertools
+import os
+import tempfile
+from fractions import Fraction
+from unittest import TestCase
+from pymafia.distributions_des import DistributionsDés
+
+
+class TestDistributionsDés(TestCase):
+
+    def test_comptes_somme(self):
+        distributions = DistributionsDés()
+        self.assertEqual([1], distributions.comptes_somme(0))
+        self.assertEqual([0, 1, 1, 1, 1, 1, 1], distributions.comptes_somme(1))
+        self.assertEqual([0, 0, 1, 2, 3, 4, 5, 6, 5, 4, 3, 2, 1], distributions.comptes_somme(2))
+        for nombre_dés in range(12):
+            self.assertEqual(6 ** nombre_dés, sum(distributions.comptes_somme(nombre_dés)))
+
+    def test_distribution_paiement(self):
+        # Comparaison avec l'énumération de tous les lancers de 4 dés
+        distributions = DistributionsDés()
+        for score in (1, 4, 10, 15, 24, 30):
+            attendu = {}
+            for lancer in itertools.product(range(1, 7), repeat=4):
+                paiement = min(sum(lancer), score)
+                attendu[paiement] = attendu.get(paiement, 0) + Fraction(1, 6 ** 4)
+
+            self.assertEqual(attendu, distributions.distribution_paiement(4, score))
+            self.assertEqual(sum(paiement * probabilite for paiement, probabilite in attendu.items()),
+                             distributions.esperance_paiement(4, score))
+            eliminations = sum(1 for lancer in itertools.product(range(1, 7), repeat=4) if sum(lancer) >= score)
+            self.assertEqual(Fraction(eliminations, 6 ** 4), distributions.probabilite_elimination(4, score))
+
+        self.assertEqual(1, sum(distributions.distribution_somme(7).values()))
+        self.assertEqual(Fraction(7, 2) * 7, distributions.esperance_paiement(7, 1000))
+
+    def test_sauvegarder_et_charger(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, 'table.bin')
+            DistributionsDés().sauvegarder(chemin, 25)
+            distributions = DistributionsDés(chemin)
+
+        self.assertEqual(26, len(distributions.comptes))
+        self.assertEqual(DistributionsDés().comptes_somme(25), distributions.comptes_somme(25))
+        # Au-delà de la table, les comptes sont calculés au besoin
+        self.assertEqual(6 ** 30, sum(distributions.comptes_somme(30)))
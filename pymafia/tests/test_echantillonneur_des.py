@@ -0,0 +1,84 @@
+import itertools
+from unittest import TestCase
+from pymafia.echantillonneur_des import EchantillonneurDés
+from pymafia.generateur_des import GenerateurDés
+from pymafia.compteur_des import CompteurDés
+from pymafia.joueur import Joueur
+from pymafia.partie import Partie
+
+
+class TestEchantillonneurDés(TestCase):
+
+    def test_enumerer_issues(self):
+        # Comparaison avec l'énumération de tous les lancers de 0 à 5 dés
+        for nombre_dés in range(6):
+            attendu = {}
+            for lancer in itertools.product(range(1, 7), repeat=nombre_dés):
+                issue = (lancer.count(1), lancer.count(6), sum(valeur for valeur in lancer if 1 < valeur < 6))
+                attendu[issue] = attendu.get(issue, 0) + 1
+
+            issues, poids = EchantillonneurDés.enumerer_issues(nombre_dés)
+            obtenu = {}
+            for comptes, p in zip(issues, poids):
+                self.assertEqual(nombre_dés, sum(comptes))
+                issue = (comptes[1], comptes[6], 2 * comptes[2] + 3 * comptes[3] + 4 * comptes[4] + 5 * comptes[5])
+                self.assertNotIn(issue, obtenu)
+                obtenu[issue] = p
+            self.assertEqual(attendu, obtenu)
+
+    def test_construire_alias(self):
+        # Chaque issue reçoit exactement sa part de la capacité totale des colonnes
+        for nombre_dés in range(12):
+            issues, seuils, alias = EchantillonneurDés.table(nombre_dés)
+            poids = EchantillonneurDés.enumerer_issues(nombre_dés)[1]
+            capacite = 6 ** nombre_dés
+            masses = [0] * len(issues)
+            for colonne, (seuil, remplacement) in enumerate(zip(seuils, alias)):
+                masses[colonne] += seuil
+                masses[remplacement] += capacite - seuil
+            self.assertEqual([p * len(poids) for p in poids], masses)
+
+    def test_repartir(self):
+        self.assertEqual((0, 2, 0, 0, 0, 0, 1), EchantillonneurDés.repartir(2, 1, 0, 0))
+        self.assertEqual((0, 1, 1, 0, 1, 2, 0), EchantillonneurDés.repartir(1, 0, 4, 16))
+        self.assertEqual((0, 0, 0, 0, 0, 3, 0), EchantillonneurDés.repartir(0, 0, 3, 15))
+
+    def test_tirer(self):
+        echantillonneur = EchantillonneurDés(nombre_dés_max=10, generateur=GenerateurDés(3))
+        autre = EchantillonneurDés(nombre_dés_max=10, generateur=GenerateurDés(3))
+        nombre_lancers = 10000
+        total_1 = 0
+        total_6 = 0
+        total_autres = 0
+        for i in range(nombre_lancers):
+            nombre_1, nombre_6, somme = echantillonneur.tirer(5)
+            self.assertEqual((nombre_1, nombre_6, somme), autre.tirer(5))
+            total_1 += nombre_1
+            total_6 += nombre_6
+            total_autres += somme
+        self.assertLess(abs(total_1 / nombre_lancers - 5 / 6), 0.05)
+        self.assertLess(abs(total_6 / nombre_lancers - 5 / 6), 0.05)
+        self.assertLess(abs(total_autres / nombre_lancers - 5 * 14 / 6), 0.2)
+
+        # Au-delà du maximum, les dés sont lancés un à un
+        comptes = echantillonneur.tirer_comptes(30)
+        self.assertEqual(30, sum(comptes))
+        self.assertEqual(0, comptes[0])
+
+    def test_joueur(self):
+        joueur = Joueur(1, echantillonneur=EchantillonneurDés(generateur=GenerateurDés(5)))
+        self.assertIsInstance(joueur.dés, CompteurDés)
+        joueur.reinitialiser_dés()
+        joueur.rouler_dés()
+        self.assertEqual(5, len(joueur.dés))
+        nombre_1, nombre_6 = joueur.compter_1_et_6()
+        joueur.retirer_dé(1)
+        joueur.retirer_dé(6)
+        self.assertEqual(5 - nombre_1 - nombre_6, len(joueur.dés))
+
+    def test_partie(self):
+        partie = Partie(4, 0, affichage=False, generateur=GenerateurDés(8), echantillonnage=True)
+        partie.ronde_max = 3
+        partie.simuler()
+        self.assertEqual(4 * 50, sum(joueur.score for joueur in partie.joueurs))
+        self.assertGreater(partie.nombre_tours, 0)
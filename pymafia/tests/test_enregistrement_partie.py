@@ -0,0 +1,62 @@
+from unittest import TestCase
+from pymafia.partie import Partie
+from pymafia.generateur_des import GenerateurDés
+from pymafia.enregistrement_partie import EnregistrementPartie
+from pymafia.evenements import PartieCommencée, Lancer, RondeGagnée, RondeTerminée
+
+
+class TestEnregistrementPartie(TestCase):
+
+    def test_encoder(self):
+        partie = Partie(4, 0, generateur=GenerateurDés(12), journalisation=True)
+        partie.ronde_max = 3
+        resultat = partie.simuler()
+
+        donnees = EnregistrementPartie.encoder(partie.journal)
+        self.assertEqual(0, len(donnees) % 4)
+        self.assertEqual(len(donnees), EnregistrementPartie.taille(donnees))
+
+        enregistrement = EnregistrementPartie(donnees)
+        self.assertEqual(4, enregistrement.nombre_joueurs)
+        self.assertEqual(partie.premier_joueur.identifiant, enregistrement.premier_joueur)
+        self.assertEqual(partie.sens, enregistrement.sens)
+        self.assertEqual(3, enregistrement.ronde_max)
+        self.assertEqual(resultat.nombre_rondes, enregistrement.nombre_rondes)
+        self.assertEqual(resultat.nombre_tours, enregistrement.nombre_tours)
+        self.assertEqual([resultat.scores[i] for i in range(1, 5)], enregistrement.scores.tolist())
+        self.assertEqual(resultat.gagnants, enregistrement.gagnants())
+        self.assertEqual([0, 0, 0, 0], enregistrement.humains.tolist())
+        self.assertEqual(resultat.points_transférés, sum(sum(ligne) for ligne in enregistrement.points.tolist()))
+
+        # Chaque tour donne le joueur et le nombre de dés de chaque valeur de son lancer
+        lancers = [evenement for evenement in partie.journal
+                   if isinstance(evenement, Lancer) and evenement.motif == Lancer.TOUR]
+        for lancer, tour in zip(lancers, enregistrement.tours.tolist()):
+            self.assertEqual(lancer.identifiant, tour[0])
+            self.assertEqual([lancer.valeurs.count(valeur) for valeur in range(1, 7)], tour[1:])
+
+        # Le nombre de tours des rondes totalise le nombre de tours de la partie
+        self.assertEqual(resultat.nombre_tours, sum(ronde[1] for ronde in enregistrement.rondes.tolist()))
+
+    def test_longue_ronde(self):
+        # Le nombre de tours d'une ronde et la ronde maximale peuvent dépasser 65535
+        journal = [PartieCommencée([PartieCommencée.ORDINATEUR] * 2, 100000)]
+        journal += [Lancer(1 + i % 2, [2, 3], Lancer.TOUR) for i in range(70000)]
+        journal += [RondeGagnée(1, 2), RondeTerminée(1)]
+        enregistrement = EnregistrementPartie(EnregistrementPartie.encoder(journal))
+        self.assertEqual(100000, enregistrement.ronde_max)
+        self.assertEqual(70000, enregistrement.nombre_tours)
+        self.assertEqual([[2, 70000]], enregistrement.rondes.tolist())
+        self.assertEqual([50, 50], enregistrement.scores.tolist())
+
+    def test_encoder_journal_invalide(self):
+        self.assertRaises(ValueError, EnregistrementPartie.encoder, [])
+        self.assertRaises(ValueError, EnregistrementPartie.encoder, Partie(60, 0, journalisation=True).journal)
+
+        # Un enregistrement ne conserve qu'un sens
+        partie = Partie(4, 0, affichage=False, generateur=GenerateurDés(12), journalisation=True,
+                        sens_chaque_ronde=True)
+        partie.ronde_max = 3
+        partie.simuler()
+        self.assertGreater(len(partie.décisions), 1)
+        self.assertRaises(ValueError, EnregistrementPartie.encoder, partie.journal)
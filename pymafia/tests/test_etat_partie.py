@@ -0,0 +1,100 @@
+from unittest import TestCase
+from pymafia.etat_partie import EtatPartie, ENTETE, RONDE_MAX
+from pymafia.generateur_des import GenerateurDés
+from pymafia.joueur_humain import JoueurHumain
+from pymafia.partie import Partie
+
+
+class TestEtatPartie(TestCase):
+
+    @staticmethod
+    def preparer_partie(nombre_joueurs, nombre_joueurs_humains=0, dés_compacts=False, graine=0):
+        partie = Partie(nombre_joueurs, nombre_joueurs_humains, affichage=False, dés_compacts=dés_compacts,
+                        generateur=GenerateurDés(graine))
+        partie.preparer_une_partie()
+        partie.sens = -1
+        partie.determiner_joueur_suivant()
+        return partie
+
+    def test_conversion(self):
+        for dés_compacts in (False, True):
+            partie = self.preparer_partie(5, 2, dés_compacts)
+            for i in range(7):
+                partie.jouer_un_tour()
+            partie.joueurs[3].score = 0
+            partie.anneau_joueurs.retirer(partie.joueurs[3])
+            etat = EtatPartie.depuis_partie(partie)
+            self.assertEqual(ENTETE.size + 5 * 9, len(etat.donnees))
+            self.assertEqual(tuple(joueur.score for joueur in partie.joueurs), etat.scores())
+
+            copie = etat.en_partie(dés_compacts=not dés_compacts)
+            self.assertEqual([joueur.identifiant for joueur in partie.joueurs],
+                             [joueur.identifiant for joueur in copie.joueurs])
+            self.assertEqual([isinstance(joueur, JoueurHumain) for joueur in partie.joueurs],
+                             [isinstance(joueur, JoueurHumain) for joueur in copie.joueurs])
+            self.assertEqual([sorted(joueur.valeurs_dés()) for joueur in partie.joueurs],
+                             [sorted(joueur.valeurs_dés()) for joueur in copie.joueurs])
+            self.assertEqual([joueur.identifiant for joueur in partie.joueurs_actifs],
+                             [joueur.identifiant for joueur in copie.joueurs_actifs])
+            for attribut in ('premier_joueur', 'joueur_courant', 'joueur_suivant'):
+                self.assertEqual(getattr(partie, attribut).identifiant, getattr(copie, attribut).identifiant)
+            for attribut in ('sens', 'ronde', 'ronde_max', 'nombre_tours', 'points_transférés'):
+                self.assertEqual(getattr(partie, attribut), getattr(copie, attribut))
+            # Sans perte: l'état de la partie recréée est le même
+            self.assertEqual(etat, EtatPartie.depuis_partie(copie))
+
+    def test_options(self):
+        # Les options de jeu et la langue font partie de l'état
+        partie = Partie(4, 0, affichage=False, generateur=GenerateurDés(6), grande_table=True, echantillonnage=True,
+                        avance_rapide=True, langue='en', sens_chaque_ronde=True)
+        partie.preparer_une_partie()
+        etat = EtatPartie.depuis_partie(partie)
+        copie = etat.en_partie()
+        self.assertTrue(copie.grande_table)
+        self.assertTrue(copie.sens_chaque_ronde)
+        self.assertEqual(partie.echantillonneur.nombre_dés_max, copie.echantillonneur.nombre_dés_max)
+        self.assertEqual(partie.avance_rapide.nombre_joueurs_max, copie.avance_rapide.nombre_joueurs_max)
+        self.assertEqual('en', copie.catalogue.langue)
+        self.assertIs(copie.echantillonneur, copie.joueurs[0].echantillonneur)
+        self.assertEqual(etat, EtatPartie.depuis_partie(copie))
+
+        # La partie recréée avec une copie du générateur se termine comme l'originale
+        partie.ronde_max = 4
+        copie = EtatPartie.depuis_partie(partie).en_partie(generateur=partie.generateur.copier())
+        partie.jouer_une_partie()
+        copie.jouer_une_partie()
+        self.assertEqual(EtatPartie.depuis_partie(partie), EtatPartie.depuis_partie(copie))
+
+        # Une partie sans option est recréée sans option
+        copie = EtatPartie.depuis_partie(self.preparer_partie(4)).en_partie()
+        self.assertEqual((False, None, None, False, 'fr'), (copie.grande_table, copie.echantillonneur,
+                                                            copie.avance_rapide, copie.sens_chaque_ronde,
+                                                            copie.catalogue.langue))
+
+    def test_suite_de_la_partie(self):
+        # Une partie recréée avec une copie du générateur se termine comme l'originale
+        partie = self.preparer_partie(4, dés_compacts=True, graine=3)
+        partie.ronde_max = 3
+        for i in range(4):
+            partie.jouer_un_tour()
+        copie = EtatPartie.depuis_partie(partie).en_partie(dés_compacts=True, generateur=partie.generateur.copier())
+        partie.jouer_une_partie()
+        copie.jouer_une_partie()
+        self.assertEqual(EtatPartie.depuis_partie(partie), EtatPartie.depuis_partie(copie))
+
+    def test_nombre_joueurs_max(self):
+        with self.assertRaises(ValueError):
+            EtatPartie.depuis_partie(Partie(52, 0, affichage=False))
+
+    def test_ronde_max(self):
+        # La plus grande ronde maximale est conservée; au-delà, l'état ne peut pas être créé
+        partie = self.preparer_partie(3)
+        partie.ronde_max = RONDE_MAX
+        partie.ronde = RONDE_MAX + 1
+        copie = EtatPartie.depuis_partie(partie).en_partie()
+        self.assertEqual((RONDE_MAX, RONDE_MAX + 1), (copie.ronde_max, copie.ronde))
+        partie.ronde_max = RONDE_MAX + 1
+        self.assertRaises(ValueError, EtatPartie.depuis_partie, partie)
+        partie.ronde_max = RONDE_MAX
+        partie.ronde = RONDE_MAX + 2
+        self.assertRaises(ValueError, EtatPartie.depuis_partie, partie)
@@ -0,0 +1,69 @@
+from unittest import TestCase
+from pymafia.generateur_des import GenerateurDés
+from pymafia.de import Dé
+
+
+class TestGenerateurDés(TestCase):
+
+    def test_lancer(self):
+        generateur = GenerateurDés(1)
+        frequence_lancer = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0}
+        nombre_lancers = 60000
+
+        for i in range(nombre_lancers):
+            frequence_lancer[generateur.lancer()] += 1
+
+        for i in range(1, 7):
+            self.assertLess(abs(frequence_lancer[i] / nombre_lancers - 1 / 6), 0.01)
+
+    def test_lancer_plusieurs(self):
+        generateur = GenerateurDés(2, taille_tampon=16)
+        self.assertEqual([], generateur.lancer_plusieurs(0))
+
+        valeurs = generateur.lancer_plusieurs(100)
+        self.assertEqual(100, len(valeurs))
+        self.assertTrue(all(1 <= valeur <= 6 for valeur in valeurs))
+
+    def test_graine(self):
+        # Deux générateurs ayant la même graine donnent la même suite de valeurs
+        generateur_1 = GenerateurDés(42)
+        generateur_2 = GenerateurDés(42)
+        self.assertEqual([generateur_1.lancer() for i in range(1000)], [generateur_2.lancer() for i in range(1000)])
+        self.assertEqual(generateur_1.randrange(1000), generateur_2.randrange(1000))
+
+    def test_dé(self):
+        dé_1 = Dé(generateur=GenerateurDés(3))
+        dé_2 = Dé(generateur=GenerateurDés(3))
+        for i in range(100):
+            dé_1.rouler()
+            dé_2.rouler()
+            self.assertEqual(dé_1.valeur, dé_2.valeur)
+
+    def test_lancer_plusieurs_comme_lancer(self):
+        # Lancer plusieurs dés ensemble donne les mêmes valeurs que les lancer un à un, même lorsque le tampon
+        # doit être rempli au milieu du lancer
+        generateur_1 = GenerateurDés(9, taille_tampon=16)
+        generateur_2 = GenerateurDés(9, taille_tampon=16)
+        for nombre_dés in [5, 3, 7, 5, 11, 2, 40, 1, 5]:
+            self.assertEqual(sorted(generateur_1.lancer_plusieurs(nombre_dés)),
+                             sorted(generateur_2.lancer() for i in range(nombre_dés)))
+
+    def test_copier(self):
+        # La copie donne la même suite de valeurs, sans influencer l'original
+        generateur = GenerateurDés(5, taille_tampon=16)
+        generateur.lancer_plusieurs(7)
+        copie = generateur.copier()
+        valeurs = [copie.lancer() for i in range(100)]
+        self.assertEqual(valeurs, [generateur.lancer() for i in range(100)])
+        self.assertEqual(copie.randrange(1000), generateur.randrange(1000))
+
+    def test_en_octets(self):
+        for graine in (0, -3, 2 ** 70, None):
+            generateur = GenerateurDés(graine)
+            generateur.lancer()
+            generateur.aleatoire.gauss(0, 1)
+            copie = GenerateurDés.depuis_octets(generateur.en_octets())
+            self.assertEqual(generateur.graine, copie.graine)
+            self.assertEqual(generateur.tampon, copie.tampon)
+            self.assertEqual([generateur.lancer() for i in range(1000)], [copie.lancer() for i in range(1000)])
+            self.assertEqual(generateur.aleatoire.gauss(0, 1), copie.aleatoire.gauss(0, 1))
@@ -1,6 +1,11 @@
 from unittest import TestCase
 from pymafia.joueur import Joueur
 from pymafia.de import Dé
+from pymafia.compteur_des import CompteurDés
+from pymafia.joueur_humain import JoueurHumain
+from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.joueur_monte_carlo import JoueurMonteCarlo
+from pymafia.generateur_des import GenerateurDés
 
 
 class TestJoueur(TestCase):
@@ -109,4 +114,64 @@ class TestJoueur(TestCase):
         joueur.reinitialiser_dés()
         self.assertEqual(len(joueur.dés), 5)
 
+    def test_joueur_dés_compacts(self):
+        joueur = Joueur(1, dés_compacts=True)
+        self.assertIsInstance(joueur.dés, CompteurDés)
+        self.assertEqual(len(joueur), 2)
+
+        joueur.reinitialiser_dés()
+        self.assertEqual(len(joueur), 5)
+        self.assertIsInstance(joueur.dés, CompteurDés)
+
+        joueur.dés.comptes = [0, 1, 0, 2, 0, 0, 2]
+        self.assertEqual(joueur.compter_1_et_6(), (1, 2))
+        self.assertEqual(joueur.calculer_points(), 19)
+        self.assertEqual(str(joueur), '⚀ ⚂ ⚂ ⚅ ⚅')
+
+        joueur.retirer_dé(1)
+        joueur.retirer_dé(6)
+        joueur.ajouter_un_dé()
+        self.assertEqual(len(joueur), 3)
+        self.assertEqual(joueur.calculer_points(), 12)
+
+        joueur.retirer_dés()
+        self.assertEqual(len(joueur), 0)
+
+    def test_copier(self):
+        # Les dés sont partagés jusqu'à ce que l'un des deux joueurs les modifie
+        for dés_compacts in (False, True):
+            joueur = Joueur(1, dés_compacts=dés_compacts)
+            joueur.reinitialiser_dés()
+            copie = joueur.copier()
+            self.assertIs(joueur.dés, copie.dés)
+            copie.ajouter_un_dé()
+            copie.score = 10
+            self.assertEqual(6, len(copie))
+            self.assertEqual(5, len(joueur))
+            self.assertEqual(50, joueur.score)
+            joueur.retirer_dés()
+            self.assertEqual(6, len(copie))
+            self.assertIsNot(joueur.dés, copie.dés)
+
+    def test_en_octets(self):
+        generateur = GenerateurDés(3)
+        for classe in (Joueur, JoueurHumain, JoueurOrdinateur):
+            for dés_compacts in (False, True):
+                joueur = classe(7, dés_compacts, generateur)
+                joueur.reinitialiser_dés(9)
+                joueur.rouler_dés()
+                joueur.score = 123
+                for copie in (Joueur.depuis_octets(joueur.en_octets(), generateur),
+                              Joueur.depuis_dict(joueur.en_dict(), generateur)):
+                    self.assertIs(classe, type(copie))
+                    self.assertEqual(7, copie.identifiant)
+                    self.assertEqual(123, copie.score)
+                    self.assertEqual(joueur.valeurs_dés(), copie.valeurs_dés())
+                    self.assertEqual(dés_compacts, isinstance(copie.dés, CompteurDés))
+                    self.assertIs(generateur, copie.generateur)
+                    copie.rouler_dés()
+
+        # Un joueur dont la classe n'a pas de type de sérialisation est refusé
+        self.assertRaises(ValueError, JoueurMonteCarlo(1).en_octets)
+        self.assertRaises(ValueError, Joueur.depuis_octets, b'XXXX' + Joueur(1).en_octets()[4:])
 
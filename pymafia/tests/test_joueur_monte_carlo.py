@@ -0,0 +1,63 @@
+from time import perf_counter
+from unittest import TestCase
+from pymafia.joueur_monte_carlo import JoueurMonteCarlo
+from pymafia.solveur_sens import SolveurSens
+from pymafia.partie import Partie
+from pymafia.generateur_des import GenerateurDés
+from pymafia.echantillonneur_des import EchantillonneurDés
+
+
+class TestJoueurMonteCarlo(TestCase):
+
+    def test_simuler(self):
+        joueur = JoueurMonteCarlo(1, graine=5)
+        nombre_simulations = 2000
+        victoires = sum(joueur.simuler((50, 50), 1, 1, perf_counter() + 1) for i in range(nombre_simulations))
+        attendue = SolveurSens().valeur((50, 50), 0, 1, 1)
+        self.assertLess(abs(victoires / nombre_simulations - attendue), 0.05)
+        # Une simulation est abandonnée à l'échéance
+        self.assertIsNone(joueur.simuler((50, 50, 50), 1, 1, perf_counter()))
+
+    def test_rechercher(self):
+        # Le sens croissant est nettement meilleur (environ 0,20 contre 0,14 selon SolveurSens). Le nombre de
+        # simulations est fixé, pour que le résultat ne dépende pas de la vitesse de la machine.
+        joueur = JoueurMonteCarlo(1, graine=7)
+        victoires, visites = joueur.rechercher((8, 30, 2), 1, float('inf'), 4000)
+        self.assertEqual(4000, joueur.nombre_simulations)
+        self.assertEqual(joueur.nombre_simulations, visites[1] + visites[-1])
+        self.assertGreater(visites[1], visites[-1])
+        self.assertGreater(victoires[1] / visites[1], victoires[-1] / visites[-1])
+
+    def test_demander_sens(self):
+        # Dans une partie où le sens est choisi à chaque ronde, le joueur qui commence la deuxième ronde choisit le
+        # meilleur sens selon SolveurSens
+        partie = Partie(3, 0, affichage=False, generateur=GenerateurDés(11), budget_monte_carlo=float('inf'),
+                        sens_chaque_ronde=True)
+        partie.ronde_max = 2
+        self.assertTrue(all(isinstance(joueur, JoueurMonteCarlo) for joueur in partie.joueurs))
+        for joueur in partie.joueurs:
+            joueur.simulations_max = 10000
+            joueur.echantillonneur_simulations = EchantillonneurDés(generateur=GenerateurDés(joueur.identifiant))
+        etapes = partie.etapes()
+        next(etapes)
+        # Le gagnant de la première ronde commence la deuxième
+        joueur = partie.joueur_courant
+        scores = []
+        for i in range(len(partie.joueurs_actifs)):
+            scores.append(joueur.score)
+            joueur = partie.anneau_joueurs.voisin(joueur, 1)
+        croissant, decroissant = SolveurSens().valeurs_sens(tuple(scores), 1)
+        self.assertGreater(abs(croissant - decroissant), 0.01)
+        try:
+            while True:
+                etapes.send(None)
+        except StopIteration:
+            pass
+        self.assertEqual(2, len(partie.décisions))
+        self.assertEqual(1 if croissant > decroissant else -1, partie.décisions[1])
+        self.assertEqual(10000, partie.premier_joueur.nombre_simulations)
+
+        # Sans temps pour simuler, le choix est aléatoire
+        joueur = JoueurMonteCarlo(1, budget=0)
+        self.assertIn(joueur.demander_sens(partie)[0], (1, -1))
+        self.assertEqual(0, joueur.nombre_simulations)
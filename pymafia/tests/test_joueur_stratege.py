@@ -0,0 +1,63 @@
+from unittest import TestCase
+from pymafia.joueur_stratege import JoueurStratège
+from pymafia.table_sens import TableSens, ÉGALITÉ
+from pymafia.partie import Partie
+from pymafia.generateur_des import GenerateurDés
+
+
+class TestJoueurStratège(TestCase):
+
+    def test_demander_sens(self):
+        table = TableSens()
+        table.choix[((5, 1, 9), 1)] = -1
+        table.choix[((9, 5, 1), 1)] = 1
+        partie = Partie(3, 0, affichage=False, generateur=GenerateurDés(2), table_sens=table)
+        self.assertTrue(all(isinstance(joueur, JoueurStratège) for joueur in partie.joueurs))
+        for joueur, score in zip(partie.joueurs, (5, 1, 9)):
+            joueur.score = score
+
+        partie.premier_joueur = partie.joueurs[0]
+        for i in range(20):
+            partie.determiner_sens()
+            self.assertEqual(-1, partie.sens)
+        partie.premier_joueur = partie.joueurs[2]
+        self.assertEqual(1, partie.joueurs[2].demander_sens(partie)[0])
+        self.assertIn("croissant", str(partie.joueurs[2].demander_sens(partie)[1]))
+
+        # Hors de la table, le choix est aléatoire
+        partie.premier_joueur = partie.joueurs[1]
+        choix = {partie.joueurs[1].demander_sens(partie)[0] for i in range(50)}
+        self.assertEqual({1, -1}, choix)
+
+    def test_partie(self):
+        # Choisi à chaque ronde, le sens de la deuxième ronde dépend des scores: la table y change la décision du
+        # joueur qui commence la ronde, qui choisit autrement au hasard
+        class TableTémoin(TableSens):
+            def choisir(self, scores, rondes):
+                self.etats.append((scores, rondes))
+                return super().choisir(scores, rondes)
+
+        témoin = TableTémoin()
+        témoin.etats = []
+        au_hasard = Partie(3, 0, affichage=False, generateur=GenerateurDés(0), table_sens=témoin,
+                           sens_chaque_ronde=True)
+        au_hasard.ronde_max = 2
+        au_hasard.simuler()
+        self.assertEqual(((50, 50, 50), 2), témoin.etats[0])
+        self.assertEqual(2, len(au_hasard.décisions))
+
+        table = TableSens()
+        sens = table.calculer(*témoin.etats[1])
+        self.assertNotEqual(ÉGALITÉ, sens)
+        self.assertNotEqual(au_hasard.décisions[1], sens)
+        partie = Partie(3, 0, affichage=False, generateur=GenerateurDés(0), table_sens=table, sens_chaque_ronde=True)
+        partie.ronde_max = 2
+        resultat = partie.simuler()
+        self.assertEqual([au_hasard.décisions[0], sens], partie.décisions)
+        self.assertEqual(3 * 50, sum(resultat.scores.values()))
+
+        # Par défaut, le sens n'est choisi qu'au début de la partie, lorsque les deux sens se valent
+        partie = Partie(3, 0, affichage=False, generateur=GenerateurDés(0), table_sens=table)
+        partie.ronde_max = 2
+        partie.simuler()
+        self.assertEqual(1, len(partie.décisions))
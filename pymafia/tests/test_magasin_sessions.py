@@ -0,0 +1,112 @@
+import asyncio
+import os
+import struct
+import tempfile
+from unittest import TestCase
+from pymafia.magasin_sessions import MagasinSessions
+from pymafia.serveur import ServeurPymafia
+from pymafia.table_jeu import TableJeu
+
+
+def traiter(serveur, commande):
+    # Exécute une commande comme le fait une connexion, hors de toute boucle
+    return asyncio.run(serveur.traiter_sans_bloquer(commande))
+
+
+class TestMagasinSessions(TestCase):
+
+    def test_lru(self):
+        magasin = MagasinSessions(capacite=2)
+        for identifiant in (1, 2, 3):
+            magasin[identifiant] = TableJeu(identifiant, 3, 1, 2, identifiant)
+        # La table 1, la moins récemment utilisée, a été suspendue
+        self.assertEqual([2, 3], list(magasin.tables))
+        self.assertEqual(1, magasin.nombre_sur_disque())
+        self.assertEqual(3, len(magasin))
+        self.assertEqual({1, 2, 3}, set(magasin))
+        self.assertIn(1, magasin)
+
+        # Utiliser la table 2 la rend la plus récente: reprendre la table 1 suspend la table 3
+        magasin.get(2)
+        table = magasin.get(1)
+        self.assertEqual(1, table.identifiant)
+        self.assertEqual([2, 1], list(magasin.tables))
+        self.assertEqual([3], list(magasin)[2:])
+        self.assertEqual(1, magasin.nombre_reprises)
+        self.assertEqual(2, magasin.nombre_suspensions)
+
+        del magasin[3]
+        self.assertNotIn(3, magasin)
+        self.assertEqual(2, magasin.pop(2).identifiant)
+        self.assertIsNone(magasin.get(3))
+        self.assertIsNone(magasin.pop(3, None))
+        self.assertRaises(KeyError, magasin.pop, 3)
+        self.assertRaises(ValueError, MagasinSessions, capacite=0)
+
+    def test_table_non_suspendue(self):
+        # Une table qui ne peut pas être suspendue reste en mémoire, et les autres sont suspendues à sa place
+        magasin = MagasinSessions(capacite=1)
+        magasin[1] = TableJeu(1, 2, 1, 70000, 1)
+        magasin[2] = TableJeu(2, 2, 1, 3, 2)
+        self.assertEqual([1, 2], list(magasin.tables))
+        self.assertRaises(ValueError, magasin.suspendre, 1)
+        self.assertEqual(70000, magasin.get(1).partie.ronde_max)
+        magasin[3] = TableJeu(3, 2, 1, 3, 3)
+        self.assertEqual([1, 3], list(magasin.tables))
+        self.assertEqual(3, len(magasin))
+
+    def test_fermer(self):
+        # À la fermeture, une table qui ne peut pas être suspendue n'empêche pas de suspendre les suivantes
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, 'sessions.sqlite')
+            magasin = MagasinSessions(chemin, capacite=3)
+            magasin[1] = TableJeu(1, 2, 1, 3, 1)
+            magasin[2] = TableJeu(2, 2, 1, 70000, 2)
+            magasin[3] = TableJeu(3, 2, 1, 3, 3)
+            self.assertEqual([2], magasin.fermer())
+            self.assertEqual([2], list(magasin.tables))
+
+            magasin = MagasinSessions(chemin)
+            self.assertEqual([1, 3], sorted(magasin))
+            magasin.fermer()
+
+    def test_reprise_invalide(self):
+        # Une table qui ne peut pas être décodée reste sur disque
+        magasin = MagasinSessions()
+        magasin.connexion.execute("INSERT INTO tables (identifiant, donnees) VALUES (?, ?)", (1, b'abc'))
+        self.assertRaises((ValueError, struct.error), magasin.get, 1)
+        self.assertIn(1, magasin)
+        self.assertEqual(0, magasin.nombre_reprises)
+
+    def test_serveur(self):
+        # Un serveur qui ne garde qu'une table en mémoire joue ses tables comme un serveur qui les garde toutes, et un
+        # nouveau serveur sur la même base reprend les tables en cours
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, 'sessions.sqlite')
+            serveur = ServeurPymafia(sessions=MagasinSessions(chemin, capacite=1))
+            témoin = ServeurPymafia()
+            demandes = {}
+            for graine in range(4):
+                reponse = traiter(serveur, "NOUVELLE 4 2 3 {}".format(graine))
+                self.assertEqual(reponse, traiter(témoin, "NOUVELLE 4 2 3 {}".format(graine)))
+                demandes[reponse.split()[1]] = reponse.split()
+
+            tour = 0
+            while demandes:
+                if tour == 5:
+                    serveur.tables.fermer()
+                    serveur = ServeurPymafia(sessions=MagasinSessions(chemin, capacite=1))
+                    self.assertEqual(5, serveur.prochain_identifiant)
+                for identifiant, demande in list(demandes.items()):
+                    commande = "SENS {} N" if demande[2] == 'SENS' else demande[2] + " {}"
+                    reponse = traiter(serveur, commande.format(identifiant))
+                    self.assertEqual(traiter(témoin, commande.format(identifiant)), reponse)
+                    if reponse.startswith('FIN'):
+                        del demandes[identifiant]
+                    else:
+                        demandes[identifiant] = reponse.split()
+                tour += 1
+            self.assertGreater(tour, 5)
+            self.assertEqual(0, len(serveur.tables))
+            self.assertGreater(serveur.tables.nombre_reprises, 0)
+            serveur.tables.fermer()
@@ -0,0 +1,66 @@
+from unittest import TestCase
+from pymafia.messages import CatalogueMessages, Message, ValeursDés, MESSAGES
+from pymafia.partie import Partie
+from pymafia.generateur_des import GenerateurDés
+import pickle
+
+
+class TestMessages(TestCase):
+
+    def test_catalogue(self):
+        # Chaque langue a un seul catalogue, avec les mêmes clés
+        francais = CatalogueMessages.obtenir('fr')
+        self.assertIs(francais, CatalogueMessages.obtenir())
+        self.assertIs(francais, pickle.loads(pickle.dumps(francais)))
+        self.assertEqual(set(MESSAGES['fr']), set(MESSAGES['en']))
+        self.assertRaises(ValueError, CatalogueMessages.obtenir, 'de')
+
+        # Le pluriel suit la règle de la langue, et les listes sont énumérées
+        anglais = CatalogueMessages.obtenir('en')
+        self.assertEqual("Le joueur 2 a 1 point.\n", francais.rendre('points_joueur', (1, 2)))
+        self.assertEqual("Le joueur 2 a 0 point.\n", francais.rendre('points_joueur', (0, 2)))
+        self.assertEqual("Player 2 has 0 points.\n", anglais.rendre('points_joueur', (0, 2)))
+        self.assertEqual("Player 2 has 1 point.\n", anglais.rendre('points_joueur', (1, 2)))
+        self.assertEqual("Il y a égalité entre les joueurs 1, 3 et 4.\n", francais.rendre('égalité_partie',
+                                                                                          ([1, 3, 4],)))
+        self.assertEqual("Players 1 and 3 are tied.\n", anglais.rendre('égalité_partie', ([1, 3],)))
+
+    def test_message(self):
+        francais = CatalogueMessages.obtenir('fr')
+        message = Message(francais, 'lancer', (3, ValeursDés([1, 4, 6])))
+        self.assertEqual("Le joueur 3 joue les dés suivants: ⚀ ⚃ ⚅ \n", str(message))
+
+        # Une suite de messages est rendue d'un bloc
+        suite = Message(francais, None, [Message(francais, 'points_joueur', (5, i)) for i in (1, 2)])
+        self.assertEqual("Le joueur 1 a 5 points.\nLe joueur 2 a 5 points.\n", str(suite))
+        self.assertEqual("À la fin de la partie, les joueurs ont les points suivants:\nLe joueur 1 a 5 points.\n"
+                         "Le joueur 2 a 5 points.\n", str(Message(francais, 'points_fin_de_partie', (suite,))))
+
+    def test_sortie(self):
+        # Une partie sans sortie ne crée aucun message; une partie avec sortie reçoit ses messages, dans sa langue
+        messages = []
+        partie = Partie(4, 0, generateur=GenerateurDés(7), langue='en', sortie=messages.append)
+        partie.ronde_max = 3
+        self.assertTrue(partie.affichage)
+        etapes = partie.etapes()
+        try:
+            while True:
+                etapes.send(None)
+        except StopIteration as fin:
+            resultat = fin.value
+        self.assertTrue(all(isinstance(message, Message) for message in messages))
+        self.assertIn('lancer', {message.cle for message in messages})
+        self.assertTrue(str(messages[0]).startswith("All players are computers!"))
+
+        sans_sortie = Partie(4, 0, affichage=False, generateur=GenerateurDés(7))
+        sans_sortie.ronde_max = 3
+        self.assertIsNone(sans_sortie.sortie)
+        self.assertEqual(resultat.scores, sans_sortie.executer(sans_sortie.etapes()).scores)
+
+        # L'affichage remplace une sortie absente par la console, sans remplacer une sortie fournie
+        sans_sortie.affichage = True
+        self.assertIs(print, sans_sortie.sortie)
+        partie.affichage = True
+        self.assertEqual(messages.append, partie.sortie)
+        partie.affichage = False
+        self.assertIsNone(partie.sortie)
@@ -0,0 +1,78 @@
+import os
+import tempfile
+from unittest import TestCase
+from fractions import Fraction
+from pymafia.oracle_victoire import OracleVictoire, TOLERANCE
+from pymafia.partie import Partie
+from pymafia.de import Dé
+
+
+class TestOracleVictoire(TestCase):
+
+    def test_issues_lancer(self):
+        oracle = OracleVictoire()
+        issues = oracle.issues_lancer(3)
+        self.assertEqual(10, len(issues))
+        self.assertAlmostEqual(1.0, sum(probabilite for nombre_1, nombre_6, probabilite in issues))
+        self.assertIn((0, 0, 64 / 216), issues)
+        self.assertIn((1, 1, 6 * 4 / 216), issues)
+
+    def test_probabilites_etat(self):
+        oracle = OracleVictoire()
+        # Avec un dé chacun, le joueur courant gagne s'il obtient 1 ou 6, sinon c'est à l'autre de lancer:
+        # p = 1/3 + 2/3 (1 - p), donc p = 3/5
+        probabilites = oracle.probabilites_etat((1, 1))
+        self.assertAlmostEqual(0.6, probabilites[0], places=14)
+        self.assertAlmostEqual(0.4, probabilites[1], places=14)
+
+        # Avec un dé chacun et trois joueurs, p0 = 1/3 + 2/3 p2, p1 = 2/3 p0 et p2 = 2/3 p1: (9, 6, 4) / 19. L'erreur
+        # est au plus la tolérance multipliée par le nombre total de dés.
+        for obtenue, attendue in zip(oracle.probabilites_etat((1, 1, 1)), (9, 6, 4)):
+            self.assertLessEqual(abs(Fraction(obtenue) - Fraction(attendue, 19)), 3 * TOLERANCE)
+
+        # Le joueur courant qui n'a plus de dé a gagné
+        self.assertEqual((1.0, 0.0, 0.0), oracle.probabilites_etat((0, 2, 3)))
+
+        probabilites = oracle.probabilites_etat((5, 5, 5))
+        self.assertAlmostEqual(1.0, sum(probabilites), places=12)
+        # Jouer en premier est un avantage
+        self.assertGreater(probabilites[0], probabilites[1])
+        self.assertGreater(probabilites[1], probabilites[2])
+        # Les états atteignables sont aussi connus
+        self.assertIn((5, 5, 4), oracle.probabilites)
+        for etat, probabilites in oracle.probabilites.items():
+            self.assertAlmostEqual(1.0, sum(probabilites), places=12)
+
+    def test_probabilites_partie(self):
+        oracle = OracleVictoire()
+        partie = Partie(4, 0, affichage=False)
+        partie.joueur_courant = partie.joueurs[1]
+        for joueur, nombre_dés in zip(partie.joueurs, (1, 3, 5, 2)):
+            joueur.dés = [Dé() for i in range(nombre_dés)]
+
+        partie.sens = 1
+        probabilites = oracle.probabilites_partie(partie)
+        self.assertEqual(oracle.probabilites_etat((3, 5, 2, 1)), tuple(probabilites[joueur] for joueur in
+                                                                       partie.joueurs[1:] + partie.joueurs[:1]))
+
+        partie.sens = -1
+        probabilites = oracle.probabilites_partie(partie)
+        self.assertEqual(oracle.probabilites_etat((3, 1, 2, 5)), tuple(probabilites[partie.joueurs[i]] for i in
+                                                                       (1, 0, 3, 2)))
+
+    def test_cache_disque(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, 'oracle')
+            with OracleVictoire(chemin) as oracle:
+                probabilites = oracle.probabilites_etat((4, 3, 2))
+
+            with OracleVictoire(chemin) as oracle:
+                self.assertTrue(oracle.connu((4, 3, 2)))
+                self.assertTrue(oracle.connu((3, 2, 3)))
+                self.assertFalse(oracle.connu((5, 5, 5)))
+                self.assertEqual(probabilites, oracle.probabilites_etat((4, 3, 2)))
+
+            # Les probabilités calculées avec une autre tolérance ne sont pas rendues
+            with OracleVictoire(chemin, tolerance=1e-6) as oracle:
+                self.assertEqual('2:1e-06:4,3,2', oracle.cle((4, 3, 2)))
+                self.assertFalse(oracle.connu((4, 3, 2)))
@@ -4,6 +4,12 @@ from pymafia.de import Dé
 from pymafia.joueur import Joueur
 from pymafia.joueur_humain import JoueurHumain
 from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.generateur_des import GenerateurDés
+import json
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pymafia.demandes import DemandeSens, DemandeLancer, DemandeContinuer
 
 
 class TestPartie(TestCase):
@@ -25,6 +31,14 @@ class TestPartie(TestCase):
         self.assertEqual(2, nombre_joueurs_humains)
         self.assertEqual(3, nombre_joueurs_ordinateurs)
 
+    def test_afficher_joueurs(self):
+        # Les ordinateurs ne sont mentionnés à part que s'il y a aussi des joueurs humains
+        for nombre_joueurs_humains, cles in ((0, ['tous_ordinateurs']), (1, ['un_humain', 'autres_ordinateurs']),
+                                             (2, ['humains', 'autre_ordinateur']), (3, ['tous_humains'])):
+            messages = []
+            Partie(3, nombre_joueurs_humains, sortie=messages.append).afficher_joueurs()
+            self.assertEqual(cles, [message.cle for message in messages])
+
     def test_trouver_joueurs_au_plus_haut_total(self):
         partie = Partie(5, 4)
         joueurs = [Joueur(1), Joueur(2), Joueur(3), Joueur(4), Joueur(5)]
@@ -310,8 +324,232 @@ class TestPartie(TestCase):
         partie.joueurs[6].score = partie.joueurs[0].score = 40
         self.assertEqual([0, 3, 6], partie.determiner_liste_gagnants())
 
-
-
-
-
+    def test_simuler(self):
+
+        partie = Partie(4, 0)
+        partie.ronde_max = 5
+        resultat = partie.simuler()
+
+        self.assertTrue(1 <= resultat.nombre_rondes <= 5)
+        self.assertGreaterEqual(resultat.nombre_tours, resultat.nombre_rondes)
+        # Les points sont seulement échangés entre les joueurs: le total demeure 4 x 50
+        self.assertEqual(200, sum(resultat.scores.values()))
+        self.assertEqual(partie.points_transférés, resultat.points_transférés)
+        for gagnant in resultat.gagnants:
+            self.assertEqual(max(resultat.scores.values()), resultat.scores[gagnant])
+
+        # Les dés compacts donnent une partie complète
+        resultat = Partie(6, 0, dés_compacts=True).simuler()
+        self.assertEqual(300, sum(resultat.scores.values()))
+
+        # Une partie simulée ne peut pas contenir de joueur humain
+        self.assertRaises(ValueError, Partie(4, 1).simuler)
+
+    def test_partie_avec_graine(self):
+
+        # Deux parties créées avec la même graine se déroulent de la même façon, avec ou sans dés compacts
+        resultats = []
+        for dés_compacts in (False, False, True):
+            partie = Partie(5, 0, dés_compacts=dés_compacts, generateur=GenerateurDés(2021))
+            partie.ronde_max = 4
+            resultat = partie.simuler()
+            resultats.append((resultat.scores, resultat.nombre_rondes, resultat.nombre_tours))
+
+        self.assertEqual(resultats[0], resultats[1])
+        self.assertEqual(resultats[0], resultats[2])
+
+    def test_parties_en_parallele(self):
+
+        def jouer(graine):
+            partie = Partie(4, 0, affichage=False, generateur=GenerateurDés(graine))
+            partie.ronde_max = 5
+            resultat = partie.simuler()
+            return resultat.scores, resultat.nombre_tours
+
+        # Chaque partie a son propre générateur: jouées en même temps dans plusieurs fils, les parties se déroulent
+        # comme si elles étaient jouées une à une
+        graines = list(range(40))
+        attendus = [jouer(graine) for graine in graines]
+        intervalle = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(8) as executeur:
+                self.assertEqual(attendus, list(executeur.map(jouer, graines)))
+        finally:
+            sys.setswitchinterval(intervalle)
+
+        # Sans générateur fourni, une partie crée le sien
+        self.assertIsNotNone(Partie(4, 0).generateur)
+        self.assertIsNot(Partie(4, 0).generateur, Partie(4, 0).generateur)
+
+    def test_grande_table(self):
+
+        # Une grande table se déroule exactement comme une table ordinaire
+        for graine in range(10):
+            resultats = []
+            for grande_table in (False, True):
+                partie = Partie(3 + graine, 0, generateur=GenerateurDés(graine), grande_table=grande_table)
+                partie.ronde_max = 4
+                resultat = partie.simuler()
+                resultats.append((resultat.scores, resultat.nombre_tours, [joueur.identifiant for joueur in
+                                                                           partie.joueurs_actifs]))
+            self.assertEqual(resultats[0], resultats[1])
+
+        # Une table de plusieurs milliers de joueurs
+        partie = Partie(5000, 0, generateur=GenerateurDés(1), grande_table=True)
+        partie.ronde_max = 2
+        resultat = partie.simuler()
+        self.assertEqual(5000 * 50, sum(resultat.scores.values()))
+        self.assertEqual(len(partie.joueurs_actifs), len([score for score in resultat.scores.values() if score > 0]))
+
+    def test_bifurquer(self):
+        for dés_compacts in (False, True):
+            partie = Partie(4, 0, affichage=False, dés_compacts=dés_compacts, generateur=GenerateurDés(12),
+                            journalisation=True)
+            partie.ronde_max = 3
+            partie.preparer_une_partie()
+            partie.determiner_sens()
+            partie.determiner_joueur_suivant()
+            for i in range(3):
+                partie.jouer_un_tour()
+            état = [(joueur.score, joueur.valeurs_dés()) for joueur in partie.joueurs]
+            nombre_événements = len(partie.journal)
+
+            # Jouer la bifurcation jusqu'à la fin ne modifie pas la partie d'origine
+            bifurcation = partie.bifurquer()
+            self.assertTrue(all(a is not b for a, b in zip(partie.joueurs, bifurcation.joueurs)))
+            self.assertEqual(partie.joueurs.index(partie.joueur_courant),
+                             bifurcation.joueurs.index(bifurcation.joueur_courant))
+            bifurcation.jouer_une_partie()
+            self.assertEqual(état, [(joueur.score, joueur.valeurs_dés()) for joueur in partie.joueurs])
+            self.assertEqual(nombre_événements, len(partie.journal))
+            self.assertEqual(4, len(partie.joueurs_actifs))
+
+            # Avec une copie du générateur, les deux parties se déroulent de la même façon
+            partie.jouer_une_partie()
+            self.assertEqual([joueur.score for joueur in partie.joueurs],
+                             [joueur.score for joueur in bifurcation.joueurs])
+            self.assertEqual(partie.nombre_tours, bifurcation.nombre_tours)
+            self.assertEqual(partie.journal, bifurcation.journal)
+
+    def test_etapes(self):
+        # Une partie entre ordinateurs ne cède qu'une DemandeContinuer par ronde, et donne le même résultat que simuler
+        partie = Partie(4, 0, affichage=False, generateur=GenerateurDés(5))
+        partie.ronde_max = 3
+        etapes = partie.etapes()
+        demandes = []
+        try:
+            while True:
+                demandes.append(etapes.send(None))
+        except StopIteration as fin:
+            resultat = fin.value
+        self.assertTrue(all(isinstance(demande, DemandeContinuer) for demande in demandes))
+        self.assertEqual(list(range(1, len(demandes) + 1)), [demande.ronde for demande in demandes])
+        partie_simulée = Partie(4, 0, affichage=False, generateur=GenerateurDés(5))
+        partie_simulée.ronde_max = 3
+        self.assertEqual(partie_simulée.simuler().scores, resultat.scores)
+
+        # Le sens envoyé en réponse à la DemandeSens est celui de la partie, et chaque tour d'un humain est demandé
+        partie = Partie(3, 3, affichage=False, generateur=GenerateurDés(8))
+        etapes = partie.etapes()
+        demande = next(etapes)
+        self.assertIsInstance(demande, DemandeSens)
+        self.assertIs(partie.premier_joueur, demande.joueur)
+        demande = etapes.send(-1)
+        self.assertEqual(-1, partie.sens)
+        self.assertEqual([-1], partie.décisions)
+        self.assertIsInstance(demande, DemandeLancer)
+        self.assertIs(partie.joueur_courant, demande.joueur)
+        self.assertEqual(0, partie.nombre_tours)
+        demande = etapes.send(None)
+        self.assertEqual(1, partie.nombre_tours)
+
+        # Choisi à chaque ronde, le sens est demandé au joueur humain qui commence chaque ronde
+        partie = Partie(3, 3, affichage=False, generateur=GenerateurDés(8), sens_chaque_ronde=True)
+        partie.ronde_max = 3
+        etapes = partie.etapes()
+        demandes = []
+        reponse = None
+        try:
+            while True:
+                demandes.append(etapes.send(reponse))
+                reponse = -1 if isinstance(demandes[-1], DemandeSens) else None
+        except StopIteration as fin:
+            resultat = fin.value
+        demandes_sens = [demande for demande in demandes if isinstance(demande, DemandeSens)]
+        self.assertEqual(resultat.nombre_rondes, len(demandes_sens))
+        self.assertEqual([-1] * len(demandes_sens), partie.décisions)
+
+        # Un sens invalide est refusé
+        partie = Partie(2, 2, affichage=False, generateur=GenerateurDés(8))
+        etapes = partie.etapes()
+        next(etapes)
+        self.assertRaises(ValueError, etapes.send, 0)
+
+    def test_etapes_entrelacées(self):
+        # Un seul fil mène plusieurs parties à la fois, une demande à la fois: chacune se déroule comme si elle était
+        # jouée seule
+        def creer_partie(graine):
+            partie = Partie(4, 2, affichage=False, generateur=GenerateurDés(graine))
+            partie.ronde_max = 4
+            return partie
+
+        def repondre(demande):
+            return 1 if isinstance(demande, DemandeSens) else None
+
+        parties = [creer_partie(graine) for graine in range(20)]
+        en_cours = [(partie.etapes(), None) for partie in parties]
+        while en_cours:
+            suivantes = []
+            for etapes, reponse in en_cours:
+                try:
+                    suivantes.append((etapes, repondre(etapes.send(reponse))))
+                except StopIteration:
+                    pass
+            en_cours = suivantes
+
+        for graine, partie in enumerate(parties):
+            seule = creer_partie(graine)
+            seule.décisions_à_rejouer = [1]
+            seule.executer(seule.etapes())
+            self.assertEqual([joueur.score for joueur in seule.joueurs], [joueur.score for joueur in partie.joueurs])
+            self.assertEqual(seule.nombre_tours, partie.nombre_tours)
+
+    def test_en_octets(self):
+        # Une partie recréée depuis sa forme binaire ou son dictionnaire se poursuit exactement de la même façon
+        for options in ({}, {'dés_compacts': True}, {'journalisation': True}, {'grande_table': True},
+                        {'echantillonnage': True, 'avance_rapide': True}, {'sens_chaque_ronde': True}):
+            partie = Partie(6, 2, affichage=False, generateur=GenerateurDés(3), **options)
+            partie.ronde_max = 4
+            partie.décisions_à_rejouer = [1, -1, 1, -1, 1]
+            partie.preparer_une_partie()
+            partie.determiner_sens()
+            partie.determiner_joueur_suivant()
+            for i in range(5):
+                partie.jouer_un_tour()
+            donnees = partie.en_octets()
+            self.assertLess(len(donnees), len(pickle.dumps(partie, pickle.HIGHEST_PROTOCOL)))
+            copies = [Partie.depuis_octets(donnees), Partie.depuis_dict(json.loads(json.dumps(partie.en_dict())))]
+            partie.jouer_une_partie()
+            for copie in copies:
+                self.assertEqual([type(joueur) for joueur in partie.joueurs],
+                                 [type(joueur) for joueur in copie.joueurs])
+                copie.jouer_une_partie()
+                self.assertEqual([joueur.score for joueur in partie.joueurs],
+                                 [joueur.score for joueur in copie.joueurs])
+                self.assertEqual(partie.nombre_tours, copie.nombre_tours)
+                self.assertEqual(partie.points_transférés, copie.points_transférés)
+                self.assertEqual(partie.décisions, copie.décisions)
+                self.assertEqual(partie.journal, copie.journal)
+                self.assertEqual(partie.sens_chaque_ronde, copie.sens_chaque_ronde)
+
+        # La langue des messages et une longue partie sont conservées
+        partie = Partie(3, 0, affichage=False, generateur=GenerateurDés(3), langue='en')
+        partie.ronde_max = 100000
+        for copie in (Partie.depuis_octets(partie.en_octets()), Partie.depuis_dict(partie.en_dict())):
+            self.assertEqual('en', copie.catalogue.langue)
+            self.assertEqual(100000, copie.ronde_max)
+
+        self.assertRaises(ValueError, Partie.depuis_octets, b'XXXX' + donnees[4:])
+        self.assertRaises(ValueError, Partie.depuis_dict, {'version': 0})
 
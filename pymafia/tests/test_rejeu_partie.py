@@ -0,0 +1,106 @@
+from unittest import TestCase
+from pymafia.partie import Partie, GRANDE_TABLE, ECHANTILLONNAGE
+from pymafia.generateur_des import GenerateurDés
+from pymafia.rejeu_partie import RejeuPartie
+from pymafia.demandes import DemandeSens
+
+
+class TestRejeuPartie(TestCase):
+
+    def test_regenerer(self):
+        for graine in range(20):
+            partie = Partie(2 + graine % 6, 0, generateur=GenerateurDés(graine))
+            partie.ronde_max = 1 + graine % 5
+            partie.simuler()
+
+            rejeu = RejeuPartie.depuis_partie(partie)
+            self.assertEqual([partie.sens], rejeu.décisions)
+            partie_recréée = rejeu.regenerer()
+            self.assertEqual([joueur.score for joueur in partie.joueurs],
+                             [joueur.score for joueur in partie_recréée.joueurs])
+            self.assertEqual(partie.nombre_tours, partie_recréée.nombre_tours)
+            self.assertTrue(rejeu.verifier())
+
+    def test_joueurs_humains(self):
+        # Le sens choisi par un joueur humain est rejoué sans le consulter
+        for graine in range(10):
+            partie = Partie(4, 4, affichage=False, generateur=GenerateurDés(graine))
+            partie.décisions_à_rejouer = [-1]
+            partie.preparer_une_partie()
+            partie.determiner_sens()
+            partie.determiner_joueur_suivant()
+            partie.jouer_une_partie()
+
+            rejeu = RejeuPartie.depuis_partie(partie)
+            self.assertEqual([-1], rejeu.décisions)
+            self.assertTrue(rejeu.verifier([joueur.score for joueur in partie.joueurs]))
+
+    def test_verifier(self):
+        partie = Partie(5, 0, generateur=GenerateurDés(77))
+        partie.simuler()
+        rejeu = RejeuPartie.depuis_partie(partie)
+
+        scores = [joueur.score for joueur in partie.joueurs]
+        self.assertTrue(rejeu.verifier(scores))
+        scores[0] += 1
+        self.assertFalse(rejeu.verifier(scores))
+        rejeu.empreinte ^= 1
+        self.assertFalse(rejeu.verifier())
+
+    def test_bytes(self):
+        partie = Partie(3, 0, generateur=GenerateurDés(2 ** 64 - 1))
+        partie.simuler()
+        rejeu = RejeuPartie.depuis_partie(partie)
+
+        donnees = rejeu.en_bytes()
+        self.assertEqual(27, len(donnees))
+        self.assertEqual(rejeu, RejeuPartie.depuis_bytes(donnees))
+        self.assertTrue(RejeuPartie.depuis_bytes(donnees).verifier())
+
+        # Une partie crée son propre générateur: elle peut toujours être rejouée
+        partie = Partie(3, 0, affichage=False)
+        partie.simuler()
+        self.assertTrue(RejeuPartie.depuis_partie(partie).verifier())
+
+    def test_options(self):
+        # Les options qui changent le déroulement de la partie sont conservées, même en binaire, pour une grande table
+        partie = Partie(300, 0, affichage=False, generateur=GenerateurDés(5), grande_table=True, echantillonnage=True)
+        partie.ronde_max = 2
+        partie.simuler()
+        rejeu = RejeuPartie.depuis_bytes(RejeuPartie.depuis_partie(partie).en_bytes())
+        self.assertEqual(GRANDE_TABLE | ECHANTILLONNAGE, rejeu.options)
+        self.assertEqual(300, rejeu.nombre_joueurs)
+        partie_recréée = rejeu.regenerer()
+        self.assertTrue(partie_recréée.grande_table)
+        self.assertIsNotNone(partie_recréée.echantillonneur)
+        self.assertTrue(rejeu.verifier())
+
+    def test_modes_de_jeu(self):
+        # Une partie jouée en avance rapide ou avec échantillonnage se rejoue aussi
+        for options in ({'avance_rapide': True}, {'echantillonnage': True}):
+            for graine in range(5):
+                partie = Partie(3, 0, affichage=False, generateur=GenerateurDés(graine), **options)
+                partie.ronde_max = 5
+                partie.simuler()
+                self.assertTrue(RejeuPartie.depuis_partie(partie).verifier())
+
+    def test_sens_chaque_ronde(self):
+        # Les sens choisis par les humains à chaque ronde sont rejoués; ceux des ordinateurs sont recalculés
+        for graine in range(5):
+            partie = Partie(4, 2, affichage=False, generateur=GenerateurDés(graine), sens_chaque_ronde=True)
+            partie.ronde_max = 4
+            etapes = partie.etapes()
+            reponse = None
+            try:
+                while True:
+                    demande = etapes.send(reponse)
+                    reponse = 1 if isinstance(demande, DemandeSens) else None
+            except StopIteration:
+                pass
+            rejeu = RejeuPartie.depuis_partie(partie)
+            self.assertEqual(partie.décisions, rejeu.décisions)
+            self.assertTrue(rejeu.verifier([joueur.score for joueur in partie.joueurs]))
+
+    def test_joueurs_non_rejouables(self):
+        partie = Partie(3, 0, affichage=False, budget_monte_carlo=0.001)
+        self.assertRaises(ValueError, RejeuPartie.depuis_partie, partie)
@@ -0,0 +1,65 @@
+from unittest import TestCase
+from pymafia.partie import Partie
+from pymafia.rejoueur import Rejoueur
+from pymafia.generateur_des import GenerateurDés
+from pymafia.evenements import Evenement, Lancer, PointsRéglés, RondeGagnée
+
+
+class TestRejoueur(TestCase):
+
+    @staticmethod
+    def etat(partie):
+        return (partie.ronde, partie.sens, partie.nombre_tours, partie.points_transférés,
+                partie.premier_joueur.identifiant, partie.joueur_courant.identifiant,
+                partie.joueur_suivant.identifiant, [joueur.identifiant for joueur in partie.joueurs_actifs],
+                [(joueur.score, sorted(joueur.valeurs_dés())) for joueur in partie.joueurs])
+
+    def test_rejouer(self):
+        for graine in range(20):
+            partie = Partie(2 + graine % 5, 0, dés_compacts=graine % 2 == 0, generateur=GenerateurDés(graine),
+                            journalisation=True)
+            partie.ronde_max = 1 + graine % 6
+            partie.simuler()
+
+            partie_rejouée = Rejoueur(partie.journal).rejouer()
+            self.assertEqual(self.etat(partie), self.etat(partie_rejouée))
+
+    def test_sens_chaque_ronde(self):
+        # Le joueur qui choisit le sens au début de chaque ronde en devient le premier joueur
+        for graine in range(30):
+            partie = Partie(4, 0, affichage=False, generateur=GenerateurDés(graine), journalisation=True,
+                            sens_chaque_ronde=True)
+            partie.ronde_max = 4
+            partie.simuler()
+
+            partie_rejouée = Rejoueur(partie.journal).rejouer()
+            self.assertEqual(self.etat(partie), self.etat(partie_rejouée))
+
+    def test_evenements(self):
+        partie = Partie(3, 0, generateur=GenerateurDés(5), journalisation=True)
+        partie.simuler()
+
+        # Un seul gagnant de ronde, et chaque lancer de tour ne compte qu'un tour
+        self.assertEqual(1, len([evenement for evenement in partie.journal if isinstance(evenement, RondeGagnée)]))
+        self.assertEqual(partie.nombre_tours, len([evenement for evenement in partie.journal
+                                                   if isinstance(evenement, Lancer) and evenement.motif == Lancer.TOUR]))
+
+        # Les événements se convertissent en dictionnaires et inversement
+        for evenement in partie.journal:
+            self.assertEqual(evenement, Evenement.depuis_dict(evenement.en_dict()))
+
+        # La journalisation n'est pas activée par défaut
+        self.assertIsNone(Partie(3, 0).journal)
+
+    def test_journal_incohérent(self):
+        partie = Partie(4, 0, generateur=GenerateurDés(8), journalisation=True)
+        partie.simuler()
+
+        # Des points réglés modifiés ne correspondent plus aux dés du perdant
+        journal = list(partie.journal)
+        index = next(i for i, evenement in enumerate(journal) if isinstance(evenement, PointsRéglés))
+        journal[index] = PointsRéglés(journal[index].identifiant, journal[index].gagnant, journal[index].points + 1)
+        self.assertRaises(ValueError, Rejoueur(journal).rejouer)
+
+        # Un journal doit commencer par PartieCommencée
+        self.assertRaises(ValueError, Rejoueur(partie.journal[1:]).rejouer)
@@ -0,0 +1,57 @@
+from unittest import TestCase
+from pymafia.rendu_console import RenduConsole, SILENCE, RESUME, RONDE, TOUR
+from pymafia.messages import CatalogueMessages, Message, ValeursDés
+from pymafia.partie import Partie
+from pymafia.generateur_des import GenerateurDés
+import io
+
+
+class TestRenduConsole(TestCase):
+
+    def test_appel(self):
+        catalogue = CatalogueMessages.obtenir()
+        flux = io.StringIO()
+        rendu = RenduConsole(RONDE, flux)
+        self.assertFalse(rendu.pause)
+
+        # Les messages d'un tour sont filtrés; ceux d'une ronde attendent la fin de la ronde pour être écrits
+        rendu(Message(catalogue, 'début_ronde', (1, 2)))
+        rendu(Message(catalogue, 'lancer', (2, ValeursDés([3, 5]))))
+        rendu(Message(catalogue, None, [Message(catalogue, 'points_donnés', (8, 1, ValeursDés([2, 6])))]))
+        self.assertEqual("", flux.getvalue())
+        self.assertEqual(["Début de la ronde 1 par le joueur 2.\n", "\n"], rendu.tampon)
+        rendu(Message(catalogue, 'points_fin_de_ronde', (Message(catalogue, 'points_joueur', (58, 2)),)))
+        self.assertEqual("Début de la ronde 1 par le joueur 2.\n\nÀ la fin de cette ronde, les joueurs ont les "
+                         "points suivants:\nLe joueur 2 a 58 points.\n\n", flux.getvalue())
+        self.assertEqual([], rendu.tampon)
+
+        # vider écrit tout ce qui reste
+        rendu(Message(catalogue, 'gagnant_partie', (2,)))
+        rendu.vider()
+        self.assertTrue(flux.getvalue().endswith("Le joueur 2 a gagné à la partie!\n\n"))
+
+        # En silence, rien n'est écrit
+        flux = io.StringIO()
+        rendu = RenduConsole(SILENCE, flux)
+        rendu(Message(catalogue, 'merci'))
+        self.assertEqual("", flux.getvalue())
+
+    def test_partie(self):
+        # Chaque niveau de verbosité affiche plus que le précédent, et la partie se déroule de la même façon
+        textes = []
+        for niveau in (RESUME, RONDE, TOUR):
+            flux = io.StringIO()
+            partie = Partie(4, 0, affichage=False, generateur=GenerateurDés(3), sortie=RenduConsole(niveau, flux))
+            partie.ronde_max = 3
+            partie.executer(partie.etapes())
+            partie.terminer_une_partie()
+            textes.append(flux.getvalue())
+
+        self.assertTrue(textes[0].endswith("Merci d'avoir joué à pymafia!\n"))
+        self.assertNotIn("Début de la ronde", textes[0])
+        self.assertIn("Début de la ronde", textes[1])
+        self.assertNotIn("joue les dés suivants", textes[1])
+        self.assertIn("joue les dés suivants", textes[2])
+        self.assertLess(len(textes[0]), len(textes[1]))
+        self.assertLess(len(textes[1]), len(textes[2]))
+        self.assertTrue(textes[2].endswith(textes[0].split("\n\n", 1)[1]))
@@ -0,0 +1,139 @@
+import asyncio
+from unittest import TestCase
+from pymafia.serveur import ServeurPymafia
+from pymafia.generateur_des import GenerateurDés
+from pymafia.partie import Partie
+
+
+def traiter(serveur, commande):
+    # Exécute une commande comme le fait une connexion, hors de toute boucle
+    return asyncio.run(serveur.traiter_sans_bloquer(commande))
+
+
+class TestServeurPymafia(TestCase):
+
+    def test_traiter(self):
+        serveur = ServeurPymafia()
+
+        # Une table entre ordinateurs se joue au complet dès sa création, comme Partie.simuler
+        reponse = traiter(serveur, "NOUVELLE 4 0 3 7").split()
+        partie = Partie(4, 0, affichage=False, generateur=GenerateurDés(7))
+        partie.ronde_max = 3
+        resultat = partie.simuler()
+        self.assertEqual(['FIN', '1', ','.join(str(gagnant) for gagnant in resultat.gagnants),
+                          ','.join(str(resultat.scores[i]) for i in range(1, 5))], reponse)
+        self.assertEqual({}, serveur.tables)
+
+        # Une table entre humains attend leurs décisions, et refuse les autres commandes
+        reponse = traiter(serveur, "NOUVELLE 3 3 2 7").split()
+        self.assertEqual(['DEMANDE', '2', 'SENS'], reponse[:3])
+        self.assertTrue(traiter(serveur, "LANCER 2").startswith("ERREUR"))
+        self.assertTrue(traiter(serveur, "SENS 2 X").startswith("ERREUR"))
+        reponse = traiter(serveur, "sens 2 n").split()
+        self.assertEqual(['DEMANDE', '2', 'LANCER'], reponse[:3])
+        self.assertEqual(-1, serveur.tables[2].partie.sens)
+        self.assertEqual("ETAT 2 1 50,50,50 5,5,5", traiter(serveur, "ETAT 2"))
+
+        while reponse[0] == 'DEMANDE':
+            commande = "{} 2".format('LANCER' if reponse[2] == 'LANCER' else 'CONTINUER')
+            reponse = traiter(serveur, commande).split()
+        self.assertEqual('FIN', reponse[0])
+        self.assertEqual(150, sum(int(score) for score in reponse[3].split(',')))
+        self.assertTrue(traiter(serveur, "ETAT 2").startswith("ERREUR"))
+
+        for commande in ("", "JOUER 1", "NOUVELLE 9 0", "NOUVELLE 4 5", "NOUVELLE quatre 0", "NOUVELLE 8 0 1001",
+                         "LANCER", "LANCER 99"):
+            self.assertTrue(traiter(serveur, commande).startswith("ERREUR"))
+
+        traiter(serveur, "NOUVELLE 2 1")
+        self.assertEqual("FERMEE 3", traiter(serveur, "QUITTER 3"))
+        self.assertEqual({}, serveur.tables)
+
+    def test_connexions(self):
+        # Deux clients jouent chacun leurs tables en même temps, sur localhost
+        async def jouer_tables(port, nombre_tables):
+            lecteur, ecrivain = await asyncio.open_connection('127.0.0.1', port)
+
+            async def envoyer(commande):
+                ecrivain.write((commande + '\n').encode('utf-8'))
+                await ecrivain.drain()
+                return (await lecteur.readline()).decode('utf-8').split()
+
+            fins = []
+            demandes = [await envoyer("NOUVELLE 4 1 2") for i in range(nombre_tables)]
+            while demandes:
+                reponses = []
+                for demande in demandes:
+                    if demande[0] == 'FIN':
+                        fins.append(demande)
+                        continue
+                    commande = {'SENS': "SENS {} O", 'LANCER': "LANCER {}", 'CONTINUER': "CONTINUER {}"}[demande[2]]
+                    reponses.append(await envoyer(commande.format(demande[1])))
+                demandes = reponses
+            ecrivain.close()
+            return fins
+
+        async def principal():
+            serveur = ServeurPymafia(port=0)
+            await serveur.demarrer()
+            try:
+                return serveur, await asyncio.gather(jouer_tables(serveur.port, 5), jouer_tables(serveur.port, 5))
+            finally:
+                await serveur.fermer()
+
+        serveur, fins = asyncio.run(principal())
+        identifiants = sorted(int(fin[1]) for client in fins for fin in client)
+        self.assertEqual(list(range(1, 11)), identifiants)
+        for client in fins:
+            for fin in client:
+                self.assertEqual(200, sum(int(score) for score in fin[3].split(',')))
+        self.assertEqual({}, serveur.tables)
+
+    def test_traiter_sans_bloquer(self):
+        # Une table entre ordinateurs se joue une ronde à la fois, en laissant la boucle servir les autres tâches, et
+        # finit comme Partie.simuler
+        async def compter(tache):
+            nombre = 0
+            while not tache.done():
+                nombre += 1
+                await asyncio.sleep(0)
+            return nombre
+
+        async def principal():
+            tache = asyncio.ensure_future(ServeurPymafia().traiter_sans_bloquer("NOUVELLE 8 0 20 4"))
+            return await asyncio.gather(tache, compter(tache))
+
+        reponse, nombre = asyncio.run(principal())
+        partie = Partie(8, 0, affichage=False, generateur=GenerateurDés(4))
+        partie.ronde_max = 20
+        resultat = partie.simuler()
+        self.assertEqual(['FIN', '1', ','.join(str(gagnant) for gagnant in resultat.gagnants),
+                          ','.join(str(resultat.scores[i]) for i in range(1, 9))], reponse.split())
+        self.assertGreater(nombre, 1)
+
+    def test_erreur_interne(self):
+        # Une commande qui échoue répond ERREUR sans couper la connexion
+        class ServeurDefaillant(ServeurPymafia):
+            def interpreter(self, commande):
+                if commande.startswith('PANNE'):
+                    raise RuntimeError("panne")
+                return super().interpreter(commande)
+
+        async def principal():
+            serveur = ServeurDefaillant(port=0)
+            await serveur.demarrer()
+            try:
+                lecteur, ecrivain = await asyncio.open_connection('127.0.0.1', serveur.port)
+                reponses = []
+                for commande in ("PANNE", "NOUVELLE 2 1"):
+                    ecrivain.write((commande + '\n').encode('utf-8'))
+                    await ecrivain.drain()
+                    reponses.append((await lecteur.readline()).decode('utf-8').strip())
+                ecrivain.close()
+                return reponses
+            finally:
+                await serveur.fermer()
+
+        reponses = asyncio.run(principal())
+        self.assertEqual("ERREUR interne: panne", reponses[0])
+        self.assertTrue(reponses[1].startswith("DEMANDE 1 "))
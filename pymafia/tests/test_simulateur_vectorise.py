@@ -0,0 +1,65 @@
+from itertools import product
+from unittest import TestCase, skipIf
+
+try:
+    import numpy as np
+    from pymafia.simulateur_vectorise import SimulateurVectorise, TABLE_TOURS, TABLE_SOMMES, TIRAGES, DÉS_PAR_TIRAGE
+except ImportError:
+    np = None
+
+from pymafia.partie import Partie
+from pymafia.generateur_des import GenerateurDés
+
+
+@skipIf(np is None, "NumPy n'est pas installé")
+class TestSimulateurVectorise(TestCase):
+
+    def test_tables_de_tirage(self):
+        # Pour chaque nombre de dés, la table doit donner la même distribution que l'énumération de tous les lancers
+        for m in range(DÉS_PAR_TIRAGE + 1):
+            tranche = slice(m * TIRAGES, (m + 1) * TIRAGES)
+            tours = np.unique(TABLE_TOURS[tranche], return_counts=True)
+            sommes = np.unique(TABLE_SOMMES[tranche], return_counts=True)
+
+            attendu_tours = {}
+            attendu_sommes = {}
+            for faces in product(range(1, 7), repeat=m):
+                code = faces.count(1) + faces.count(6) + 256 * faces.count(6)
+                attendu_tours[code] = attendu_tours.get(code, 0) + 6 ** (DÉS_PAR_TIRAGE - m)
+                attendu_sommes[sum(faces)] = attendu_sommes.get(sum(faces), 0) + 6 ** (DÉS_PAR_TIRAGE - m)
+
+            self.assertEqual(attendu_tours, dict(zip(tours[0].tolist(), tours[1].tolist())))
+            self.assertEqual(attendu_sommes, dict(zip(sommes[0].tolist(), sommes[1].tolist())))
+
+    def test_simuler(self):
+        simulateur = SimulateurVectorise(2000, 5, ronde_max=4, graine=3).simuler()
+
+        # Les points sont seulement échangés entre les joueurs
+        self.assertTrue((simulateur.scores.sum(axis=1) == 250).all())
+        self.assertTrue((simulateur.scores >= 0).all())
+        self.assertTrue(((1 <= simulateur.nombre_rondes) & (simulateur.nombre_rondes <= 4)).all())
+        self.assertTrue((simulateur.nombre_tours >= simulateur.nombre_rondes).all())
+        self.assertTrue(simulateur.gagnants().any(axis=1).all())
+
+        # Une même graine donne les mêmes parties
+        autre = SimulateurVectorise(2000, 5, ronde_max=4, graine=3).simuler()
+        self.assertTrue((simulateur.scores == autre.scores).all())
+        self.assertTrue((simulateur.nombre_tours == autre.nombre_tours).all())
+
+    def test_memes_regles_que_partie(self):
+        # Les moyennes du simulateur doivent correspondre à celles des parties jouées avec la classe Partie
+        nombre_parties = 1000
+        simulateur = SimulateurVectorise(20000, 3, ronde_max=2, graine=5).simuler()
+
+        tours = points = 0
+        for i in range(nombre_parties):
+            partie = Partie(3, 0, affichage=False, generateur=GenerateurDés(i))
+            partie.ronde_max = 2
+            resultat = partie.simuler()
+            tours += resultat.nombre_tours
+            points += resultat.points_transférés
+
+        self.assertLess(abs(tours / nombre_parties - simulateur.nombre_tours.mean()),
+                        0.1 * simulateur.nombre_tours.mean())
+        self.assertLess(abs(points / nombre_parties - simulateur.points_transférés.mean()),
+                        0.1 * simulateur.points_transférés.mean())
@@ -0,0 +1,37 @@
+from unittest import TestCase
+from pymafia.solveur_sens import SolveurSens
+from pymafia.oracle_victoire import OracleVictoire
+
+
+class TestSolveurSens(TestCase):
+
+    def test_valeur_une_ronde_entre_deux_joueurs(self):
+        # Avec deux joueurs à égalité et une seule ronde, le gagnant de la ronde gagne la partie
+        solveur = SolveurSens()
+        probabilite_ronde = OracleVictoire().probabilites_etat((5, 5))[0]
+        croissant, decroissant = solveur.valeurs_sens((50, 50), 1)
+        self.assertAlmostEqual(probabilite_ronde, croissant, places=12)
+        self.assertEqual(croissant, decroissant)
+
+    def test_symetrie(self):
+        solveur = SolveurSens()
+        # Au début d'une partie, les deux sens se valent
+        croissant, decroissant = solveur.valeurs_sens((5, 5, 5), 2)
+        self.assertAlmostEqual(croissant, decroissant, places=12)
+        # Jouer vers la gauche revient à jouer vers la droite avec les voisins échangés
+        self.assertAlmostEqual(solveur.valeur((5, 1, 9), 0, 1, 1), solveur.valeur((5, 9, 1), 0, -1, 1), places=12)
+        croissant, decroissant = solveur.valeurs_sens((5, 1, 9), 1)
+        self.assertGreater(abs(croissant - decroissant), 1e-3)
+
+    def test_etats_accessibles(self):
+        solveur = SolveurSens()
+        etats = solveur.etats_accessibles(3, 2, 5)
+        self.assertEqual(((5, 5, 5), 2), etats[0])
+        for scores, rondes in etats[1:]:
+            self.assertEqual(1, rondes)
+            self.assertEqual(15, sum(scores))
+            self.assertTrue(all(score > 0 for score in scores))
+        # Le gagnant d'une ronde prend au moins un point à chacun des perdants, qui peuvent être éliminés
+        self.assertIn(((7, 4, 4), 1), etats)
+        self.assertIn(((11, 4), 1), etats)
+        self.assertNotIn(((10, 5), 1), etats)
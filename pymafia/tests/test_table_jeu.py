@@ -0,0 +1,48 @@
+from unittest import TestCase
+from pymafia.table_jeu import TableJeu
+from pymafia.demandes import DemandeSens, DemandeLancer, DemandeContinuer
+
+
+class TestTableJeu(TestCase):
+
+    @staticmethod
+    def repondre(demande):
+        return -1 if isinstance(demande, DemandeSens) else None
+
+    def test_avancer(self):
+        # Une table sans humain se joue au complet dès sa création
+        table = TableJeu(1, 4, 0, 3, 5)
+        self.assertTrue(table.terminee)
+        self.assertIsNone(table.demande)
+        self.assertEqual(200, sum(table.resultat.scores.values()))
+
+        table = TableJeu(2, 3, 2, 3, 5)
+        self.assertIsInstance(table.demande, DemandeSens)
+        while not table.terminee:
+            table.avancer(self.repondre(table.demande))
+        self.assertEqual(150, sum(table.resultat.scores.values()))
+        self.assertRaises(ValueError, table.en_octets)
+
+    def test_en_octets(self):
+        # Une table suspendue puis reprise à chaque demande se joue comme une table jamais suspendue
+        for graine in range(10):
+            table = TableJeu(1, 4, 2, 4, graine)
+            while not table.terminee:
+                table.avancer(self.repondre(table.demande))
+
+            reprise = TableJeu(1, 4, 2, 4, graine)
+            types_demandes = set()
+            while not reprise.terminee:
+                demande = reprise.demande
+                types_demandes.add(type(demande))
+                reprise = TableJeu.depuis_octets(1, reprise.en_octets())
+                self.assertIs(type(demande), type(reprise.demande))
+                self.assertEqual(demande.joueur and demande.joueur.identifiant,
+                                 reprise.demande.joueur and reprise.demande.joueur.identifiant)
+                reprise.avancer(self.repondre(reprise.demande))
+
+            self.assertEqual(table.resultat.scores, reprise.resultat.scores)
+            self.assertEqual(table.partie.nombre_tours, reprise.partie.nombre_tours)
+            self.assertEqual(table.partie.décisions, reprise.partie.décisions)
+            if graine == 0:
+                self.assertLessEqual({DemandeLancer, DemandeContinuer}, types_demandes)
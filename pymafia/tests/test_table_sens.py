@@ -0,0 +1,41 @@
+import os
+import tempfile
+from unittest import TestCase
+from pymafia.table_sens import TableSens, ÉGALITÉ
+from pymafia.solveur_sens import SolveurSens
+from pymafia.partie import Partie
+
+
+class TestTableSens(TestCase):
+
+    def test_remplir(self):
+        solveur = SolveurSens()
+        table = TableSens()
+        table.remplir(3, 2, 5, solveur)
+        self.assertEqual(len(solveur.etats_accessibles(3, 2, 5)), len(table.choix))
+        self.assertEqual(ÉGALITÉ, table.choisir((5, 5, 5), 2))
+        croissant, decroissant = solveur.valeurs_sens((8, 3, 4), 1)
+        self.assertEqual(1 if croissant > decroissant else -1, table.choisir((8, 3, 4), 1))
+        self.assertIsNone(table.choisir((50, 50, 50), 1))
+
+    def test_sauvegarder_et_charger(self):
+        table = TableSens()
+        table.remplir(3, 2, 5)
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, 'sens.bin')
+            table.sauvegarder(chemin)
+            self.assertEqual(table.choix, TableSens(chemin).choix)
+
+            with open(chemin, 'wb') as fichier:
+                fichier.write(b'autre chose')
+            with self.assertRaises(ValueError):
+                TableSens(chemin)
+
+    def test_etat_partie(self):
+        partie = Partie(4, 0, affichage=False)
+        for joueur, score in zip(partie.joueurs, (10, 20, 30, 40)):
+            joueur.score = score
+        partie.premier_joueur = partie.joueurs[2]
+        partie.ronde_max = 3
+        partie.ronde = 2
+        self.assertEqual(((30, 40, 10, 20), 2), TableSens.etat_partie(partie))
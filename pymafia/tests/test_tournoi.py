@@ -0,0 +1,35 @@
+from unittest import TestCase
+from pymafia.tournoi import Tournoi
+
+
+class TestTournoi(TestCase):
+
+    def test_tranches(self):
+        tournoi = Tournoi(10, 3)
+        self.assertEqual([(0, 3), (3, 6), (6, 10)], tournoi.tranches(3))
+        self.assertEqual([(i, i + 1) for i in range(10)], tournoi.tranches(50))
+
+    def test_statistiques(self):
+        tournoi = Tournoi(50, 4, ronde_max=3, graine=1).simuler()
+
+        self.assertEqual(50 * 4, sum(tournoi.distribution_scores.values()))
+        self.assertEqual(50 * 4 * 50, sum(score * nombre for score, nombre in tournoi.distribution_scores.items()))
+        # Une partie nulle compte pour au moins deux gagnants
+        self.assertLessEqual(50 + tournoi.égalités, sum(tournoi.victoires.values()))
+        self.assertLessEqual(1, tournoi.moyenne_rondes())
+        self.assertLessEqual(tournoi.moyenne_rondes(), 3)
+
+    def test_determinisme(self):
+        # Les statistiques d'un tournoi ayant une graine ne dépendent pas du nombre de processus
+        tournoi_1 = Tournoi(40, 3, ronde_max=2, graine=2021).simuler(1)
+        tournoi_2 = Tournoi(40, 3, ronde_max=2, graine=2021).simuler(3)
+
+        self.assertEqual(tournoi_1.victoires, tournoi_2.victoires)
+        self.assertEqual(tournoi_1.égalités, tournoi_2.égalités)
+        self.assertEqual(tournoi_1.total_tours, tournoi_2.total_tours)
+        self.assertEqual(tournoi_1.distribution_scores, tournoi_2.distribution_scores)
+        self.assertEqual(str(tournoi_1), str(tournoi_2))
+
+    def test_validation(self):
+        self.assertRaises(ValueError, Tournoi, 0, 4)
+        self.assertRaises(ValueError, Tournoi, 10, 1)
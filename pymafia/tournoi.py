@@ -0,0 +1,231 @@
+"""
+Module de la classe Tournoi
+"""
+
+import hashlib
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from pymafia.generateur_des import GenerateurDés
+from pymafia.partie import Partie, RONDEMAX
+
+# Nombre de tranches de parties confiées à chaque processus, pour équilibrer la charge entre les processus
+TRANCHES_PAR_PROCESSUS = 8
+
+
+class Tournoi:
+    """
+    Classe pour une série de parties simulées entre joueurs ordinateurs, dont on compile les statistiques.
+
+    Chaque partie reçoit son propre GenerateurDés, dont la graine est tirée de la graine du tournoi et du numéro de la
+    partie. Le résultat d'une partie ne dépend donc pas du processus qui la joue, et les statistiques d'un tournoi
+    ayant une graine sont les mêmes quel que soit le nombre de processus utilisés.
+
+    Les processus ne partagent que le tournoi lui-même et ne renvoient qu'un Tournoi par tranche, mais la création des
+    processus et l'envoi des tranches ont un coût fixe: l'accélération selon le nombre de processus se mesure avec
+    banc_essai.banc_tournoi, sur la machine qui joue le tournoi.
+
+    Attributes:
+        nombre_parties (int): Nombre de parties du tournoi
+        nombre_joueurs (int): Nombre de joueurs de chaque partie
+        ronde_max (int): Nombre maximal de rondes de chaque partie
+        graine (int): Graine du tournoi (tirée au hasard si elle n'est pas donnée)
+        avance_rapide (bool): True si les rondes sont jouées en un seul tirage (voir AvanceRapide); les tours de ces
+            rondes ne sont alors pas comptés
+        victoires (dict): Nombre de parties gagnées par chaque joueur, selon son identifiant (en cas d'égalité, la
+            partie compte pour chacun des gagnants)
+        égalités (int): Nombre de parties terminées par une égalité
+        total_rondes (int): Nombre de rondes jouées, toutes parties confondues
+        total_tours (int): Nombre de tours joués, toutes parties confondues
+        total_points_transférés (int): Somme des points donnés aux gagnants des rondes, toutes parties confondues
+        distribution_scores (dict): Nombre de fois où chaque score final a été obtenu par un joueur
+    """
+
+    def __init__(self, nombre_parties, nombre_joueurs, ronde_max=RONDEMAX, graine=None, avance_rapide=False):
+        """
+        Constructeur de la classe Tournoi
+        Args:
+            nombre_parties (int): Nombre de parties du tournoi (au moins 1)
+            nombre_joueurs (int): Nombre de joueurs de chaque partie (au moins 2)
+            ronde_max (int, optional): Nombre maximal de rondes de chaque partie
+            graine (int, optional): Graine du tournoi, pour obtenir des statistiques reproductibles
+            avance_rapide (bool, optional): True pour jouer les rondes en un seul tirage plutôt que tour par tour
+        """
+        if nombre_parties < 1:
+            raise ValueError("Un tournoi doit compter au moins une partie.")
+        if nombre_joueurs < 2:
+            raise ValueError("Une partie doit compter au moins 2 joueurs.")
+
+        self.nombre_parties = nombre_parties
+        self.nombre_joueurs = nombre_joueurs
+        self.ronde_max = ronde_max
+        self.graine = random.randrange(2 ** 32) if graine is None else graine
+        self.avance_rapide = avance_rapide
+        self.reinitialiser_statistiques()
+
+    def reinitialiser_statistiques(self):
+        """
+        Méthode qui remet à zéro les statistiques du tournoi.
+        """
+        self.victoires = {identifiant: 0 for identifiant in range(1, self.nombre_joueurs + 1)}
+        self.égalités = 0
+        self.total_rondes = 0
+        self.total_tours = 0
+        self.total_points_transférés = 0
+        self.distribution_scores = {}
+
+    def graine_partie(self, numero_partie):
+        """
+        Méthode qui calcule la graine du générateur d'une partie à partir de la graine du tournoi. La graine est un
+        entier de 64 bits, ce qui permet de conserver la partie sous la forme d'un RejeuPartie.
+        Args:
+            numero_partie (int): Numéro de la partie dans le tournoi (à partir de 0)
+
+        Returns:
+            int: Graine de la partie
+        """
+        empreinte = hashlib.blake2b("{}:{}".format(self.graine, numero_partie).encode(), digest_size=8)
+        return int.from_bytes(empreinte.digest(), 'little')
+
+    def jouer_partie(self, numero_partie):
+        """
+        Méthode qui simule une partie du tournoi.
+        Args:
+            numero_partie (int): Numéro de la partie dans le tournoi (à partir de 0)
+
+        Returns:
+            ResultatPartie: Le résultat de la partie
+        """
+        partie = Partie(self.nombre_joueurs, 0, affichage=False,
+                        generateur=GenerateurDés(self.graine_partie(numero_partie)), grande_table=True,
+                        avance_rapide=self.avance_rapide)
+        partie.ronde_max = self.ronde_max
+        return partie.simuler()
+
+    def jouer_tranche(self, debut, fin):
+        """
+        Méthode qui simule les parties dont le numéro est entre debut et fin - 1 et compile leurs statistiques. C'est
+        la tâche confiée à un processus.
+        Args:
+            debut (int): Numéro de la première partie
+            fin (int): Numéro suivant celui de la dernière partie
+
+        Returns:
+            Tournoi: Tournoi dont les statistiques sont celles de ces parties seulement
+        """
+        self.reinitialiser_statistiques()
+        for numero_partie in range(debut, fin):
+            self.ajouter_resultat(self.jouer_partie(numero_partie))
+        return self
+
+    def ajouter_resultat(self, resultat):
+        """
+        Méthode qui ajoute le résultat d'une partie aux statistiques du tournoi.
+        Args:
+            resultat (ResultatPartie): Le résultat de la partie
+        """
+        for identifiant in resultat.gagnants:
+            self.victoires[identifiant] += 1
+        if len(resultat.gagnants) > 1:
+            self.égalités += 1
+        self.total_rondes += resultat.nombre_rondes
+        self.total_tours += resultat.nombre_tours
+        self.total_points_transférés += resultat.points_transférés
+        for score in resultat.scores.values():
+            self.distribution_scores[score] = self.distribution_scores.get(score, 0) + 1
+
+    def fusionner(self, autre):
+        """
+        Méthode qui ajoute les statistiques d'un autre tournoi (par exemple, celles d'une tranche de parties jouée par
+        un autre processus) à celles de ce tournoi. Toutes les statistiques sont des entiers, de sorte que le total ne
+        dépend pas de l'ordre dans lequel les tranches sont fusionnées.
+        Args:
+            autre (Tournoi): Tournoi dont on ajoute les statistiques
+        """
+        for identifiant, nombre in autre.victoires.items():
+            self.victoires[identifiant] += nombre
+        self.égalités += autre.égalités
+        self.total_rondes += autre.total_rondes
+        self.total_tours += autre.total_tours
+        self.total_points_transférés += autre.total_points_transférés
+        for score, nombre in autre.distribution_scores.items():
+            self.distribution_scores[score] = self.distribution_scores.get(score, 0) + nombre
+
+    def tranches(self, nombre_tranches):
+        """
+        Méthode qui découpe les numéros de parties en tranches consécutives de tailles presque égales.
+        Args:
+            nombre_tranches (int): Nombre de tranches voulu
+
+        Returns:
+            list: Liste de tuples (debut, fin) de chaque tranche
+        """
+        nombre_tranches = max(1, min(nombre_tranches, self.nombre_parties))
+        bornes = [self.nombre_parties * i // nombre_tranches for i in range(nombre_tranches + 1)]
+        return list(zip(bornes[:-1], bornes[1:]))
+
+    def simuler(self, nombre_processus=1):
+        """
+        Méthode qui simule toutes les parties du tournoi et compile leurs statistiques. Avec plus d'un processus, les
+        parties sont réparties en tranches entre les processus d'un ProcessPoolExecutor.
+        Args:
+            nombre_processus (int, optional): Nombre de processus à utiliser
+
+        Returns:
+            Tournoi: Le tournoi lui-même, pour enchaîner les appels
+        """
+        if nombre_processus <= 1:
+            return self.jouer_tranche(0, self.nombre_parties)
+
+        tranches = self.tranches(nombre_processus * TRANCHES_PAR_PROCESSUS)
+        self.reinitialiser_statistiques()
+        with ProcessPoolExecutor(max_workers=nombre_processus) as executeur:
+            for resultat_tranche in executeur.map(self.jouer_tranche, *zip(*tranches)):
+                self.fusionner(resultat_tranche)
+        return self
+
+    def taux_victoires(self):
+        """
+        Méthode qui calcule la proportion des parties gagnées par chaque joueur.
+        Returns:
+            dict: Taux de victoires de chaque joueur, selon son identifiant
+        """
+        return {identifiant: nombre / self.nombre_parties for identifiant, nombre in self.victoires.items()}
+
+    def moyenne_rondes(self):
+        """
+        Méthode qui calcule le nombre moyen de rondes jouées par partie.
+        Returns:
+            float: Nombre moyen de rondes
+        """
+        return self.total_rondes / self.nombre_parties
+
+    def moyenne_tours(self):
+        """
+        Méthode qui calcule le nombre moyen de tours joués par partie.
+        Returns:
+            float: Nombre moyen de tours
+        """
+        return self.total_tours / self.nombre_parties
+
+    def __str__(self):
+        """
+        Méthode qui retourne un rapport des statistiques du tournoi en chaîne de caractères.
+        Returns:
+            str: Rapport du tournoi
+        """
+        lignes = ["Tournoi de {} parties à {} joueurs (graine {}, {} ronde(s) au maximum)".format(
+            self.nombre_parties, self.nombre_joueurs, self.graine, self.ronde_max)]
+        for identifiant, taux in self.taux_victoires().items():
+            lignes.append("  Joueur {}: {:.2%} de victoires".format(identifiant, taux))
+        lignes.append("  Égalités: {}".format(self.égalités))
+        lignes.append("  Rondes par partie: {:.3f}".format(self.moyenne_rondes()))
+        lignes.append("  Tours par partie: {:.3f}".format(self.moyenne_tours()))
+        lignes.append("  Points transférés par partie: {:.3f}".format(
+            self.total_points_transférés / self.nombre_parties))
+        lignes.append("  Distribution des scores finaux:")
+        nombre_scores = sum(self.distribution_scores.values())
+        for score in sorted(self.distribution_scores):
+            nombre = self.distribution_scores[score]
+            lignes.append("    {:>4}: {:>9} ({:.2%})".format(score, nombre, nombre / nombre_scores))
+        return "\n".join(lignes)
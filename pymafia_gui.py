@@ -4,7 +4,8 @@ Module contenant la description d'une classe pour la fenêtre du jeu Pymafia et
 from tkinter.constants import NONE
 from pymafia.partie import Partie
 from tkinter import Tk, Frame, Button, Label, StringVar, DISABLED, NORMAL, Toplevel, Menu,simpledialog, messagebox, Checkbutton
-from pymafia.partie import RONDEMAX
+from pymafia.demandes import DemandeSens, DemandeLancer, DemandeContinuer
+from pymafia.evenements import DésRetirés, DésPassés
 
 def demander_nombre_joueur():
     answer = simpledialog.askstring("Input", "Combien de joueurs serez-vous?",
@@ -21,17 +22,7 @@ def shows_instructions():
 
 def recommencer():
     if messagebox.askquestion("ALERTE", "Voulez-vous vraiment recommencer une partie\n Cette étape sera irréversible") == "yes":
-        for joueur in pymafia_fenetre.frames_joueurs:
-            joueur.inactiver_bouton()
-        pymafia_fenetre.frames_joueurs[pymafia_fenetre.partie.joueur_courant.identifiant-1].inactiver_bouton()
-        pymafia_fenetre.partie.preparer_une_partie()
-        pymafia_fenetre.partie.reinitialiser_dés_joueurs()
-        for frame in pymafia_fenetre.frames_joueurs:
-            frame.mettre_label_dés_a_jour()
-        pymafia_fenetre.frames_joueurs[pymafia_fenetre.partie.premier_joueur.identifiant-1].activer_bouton()
-        for joueur in pymafia_fenetre.partie.joueurs_actifs:
-            joueur.score = 50
-        pymafia_fenetre.partie.ronde = 1
+        pymafia_fenetre.commencer_partie()
         afficher_score()
 
 def quitter():
@@ -39,11 +30,13 @@ def quitter():
         pymafia_fenetre.quit()
             
 
-def afficher_score():
+def afficher_score(fenetre=None):
+    if fenetre is None:
+        fenetre = pymafia_fenetre
     index = 0
-    pymafia_fenetre.title(f"Jeu de pymafia (Ronde #{pymafia_fenetre.partie.ronde})")
-    for joueur in pymafia_fenetre.partie.joueurs_actifs:
-        label = Label(pymafia_fenetre, text = f"Joueur {joueur.identifiant} : {joueur.score}")
+    fenetre.title(f"Jeu de pymafia (Ronde #{fenetre.partie.ronde})")
+    for joueur in fenetre.partie.joueurs_actifs:
+        label = Label(fenetre, text = f"Joueur {joueur.identifiant} : {joueur.score}")
         label.place(x=0, y=index)
         index += 15    
         
@@ -64,49 +57,9 @@ class FrameJoueur(Frame):
         self.bouton_rouler_dés = Button(self, command=self.rouler_dés, text="Rouler\nles\ndés")
 
     def rouler_dés(self):
-        self.joueur.rouler_dés()
-        self.mettre_label_dés_a_jour()
-        nombre_1, nombre_6 = pymafia_fenetre.partie.verifier_dés_joueur_courant_pour_1_et_6()
-        messagebox.showinfo("", f"{pymafia_fenetre.partie.message_pour_dé_1(nombre_1)}\n{pymafia_fenetre.partie.message_pour_dé_6(nombre_6)}")
-        pymafia_fenetre.partie.gerer_dés_1_et_6()
-        pymafia_fenetre.partie.retirer_joueurs_sans_points()
+        # Le tour est joué par les étapes de la partie, qui attendaient que ce joueur lance ses dés
         self.inactiver_bouton()
-        if pymafia_fenetre.partie.verifier_si_fin_de_ronde() == True:
-            pymafia_fenetre.partie.terminer_ronde()
-            if len(pymafia_fenetre.partie.joueurs_actifs) == 1: # or pymafia_fenetre.partie.ronde == RONDEMAX:
-                pymafia_fenetre.partie.terminer_une_partie()
-                messagebox.showinfo("Bravo!", f"Le joueur {pymafia_fenetre.partie.joueurs_actifs[0].identifiant} \
-                a gagné la partie\nMerci d''avoir joué à pymafia!")
-                pymafia_fenetre.quit()
-            
-            # Plusieurs joueurs ont gagné la partie, RondeMax est atteint
-            if (pymafia_fenetre.partie.ronde == RONDEMAX):
-                string_joueur = ""
-                for joueur in pymafia_fenetre.partie.joueurs_actifs:
-                    string_joueur += f"Joueur {joueur.identifiant} \n"
-
-                messagebox.showinfo("Bravo!", "Les joueurs suivants ont gagnés la partie :\n"
-                f"{string_joueur}"
-                "\nMerci d''avoir joué à pymafia!")
-                pymafia_fenetre.quit()
-
-            # Personne n'a gagné la fin du ronde, on passe à la suivante 
-            else:
-                pymafia_fenetre.partie.passer_a_la_ronde_suivante()
-                pymafia_fenetre.partie.preparer_une_partie()
-                for frame in pymafia_fenetre.frames_joueurs:
-                    frame.mettre_label_dés_a_jour()
-                pymafia_fenetre.partie.reinitialiser_dés_joueurs()
-                messagebox.showinfo(f"Ronde #{pymafia_fenetre.partie.ronde}", f"Joueur {self.partie.premier_joueur.identifiant} commence la ronde")
-                pymafia_fenetre.frames_joueurs[pymafia_fenetre.partie.premier_joueur.identifiant-1].activer_bouton()
-                afficher_score()
-
-        # La ronde n'est pas terminée on passe au prochain joueur                                                                 
-        else:
-            pymafia_fenetre.partie.passer_au_prochain_joueur()
-            pymafia_fenetre.frames_joueurs[pymafia_fenetre.partie.joueur_courant.identifiant-1].activer_bouton()
-            pymafia_fenetre.frames_joueurs[pymafia_fenetre.partie.joueur_courant.identifiant-1].mettre_label_dés_a_jour()
-            self.mettre_label_dés_a_jour()
+        pymafia_fenetre.avancer()
 
     def mettre_label_dés_a_jour(self):
         # Méthode à être redéfinie dans les classes filles
@@ -234,11 +187,9 @@ class FenetrePymafia(Tk):
         super().__init__()
         self.title("Jeu de pymafia")
         self.resizable(0, 0)       
-        self.partie = Partie(4, 4)
-
-        self.partie.preparer_une_partie()
-        
-
+        self.partie = Partie(4, 4, journalisation=True)
+        self.etapes = None
+        self.position_journal = 0
 
         self.frames_joueurs = []
 
@@ -271,14 +222,84 @@ class FenetrePymafia(Tk):
         menubar.add_cascade(label="Fichier", menu=filemenu)
 
         self.config(menu=menubar)
-        messagebox.showinfo(f"Ronde #{self.partie.ronde}", f"Joueur {self.partie.premier_joueur.identifiant} commence la ronde")
-        if messagebox.askquestion("Début de la partie", f"Joueur #{self.partie.premier_joueur.identifiant} est le premier joueur\n"
-        "Voulez-vous commencer dans le sens horaire ?") == "yes":
-            self.partie.sens= 1
-        else:
-            self.partie.sens = -1 
-        self.frames_joueurs[self.partie.premier_joueur.identifiant-1].activer_bouton()
-                    
+        self.commencer_partie()
+
+    def commencer_partie(self):
+        """
+        Méthode qui commence une nouvelle partie et la mène jusqu'à ce que le premier joueur doive lancer ses dés.
+        """
+        if self.etapes is not None:
+            self.partie = Partie(4, 4, journalisation=True)
+            for frame, joueur in zip(self.frames_joueurs, self.partie.joueurs):
+                frame.joueur = joueur
+        for frame in self.frames_joueurs:
+            frame.inactiver_bouton()
+        self.etapes = self.partie.etapes()
+        self.position_journal = 0
+        self.avancer()
+
+    def avancer(self, reponse=None):
+        """
+        Méthode qui envoie une réponse aux étapes de la partie, puis répond à leurs demandes jusqu'à ce que l'une
+        d'elles attende un clic: c'est alors le tour d'un joueur, dont le bouton est activé.
+        Args:
+            reponse (optional): Réponse à la demande en cours
+        """
+        while True:
+            try:
+                demande = self.etapes.send(reponse)
+            except StopIteration:
+                self.mettre_a_jour()
+                self.terminer_partie()
+                return
+            self.mettre_a_jour()
+            reponse = None
+            if isinstance(demande, DemandeSens):
+                identifiant = demande.joueur.identifiant
+                messagebox.showinfo(f"Ronde #{self.partie.ronde}", f"Joueur {identifiant} commence la ronde")
+                if messagebox.askquestion("Début de la partie", f"Joueur #{identifiant} est le premier joueur\n"
+                                          "Voulez-vous commencer dans le sens horaire ?") == "yes":
+                    reponse = 1
+                else:
+                    reponse = -1
+            elif isinstance(demande, DemandeContinuer):
+                messagebox.showinfo(f"Ronde #{demande.ronde}", str(self.partie.message_points_en_fin_de_ronde()))
+            elif isinstance(demande, DemandeLancer):
+                self.frames_joueurs[demande.joueur.identifiant-1].activer_bouton()
+                return
+
+    def mettre_a_jour(self):
+        """
+        Méthode qui met à jour les dés affichés et annonce les dés de valeur 1 et 6 roulés depuis la dernière mise à
+        jour.
+        """
+        for frame in self.frames_joueurs:
+            frame.mettre_label_dés_a_jour()
+        messages = []
+        for evenement in self.partie.journal[self.position_journal:]:
+            if isinstance(evenement, DésRetirés):
+                messages.append(str(self.partie.message('dés_retirés', evenement.nombre, evenement.identifiant)))
+            elif isinstance(evenement, DésPassés):
+                messages.append(str(self.partie.message('dés_passés', evenement.nombre, evenement.identifiant)))
+        self.position_journal = len(self.partie.journal)
+        if messages:
+            messagebox.showinfo("", "\n".join(messages))
+        afficher_score(self)
+
+    def terminer_partie(self):
+        """
+        Méthode qui annonce le ou les gagnants de la partie terminée, puis ferme la fenêtre.
+        """
+        self.partie.terminer_une_partie()
+        gagnants = [self.partie.joueurs[index] for index in self.partie.determiner_liste_gagnants()]
+        string_joueur = ""
+        for joueur in gagnants:
+            string_joueur += f"Joueur {joueur.identifiant} \n"
+        messagebox.showinfo("Bravo!", "Les joueurs suivants ont gagné la partie :\n"
+        f"{string_joueur}"
+        "\nMerci d'avoir joué à pymafia!")
+        self.quit()
+
 if __name__ == '__main__':
     pymafia_fenetre = FenetrePymafia()
     afficher_score()